@@ -37,6 +37,8 @@ from .exceptions import (
     NotFoundError,
     ValidationError,
     APIError,
+    BudgetExceededError,
+    CircuitOpenError,
 )
 
 __all__ = [
@@ -47,4 +49,6 @@ __all__ = [
     "NotFoundError",
     "ValidationError",
     "APIError",
+    "BudgetExceededError",
+    "CircuitOpenError",
 ] 
\ No newline at end of file
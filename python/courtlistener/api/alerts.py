@@ -2,7 +2,8 @@
 Alerts API module for CourtListener SDK.
 """
 
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Iterable
+from ..utils.alert_sync import SyncResult, sync_alerts
 from .base import BaseAPI
 
 
@@ -102,7 +103,7 @@ class AlertsAPI(BaseAPI):
         Returns:
             Updated alert data
         """
-        return self.client.post(f"{self.endpoint}{alert_id}/", data=kwargs)
+        return self.client._make_request('PATCH', f"{self.endpoint}{alert_id}/", json_data=kwargs)
     
     def delete(self, alert_id: int) -> bool:
         """
@@ -142,3 +143,38 @@ class AlertsAPI(BaseAPI):
         
         params.update(kwargs)
         return self.client.paginate(self.endpoint, params=params)
+
+    def sync(
+        self,
+        desired_alerts: Iterable[Dict[str, Any]],
+        key='name',
+        delete_missing: bool = True,
+        max_workers: int = 4,
+        dry_run: bool = False,
+        **filters
+    ) -> SyncResult:
+        """
+        Reconcile alerts with a desired set in one pass.
+
+        Existing alerts are paged through once and only the differences are
+        applied, concurrently. Running the same sync again is a no-op, and a
+        sync that failed part-way is finished by running it again.
+
+        Args:
+            desired_alerts: Alert dicts with ``create`` fields (``name``,
+                ``query``, ``rate``, ...)
+            key: Field (or function of an alert dict) identifying an alert
+            delete_missing: Delete existing alerts that are not desired
+            max_workers: Concurrent create/update/delete requests
+            dry_run: Only compute the changes
+            **filters: Limit the existing alerts considered (e.g.
+                ``alert_type='search'``); also used as defaults for the
+                desired alerts
+
+        Returns:
+            SyncResult with the created, updated and deleted alerts
+        """
+        return sync_alerts(
+            self, desired_alerts, key=key, delete_missing=delete_missing,
+            max_workers=max_workers, dry_run=dry_run, **filters
+        )
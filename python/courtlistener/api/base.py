@@ -2,13 +2,22 @@
 Base API class for CourtListener API modules.
 """
 
+import logging
 from typing import Dict, Any, Optional, Iterator, Union
+from .. import tracing
 from ..exceptions import CourtListenerError
 
+logger = logging.getLogger(__name__)
+
 
 class BaseAPI:
     """Base class for all API modules."""
     
+    def __init_subclass__(cls, **kwargs):
+        """Record a tracing span for each public method call (no-op while tracing is off)."""
+        super().__init_subclass__(**kwargs)
+        tracing.trace_public_methods(cls)
+    
     def __init__(self, client):
         """Initialize the API module with a client instance."""
         self.client = client
@@ -62,6 +71,23 @@ class BaseAPI:
         # This should be overridden by subclasses
         raise NotImplementedError("Subclasses must implement _get_endpoint")
     
+    def _index_locally(self, items) -> None:
+        """
+        Feed fetched models to the client's local search index, if attached.
+        
+        Indexing failures are logged and never fail the API call that
+        already succeeded.
+        
+        Args:
+            items: Models or dicts that were just fetched
+        """
+        index = getattr(self.client, 'local_index', None)
+        if index is not None and items:
+            try:
+                index.ingest(items)
+            except Exception:
+                logger.exception("Local search indexing failed")
+    
     def _validate_params(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """
         Validate and clean parameters.
@@ -75,3 +101,6 @@ class BaseAPI:
         # Remove None values
         cleaned = {k: v for k, v in params.items() if v is not None}
         return cleaned
+
+
+tracing.trace_public_methods(BaseAPI)
@@ -1,12 +1,117 @@
 """Citations API module for CourtListener SDK."""
 
-from typing import Dict, Any, Optional, List, Union
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Optional, List, Union, Tuple
+from ..exceptions import RateLimitError, ValidationError
 from ..utils.filters import build_filters
 from ..utils.validators import validate_id
 from ..models.base import BaseModel
 from .base import BaseAPI
 
 
+# Server-side limits of the citation-lookup/ endpoint
+CITATION_LOOKUP_MAX_CHARS = 64000
+CITATION_LOOKUP_MAX_CITATIONS = 250
+
+# Characters shared by neighbouring chunks; longer than any citation
+CITATION_LOOKUP_OVERLAP = 200
+
+# Boundaries to split long texts on, from safest to least safe. Sentence
+# ends skip "v." and single-letter abbreviations ("F. Supp.", "S. Ct.").
+_SPLIT_BOUNDARIES = (
+    re.compile(r'\n\s*\n'),
+    re.compile(r'\n'),
+    re.compile(r'(?<!\bv)(?<!\b[A-Z])[.;:]\s+(?=[A-Z(\[])'),
+    re.compile(r'\s+'),
+)
+
+
+def _split_text(text: str, max_chars: int, overlap: int = 0) -> List[Tuple[int, str]]:
+    """
+    Split text into chunks no longer than ``max_chars`` on safe boundaries.
+
+    Paragraph breaks are preferred, then line breaks, then sentence ends and
+    finally any whitespace. A boundary can still fall inside a citation
+    (e.g. between the volume and the reporter), so each chunk after the
+    first starts ``overlap`` characters before the previous one ended;
+    callers keep a citation only from the chunk that contains it whole.
+
+    Args:
+        text: Text to split
+        max_chars: Maximum chunk length
+        overlap: Characters repeated from the end of the previous chunk
+            (at most a quarter of ``max_chars`` is used)
+
+    Returns:
+        List of ``(offset, chunk)`` tuples, where ``offset`` is the position
+        of the chunk in the original text
+    """
+    overlap = max(0, min(overlap, max_chars // 4))
+    chunks = []
+    start = 0
+    while len(text) - start > max_chars:
+        window = text[start:start + max_chars]
+        cut = None
+        for boundary in _SPLIT_BOUNDARIES:
+            matches = [m.end() for m in boundary.finditer(window)]
+            # Ignore boundaries in the first half so chunks stay reasonably full
+            matches = [end for end in matches if end > max_chars // 2]
+            if matches:
+                cut = matches[-1]
+                break
+        if cut is None:
+            cut = max_chars
+        chunks.append((start, text[start:start + cut]))
+        start += max(1, cut - overlap)
+    if start < len(text) or not chunks:
+        chunks.append((start, text[start:]))
+    return chunks
+
+
+def _owned_ranges(chunks: List[Tuple[int, str]], length: int) -> List[Tuple[int, int]]:
+    """
+    Range of start positions each overlapping chunk is responsible for.
+
+    Neighbouring chunks split their overlap in the middle, so a citation
+    shorter than half the overlap is reported by exactly one chunk, and by
+    one that contains it whole.
+    """
+    ranges = []
+    for index, (offset, chunk) in enumerate(chunks):
+        low = 0
+        if index:
+            prev_offset, prev_chunk = chunks[index - 1]
+            low = (offset + prev_offset + len(prev_chunk)) // 2
+        high = length
+        if index + 1 < len(chunks):
+            high = (chunks[index + 1][0] + offset + len(chunk)) // 2
+        ranges.append((low, high))
+    return ranges
+
+
+class _LookupThrottle:
+    """Shared back-off so that one throttled worker pauses all of them."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._resume_at = 0.0
+
+    def wait(self):
+        """Sleep until the shared back-off period has passed."""
+        with self._lock:
+            delay = self._resume_at - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+
+    def back_off(self, seconds: float):
+        """Pause all workers for at least ``seconds``."""
+        with self._lock:
+            self._resume_at = max(self._resume_at, time.monotonic() + seconds)
+
+
 class Citation(BaseModel):
     """Model for citation data."""
     pass
@@ -88,6 +193,124 @@ class CitationsAPI(BaseAPI):
         data = {'text': text}
         return self.client.post('citation-lookup/', json_data=data)
 
+    def lookup_citations_bulk(
+        self,
+        texts: Union[str, List[str]],
+        max_chars: int = CITATION_LOOKUP_MAX_CHARS,
+        max_workers: int = 4,
+        max_throttle_retries: int = 3,
+    ) -> Union[List[Dict[str, Any]], List[List[Dict[str, Any]]]]:
+        """
+        Look up citations in one huge text or many documents.
+
+        Each text is split on safe boundaries into slightly overlapping
+        chunks below the server's size limit, the chunks are sent
+        concurrently, and the results are merged with
+        ``start_index``/``end_index`` remapped to the original text. A
+        citation straddling a chunk boundary is taken from the neighbouring
+        chunk that contains it whole, so none is lost or reported twice.
+        Citations the server skipped because of its per-request citation cap
+        (``status`` 429) are resubmitted in follow-up requests. When the
+        server throttles a request, every worker backs off together before
+        retrying.
+
+        Args:
+            texts: A single text or a list of texts
+            max_chars: Maximum characters per request
+                (default: 64000, the server limit)
+            max_workers: Maximum number of concurrent requests (default: 4)
+            max_throttle_retries: How many times to retry a throttled chunk
+                after the transport's own retries are exhausted (default: 3)
+
+        Returns:
+            For a single text, the list of citation results ordered by
+            position. For a list of texts, one such list per text.
+        """
+        if max_chars <= 0:
+            raise ValidationError("max_chars must be greater than 0")
+        if max_workers < 1:
+            raise ValidationError("max_workers must be at least 1")
+
+        single = isinstance(texts, str)
+        documents = [texts] if isinstance(texts, str) else list(texts)
+
+        jobs = []
+        for doc_index, text in enumerate(documents):
+            chunks = _split_text(text, max_chars, CITATION_LOOKUP_OVERLAP)
+            for (offset, chunk), owned in zip(chunks, _owned_ranges(chunks, len(text))):
+                if chunk.strip():
+                    jobs.append((doc_index, offset, chunk, owned))
+        throttle = _LookupThrottle()
+
+        def run(job):
+            doc_index, offset, chunk, (low, high) = job
+            citations = self._lookup_chunk(chunk, offset, throttle, max_throttle_retries)
+            # Drop citations that belong to (and are complete in) a neighbour
+            return doc_index, [
+                item for item in citations
+                if item.get('start_index') is None or low <= item['start_index'] < high
+            ]
+
+        results: List[List[Dict[str, Any]]] = [[] for _ in documents]
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for doc_index, citations in executor.map(run, jobs):
+                results[doc_index].extend(citations)
+
+        for citations in results:
+            citations.sort(key=lambda item: item.get('start_index') or 0)
+        return results[0] if single else results
+
+    def _lookup_chunk(
+        self,
+        chunk: str,
+        offset: int,
+        throttle: _LookupThrottle,
+        max_throttle_retries: int,
+    ) -> List[Dict[str, Any]]:
+        """Look up one chunk, following up on citations beyond the server cap."""
+        found = []
+        remaining, base = chunk, offset
+        throttled = 0
+        while remaining.strip():
+            throttle.wait()
+            try:
+                response = self.lookup_citations(remaining)
+            except RateLimitError as e:
+                if throttled >= max_throttle_retries:
+                    raise
+                throttled += 1
+                delay = e.retry_after
+                if delay is None:
+                    delay = self.client.config.rate_limit_delay
+                throttle.back_off(delay)
+                continue
+
+            capped_at = None
+            for item in response or []:
+                if item.get('status') == 429:
+                    if item.get('start_index') is not None:
+                        start = item['start_index']
+                        capped_at = start if capped_at is None else min(capped_at, start)
+                    continue
+                item = dict(item)
+                for key in ('start_index', 'end_index'):
+                    if item.get(key) is not None:
+                        item[key] += base
+                found.append(item)
+
+            if capped_at is None:
+                break
+            if capped_at == 0:
+                # Nothing was looked up, so back off before resubmitting the same text
+                if throttled >= max_throttle_retries:
+                    raise RateLimitError("Citation lookup was capped before the first citation")
+                throttled += 1
+                throttle.back_off(self.client.config.rate_limit_delay)
+                continue
+            # Resubmit the text from the first citation the server skipped
+            remaining, base = remaining[capped_at:], base + capped_at
+        return found
+
     def list_citations(self, page: int = 1, **filters) -> Dict[str, Any]:
         params = filters.copy() if filters else {}
         params['page'] = page
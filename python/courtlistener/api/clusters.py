@@ -88,7 +88,9 @@ class ClustersAPI(BaseAPI):
         params.update(filters)
         
         response = self.client.get("/clusters/", params=params)
-        return [OpinionCluster(item) for item in response.get("results", [])]
+        clusters = [OpinionCluster(item) for item in response.get("results", [])]
+        self._index_locally(clusters)
+        return clusters
     
     def get_cluster(self, cluster_id: int) -> OpinionCluster:
         """Get a specific opinion cluster by ID.
@@ -104,7 +106,9 @@ class ClustersAPI(BaseAPI):
             CourtListenerError: If the API request fails
         """
         response = self.client.get(f"/clusters/{cluster_id}/")
-        return OpinionCluster(response)
+        cluster = OpinionCluster(response)
+        self._index_locally([cluster])
+        return cluster
     
     def get_clusters_by_court(self, court_id: int,
                              filters: Optional[Dict[str, Any]] = None,
@@ -257,14 +261,18 @@ class ClustersAPI(BaseAPI):
     def list_opinion_clusters(self, page: int = 1, **filters) -> Dict[str, Any]:
         params = filters.copy() if filters else {}
         params['page'] = page
-        return self.client.get('clusters/', params=params)
+        response = self.client.get('clusters/', params=params)
+        self._index_locally(response.get('results', []))
+        return response
 
     def search_opinion_clusters(self, q: str = None, page: int = 1, **filters) -> Dict[str, Any]:
         params = filters.copy() if filters else {}
         if q:
             params['q'] = q
         params['page'] = page
-        return self.client.get('clusters/', params=params)
+        response = self.client.get('clusters/', params=params)
+        self._index_locally(response.get('results', []))
+        return response
 
     def search_clusters(self, q: str, page: int = 1, **filters) -> List[OpinionCluster]:
         """Search opinion clusters."""
@@ -2,19 +2,51 @@
 Courts API client for CourtListener.
 """
 
+import threading
 from typing import List, Optional, Dict, Any, Union
 from ..models.court import Court
 from ..exceptions import NotFoundError, APIError
+from ..utils.court_catalog import CourtCatalog, DEFAULT_TTL
 from .base import BaseAPI
 
+# Results per page of courts/, used to page through a loaded catalog
+COURTS_PAGE_SIZE = 20
+
 
 class CourtsAPI(BaseAPI):
     """API client for courts endpoints."""
     
+    def __init__(self, client):
+        super().__init__(client)
+        self._catalog: Optional[CourtCatalog] = None
+        self._catalog_lock = threading.Lock()
+    
     def _get_endpoint(self) -> str:
         """Get the API endpoint for this module."""
         return "courts/"
     
+    def catalog(self, path: Optional[str] = None, ttl: float = DEFAULT_TTL, refresh: bool = False) -> CourtCatalog:
+        """
+        Get the catalog of every court, loaded once and then served from memory.
+        
+        Args:
+            path: JSON file to keep the court records in between runs
+            ttl: Seconds the stored copy stays fresh (default: 30 days)
+            refresh: Reload from the API even if a catalog is already loaded
+        
+        Returns:
+            CourtCatalog instance
+        """
+        with self._catalog_lock:
+            if self._catalog is None or refresh:
+                self._catalog = CourtCatalog.load(self.client, path=path, ttl=ttl, refresh=refresh)
+            return self._catalog
+    
+    def _catalog_page(self, courts: List[Court], page: int) -> List[Court]:
+        """One page of catalog courts, sliced like the API would page them."""
+        start = (page - 1) * COURTS_PAGE_SIZE
+        return courts[start:start + COURTS_PAGE_SIZE]
+    
     def list(self, page: int = 1, q: str = None, filters: dict = None, **kwargs) -> List[Court]:
         """
         List courts with optional filtering and pagination.
@@ -99,7 +131,7 @@ class CourtsAPI(BaseAPI):
     
     def get_federal_courts(self, page: int = 1) -> List[Court]:
         """
-        Get federal courts.
+        Get federal courts, from the catalog once ``catalog()`` has loaded it.
         
         Args:
             page: Page number for pagination
@@ -107,11 +139,13 @@ class CourtsAPI(BaseAPI):
         Returns:
             List of Court objects
         """
+        if self._catalog is not None:
+            return self._catalog_page(self._catalog.get_federal_courts(), page)
         return self.list_courts(page=page, jurisdiction="F")
     
     def get_state_courts(self, page: int = 1) -> List[Court]:
         """
-        Get state courts.
+        Get state courts, from the catalog once ``catalog()`` has loaded it.
         
         Args:
             page: Page number for pagination
@@ -119,11 +153,13 @@ class CourtsAPI(BaseAPI):
         Returns:
             List of Court objects
         """
+        if self._catalog is not None:
+            return self._catalog_page(self._catalog.get_state_courts(), page)
         return self.list_courts(page=page, jurisdiction="S")
     
     def get_court_by_url(self, court_url: str) -> Court:
         """
-        Get court by URL.
+        Get court by URL, from the catalog once ``catalog()`` has loaded it.
         
         Args:
             court_url: Court URL
@@ -131,6 +167,11 @@ class CourtsAPI(BaseAPI):
         Returns:
             Court object
         """
+        if self._catalog is not None:
+            try:
+                return self._catalog.get_court_by_url(court_url)
+            except NotFoundError:
+                pass  # Added after the catalog was fetched
         # Extract court ID from URL
         court_id = court_url.rstrip('/').split('/')[-1]
         return self.get_court(court_id)
@@ -147,13 +188,19 @@ class CourtsAPI(BaseAPI):
         return self.client.get('dockets/', params=params)
     
     def get_territorial_courts(self, page: int = 1) -> List[Court]:
-        """Get territorial courts."""
+        """Get territorial courts (from the catalog once loaded)."""
+        if self._catalog is not None:
+            return self._catalog_page(self._catalog.get_territorial_courts(), page)
         return self.list_courts(page=page, jurisdiction="T")
     
     def get_active_courts(self, page: int = 1) -> List[Court]:
-        """Get active courts."""
+        """Get active courts (from the catalog once loaded)."""
+        if self._catalog is not None:
+            return self._catalog_page(self._catalog.get_active_courts(), page)
         return self.list_courts(page=page, is_active=True)
     
     def get_defunct_courts(self, page: int = 1) -> List[Court]:
-        """Get defunct courts."""
+        """Get defunct courts (from the catalog once loaded)."""
+        if self._catalog is not None:
+            return self._catalog_page(self._catalog.get_defunct_courts(), page)
         return self.list_courts(page=page, is_active=False) 
\ No newline at end of file
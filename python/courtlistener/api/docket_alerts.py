@@ -2,7 +2,9 @@
 Docket Alerts API module for CourtListener SDK.
 """
 
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Iterable
+from ..utils.alert_sync import SyncResult, sync_docket_alerts
+from ..utils.docket_watcher import DocketWatcher
 from .base import BaseAPI
 
 
@@ -94,7 +96,7 @@ class DocketAlertsAPI(BaseAPI):
         Returns:
             Updated docket alert data
         """
-        return self.client.post(f"{self.endpoint}{alert_id}/", data=kwargs)
+        return self.client._make_request('PATCH', f"{self.endpoint}{alert_id}/", json_data=kwargs)
     
     def delete(self, alert_id: int) -> bool:
         """
@@ -134,3 +136,53 @@ class DocketAlertsAPI(BaseAPI):
         
         params.update(kwargs)
         return self.client.paginate(self.endpoint, params=params)
+
+    def sync(
+        self,
+        desired_docket_ids: Iterable[Any],
+        alert_type: Optional[str] = None,
+        delete_missing: bool = True,
+        max_workers: int = 4,
+        dry_run: bool = False,
+        **kwargs
+    ) -> SyncResult:
+        """
+        Reconcile docket alerts with a desired set of dockets in one pass.
+
+        Existing alerts are paged through once and only the missing alerts
+        are created and the unwanted ones deleted, concurrently. An
+        unsubscription on a desired docket is switched back to a
+        subscription rather than counted as an alert. Running the
+        same sync again is a no-op, and a sync that failed part-way is
+        finished by running it again.
+
+        Args:
+            desired_docket_ids: Docket IDs or URLs to have alerts on
+            alert_type: Alert type for new alerts
+            delete_missing: Delete alerts on dockets that are not desired
+            max_workers: Concurrent create/delete requests
+            dry_run: Only compute the changes
+            **kwargs: Extra fields for new alerts (e.g. ``webhook_url``)
+
+        Returns:
+            SyncResult with the created, updated and deleted alerts
+        """
+        return sync_docket_alerts(
+            self, desired_docket_ids, alert_type=alert_type, delete_missing=delete_missing,
+            max_workers=max_workers, dry_run=dry_run, **kwargs
+        )
+    
+    def watch(self, **kwargs) -> DocketWatcher:
+        """
+        Create a watcher that polls every docket with a docket alert.
+
+        Call ``sync_alerts()`` on the watcher to pick up subscription changes.
+
+        Args:
+            **kwargs: Passed to ``DocketWatcher`` (e.g. ``interval``,
+                ``callback``, ``state_path``)
+
+        Returns:
+            DocketWatcher instance (not yet started)
+        """
+        return DocketWatcher.from_alerts(self.client, **kwargs)
@@ -8,6 +8,7 @@ filings or events within a docket.
 from typing import Dict, List, Optional, Any, Union, TYPE_CHECKING
 from ..models.docket_entry import DocketEntry
 from ..utils.filters import build_filters
+from ..utils.docket_watcher import DocketWatcher
 from .base import BaseAPI
 
 if TYPE_CHECKING:
@@ -83,6 +84,21 @@ class DocketEntriesAPI(BaseAPI):
         """
         return self.search_docket_entries(page=page, **filters)
     
+    def watch(self, dockets, **kwargs) -> DocketWatcher:
+        """
+        Create a watcher that finds new entries of many dockets with batched
+        ``date_modified__gt`` queries instead of polling each docket.
+
+        Args:
+            dockets: Docket IDs or URLs to watch
+            **kwargs: Passed to ``DocketWatcher`` (e.g. ``since``,
+                ``interval``, ``callback``, ``queue``, ``state_path``)
+
+        Returns:
+            DocketWatcher instance (not yet started)
+        """
+        return DocketWatcher(self.client, dockets, **kwargs)
+    
     def list_entries(self, docket_id: Optional[int] = None, 
                     filters: Optional[Dict[str, Any]] = None,
                     limit: Optional[int] = None) -> List[DocketEntry]:
@@ -2,7 +2,8 @@
 Financial Disclosures API module for CourtListener SDK.
 """
 
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Sequence
+from ..utils.disclosures import DisclosureHistory
 from .base import BaseAPI
 
 
@@ -76,3 +77,33 @@ class FinancialDisclosuresAPI(BaseAPI):
         
         params.update(kwargs)
         return self.client.paginate(self.endpoint, params=params)
+
+    def history(
+        self,
+        judges,
+        year: Optional[int] = None,
+        tables: Optional[Sequence[str]] = None,
+        max_workers: int = 8,
+        batch_size: int = 100,
+    ) -> DisclosureHistory:
+        """
+        Fetch the full disclosure history of one or more judges.
+
+        Reports are listed per judge, then every sub-resource (investments,
+        gifts, debts, agreements, reimbursements, non-investment incomes,
+        spouse incomes, disclosure positions) is paginated for batches of
+        reports concurrently into columnar tables.
+
+        Args:
+            judges: Judge ID or URL, or an iterable of them
+            year: Only fetch reports for this year
+            tables: Sub-resource tables to fetch (default: all)
+            max_workers: Concurrent requests
+            batch_size: Reports per sub-resource request
+
+        Returns:
+            DisclosureHistory with one ``ColumnTable`` per resource
+        """
+        return DisclosureHistory.from_api(
+            self.client, judges, year=year, tables=tables, max_workers=max_workers, batch_size=batch_size,
+        )
@@ -2,9 +2,11 @@
 Judges API client for CourtListener.
 """
 
+import threading
 from typing import List, Optional, Dict, Any, Union
 from ..models.judge import Judge
 from ..exceptions import NotFoundError, APIError
+from ..utils.judge_directory import JudgeDirectory, DEFAULT_TTL
 from .base import BaseAPI
 
 
@@ -14,11 +16,30 @@ class JudgesAPI(BaseAPI):
     def __init__(self, client):
         self.client = client
         self.base_url = f"{client.config.base_url}/people"
+        self._directory = None
+        self._directory_lock = threading.Lock()
     
     def _get_endpoint(self) -> str:
         """Get the API endpoint for this module."""
         return "people/"
     
+    def directory(self, path: Optional[str] = None, ttl: float = DEFAULT_TTL, refresh: bool = False) -> JudgeDirectory:
+        """
+        Get the local judge directory, loaded once and then served from memory.
+        
+        Args:
+            path: JSON file to keep the records in between runs
+            ttl: Seconds the stored copy stays fresh (default: 7 days)
+            refresh: Reload from the API even if a directory is already loaded
+        
+        Returns:
+            JudgeDirectory instance
+        """
+        with self._directory_lock:
+            if self._directory is None or refresh:
+                self._directory = JudgeDirectory.load(self.client, path=path, ttl=ttl, refresh=refresh)
+            return self._directory
+    
     def _get_model_class(self):
         """Get the model class associated with this API."""
         return Judge
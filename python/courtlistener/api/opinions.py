@@ -87,12 +87,16 @@ class OpinionsAPI(BaseAPI):
         params.update(kwargs)
         
         response = self.client.get("/opinions/", params=params)
-        return [Opinion(item) for item in response.get("results", [])]
+        opinions = [Opinion(item) for item in response.get("results", [])]
+        self._index_locally(opinions)
+        return opinions
     
     def get_opinion(self, opinion_id: int) -> Opinion:
         """Get a specific opinion by ID."""
         response = self.client.get(f"/opinions/{opinion_id}/")
-        return Opinion(response)
+        opinion = Opinion(response)
+        self._index_locally([opinion])
+        return opinion
 
     def search_opinions(self, q: str, page: int = 1, **filters) -> List[Opinion]:
         """Search opinions."""
@@ -101,6 +105,7 @@ class OpinionsAPI(BaseAPI):
     def get_opinion_cluster(self, cluster_id: int) -> Dict[str, Any]:
         """Get an opinion cluster."""
         response = self.client.get(f"/clusters/{cluster_id}/")
+        self._index_locally([response])
         return response
     
     def list_opinion_clusters(self, page: int = 1, **filters) -> Dict[str, Any]:
@@ -108,6 +113,7 @@ class OpinionsAPI(BaseAPI):
         params = {"page": page}
         params.update(filters)
         response = self.client.get("/clusters/", params=params)
+        self._index_locally(response.get("results", []))
         return response
     
     def get_opinions_in_cluster(self, cluster_id: int, **filters) -> List[Opinion]:
@@ -115,7 +121,9 @@ class OpinionsAPI(BaseAPI):
         params = {"cluster": cluster_id}
         params.update(filters)
         response = self.client.get("/opinions/", params=params)
-        return [Opinion(item) for item in response.get("results", [])]
+        opinions = [Opinion(item) for item in response.get("results", [])]
+        self._index_locally(opinions)
+        return opinions
     
     def get_citations(self, opinion_id: int, **filters) -> Dict[str, Any]:
         """Get citations for an opinion."""
@@ -128,4 +136,6 @@ class OpinionsAPI(BaseAPI):
         """Get sub-opinions for an opinion."""
         params = {"parent_opinion": opinion_id}
         response = self.client.get("/opinions/", params=params)
-        return [Opinion(item) for item in response.get("results", [])] 
\ No newline at end of file
+        opinions = [Opinion(item) for item in response.get("results", [])]
+        self._index_locally(opinions)
+        return opinions 
\ No newline at end of file
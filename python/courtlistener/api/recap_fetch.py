@@ -4,6 +4,7 @@ RECAP Fetch API module for CourtListener SDK.
 
 from typing import Dict, Any, Optional, List
 from .base import BaseAPI
+from ..utils.recap_jobs import RecapJobManager
 
 
 class RecapFetchAPI(BaseAPI):
@@ -25,6 +26,34 @@ class RecapFetchAPI(BaseAPI):
         """
         return self.client.get(self.endpoint, params=kwargs)
     
+    def create(self, **data) -> Dict[str, Any]:
+        """
+        Queue a PACER fetch.
+        
+        Args:
+            **data: Fetch fields (``request_type``, ``docket``,
+                ``recap_document``, ``pacer_username``, ``pacer_password``...)
+        
+        Returns:
+            Created RECAP fetch operation data
+        """
+        created: Dict[str, Any] = self.client.post(self.endpoint, data=data)
+        return created
+    
+    def jobs(self, **kwargs) -> RecapJobManager:
+        """
+        Get a job manager that submits fetches and polls them in batches.
+        
+        Args:
+            **kwargs: ``RecapJobManager`` options (``initial_interval``,
+                ``max_interval``, ``backoff``, ``batch_size``, ``timeout``,
+                ``callback``)
+        
+        Returns:
+            RecapJobManager instance
+        """
+        return RecapJobManager(self.client, **kwargs)
+    
     def get(self, fetch_id: int) -> Dict[str, Any]:
         """
         Get a specific RECAP fetch operation by ID.
@@ -5,11 +5,13 @@ This module provides a high-level facade for interacting with the CourtListener
 """
 
 import logging
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Literal, Optional, Union, overload
 
 from ..config import Config
 from ..exceptions import CourtListenerError
 from ..utils.pagination import PageIterator
+from ..utils.scheduler import request_priority
+from ..utils.streaming import StreamedPage
 from ..transport import Transport
 from ..endpoints import EndpointRegistry, DisabledEndpoint
 
@@ -25,6 +27,14 @@ class CourtListenerClient:
         max_retries: Optional[int] = None,
         retry_delay: Optional[float] = None,
         rate_limit_delay: Optional[float] = None,
+        accept_encoding: Optional[str] = None,
+        budget=None,
+        api_tokens: Optional[List[str]] = None,
+        token_requests_per_second: Optional[float] = None,
+        circuit_breaker=None,
+        concurrency_limiter=None,
+        hedging=None,
+        scheduler=None,
     ):
         """
         Initialize CourtListener client.
@@ -36,6 +46,21 @@ class CourtListenerClient:
             max_retries: Maximum number of retries for failed requests
             retry_delay: Delay between retries in seconds
             rate_limit_delay: Delay when rate limited in seconds
+            accept_encoding: ``Accept-Encoding`` header value (default:
+                gzip/deflate plus zstd and brotli when installed)
+            budget: Optional ``RequestBudget`` that every request is counted
+                against
+            api_tokens: Several API tokens; requests are spread across them
+                and rotate away from tokens that get 401 or 429 responses
+            token_requests_per_second: Request rate allowed per API token
+                (e.g. ``5000 / 3600`` for 5,000 per hour)
+            circuit_breaker: Optional ``CircuitBreaker`` that fails requests
+                fast while the API is failing
+            concurrency_limiter: Optional ``AdaptiveConcurrencyLimiter``
+                bounding in-flight requests across threads
+            hedging: Optional ``HedgingPolicy`` that duplicates slow GETs
+            scheduler: Optional ``RequestScheduler`` that admits requests by
+                priority (see ``priority()``)
         """
         self.config = Config(
             api_token=api_token,
@@ -44,15 +69,28 @@ class CourtListenerClient:
             max_retries=max_retries,
             retry_delay=retry_delay,
             rate_limit_delay=rate_limit_delay,
+            accept_encoding=accept_encoding,
+            api_tokens=api_tokens,
+            token_requests_per_second=token_requests_per_second,
         )
         
         # Initialize transport layer
         self.transport = Transport(self.config)
         self.session = self.transport.session  # For backward compatibility
+        self.transfer_stats = self.transport.transfer_stats
+        self.hooks = self.transport.hooks
+        self.transport.budget = budget
+        self.transport.circuit_breaker = circuit_breaker
+        self.transport.concurrency_limiter = concurrency_limiter
+        self.transport.hedging = hedging
+        self.transport.scheduler = scheduler
         
         # Initialize logger
         self.logger = logging.getLogger(__name__)
         
+        # Optional local search index fed by opinions/clusters as they are fetched
+        self.local_index = None
+        
         # Initialize API endpoint registry
         self.registry = EndpointRegistry(self)
         
@@ -120,6 +158,95 @@ class CourtListenerClient:
         """Get the API token."""
         return self.config.api_token
     
+    @property
+    def budget(self):
+        """Request budget enforced by the transport (None if unlimited)."""
+        return self.transport.budget
+    
+    @budget.setter
+    def budget(self, budget):
+        self.transport.budget = budget
+    
+    @property
+    def token_pool(self):
+        """Token pool requests are spread across (None with a single token)."""
+        return self.transport.token_pool
+    
+    @token_pool.setter
+    def token_pool(self, pool):
+        self.transport.token_pool = pool
+    
+    @property
+    def circuit_breaker(self):
+        """Circuit breaker guarding requests (None if disabled)."""
+        return self.transport.circuit_breaker
+    
+    @circuit_breaker.setter
+    def circuit_breaker(self, breaker):
+        self.transport.circuit_breaker = breaker
+    
+    @property
+    def concurrency_limiter(self):
+        """Adaptive concurrency limiter for requests (None if disabled)."""
+        return self.transport.concurrency_limiter
+    
+    @concurrency_limiter.setter
+    def concurrency_limiter(self, limiter):
+        self.transport.concurrency_limiter = limiter
+    
+    @property
+    def hedging(self):
+        """Hedging policy for slow GETs (None if disabled)."""
+        return self.transport.hedging
+    
+    @hedging.setter
+    def hedging(self, policy):
+        self.transport.hedging = policy
+    
+    @property
+    def scheduler(self):
+        """Priority scheduler for requests (None if disabled)."""
+        return self.transport.scheduler
+    
+    @scheduler.setter
+    def scheduler(self, scheduler):
+        self.transport.scheduler = scheduler
+    
+    def priority(self, priority):
+        """
+        Context manager running the requests made inside it at a priority.
+        
+        Args:
+            priority: ``'interactive'``, ``'normal'`` or ``'bulk'``
+        
+        Returns:
+            Context manager; only has an effect when a ``scheduler`` is set
+        """
+        return request_priority(priority)
+    
+    @overload
+    def _make_request(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = ...,
+        data: Optional[Dict[str, Any]] = ...,
+        json_data: Optional[Dict[str, Any]] = ...,
+        stream: Literal[False] = ...,
+    ) -> Dict[str, Any]: ...
+    
+    @overload
+    def _make_request(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = ...,
+        data: Optional[Dict[str, Any]] = ...,
+        json_data: Optional[Dict[str, Any]] = ...,
+        *,
+        stream: Literal[True],
+    ) -> StreamedPage: ...
+    
     def _make_request(
         self,
         method: str,
@@ -127,7 +254,8 @@ class CourtListenerClient:
         params: Optional[Dict[str, Any]] = None,
         data: Optional[Dict[str, Any]] = None,
         json_data: Optional[Dict[str, Any]] = None,
-    ) -> Dict[str, Any]:
+        stream: bool = False,
+    ) -> Union[Dict[str, Any], StreamedPage]:
         """
         Make HTTP request to the API (delegates to transport layer).
         
@@ -137,6 +265,7 @@ class CourtListenerClient:
             params: Query parameters
             data: Form data
             json_data: JSON data for POST requests
+            stream: Return a StreamedPage that decodes results incrementally
         
         Returns:
             API response data
@@ -144,6 +273,8 @@ class CourtListenerClient:
         Raises:
             Various CourtListenerError subclasses for different error conditions
         """
+        if stream:
+            return self.transport._make_request(method, endpoint, params, data, json_data, stream=True)
         return self.transport._make_request(method, endpoint, params, data, json_data)
     
     def _handle_response(self, response):
@@ -169,17 +300,21 @@ class CourtListenerClient:
         """Make POST request to API endpoint."""
         return self.transport.post(endpoint, data, json_data)
     
-    def paginate(self, endpoint: str, params: Optional[Dict[str, Any]] = None) -> PageIterator:
+    def paginate(self, endpoint: str, params: Optional[Dict[str, Any]] = None, stream: bool = False) -> PageIterator:
         """
         Get paginated results from an endpoint.
         
         Args:
             endpoint: API endpoint path
             params: Query parameters
+            stream: Decode each page incrementally so items are yielded as
+                bytes arrive instead of after the whole page is parsed
         
         Returns:
             PageIterator for iterating through results
         """
+        if stream:
+            return PageIterator(self, endpoint, params, stream=True)
         return PageIterator(self, endpoint, params)
     
     def test_connection(self) -> bool:
@@ -3,9 +3,15 @@ Configuration management for the CourtListener SDK.
 """
 
 import os
-from typing import Optional
+from typing import List, Optional
 from .exceptions import ValidationError
 
+try:
+    from urllib3.response import HTTPResponse as _HTTPResponse
+    _CONTENT_DECODERS = tuple(getattr(_HTTPResponse, 'CONTENT_DECODERS', ('gzip', 'deflate')))
+except ImportError:
+    _CONTENT_DECODERS = ('gzip', 'deflate')
+
 # Load environment variables from .env file if it exists
 try:
     from dotenv import load_dotenv
@@ -14,6 +20,17 @@ except ImportError:
     pass
 
 
+def supported_encodings() -> str:
+    """
+    Build an ``Accept-Encoding`` value from the codecs urllib3 can decode.
+
+    zstd and brotli are only offered when ``zstandard`` and ``brotli`` are
+    installed; gzip and deflate are always available.
+    """
+    preferred = ('zstd', 'br', 'gzip', 'deflate')
+    return ', '.join(encoding for encoding in preferred if encoding in _CONTENT_DECODERS)
+
+
 class Config:
     """Configuration class for CourtListener SDK."""
     
@@ -32,6 +49,9 @@ class Config:
         max_retries: Optional[int] = None,
         retry_delay: Optional[float] = None,
         rate_limit_delay: Optional[float] = None,
+        accept_encoding: Optional[str] = None,
+        api_tokens: Optional[List[str]] = None,
+        token_requests_per_second: Optional[float] = None,
     ):
         """
         Initialize configuration.
@@ -43,13 +63,30 @@ class Config:
             max_retries: Maximum number of retries for failed requests
             retry_delay: Delay between retries in seconds
             rate_limit_delay: Delay when rate limited in seconds
+            accept_encoding: ``Accept-Encoding`` header value (default: every
+                compression codec the installed urllib3 can decode; pass
+                ``'identity'`` to disable compression)
+            api_tokens: Several API tokens to spread requests across; the
+                first one is used when ``api_token`` is not given
+            token_requests_per_second: Request rate allowed per API token
+                (e.g. ``5000 / 3600`` for 5,000 per hour); requests are
+                paced per token when set
         """
-        self.api_token = api_token or self._get_api_token_from_env()
+        tokens = [token for token in (api_tokens or []) if token]
+        if not api_token and not tokens:
+            api_token = self._get_api_token_from_env()
+            tokens = self._get_api_tokens_from_env()
+        self.api_token = api_token or (tokens[0] if tokens else None)
+        self.api_tokens = list(dict.fromkeys([self.api_token] + tokens)) if self.api_token else []
         self.base_url = base_url or self.DEFAULT_BASE_URL
         self.timeout = timeout or self.DEFAULT_TIMEOUT
         self.max_retries = max_retries or self.DEFAULT_MAX_RETRIES
         self.retry_delay = retry_delay or self.DEFAULT_RETRY_DELAY
         self.rate_limit_delay = rate_limit_delay or self.DEFAULT_RATE_LIMIT_DELAY
+        self.accept_encoding = accept_encoding or supported_encodings()
+        if token_requests_per_second is None:
+            token_requests_per_second = self._get_token_rate_from_env()
+        self.token_requests_per_second = token_requests_per_second
         
         self._validate_config()
     
@@ -57,6 +94,21 @@ class Config:
         """Get API token from environment variables."""
         return os.getenv("COURTLISTENER_API_TOKEN")
     
+    def _get_api_tokens_from_env(self) -> List[str]:
+        """Get a comma-separated list of API tokens from environment variables."""
+        value = os.getenv("COURTLISTENER_API_TOKENS") or ""
+        return [token.strip() for token in value.split(",") if token.strip()]
+    
+    def _get_token_rate_from_env(self) -> Optional[float]:
+        """Get the per-token request rate from environment variables."""
+        value = os.getenv("COURTLISTENER_TOKEN_REQUESTS_PER_SECOND")
+        if not value:
+            return None
+        try:
+            return float(value)
+        except ValueError:
+            raise ValidationError("COURTLISTENER_TOKEN_REQUESTS_PER_SECOND must be a number")
+    
     def _validate_config(self):
         """Validate configuration settings."""
         if not self.api_token:
@@ -73,6 +125,9 @@ class Config:
         
         if self.rate_limit_delay < 0:
             raise ValidationError("Rate limit delay must be non-negative")
+        
+        if self.token_requests_per_second is not None and self.token_requests_per_second <= 0:
+            raise ValidationError("Token requests per second must be greater than 0")
     
     def get_headers(self) -> dict:
         """Get default headers for API requests."""
@@ -80,6 +135,7 @@ class Config:
             "Authorization": f"Token {self.api_token}",
             "Content-Type": "application/json",
             "User-Agent": f"CourtListener-SDK/{self._get_version()}",
+            "Accept-Encoding": self.accept_encoding,
         }
     
     def _get_version(self) -> str:
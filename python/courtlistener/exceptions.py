@@ -2,6 +2,8 @@
 Custom exceptions for the CourtListener SDK.
 """
 
+from typing import Optional
+
 
 class CourtListenerError(Exception):
     """Base exception for all CourtListener SDK errors."""
@@ -66,6 +68,22 @@ class TimeoutError(CourtListenerError):
 class AcceptedError(CourtListenerError):
     """Raised when an asynchronous request is accepted (HTTP 202)."""
     
-    def __init__(self, message: str = "Request accepted and being processed asynchronously", status_code: int = 202, retry_after: int = None):
+    def __init__(self, message: str = "Request accepted and being processed asynchronously", status_code: int = 202, retry_after: Optional[int] = None):
         super().__init__(message, status_code)
-        self.retry_after = retry_after 
\ No newline at end of file
+        self.retry_after = retry_after
+
+
+class BudgetExceededError(CourtListenerError):
+    """Raised when a request would exceed a hard request-budget cap."""
+    
+    def __init__(self, message: str = "Request budget exceeded", retry_after: Optional[float] = None):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class CircuitOpenError(CourtListenerError):
+    """Raised when the circuit breaker is open and requests fail fast."""
+    
+    def __init__(self, message: str = "Circuit breaker is open", retry_after: Optional[float] = None):
+        super().__init__(message)
+        self.retry_after = retry_after
@@ -0,0 +1,128 @@
+"""
+Request lifecycle hooks for the CourtListener SDK.
+
+Callbacks registered on ``Transport.hooks`` (also ``client.hooks``) are
+invoked around every HTTP attempt:
+
+- ``before_request(context)``: before each attempt; hooks may edit
+  ``context.request_kwargs`` (headers, params, timeout) to act as middleware
+- ``after_response(context, response)``: when a response arrives, before it
+  is turned into data or an exception
+- ``on_retry(context, error, delay)``: when an attempt failed and will be
+  retried after ``delay`` seconds
+- ``on_error(context, error)``: when the request finally fails
+"""
+
+import logging
+import threading
+from typing import Dict, Any, Callable, List, Optional
+
+from .exceptions import ValidationError
+
+HOOK_EVENTS = ('before_request', 'after_response', 'on_retry', 'on_error')
+
+
+class RequestContext:
+    """State of one logical request, shared by every attempt."""
+
+    def __init__(
+        self,
+        method: str,
+        url: str,
+        endpoint: str,
+        request_kwargs: Dict[str, Any],
+    ):
+        """
+        Initialize the request context.
+
+        Args:
+            method: HTTP method
+            url: Full request URL
+            endpoint: Normalized endpoint path (e.g. ``'opinions/{id}/'``)
+            request_kwargs: Keyword arguments passed to ``Session.request``
+        """
+        self.method = method
+        self.url = url
+        self.endpoint = endpoint
+        self.request_kwargs = request_kwargs
+        self.attempt = 0
+        self.status_code: Optional[int] = None
+        self.elapsed: Optional[float] = None
+        # Free-form storage for hooks that need to pass state between events
+        self.extra: Dict[str, Any] = {}
+
+    @property
+    def params(self) -> Optional[Dict[str, Any]]:
+        """Query parameters of the request."""
+        return self.request_kwargs.get('params')
+
+    def __repr__(self) -> str:
+        """String representation of the context."""
+        return f"RequestContext(method='{self.method}', endpoint='{self.endpoint}', attempt={self.attempt})"
+
+
+class HookRegistry:
+    """Thread-safe registry of request lifecycle callbacks."""
+
+    def __init__(self):
+        """Initialize an empty registry."""
+        self._lock = threading.Lock()
+        self._hooks: Dict[str, List[Callable]] = {event: [] for event in HOOK_EVENTS}
+        self.logger = logging.getLogger(__name__)
+
+    def register(self, event: str, callback: Optional[Callable] = None):
+        """
+        Register a callback for an event.
+
+        Can be used directly or as a decorator::
+
+            @client.hooks.register('after_response')
+            def log_status(context, response):
+                ...
+
+        Args:
+            event: One of ``HOOK_EVENTS``
+            callback: Callable to invoke
+
+        Returns:
+            The callback (or a decorator when ``callback`` is omitted)
+        """
+        self._check_event(event)
+        if callback is None:
+            return lambda func: self.register(event, func)
+        with self._lock:
+            self._hooks[event] = self._hooks[event] + [callback]
+        return callback
+
+    def unregister(self, event: str, callback: Callable) -> None:
+        """Remove a previously registered callback; unknown callbacks are ignored."""
+        self._check_event(event)
+        with self._lock:
+            self._hooks[event] = [hook for hook in self._hooks[event] if hook != callback]
+
+    def emit(self, event: str, *args) -> None:
+        """
+        Invoke every callback registered for ``event``.
+
+        A failing callback is logged and never breaks the request.
+        """
+        # Lists are replaced, never mutated, so this read needs no lock
+        for callback in self._hooks[event]:
+            try:
+                callback(*args)
+            except Exception:
+                self.logger.exception("%s hook %r failed", event, callback)
+
+    def has_hooks(self, event: str) -> bool:
+        """Check whether any callback is registered for ``event``."""
+        return bool(self._hooks[event])
+
+    def clear(self) -> None:
+        """Remove all callbacks."""
+        with self._lock:
+            self._hooks = {event: [] for event in HOOK_EVENTS}
+
+    @staticmethod
+    def _check_event(event: str) -> None:
+        if event not in HOOK_EVENTS:
+            raise ValidationError(f"Unknown hook event: {event}. Use one of {', '.join(HOOK_EVENTS)}")
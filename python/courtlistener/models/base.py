@@ -6,6 +6,8 @@ from typing import Dict, Any, Optional, List
 from datetime import datetime, date
 import json
 
+from .. import tracing
+
 
 class BaseModel:
     """Base class for all CourtListener data models."""
@@ -18,7 +20,11 @@ class BaseModel:
             data: Dictionary containing model data from API response
         """
         self._data = data
-        self._parse_data()
+        if not tracing.is_enabled():
+            self._parse_data()
+            return
+        with tracing.span(f"{self.__class__.__name__}.parse"):
+            self._parse_data()
     
     def _parse_data(self):
         """Parse raw data into model attributes. Override in subclasses."""
@@ -55,6 +61,26 @@ class BaseModel:
                     pass
         return result
     
+    def resolved(self, field: str, default: Any = None) -> Any:
+        """
+        Object (or list of objects) a hyperlinked field points to.
+
+        Available once a ``ReferenceResolver`` has resolved this model; a
+        model attached for lazy resolution is resolved, together with the
+        rest of its batch, on first access.
+        
+        Args:
+            field: Field name (e.g. ``'court'``)
+            default: Value returned if the field was not resolved
+        
+        Returns:
+            Model instance(s) for the field, or ``default``
+        """
+        resolver = self.__dict__.get('_resolver')
+        if resolver is not None and field not in self.__dict__.get('_resolved', {}):
+            resolver._flush()
+        return self.__dict__.get('_resolved', {}).get(field, default)
+    
     def to_json(self, indent: Optional[int] = None) -> str:
         """Convert model to JSON string."""
         return json.dumps(self.to_dict(), indent=indent, default=str)
@@ -8,9 +8,31 @@ from .base import BaseModel
 class Opinion(BaseModel):
     """Model for opinion data."""
     
+    # Optional OpinionTextStore that holds bodies removed from _data
+    _text_store = None
+    
     def __init__(self, data: dict):
         super().__init__(data)
     
+    def attach_text_store(self, store) -> None:
+        """
+        Load text bodies lazily from an ``OpinionTextStore``.
+        
+        Fields missing from the API data are read from the store (by
+        ``sha1``) each time they are accessed instead of being kept in memory.
+        
+        Args:
+            store: OpinionTextStore holding this opinion's bodies
+        """
+        self._text_store = store
+    
+    def _text(self, field: str) -> Optional[str]:
+        """Get a text body from the API data, falling back to the text store."""
+        value: Optional[str] = self._data.get(field, None)
+        if value is None and self._text_store is not None and self.sha1:
+            value = self._text_store.get_body(self.sha1, field)
+        return value
+    
     @property
     def id(self) -> int:
         """Opinion ID."""
@@ -131,37 +153,37 @@ class Opinion(BaseModel):
     @property
     def plain_text(self) -> str:
         """Plain text content."""
-        return self._data.get('plain_text', None)
+        return self._text('plain_text')
     
     @property
     def html(self) -> str:
         """HTML content."""
-        return self._data.get('html', None)
+        return self._text('html')
     
     @property
     def html_lawbox(self) -> str:
         """Lawbox HTML content."""
-        return self._data.get('html_lawbox', None)
+        return self._text('html_lawbox')
     
     @property
     def html_columbia(self) -> str:
         """Columbia HTML content."""
-        return self._data.get('html_columbia', None)
+        return self._text('html_columbia')
     
     @property
     def html_anon_2020(self) -> str:
         """Anonymous 2020 HTML content."""
-        return self._data.get('html_anon_2020', None)
+        return self._text('html_anon_2020')
     
     @property
     def xml_harvard(self) -> str:
         """Harvard XML content."""
-        return self._data.get('xml_harvard', None)
+        return self._text('xml_harvard')
     
     @property
     def html_with_citations(self) -> str:
         """HTML with citations."""
-        return self._data.get('html_with_citations', None)
+        return self._text('html_with_citations')
     
     @property
     def sha1(self) -> str:
@@ -0,0 +1,147 @@
+"""
+Optional OpenTelemetry tracing for the CourtListener SDK.
+
+When enabled, every public API method call (e.g. ``DocketsAPI.list_all_dockets``)
+records a span, with child spans for each page fetched by ``PageIterator``,
+each HTTP attempt made by ``Transport`` and each model constructed from the
+response. Tracing is off by default; while disabled every instrumentation
+point is a single global check and no OpenTelemetry code is imported or run.
+
+Requires ``opentelemetry-api`` (``pip install courtlistener-sdk-python[tracing]``)
+plus whichever OpenTelemetry SDK/exporter the application configures.
+"""
+
+import functools
+import inspect
+from contextlib import nullcontext
+from typing import Dict, Any, Callable, Optional
+
+try:
+    from opentelemetry import context as otel_context
+    from opentelemetry import trace as otel_trace
+except ImportError:
+    otel_context = None  # type: ignore[assignment]
+    otel_trace = None  # type: ignore[assignment]
+
+from .exceptions import CourtListenerError
+
+# Active tracer; None means tracing is disabled
+_tracer = None
+
+_DISABLED = nullcontext()
+
+
+def enable_tracing(tracer=None) -> None:
+    """
+    Turn tracing on.
+
+    Args:
+        tracer: OpenTelemetry ``Tracer`` to record spans with (default: the
+            ``courtlistener`` tracer from the global tracer provider)
+    """
+    global _tracer
+    if otel_trace is None:
+        raise CourtListenerError(
+            "Tracing requires the opentelemetry-api package. "
+            "Install it with: pip install courtlistener-sdk-python[tracing]"
+        )
+    if tracer is None:
+        from . import __version__
+        tracer = otel_trace.get_tracer('courtlistener', __version__)
+    _tracer = tracer
+
+
+def disable_tracing() -> None:
+    """Turn tracing off."""
+    global _tracer
+    _tracer = None
+
+
+def is_enabled() -> bool:
+    """Check whether tracing is on."""
+    return _tracer is not None
+
+
+def span(name: str, attributes: Optional[Dict[str, Any]] = None, context=None):
+    """
+    Context manager that records a span when tracing is on.
+
+    Args:
+        name: Span name
+        attributes: Span attributes
+        context: Parent context (default: the current context)
+
+    Returns:
+        Context manager yielding the span, or None when tracing is off
+    """
+    tracer = _tracer
+    if tracer is None:
+        return _DISABLED
+    return tracer.start_as_current_span(name, context=context, attributes=attributes)
+
+
+def current_context():
+    """
+    Capture the current trace context so later work can be parented to it.
+
+    Returns:
+        OpenTelemetry context, or None when tracing is off
+    """
+    if _tracer is None:
+        return None
+    return otel_context.get_current()
+
+
+def traced(func: Callable) -> Callable:
+    """
+    Record a span named ``<Class>.<method>`` around each call of a method.
+
+    Generator methods keep their span open, and current, while the caller
+    iterates, so page fetches made during iteration become its children.
+    """
+    if getattr(func, '_traced', False):
+        return func
+
+    if inspect.isgeneratorfunction(func):
+        @functools.wraps(func)
+        def wrapper(self, *args, **kwargs):
+            tracer = _tracer
+            if tracer is None:
+                return func(self, *args, **kwargs)
+            name = f"{type(self).__name__}.{func.__name__}"
+            return _traced_generator(tracer, name, func(self, *args, **kwargs))
+    else:
+        @functools.wraps(func)
+        def wrapper(self, *args, **kwargs):
+            tracer = _tracer
+            if tracer is None:
+                return func(self, *args, **kwargs)
+            with tracer.start_as_current_span(f"{type(self).__name__}.{func.__name__}"):
+                return func(self, *args, **kwargs)
+
+    setattr(wrapper, '_traced', True)
+    return wrapper
+
+
+def trace_public_methods(cls: type) -> type:
+    """Apply ``traced`` to every public function defined directly on ``cls``."""
+    for name, value in list(vars(cls).items()):
+        if not name.startswith('_') and inspect.isfunction(value):
+            setattr(cls, name, traced(value))
+    return cls
+
+
+def _traced_generator(tracer, name: str, generator):
+    """Iterate ``generator`` with a span that is current during each step."""
+    current = tracer.start_span(name)
+    try:
+        while True:
+            with otel_trace.use_span(current, end_on_exit=False):
+                try:
+                    item = next(generator)
+                except StopIteration:
+                    return
+            yield item
+    finally:
+        generator.close()
+        current.end()
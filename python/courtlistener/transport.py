@@ -4,11 +4,16 @@ HTTP Transport layer for the CourtListener SDK.
 This module handles all HTTP communication, retries, timeouts, and response processing.
 """
 
+import re
+import threading
 import time
 import requests
 import logging
-from typing import Dict, Any, Optional
-from urllib.parse import urljoin
+from contextlib import nullcontext
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from typing import Dict, Any, Literal, Optional, Union, overload
+from urllib.parse import urljoin, urlparse
 
 from .exceptions import (
     CourtListenerError,
@@ -17,9 +22,131 @@ from .exceptions import (
     NotFoundError,
     APIError,
     AcceptedError,
+    CircuitOpenError,
     ConnectionError,
     TimeoutError,
 )
+from . import tracing
+from .hooks import HookRegistry, RequestContext
+from .utils.scheduler import current_priority
+from .utils.streaming import StreamedPage
+from .utils.token_pool import TokenPool
+
+_ID_SEGMENT_RE = re.compile(r'/\d+(?=/|$)')
+
+
+class TransferStats:
+    """Thread-safe per-endpoint counters of bytes on the wire vs. decoded."""
+    
+    def __init__(self):
+        """Initialize empty counters."""
+        self._lock = threading.Lock()
+        self._endpoints: Dict[str, Dict[str, Any]] = {}
+    
+    def record(self, endpoint: str, wire_bytes: int, decoded_bytes: int, encoding: Optional[str] = None) -> None:
+        """
+        Record one response body.
+        
+        Args:
+            endpoint: Normalized endpoint path (e.g. ``'opinions/{id}/'``)
+            wire_bytes: Bytes received over the network (compressed)
+            decoded_bytes: Bytes after content decoding
+            encoding: ``Content-Encoding`` of the response, if any
+        """
+        with self._lock:
+            stats = self._endpoints.setdefault(
+                endpoint, {'requests': 0, 'wire_bytes': 0, 'decoded_bytes': 0, 'encodings': {}}
+            )
+            stats['requests'] += 1
+            stats['wire_bytes'] += wire_bytes
+            stats['decoded_bytes'] += decoded_bytes
+            encoding = encoding or 'identity'
+            stats['encodings'][encoding] = stats['encodings'].get(encoding, 0) + 1
+    
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get a copy of the counters, largest wire volume first.
+        
+        Returns:
+            Dict mapping endpoint to ``requests``, ``wire_bytes``,
+            ``decoded_bytes``, ``ratio`` (wire/decoded) and ``encodings``
+        """
+        with self._lock:
+            items = [
+                (endpoint, dict(stats, encodings=dict(stats['encodings'])))
+                for endpoint, stats in self._endpoints.items()
+            ]
+        for _, stats in items:
+            stats['ratio'] = stats['wire_bytes'] / stats['decoded_bytes'] if stats['decoded_bytes'] else 1.0
+        items.sort(key=lambda item: item[1]['wire_bytes'], reverse=True)
+        return dict(items)
+    
+    def totals(self) -> Dict[str, int]:
+        """Get request and byte totals across all endpoints."""
+        with self._lock:
+            return {
+                'requests': sum(s['requests'] for s in self._endpoints.values()),
+                'wire_bytes': sum(s['wire_bytes'] for s in self._endpoints.values()),
+                'decoded_bytes': sum(s['decoded_bytes'] for s in self._endpoints.values()),
+            }
+    
+    def reset(self) -> None:
+        """Clear all counters."""
+        with self._lock:
+            self._endpoints.clear()
+
+
+class _CountingReader:
+    """File-like wrapper that counts decoded bytes read from a stream."""
+    
+    def __init__(self, fileobj):
+        self._fileobj = fileobj
+        self.bytes_read = 0
+    
+    def read(self, size: int = -1) -> bytes:
+        data: bytes = self._fileobj.read(size)
+        self.bytes_read += len(data)
+        return data
+
+
+def _wire_bytes(response, decoded_bytes: int) -> int:
+    """Bytes read off the socket, falling back to Content-Length or the decoded size."""
+    tell = getattr(getattr(response, 'raw', None), 'tell', None)
+    if callable(tell):
+        try:
+            wire = tell()
+        except (OSError, ValueError):
+            wire = None
+        if isinstance(wire, int) and not isinstance(wire, bool):
+            return wire
+    headers = getattr(response, 'headers', None) or {}
+    length = headers.get('Content-Length') if hasattr(headers, 'get') else None
+    if isinstance(length, str) and length.isdigit():
+        return int(length)
+    return decoded_bytes
+
+
+def _run_in_thread(func, *args) -> Future:
+    """Run ``func`` on a new daemon thread and return a future of its result."""
+    future: Future = Future()
+
+    def run():
+        future.set_running_or_notify_cancel()
+        try:
+            future.set_result(func(*args))
+        except BaseException as e:
+            future.set_exception(e)
+
+    threading.Thread(target=run, name='courtlistener-request', daemon=True).start()
+    return future
+
+
+def _close_response(future) -> None:
+    """Release the connection of a hedged response that lost the race."""
+    if future.exception() is None:
+        close = getattr(future.result(), 'close', None)
+        if callable(close):
+            close()
 
 
 class Transport:
@@ -36,6 +163,49 @@ class Transport:
         self.session = requests.Session()
         self.session.headers.update(self.config.get_headers())
         self.logger = logging.getLogger(__name__)
+        self.transfer_stats = TransferStats()
+        self.hooks = HookRegistry()
+        # Optional RequestBudget charged for every HTTP attempt
+        self.budget = None
+        # Rotate across tokens when the config has more than one
+        tokens = getattr(config, 'api_tokens', None)
+        rate = getattr(config, 'token_requests_per_second', None)
+        self.token_pool = None
+        if isinstance(tokens, list) and (len(tokens) > 1 or (tokens and rate)):
+            # A single token only needs a pool to pace it
+            self.token_pool = TokenPool(tokens, requests_per_second=rate)
+        # Optional CircuitBreaker and AdaptiveConcurrencyLimiter
+        self.circuit_breaker = None
+        self.concurrency_limiter = None
+        # Optional RequestScheduler admitting requests by priority
+        self.scheduler = None
+        # Optional HedgingPolicy for idempotent GETs
+        self.hedging = None
+        self._hedge_executor = None
+        self._hedge_lock = threading.Lock()
+    
+    @overload
+    def _make_request(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = ...,
+        data: Optional[Dict[str, Any]] = ...,
+        json_data: Optional[Dict[str, Any]] = ...,
+        stream: Literal[False] = ...,
+    ) -> Dict[str, Any]: ...
+    
+    @overload
+    def _make_request(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = ...,
+        data: Optional[Dict[str, Any]] = ...,
+        json_data: Optional[Dict[str, Any]] = ...,
+        *,
+        stream: Literal[True],
+    ) -> StreamedPage: ...
     
     def _make_request(
         self,
@@ -44,7 +214,8 @@ class Transport:
         params: Optional[Dict[str, Any]] = None,
         data: Optional[Dict[str, Any]] = None,
         json_data: Optional[Dict[str, Any]] = None,
-    ) -> Dict[str, Any]:
+        stream: bool = False,
+    ) -> Union[Dict[str, Any], StreamedPage]:
         """
         Make HTTP request to the API.
         
@@ -54,6 +225,8 @@ class Transport:
             params: Query parameters
             data: Form data
             json_data: JSON data for POST requests
+            stream: Decode the ``results`` array incrementally and return a
+                StreamedPage instead of a dict
         
         Returns:
             API response data
@@ -81,11 +254,53 @@ class Transport:
         if json_data:
             request_kwargs['json'] = json_data
         
+        if stream:
+            request_kwargs['stream'] = True
+        
+        context = RequestContext(method, url, self._endpoint_key(url), request_kwargs)
+        # Captured once so retries keep the caller's priority
+        priority = current_priority()
+        
         # Make request with retry logic
         for attempt in range(self.config.max_retries + 1):
+            context.attempt = attempt
+            token = self.config.api_token
             try:
-                response = self.session.request(method, url, **request_kwargs)
-                return self._handle_response(response)
+                with tracing.span(f"HTTP {method}", self._span_attributes(context)) as attempt_span:
+                    scheduler = self.scheduler
+                    with scheduler.slot(priority) if scheduler is not None else nullcontext():
+                        # Token and budget waits happen inside the slot, so the
+                        # scheduler decides which request gets the next token
+                        if self.token_pool is not None:
+                            token = self.token_pool.acquire()
+                            request_kwargs['headers'] = dict(request_kwargs.get('headers') or {}, Authorization=f"Token {token}")
+                        if self.budget is not None:
+                            self.budget.acquire(context.endpoint, token)
+                        self.hooks.emit('before_request', context)
+                        slot = self.concurrency_limiter.acquire() if self.concurrency_limiter is not None else None
+                        # A half-open trial is only handed back by recording an
+                        # outcome, so take it right before the request is sent
+                        if self.circuit_breaker is not None:
+                            try:
+                                self.circuit_breaker.allow()
+                            except CircuitOpenError:
+                                if slot is not None and self.concurrency_limiter is not None:
+                                    self.concurrency_limiter.cancel(slot)
+                                raise
+                        started = time.monotonic()
+                        if self.hedging is not None and not stream and self.hedging.applies_to(method, context.endpoint):
+                            response, token = self._send_hedged(method, url, request_kwargs, context, token, slot)
+                        else:
+                            response = self._send(method, url, request_kwargs, slot)
+                    context.elapsed = time.monotonic() - started
+                    context.status_code = response.status_code
+                    if attempt_span is not None:
+                        attempt_span.set_attribute('http.response.status_code', response.status_code)
+                    self.hooks.emit('after_response', context, response)
+                    if stream:
+                        return self._handle_stream_response(response, url)
+                    self._record_transfer(url, response)
+                    return self._handle_response(response)
             
             except requests.exceptions.Timeout as exc:
                 if attempt == self.config.max_retries:
@@ -93,8 +308,8 @@ class Transport:
                     message = "Request timed out"
                     if detail:
                         message = f"{message}: {detail}"
-                    raise TimeoutError(message)
-                time.sleep(self.config.retry_delay)
+                    raise self._give_up(context, TimeoutError(message))
+                self._wait_for_retry(context, exc, self.config.retry_delay)
             
             except requests.exceptions.ConnectionError as exc:
                 if attempt == self.config.max_retries:
@@ -102,32 +317,212 @@ class Transport:
                     message = "Failed to connect to API"
                     if detail:
                         message = f"{message}: {detail}"
-                    raise ConnectionError(message)
-                time.sleep(self.config.retry_delay)
+                    raise self._give_up(context, ConnectionError(message))
+                self._wait_for_retry(context, exc, self.config.retry_delay)
             
             except requests.exceptions.RequestException as e:
                 if attempt == self.config.max_retries:
-                    raise CourtListenerError(f"Request failed: {str(e)}")
-                time.sleep(self.config.retry_delay)
+                    raise self._give_up(context, CourtListenerError(f"Request failed: {str(e)}"))
+                self._wait_for_retry(context, e, self.config.retry_delay)
             
             except APIError as e:
                 if attempt == self.config.max_retries:
-                    raise e
-                time.sleep(self.config.retry_delay)
+                    raise self._give_up(context, e)
+                self._wait_for_retry(context, e, self.config.retry_delay)
             
             except RateLimitError as e:
+                if self.token_pool is not None:
+                    self.token_pool.report(token, 429, e.retry_after)
                 if attempt == self.config.max_retries:
-                    raise e
-                # Use retry_after if available, otherwise use rate_limit_delay
-                delay = getattr(e, 'retry_after', None) or self.config.rate_limit_delay
-                time.sleep(delay)
+                    raise self._give_up(context, e)
+                if self.token_pool is not None:
+                    # The pool rests this token and waits only if all are resting
+                    delay = 0
+                else:
+                    # Use retry_after if available, otherwise use rate_limit_delay
+                    delay = getattr(e, 'retry_after', None) or self.config.rate_limit_delay
+                    if self.scheduler is not None:
+                        # Hold the whole queue so the retry is re-admitted by priority
+                        self.scheduler.pause(delay)
+                        delay = 0
+                self._wait_for_retry(context, e, delay)
             
             except AcceptedError as e:
-                if attempt == self.config.max_retries:
-                    raise e
-                # Use retry_after if available, otherwise use retry_delay
-                delay = getattr(e, 'retry_after', None) or self.config.retry_delay
-                time.sleep(delay)
+                # The work is queued server-side; callers such as
+                # RecapJobManager schedule the follow-up from Retry-After
+                raise self._give_up(context, e)
+            
+            except AuthenticationError as e:
+                if self.token_pool is None:
+                    raise self._give_up(context, e)
+                # Take the rejected token out of rotation and try another one
+                self.token_pool.report(token, 401)
+                if attempt == self.config.max_retries or not self.token_pool.has_available():
+                    raise self._give_up(context, e)
+                self._wait_for_retry(context, e, 0)
+            
+            except CourtListenerError as e:
+                # Not retryable (authentication, not found, validation, budget, open circuit)
+                raise self._give_up(context, e)
+    
+    def _send(self, method: str, url: str, request_kwargs: Dict[str, Any], slot: Optional[float]) -> requests.Response:
+        """Send one HTTP request and record its outcome."""
+        try:
+            response = self.session.request(method, url, **request_kwargs)
+        except Exception as exc:
+            self._record_outcome(slot, error=exc)
+            raise
+        self._record_outcome(slot, status_code=response.status_code)
+        return response
+    
+    def _send_hedged(
+        self,
+        method: str,
+        url: str,
+        request_kwargs: Dict[str, Any],
+        context: RequestContext,
+        token: Optional[str],
+        slot: Optional[float],
+    ):
+        """
+        Send a request, plus a duplicate if it is slower than the hedging delay.
+        
+        Args:
+            method: HTTP method
+            url: Request URL
+            request_kwargs: Arguments for ``session.request``
+            context: Context of the current attempt
+            token: API token the request is sent with
+            slot: Concurrency limiter ticket held by the request
+        
+        Returns:
+            Tuple of the first successful response and the token it was sent with
+        """
+        policy = self.hedging
+        if policy is None:
+            # Hedging was switched off since the request was admitted
+            return self._send(method, url, request_kwargs, slot), token
+        started = time.monotonic()
+        # The primary gets its own thread rather than a pool worker, so hedged
+        # GETs are never capped or queued behind each other; the caller thread
+        # waits for whichever response lands first
+        primary = _run_in_thread(self._send, method, url, request_kwargs, slot)
+        
+        def observe(future):
+            if future.exception() is None:
+                policy.observe(context.endpoint, time.monotonic() - started)
+        
+        primary.add_done_callback(observe)
+        try:
+            return primary.result(timeout=policy.delay(context.endpoint)), token
+        except FutureTimeoutError:
+            pass
+        
+        hedge = self._start_hedge(self._get_hedge_executor(policy), method, url, request_kwargs, context)
+        if hedge is None:
+            return primary.result(), token
+        secondary, hedge_token = hedge
+        
+        done, _ = wait([primary, secondary], return_when=FIRST_COMPLETED)
+        first = primary if primary in done else secondary
+        other = secondary if first is primary else primary
+        winner = first
+        if first.exception() is not None and other.exception() is None:
+            winner = other
+        loser = other if winner is first else first
+        loser.add_done_callback(_close_response)
+        policy.record_hedge(won=winner is secondary)
+        return winner.result(), (hedge_token if winner is secondary else token)
+    
+    def _start_hedge(self, executor, method: str, url: str, request_kwargs: Dict[str, Any], context: RequestContext):
+        """
+        Send the hedge request if the breaker, limiter, token pool and budget allow it.
+        
+        Returns:
+            Tuple of the hedge future and its token, or None if no hedge was sent
+        """
+        if self.circuit_breaker is not None and self.circuit_breaker.state != self.circuit_breaker.CLOSED:
+            return None
+        if self.scheduler is not None and not self.scheduler.try_acquire(current_priority()):
+            return None
+        slot = None
+        if self.concurrency_limiter is not None:
+            slot = self.concurrency_limiter.try_acquire()
+            if slot is None:
+                self._release_scheduler()
+                return None
+        token = self.config.api_token
+        hedge_kwargs = request_kwargs
+        if self.token_pool is not None:
+            # Never wait for a token: a hedge only uses spare capacity
+            token = self.token_pool.try_acquire()
+            if token is not None:
+                hedge_kwargs = dict(
+                    request_kwargs,
+                    headers=dict(request_kwargs.get('headers') or {}, Authorization=f"Token {token}"),
+                )
+        allowed = token is not None or self.token_pool is None
+        if allowed and self.budget is not None:
+            allowed = self.budget.try_acquire(context.endpoint, token)
+        if not allowed:
+            if slot is not None and self.concurrency_limiter is not None:
+                self.concurrency_limiter.cancel(slot)
+            self._release_scheduler()
+            return None
+        self.logger.debug("Hedging slow %s request to %s", method, context.endpoint)
+        future = executor.submit(self._send, method, url, hedge_kwargs, slot)
+        future.add_done_callback(lambda _: self._release_scheduler())
+        return future, token
+    
+    def _release_scheduler(self) -> None:
+        if self.scheduler is not None:
+            self.scheduler.release()
+    
+    def _get_hedge_executor(self, policy) -> ThreadPoolExecutor:
+        """Thread pool shared by hedge requests (not primaries), created on first use."""
+        with self._hedge_lock:
+            if self._hedge_executor is None:
+                self._hedge_executor = ThreadPoolExecutor(
+                    max_workers=policy.max_workers, thread_name_prefix='courtlistener-hedge'
+                )
+            return self._hedge_executor
+    
+    def _record_outcome(
+        self,
+        slot: Optional[float],
+        status_code: Optional[int] = None,
+        error: Optional[Exception] = None,
+    ) -> None:
+        """Feed an attempt's outcome to the circuit breaker and concurrency limiter."""
+        failed = isinstance(error, (requests.exceptions.Timeout, requests.exceptions.ConnectionError))
+        if isinstance(status_code, int):
+            failed = status_code >= 500
+        if self.circuit_breaker is not None:
+            self.circuit_breaker.record(success=not failed)
+        if slot is not None and self.concurrency_limiter is not None:
+            self.concurrency_limiter.release(slot, congested=failed or status_code == 429)
+    
+    @staticmethod
+    def _span_attributes(context: RequestContext) -> Optional[Dict[str, Any]]:
+        """Attributes for an HTTP attempt span (None while tracing is off)."""
+        if not tracing.is_enabled():
+            return None
+        return {
+            'http.request.method': context.method,
+            'url.full': context.url,
+            'courtlistener.endpoint': context.endpoint,
+            'courtlistener.attempt': context.attempt,
+        }
+    
+    def _wait_for_retry(self, context: RequestContext, error: Exception, delay: float) -> None:
+        """Notify ``on_retry`` hooks, then sleep before the next attempt."""
+        self.hooks.emit('on_retry', context, error, delay)
+        time.sleep(delay)
+    
+    def _give_up(self, context: RequestContext, error: Exception) -> Exception:
+        """Notify ``on_error`` hooks and return the error to raise."""
+        self.hooks.emit('on_error', context, error)
+        return error
     
     def _handle_response(self, response: requests.Response) -> Dict[str, Any]:
         """
@@ -142,9 +537,16 @@ class Transport:
         Raises:
             Various CourtListenerError subclasses based on response status
         """
-        if response.status_code == 200:
+        if response.status_code in (200, 201):
             return response.json()
         
+        elif response.status_code == 202:
+            # Accepted for asynchronous processing; not retried here
+            raise AcceptedError(retry_after=self._retry_after(response))
+        
+        elif response.status_code == 204:
+            return {}
+        
         elif response.status_code == 401:
             raise AuthenticationError("Invalid API token")
         
@@ -152,14 +554,7 @@ class Transport:
             raise NotFoundError("Resource not found")
         
         elif response.status_code == 429:
-            # Rate limited - extract Retry-After header if present
-            retry_after = None
-            if 'Retry-After' in response.headers:
-                try:
-                    retry_after = int(response.headers['Retry-After'])
-                except (ValueError, TypeError):
-                    pass
-            raise RateLimitError("Rate limit exceeded", retry_after=retry_after)
+            raise RateLimitError("Rate limit exceeded", retry_after=self._retry_after(response))
         
         elif response.status_code >= 500:
             raise APIError(f"Server error: {response.status_code}")
@@ -174,10 +569,79 @@ class Transport:
             
             raise APIError(error_message, response.status_code)
     
+    @staticmethod
+    def _retry_after(response: requests.Response) -> Optional[int]:
+        """Seconds from the Retry-After header, if present."""
+        try:
+            return int(response.headers['Retry-After'])
+        except (KeyError, ValueError, TypeError):
+            return None
+    
+    def _handle_stream_response(self, response: requests.Response, url: str) -> Union[Dict[str, Any], StreamedPage]:
+        """
+        Wrap a successful streamed response in a StreamedPage.
+        
+        Error responses are read in full and handled by ``_handle_response``.
+        
+        Args:
+            response: HTTP response object opened with ``stream=True``
+            url: Request URL, used to attribute transfer sizes
+        
+        Returns:
+            StreamedPage over the response body (the parsed body for any
+            other success status)
+        """
+        if response.status_code != 200:
+            try:
+                self._record_transfer(url, response)
+                return self._handle_response(response)
+            finally:
+                response.close()
+        
+        # Let urllib3 undo the negotiated Content-Encoding while we read
+        response.raw.decode_content = True
+        reader = _CountingReader(response.raw)
+        
+        def close():
+            self._record_sizes(url, response, _wire_bytes(response, reader.bytes_read), reader.bytes_read)
+            response.close()
+        
+        return StreamedPage(reader, on_close=close)
+    
+    def _record_transfer(self, url: str, response: requests.Response) -> None:
+        """Record the compressed and decoded size of a fully read response."""
+        try:
+            decoded = len(response.content)
+        except (TypeError, requests.exceptions.RequestException):
+            return
+        self._record_sizes(url, response, _wire_bytes(response, decoded), decoded)
+    
+    def _record_sizes(self, url: str, response: requests.Response, wire: int, decoded: int) -> None:
+        headers = getattr(response, 'headers', None) or {}
+        encoding = headers.get('Content-Encoding') if hasattr(headers, 'get') else None
+        self.transfer_stats.record(
+            self._endpoint_key(url),
+            wire,
+            decoded,
+            encoding if isinstance(encoding, str) else None,
+        )
+    
+    def _endpoint_key(self, url: str) -> str:
+        """Reduce a request URL to its endpoint path with numeric ids collapsed."""
+        path = urlparse(url).path
+        base_path = urlparse(self.config.base_url).path
+        if base_path and path.startswith(base_path):
+            path = path[len(base_path):]
+        return _ID_SEGMENT_RE.sub('/{id}', '/' + path.lstrip('/'))[1:] or '/'
+    
     def get(self, endpoint: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """Make GET request to API endpoint."""
         return self._make_request('GET', endpoint, params=params)
     
+    def stream_get(self, endpoint: str, params: Optional[Dict[str, Any]] = None) -> StreamedPage:
+        """Make GET request and decode the page's results incrementally."""
+        return self._make_request('GET', endpoint, params=params, stream=True)
+    
     def post(self, endpoint: str, data: Optional[Dict[str, Any]] = None, json_data: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """Make POST request to API endpoint."""
         return self._make_request('POST', endpoint, data=data, json_data=json_data)
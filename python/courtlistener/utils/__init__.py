@@ -3,15 +3,69 @@ Utility functions for the CourtListener SDK.
 """
 
 from .pagination import Paginator, PageIterator
-from .filters import build_filters, build_date_range_filter
+from .filters import build_filters, build_date_range_filter, Query
 from .validators import validate_date, validate_citation, validate_docket_number
+from .citation_network import CitationNetwork
+from .citation_extractor import CitationExtractor, extract_citations, normalize_citation
+from .search_index import LocalSearchIndex
+from .text_store import OpinionTextStore
+from .downloads import DownloadManager
+from .streaming import StreamedPage
+from .metrics import MetricsCollector
+from .budget import RequestBudget, BudgetRule
+from .token_pool import TokenPool
+from .resilience import CircuitBreaker, AdaptiveConcurrencyLimiter
+from .hedging import HedgingPolicy
+from .scheduler import RequestScheduler, request_priority
+from .court_catalog import CourtCatalog
+from .resolver import ReferenceResolver
+from .judge_directory import JudgeDirectory, IntervalTree
+from .disclosures import DisclosureHistory, ColumnTable, parse_value_codes
+from .docket_watcher import DocketWatcher, DocketChange
+from .webhooks import WebhookReceiver, AsyncWebhookReceiver, WebhookQueue, WebhookEvent
+from .alert_sync import SyncResult
+from .recap_jobs import RecapJobManager, RecapJob
 
 __all__ = [
     "Paginator",
     "PageIterator",
     "build_filters",
     "build_date_range_filter",
+    "Query",
     "validate_date",
     "validate_citation",
     "validate_docket_number",
+    "CitationNetwork",
+    "CitationExtractor",
+    "extract_citations",
+    "normalize_citation",
+    "LocalSearchIndex",
+    "OpinionTextStore",
+    "DownloadManager",
+    "StreamedPage",
+    "MetricsCollector",
+    "RequestBudget",
+    "BudgetRule",
+    "TokenPool",
+    "CircuitBreaker",
+    "AdaptiveConcurrencyLimiter",
+    "HedgingPolicy",
+    "RequestScheduler",
+    "request_priority",
+    "CourtCatalog",
+    "ReferenceResolver",
+    "JudgeDirectory",
+    "IntervalTree",
+    "DisclosureHistory",
+    "ColumnTable",
+    "parse_value_codes",
+    "DocketWatcher",
+    "DocketChange",
+    "WebhookReceiver",
+    "AsyncWebhookReceiver",
+    "WebhookQueue",
+    "WebhookEvent",
+    "SyncResult",
+    "RecapJobManager",
+    "RecapJob",
 ] 
\ No newline at end of file
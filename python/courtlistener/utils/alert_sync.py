@@ -0,0 +1,235 @@
+"""
+Bulk alert reconciliation for the CourtListener SDK.
+
+``sync_alerts`` and ``sync_docket_alerts`` (exposed as ``AlertsAPI.sync`` and
+``DocketAlertsAPI.sync``) page through the existing alerts once, diff them
+against the desired state, and apply only the needed creates, updates and
+deletes concurrently. The diff is recomputed from the server on every run,
+so a sync is idempotent and an interrupted or partly failed sync is resumed
+by running it again.
+"""
+
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Dict, Any, Callable, Iterable, List, Optional, Tuple, Union
+
+from ..exceptions import ValidationError
+from .urls import parse_resource_id
+
+logger = logging.getLogger(__name__)
+
+# DocketAlert.alert_type values; an unsubscription opts a docket out of alerts
+_UNSUBSCRIPTION = 0
+_SUBSCRIPTION = 1
+
+
+class SyncResult:
+    """Outcome of an alert sync."""
+
+    def __init__(self, dry_run: bool = False):
+        """
+        Initialize the result.
+
+        Args:
+            dry_run: Whether the changes were only planned
+        """
+        self.dry_run = dry_run
+        self.created: List[Any] = []
+        self.updated: List[Any] = []
+        self.deleted: List[Any] = []
+        self.unchanged = 0
+        self.errors: List[Tuple[str, Any, Exception]] = []
+
+    @property
+    def ok(self) -> bool:
+        """True if every change was applied."""
+        return not self.errors
+
+    @property
+    def changes(self) -> int:
+        """Number of creates, updates and deletes (applied or planned)."""
+        return len(self.created) + len(self.updated) + len(self.deleted)
+
+    def __repr__(self) -> str:
+        """String representation of the result."""
+        return (
+            f"SyncResult(created={len(self.created)}, updated={len(self.updated)}, "
+            f"deleted={len(self.deleted)}, unchanged={self.unchanged}, errors={len(self.errors)}, "
+            f"dry_run={self.dry_run})"
+        )
+
+
+def _apply(operations: List[Tuple[str, Any, Callable[[], Any]]], result: SyncResult, max_workers: int) -> SyncResult:
+    """Run ``(kind, key, call)`` operations concurrently and record their outcome."""
+    if result.dry_run or not operations:
+        return result
+    buckets = {'create': result.created, 'update': result.updated, 'delete': result.deleted}
+
+    def run(operation):
+        kind, key, call = operation
+        try:
+            return kind, key, call(), None
+        except Exception as e:
+            return kind, key, None, e
+
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(operations)))) as executor:
+        for kind, key, value, error in executor.map(run, operations):
+            if error is not None:
+                logger.warning("Alert sync failed to %s %r: %s", kind, key, error)
+                result.errors.append((kind, key, error))
+            else:
+                buckets[kind].append(value if kind != 'delete' else key)
+    return result
+
+
+def sync_alerts(
+    api,
+    desired_alerts: Iterable[Dict[str, Any]],
+    key: Union[str, Callable[[Dict[str, Any]], Any]] = 'name',
+    delete_missing: bool = True,
+    max_workers: int = 4,
+    dry_run: bool = False,
+    **filters,
+) -> SyncResult:
+    """
+    Make the account's search alerts match ``desired_alerts``.
+
+    Args:
+        api: ``AlertsAPI`` instance
+        desired_alerts: Alert dicts with the ``create`` fields (``name``,
+            ``query``, ``rate``, optionally ``alert_type``, ``webhook_url``...)
+        key: Field (or function of an alert dict) identifying an alert;
+            existing alerts with the same key are updated in place if any
+            desired field differs
+        delete_missing: Delete existing alerts whose key is not desired
+        max_workers: Concurrent create/update/delete requests
+        dry_run: Only compute the changes
+        **filters: Limit the existing alerts considered (e.g.
+            ``alert_type='search'``), so alerts managed elsewhere are kept;
+            also used as defaults for the desired alerts
+
+    Returns:
+        SyncResult; ``created``/``updated`` hold the API responses (the
+        desired dicts on a dry run) and ``deleted`` the alert IDs
+    """
+    key_of = key if callable(key) else (lambda alert: alert.get(key))
+    desired: Dict[Any, Dict[str, Any]] = {}
+    for alert in desired_alerts:
+        alert = dict(filters, **alert)
+        alert_key = key_of(alert)
+        if alert_key is None:
+            raise ValidationError(f"Desired alert has no key: {alert!r}")
+        if alert_key in desired:
+            raise ValidationError(f"Duplicate desired alert: {alert_key!r}")
+        missing = [field for field in ('name', 'query', 'rate') if alert.get(field) is None]
+        if missing:
+            raise ValidationError(f"Desired alert {alert_key!r} is missing {', '.join(missing)}")
+        desired[alert_key] = alert
+
+    result = SyncResult(dry_run)
+    operations: List[Tuple[str, Any, Callable[[], Any]]] = []
+    seen = set()
+    existing = sorted(api.paginate(**filters), key=lambda alert: parse_resource_id(alert.get('id')) or 0)
+    for alert in existing:
+        alert_key = key_of(alert)
+        alert_id = parse_resource_id(alert.get('id'))
+        if alert_key in desired and alert_key not in seen:
+            seen.add(alert_key)
+            wanted = desired[alert_key]
+            changed = {field: value for field, value in wanted.items() if alert.get(field) != value}
+            if not changed:
+                result.unchanged += 1
+            elif dry_run:
+                result.updated.append(wanted)
+            else:
+                operations.append(('update', alert_id, partial(api.update, alert_id, **changed)))
+        elif alert_key in seen or delete_missing:
+            # Duplicates of a desired alert are always removed
+            if dry_run:
+                result.deleted.append(alert_id)
+            else:
+                operations.append(('delete', alert_id, partial(api.delete, alert_id)))
+    for alert_key, alert in desired.items():
+        if alert_key in seen:
+            continue
+        if dry_run:
+            result.created.append(alert)
+        else:
+            operations.append(('create', alert_key, partial(api.create, **alert)))
+    return _apply(operations, result, max_workers)
+
+
+def sync_docket_alerts(
+    api,
+    desired_docket_ids: Iterable[Any],
+    alert_type: Optional[str] = None,
+    delete_missing: bool = True,
+    max_workers: int = 4,
+    dry_run: bool = False,
+    **create_kwargs,
+) -> SyncResult:
+    """
+    Make the account's docket alerts cover exactly ``desired_docket_ids``.
+
+    Unsubscription records (``alert_type`` 0) never count as coverage: one
+    on a desired docket is switched back to a subscription, and one on any
+    other docket is kept.
+
+    Args:
+        api: ``DocketAlertsAPI`` instance
+        desired_docket_ids: Docket IDs or URLs
+        alert_type: Alert type for new alerts
+        delete_missing: Delete alerts on dockets that are not desired
+        max_workers: Concurrent create/delete requests
+        dry_run: Only compute the changes
+        **create_kwargs: Extra fields for new alerts (e.g. ``webhook_url``)
+
+    Returns:
+        SyncResult; ``created`` and ``updated`` hold the API responses (the
+        docket IDs on a dry run) and ``deleted`` the alert IDs
+    """
+    desired = []
+    for docket in desired_docket_ids:
+        docket_id = parse_resource_id(docket)
+        if docket_id is None:
+            raise ValidationError(f"Invalid docket: {docket!r}")
+        desired.append(docket_id)
+    desired_set = set(desired)
+
+    result = SyncResult(dry_run)
+    operations: List[Tuple[str, Any, Callable[[], Any]]] = []
+    seen = set()
+    unsubscribed: Dict[Any, Any] = {}
+    existing = sorted(api.paginate(), key=lambda alert: parse_resource_id(alert.get('id')) or 0)
+    for alert in existing:
+        docket_id = parse_resource_id(alert.get('docket'))
+        alert_id = parse_resource_id(alert.get('id'))
+        if alert.get('alert_type') in (_UNSUBSCRIPTION, str(_UNSUBSCRIPTION)):
+            if docket_id in desired_set:
+                unsubscribed.setdefault(docket_id, alert_id)
+        elif docket_id in desired_set and docket_id not in seen:
+            seen.add(docket_id)
+            result.unchanged += 1
+        elif docket_id in seen or delete_missing:
+            if dry_run:
+                result.deleted.append(alert_id)
+            else:
+                operations.append(('delete', alert_id, partial(api.delete, alert_id)))
+    for docket_id in dict.fromkeys(desired):
+        if docket_id in seen:
+            continue
+        if docket_id in unsubscribed:
+            # Docket alerts are unique per docket, so the opt-out itself is flipped
+            if dry_run:
+                result.updated.append(docket_id)
+            else:
+                resubscribe = dict(create_kwargs, alert_type=_SUBSCRIPTION if alert_type is None else alert_type)
+                operations.append(('update', docket_id, partial(api.update, unsubscribed[docket_id], **resubscribe)))
+        elif dry_run:
+            result.created.append(docket_id)
+        else:
+            operations.append((
+                'create', docket_id, partial(api.create, docket_id, alert_type=alert_type, **create_kwargs),
+            ))
+    return _apply(operations, result, max_workers)
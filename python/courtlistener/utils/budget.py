@@ -0,0 +1,365 @@
+"""
+Request budgets for the CourtListener SDK.
+
+``RequestBudget`` counts HTTP requests by endpoint and API token over rolling
+time windows and enforces caps such as "at most 4,000 requests per hour for
+this job". Hard caps stop (or delay) requests before they are sent; soft caps
+only warn. Counts live in memory by default, or in a SQLite file so that
+several processes on one host share one budget.
+"""
+
+import hashlib
+import logging
+import sqlite3
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Dict, Any, Callable, Iterable, List, Optional, Set, Tuple
+
+from ..exceptions import BudgetExceededError, ValidationError
+
+
+def _token_key(token: Optional[str]) -> str:
+    """Short fingerprint of a token so raw tokens are never stored."""
+    return hashlib.sha256(token.encode('utf-8')).hexdigest()[:16] if token else ''
+
+
+class BudgetRule:
+    """A cap on requests within a rolling window."""
+
+    def __init__(
+        self,
+        limit: int,
+        window: float,
+        endpoint: Optional[str] = None,
+        token: Optional[str] = None,
+        hard: bool = True,
+        name: Optional[str] = None,
+    ):
+        """
+        Initialize the rule.
+
+        Args:
+            limit: Maximum requests within the window
+            window: Window length in seconds (e.g. 3600 for hourly)
+            endpoint: Only count endpoints starting with this path (e.g.
+                ``'search/'``); all endpoints when omitted
+            token: Only count requests made with this API token; all tokens
+                when omitted
+            hard: Refuse requests over the cap (True) or only warn (False)
+            name: Name used in ``remaining()`` (default derived from the rule)
+        """
+        if limit < 1:
+            raise ValidationError("limit must be at least 1")
+        if window <= 0:
+            raise ValidationError("window must be greater than 0")
+        self.limit = int(limit)
+        self.window = float(window)
+        self.endpoint = endpoint.lstrip('/') if endpoint else None
+        self.token_key = _token_key(token) if token else None
+        self.hard = hard
+        self.name = name or f"{self.endpoint or '*'}:{self.limit}/{self.window:g}s"
+
+    def matches(self, endpoint: str, token_key: str) -> bool:
+        """Check whether a request counts against this rule."""
+        if self.endpoint is not None and not endpoint.startswith(self.endpoint):
+            return False
+        return self.token_key is None or self.token_key == token_key
+
+    def __repr__(self) -> str:
+        """String representation of the rule."""
+        kind = 'hard' if self.hard else 'soft'
+        return f"BudgetRule(name='{self.name}', limit={self.limit}, window={self.window:g}, {kind})"
+
+
+class _MemoryStore:
+    """Request log kept in this process, with one timestamp deque per rule."""
+
+    def __init__(self, rules: Iterable[BudgetRule]):
+        self._lock = threading.RLock()
+        self._log: deque = deque()
+        self._by_rule: Dict[int, deque] = {id(rule): deque() for rule in rules}
+        self._rules = list(rules)
+
+    @contextmanager
+    def transaction(self):
+        with self._lock:
+            yield
+
+    def record(self, ts: float, endpoint: str, token_key: str) -> None:
+        self._log.append((ts, endpoint, token_key))
+        for rule in self._rules:
+            if rule.matches(endpoint, token_key):
+                self._by_rule[id(rule)].append(ts)
+
+    def count(self, since: float, rule: BudgetRule) -> int:
+        timestamps = self._by_rule[id(rule)]
+        while timestamps and timestamps[0] <= since:
+            timestamps.popleft()
+        return len(timestamps)
+
+    def nth_oldest(self, since: float, rule: BudgetRule, n: int) -> Optional[float]:
+        self.count(since, rule)
+        timestamps = self._by_rule[id(rule)]
+        return timestamps[n] if n < len(timestamps) else None
+
+    def entries(self, since: float) -> Iterable[Tuple[float, str, str]]:
+        with self._lock:
+            return [entry for entry in self._log if entry[0] > since]
+
+    def prune(self, before: float) -> None:
+        while self._log and self._log[0][0] <= before:
+            self._log.popleft()
+
+    def close(self) -> None:
+        pass
+
+
+class _SQLiteStore:
+    """Request log in a SQLite file shared by every process that opens it."""
+
+    def __init__(self, path: str):
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(path, timeout=30, isolation_level=None, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS budget_requests (ts REAL NOT NULL, endpoint TEXT NOT NULL, token TEXT NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS budget_requests_ts ON budget_requests (ts)")
+
+    @contextmanager
+    def transaction(self):
+        # BEGIN IMMEDIATE takes the write lock up front, so check-then-record
+        # is atomic across processes
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._conn.execute("COMMIT")
+
+    def record(self, ts: float, endpoint: str, token_key: str) -> None:
+        self._conn.execute("INSERT INTO budget_requests VALUES (?, ?, ?)", (ts, endpoint, token_key))
+
+    def count(self, since: float, rule: BudgetRule) -> int:
+        where, args = self._where(since, rule)
+        return int(self._conn.execute("SELECT COUNT(*) FROM budget_requests" + where, args).fetchone()[0])
+
+    def nth_oldest(self, since: float, rule: BudgetRule, n: int) -> Optional[float]:
+        where, args = self._where(since, rule)
+        row = self._conn.execute(
+            "SELECT ts FROM budget_requests" + where + " ORDER BY ts LIMIT 1 OFFSET ?", args + [n]
+        ).fetchone()
+        return float(row[0]) if row else None
+
+    @staticmethod
+    def _where(since: float, rule: BudgetRule) -> Tuple[str, List[Any]]:
+        sql = " WHERE ts > ?"
+        args: List[Any] = [since]
+        if rule.endpoint is not None:
+            sql += " AND substr(endpoint, 1, ?) = ?"
+            args += [len(rule.endpoint), rule.endpoint]
+        if rule.token_key is not None:
+            sql += " AND token = ?"
+            args.append(rule.token_key)
+        return sql, args
+
+    def entries(self, since: float) -> Iterable[Tuple[float, str, str]]:
+        with self._lock:
+            return self._conn.execute(
+                "SELECT ts, endpoint, token FROM budget_requests WHERE ts > ?", (since,)
+            ).fetchall()
+
+    def prune(self, before: float) -> None:
+        self._conn.execute("DELETE FROM budget_requests WHERE ts <= ?", (before,))
+
+    def close(self) -> None:
+        self._conn.close()
+
+
+class RequestBudget:
+    """Thread- and process-safe request accounting with rolling-window caps."""
+
+    def __init__(
+        self,
+        rules: Iterable[BudgetRule],
+        path: Optional[str] = None,
+        block: bool = False,
+        max_wait: Optional[float] = None,
+        on_soft_limit: Optional[Callable[[BudgetRule, int], None]] = None,
+    ):
+        """
+        Initialize the budget.
+
+        Args:
+            rules: Caps to enforce
+            path: SQLite file shared across processes (default: in memory,
+                shared by the threads of this process only)
+            block: Wait for a hard cap's window to free up instead of raising
+            max_wait: Longest single wait when blocking, in seconds; raise
+                ``BudgetExceededError`` if the cap frees up later than that
+            on_soft_limit: Called with ``(rule, used)`` when a soft cap is
+                first exceeded within its window
+        """
+        self.rules = list(rules)
+        if not self.rules:
+            raise ValidationError("At least one budget rule is required")
+        self.block = block
+        self.max_wait = max_wait
+        self.on_soft_limit = on_soft_limit
+        self.path = path
+        self._store = _SQLiteStore(path) if path else _MemoryStore(self.rules)
+        self._max_window = max(rule.window for rule in self.rules)
+        self._soft_exceeded: Set[str] = set()
+        self.logger = logging.getLogger(__name__)
+
+    def acquire(self, endpoint: str, token: Optional[str] = None) -> None:
+        """
+        Count one request, enforcing every matching cap.
+
+        Args:
+            endpoint: Normalized endpoint path (e.g. ``'search/'``)
+            token: API token the request is made with
+
+        Raises:
+            BudgetExceededError: If a hard cap is exhausted (and ``block`` is
+                off, or the wait would exceed ``max_wait``)
+        """
+        while True:
+            wait, blocking_rule = self._reserve(endpoint, token)
+            if blocking_rule is None:
+                return
+            if not self.block or (self.max_wait is not None and wait > self.max_wait):
+                raise BudgetExceededError(
+                    f"Request budget '{blocking_rule.name}' exhausted for {endpoint}; "
+                    f"next request allowed in {wait:.1f}s",
+                    retry_after=wait,
+                )
+            time.sleep(wait)
+
+    def try_acquire(self, endpoint: str, token: Optional[str] = None) -> bool:
+        """
+        Count one request only if no hard cap is exhausted; never waits.
+
+        Args:
+            endpoint: Normalized endpoint path (e.g. ``'search/'``)
+            token: API token the request is made with
+
+        Returns:
+            True if the request was counted
+        """
+        return self._reserve(endpoint, token)[1] is None
+
+    def remaining(self, endpoint: Optional[str] = None, token: Optional[str] = None) -> Dict[str, int]:
+        """
+        Requests left in each rule's current window.
+
+        Args:
+            endpoint: Only report rules that apply to this endpoint
+            token: Only report rules that apply to this token
+
+        Returns:
+            Dict mapping rule name to remaining requests (0 when exhausted)
+        """
+        token_key = _token_key(token)
+        now = time.time()
+        result = {}
+        with self._store.transaction():
+            for rule in self.rules:
+                if endpoint is not None and rule.endpoint is not None and not endpoint.lstrip('/').startswith(rule.endpoint):
+                    continue
+                if token is not None and rule.token_key not in (None, token_key):
+                    continue
+                used = self._store.count(now - rule.window, rule)
+                result[rule.name] = max(rule.limit - used, 0)
+        return result
+
+    def reset_in(self, name: str) -> float:
+        """
+        Seconds until the named rule has room for another request.
+
+        Args:
+            name: Rule name
+
+        Returns:
+            0.0 if a request is allowed now
+        """
+        rule = next((rule for rule in self.rules if rule.name == name), None)
+        if rule is None:
+            raise ValidationError(f"Unknown budget rule: {name}")
+        now = time.time()
+        with self._store.transaction():
+            return self._wait_for(rule, self._store.count(now - rule.window, rule), now)
+
+    def usage(self, window: Optional[float] = None) -> Dict[str, Dict[str, int]]:
+        """
+        Requests counted per endpoint and token fingerprint.
+
+        Args:
+            window: Look-back in seconds (default: the longest rule window)
+
+        Returns:
+            ``{endpoint: {token_fingerprint: count}}``
+        """
+        since = time.time() - (window if window is not None else self._max_window)
+        result: Dict[str, Dict[str, int]] = {}
+        for _, endpoint, token_key in self._store.entries(since):
+            by_token = result.setdefault(endpoint, {})
+            by_token[token_key] = by_token.get(token_key, 0) + 1
+        return result
+
+    def close(self) -> None:
+        """Close the shared store."""
+        self._store.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def __repr__(self) -> str:
+        """String representation of the budget."""
+        return f"RequestBudget(rules={len(self.rules)}, path={self.path!r})"
+
+    def _reserve(self, endpoint: str, token: Optional[str]) -> Tuple[float, Optional[BudgetRule]]:
+        """Record a request if every hard cap allows it; returns ``_check``'s result."""
+        token_key = _token_key(token)
+        with self._store.transaction():
+            now = time.time()
+            self._store.prune(now - self._max_window)
+            wait, blocking_rule = self._check(now, endpoint, token_key)
+            if blocking_rule is None:
+                self._store.record(now, endpoint, token_key)
+            return wait, blocking_rule
+
+    def _check(self, now: float, endpoint: str, token_key: str) -> Tuple[float, Optional[BudgetRule]]:
+        """Return (wait, rule) for the first exhausted hard cap, or (0, None)."""
+        for rule in self.rules:
+            if not rule.matches(endpoint, token_key):
+                continue
+            used = self._store.count(now - rule.window, rule)
+            if used < rule.limit:
+                self._soft_exceeded.discard(rule.name)
+                continue
+            if rule.hard:
+                return self._wait_for(rule, used, now), rule
+            if rule.name not in self._soft_exceeded:
+                self._soft_exceeded.add(rule.name)
+                self.logger.warning("Soft request budget '%s' exceeded (%d requests)", rule.name, used + 1)
+                if self.on_soft_limit is not None:
+                    self.on_soft_limit(rule, used + 1)
+        return 0.0, None
+
+    def _wait_for(self, rule: BudgetRule, used: int, now: float) -> float:
+        """Seconds until enough of the ``used`` requests in the window have aged out."""
+        excess = used - rule.limit
+        if excess < 0:
+            return 0.0
+        oldest = self._store.nth_oldest(now - rule.window, rule, excess)
+        if oldest is None:
+            return 0.0
+        return max(oldest + rule.window - now, 0.0)
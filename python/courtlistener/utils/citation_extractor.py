@@ -0,0 +1,275 @@
+"""
+Local citation extraction for the CourtListener SDK.
+
+Finds and normalizes "volume reporter page" citations in text without calling
+the ``citation-lookup/`` endpoint, so large corpora can be pre-screened
+locally. All reporter patterns are compiled once into a single regular
+expression.
+"""
+
+import re
+from typing import Dict, Any, Iterator, List, Optional
+
+
+# Canonical reporter abbreviations mapped to alternative spellings.
+# Spacing variants ("F.Supp.2d" vs "F. Supp. 2d") are handled automatically.
+REPORTERS: Dict[str, List[str]] = {
+    # Supreme Court
+    "U.S.": [],
+    "S. Ct.": [],
+    "L. Ed.": ["L.Ed."],
+    "L. Ed. 2d": [],
+    "U.S.L.W.": [],
+    # Federal courts
+    "F.": [],
+    "F.2d": [],
+    "F.3d": [],
+    "F.4th": [],
+    "F. Supp.": [],
+    "F. Supp. 2d": [],
+    "F. Supp. 3d": [],
+    "F. App'x": ["Fed. App'x", "Fed. Appx.", "F. Appx."],
+    "F.R.D.": [],
+    "B.R.": [],
+    "Fed. Cl.": [],
+    "Ct. Cl.": [],
+    "Vet. App.": [],
+    "T.C.": [],
+    "M.J.": [],
+    # Regional reporters
+    "A.": [],
+    "A.2d": [],
+    "A.3d": [],
+    "N.E.": [],
+    "N.E.2d": [],
+    "N.E.3d": [],
+    "N.W.": [],
+    "N.W.2d": [],
+    "S.E.": [],
+    "S.E.2d": [],
+    "S.W.": [],
+    "S.W.2d": [],
+    "S.W.3d": [],
+    "So.": [],
+    "So. 2d": [],
+    "So. 3d": [],
+    "P.": [],
+    "P.2d": [],
+    "P.3d": [],
+    # State reporters
+    "Cal.": [],
+    "Cal. 2d": [],
+    "Cal. 3d": [],
+    "Cal. 4th": [],
+    "Cal. 5th": [],
+    "Cal. App.": [],
+    "Cal. App. 2d": [],
+    "Cal. App. 3d": [],
+    "Cal. App. 4th": [],
+    "Cal. App. 5th": [],
+    "Cal. Rptr.": [],
+    "Cal. Rptr. 2d": [],
+    "Cal. Rptr. 3d": [],
+    "N.Y.": [],
+    "N.Y.2d": [],
+    "N.Y.3d": [],
+    "N.Y.S.": [],
+    "N.Y.S.2d": [],
+    "N.Y.S.3d": [],
+    "A.D.": [],
+    "A.D.2d": [],
+    "A.D.3d": [],
+    "Misc.": [],
+    "Misc. 2d": [],
+    "Misc. 3d": [],
+    "Ill.": [],
+    "Ill. 2d": [],
+    "Ill. App.": [],
+    "Ill. App. 3d": [],
+    "Ill. Dec.": [],
+    "Mass.": [],
+    "Mass. App. Ct.": [],
+    "Mich.": [],
+    "Mich. App.": [],
+    "N.J.": [],
+    "N.J. Super.": [],
+    "Ohio St.": [],
+    "Ohio St. 2d": [],
+    "Ohio St. 3d": [],
+    "Pa.": [],
+    "Pa. Super.": [],
+    "Tex.": [],
+    "Wash.": [],
+    "Wash. 2d": [],
+    "Wash. App.": [],
+    "Wis. 2d": [],
+    "Conn.": [],
+    "Ga.": [],
+    "Ga. App.": [],
+    "Md.": [],
+    "Minn.": [],
+    "Mo.": [],
+    "N.C.": [],
+    "N.C. App.": [],
+    "Va.": [],
+}
+
+
+def _reporter_key(reporter: str) -> str:
+    """Lookup key for a reporter spelling: whitespace removed, lowercased."""
+    return re.sub(r'\s+', '', reporter).lower()
+
+
+def _reporter_pattern(reporter: str) -> str:
+    """Regex for a reporter abbreviation that tolerates spacing variants."""
+    # Split after periods/apostrophes and at spaces; allow any spacing between parts
+    parts = [part for part in re.split(r"\s+|(?<=[.'])", reporter) if part]
+    return r'\s*'.join(re.escape(part) for part in parts)
+
+
+class CitationExtractor:
+    """
+    High-throughput extractor for "volume reporter page" citations.
+
+    The reporter table is compiled once into a single alternation, ordered
+    longest-first, so each call is one linear scan of the text.
+    """
+
+    def __init__(self, reporters: Optional[Dict[str, List[str]]] = None):
+        """
+        Initialize the extractor.
+
+        Args:
+            reporters: Additional reporters (canonical form mapped to
+                alternative spellings), merged over ``REPORTERS``
+        """
+        table = dict(REPORTERS)
+        if reporters:
+            table.update(reporters)
+
+        self._canonical: Dict[str, str] = {}
+        for canonical, variants in table.items():
+            for spelling in [canonical] + list(variants):
+                self._canonical[_reporter_key(spelling)] = canonical
+
+        spellings = sorted(
+            {spelling for canonical, variants in table.items() for spelling in [canonical] + list(variants)},
+            key=len,
+            reverse=True,
+        )
+        alternation = '|'.join(_reporter_pattern(spelling) for spelling in spellings)
+        self._pattern = re.compile(
+            r'(?<![\w.])(?P<volume>\d{1,4})\s+'
+            r'(?P<reporter>' + alternation + r')'
+            r'\s*(?P<page>\d{1,5})(?!\w)'
+            r'(?:,\s*(?P<pin_cite>\d{1,5})(?!\w))?'
+        )
+
+    def iter_extract(self, text: str) -> Iterator[Dict[str, Any]]:
+        """
+        Lazily extract citations from text.
+
+        Args:
+            text: Text to scan
+
+        Yields:
+            Dicts shaped like ``citation-lookup/`` results: ``citation``,
+            ``normalized_citations``, ``start_index`` and ``end_index``, plus
+            the parsed ``volume``, ``reporter``, ``page`` and ``pin_cite``
+        """
+        if not text:
+            return
+        for match in self._pattern.finditer(text):
+            reporter = self._canonical[_reporter_key(match.group('reporter'))]
+            volume = int(match.group('volume'))
+            page = int(match.group('page'))
+            pin_cite = match.group('pin_cite')
+            yield {
+                'citation': match.group(0),
+                'normalized_citations': [f"{volume} {reporter} {page}"],
+                'start_index': match.start(),
+                'end_index': match.end(),
+                'volume': volume,
+                'reporter': reporter,
+                'page': page,
+                'pin_cite': int(pin_cite) if pin_cite else None,
+            }
+
+    def extract(self, text: str) -> List[Dict[str, Any]]:
+        """
+        Extract all citations from text.
+
+        Args:
+            text: Text to scan
+
+        Returns:
+            List of citation dicts (see ``iter_extract``)
+        """
+        return list(self.iter_extract(text))
+
+    def contains_citation(self, text: str) -> bool:
+        """
+        Check whether text contains at least one citation.
+
+        Stops at the first match, so it is the cheapest way to pre-screen
+        documents before sending them to ``citation-lookup/``.
+        """
+        return bool(text) and self._pattern.search(text) is not None
+
+    def normalize(self, citation: str) -> Optional[str]:
+        """
+        Normalize a single citation string.
+
+        Args:
+            citation: Citation such as ``"576 U.S. 644"`` or ``"123 F.Supp.2d 456"``
+
+        Returns:
+            Canonical ``"volume reporter page"`` form, or None if the string
+            is not a recognized citation
+        """
+        if not citation:
+            return None
+        match = self._pattern.fullmatch(citation.strip())
+        if not match:
+            return None
+        reporter = self._canonical[_reporter_key(match.group('reporter'))]
+        return f"{int(match.group('volume'))} {reporter} {int(match.group('page'))}"
+
+
+_default_extractor: Optional[CitationExtractor] = None
+
+
+def _get_default_extractor() -> CitationExtractor:
+    """Return the shared extractor, compiling it on first use."""
+    global _default_extractor
+    if _default_extractor is None:
+        _default_extractor = CitationExtractor()
+    return _default_extractor
+
+
+def extract_citations(text: str) -> List[Dict[str, Any]]:
+    """
+    Extract citations from text with the default reporter table.
+
+    Args:
+        text: Text to scan
+
+    Returns:
+        List of citation dicts (see ``CitationExtractor.iter_extract``)
+
+    Examples:
+        >>> extract_citations("See 576 U.S. 644, 651 (2015).")[0]['normalized_citations']
+        ['576 U.S. 644']
+    """
+    return _get_default_extractor().extract(text)
+
+
+def normalize_citation(citation: str) -> Optional[str]:
+    """
+    Normalize a citation with the default reporter table.
+
+    Examples:
+        >>> normalize_citation("123 F.Supp.2d 456")
+        '123 F. Supp. 2d 456'
+    """
+    return _get_default_extractor().normalize(citation)
@@ -0,0 +1,302 @@
+"""
+Preloaded court catalog for the CourtListener SDK.
+
+Court metadata almost never changes, yet nearly every docket, cluster and
+opinion refers to its court by URL. ``CourtCatalog`` fetches every court once,
+keeps the raw records in a local JSON file with a long TTL, and answers
+lookups from in-memory indexes: by id, URL, jurisdiction, active/defunct
+status, PACER and FJC codes, and the ``parent_court`` / ``appeals_to``
+hierarchy.
+"""
+
+import json
+import os
+import tempfile
+import time
+from typing import Dict, Any, Iterable, Iterator, List, Optional, Union
+
+from ..exceptions import NotFoundError
+from ..models.court import Court
+from .urls import parse_court_id
+
+# Refresh the local copy after 30 days by default
+DEFAULT_TTL = 30 * 24 * 3600
+
+
+def _court_id(value: Any) -> Optional[str]:
+    """Court id from an id, a court URL, a court dict or a Court."""
+    if isinstance(value, Court):
+        return value.id
+    return parse_court_id(value)
+
+
+def _court_ids(value: Any) -> List[str]:
+    """Court ids from a single reference or a list of them."""
+    values = value if isinstance(value, (list, tuple)) else [value]
+    return [court_id for court_id in (_court_id(item) for item in values) if court_id]
+
+
+class CourtCatalog:
+    """In-memory index of every CourtListener court."""
+
+    def __init__(self, courts: Iterable[Union[Court, Dict[str, Any]]], fetched_at: Optional[float] = None):
+        """
+        Build the catalog indexes.
+
+        Args:
+            courts: Court objects or raw court dicts
+            fetched_at: When the records were fetched (epoch seconds;
+                default: now)
+        """
+        self.fetched_at = fetched_at if fetched_at is not None else time.time()
+        self._courts: Dict[str, Court] = {}
+        for court in courts:
+            court = court if isinstance(court, Court) else Court(court)
+            if court.id:
+                self._courts[court.id] = court
+
+        self._by_jurisdiction: Dict[str, List[Court]] = {}
+        self._by_pacer_id: Dict[str, Court] = {}
+        self._by_fjc_id: Dict[str, Court] = {}
+        self._children: Dict[str, List[Court]] = {}
+        self._appeals_from: Dict[str, List[Court]] = {}
+        for court in self._courts.values():
+            self._by_jurisdiction.setdefault(court.jurisdiction, []).append(court)
+            if court.pacer_court_id:
+                self._by_pacer_id[str(court.pacer_court_id).lower()] = court
+            if court.fjc_court_id:
+                self._by_fjc_id[str(court.fjc_court_id)] = court
+            parent = _court_id(court.parent_court)
+            if parent:
+                self._children.setdefault(parent, []).append(court)
+            for target in _court_ids(court.appeals_to):
+                self._appeals_from.setdefault(target, []).append(court)
+
+    @classmethod
+    def from_api(cls, client, **params) -> 'CourtCatalog':
+        """
+        Build a catalog by paginating through ``courts/``.
+
+        Args:
+            client: CourtListener client instance
+            **params: Filters passed to ``courts/``
+
+        Returns:
+            CourtCatalog instance
+        """
+        return cls(client.paginate('courts/', params=params or None))
+
+    @classmethod
+    def load(
+        cls,
+        client,
+        path: Optional[str] = None,
+        ttl: float = DEFAULT_TTL,
+        refresh: bool = False,
+    ) -> 'CourtCatalog':
+        """
+        Load the catalog from a local file, fetching it when stale or missing.
+
+        Args:
+            client: CourtListener client instance, used when a fetch is needed
+            path: JSON file holding the court records (default: fetch every
+                time and keep nothing on disk)
+            ttl: Seconds a stored copy stays fresh (default: 30 days)
+            refresh: Fetch from the API even if the stored copy is fresh
+
+        Returns:
+            CourtCatalog instance
+        """
+        if path:
+            path = os.path.expanduser(path)
+        if path and not refresh:
+            catalog = cls.read(path)
+            if catalog is not None and time.time() - catalog.fetched_at < ttl:
+                return catalog
+        catalog = cls.from_api(client)
+        if path:
+            catalog.save(path)
+        return catalog
+
+    @classmethod
+    def read(cls, path: str) -> Optional['CourtCatalog']:
+        """
+        Read a catalog saved with ``save``.
+
+        Args:
+            path: JSON file path
+
+        Returns:
+            CourtCatalog, or None if the file is missing or unreadable
+        """
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                payload = json.load(f)
+            return cls(payload['courts'], fetched_at=float(payload['fetched_at']))
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    def save(self, path: str) -> None:
+        """
+        Write the raw court records to a JSON file (atomically).
+
+        Args:
+            path: JSON file path
+        """
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        payload = {
+            'fetched_at': self.fetched_at,
+            'courts': [court._data for court in self._courts.values()],
+        }
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(payload, f, default=str)
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    def get(self, court_id: str) -> Court:
+        """
+        Get a court by id.
+
+        Args:
+            court_id: Court id (e.g. ``'scotus'``)
+
+        Returns:
+            Court object
+
+        Raises:
+            NotFoundError: If the catalog has no such court
+        """
+        court = self._courts.get(court_id)
+        if court is None:
+            raise NotFoundError(f"Court not found: {court_id}")
+        return court
+
+    def get_court_by_url(self, court_url: Union[str, Dict[str, Any]]) -> Court:
+        """
+        Get the court a hyperlinked ``court`` field points to.
+
+        Args:
+            court_url: Court URL (or id or court dict)
+
+        Returns:
+            Court object
+
+        Raises:
+            NotFoundError: If the catalog has no such court
+        """
+        court_id = _court_id(court_url)
+        if court_id is None:
+            raise NotFoundError(f"Court not found: {court_url}")
+        return self.get(court_id)
+
+    def get_by_pacer_id(self, pacer_court_id: str) -> Optional[Court]:
+        """Court with a PACER code such as ``'nysd'`` (case-insensitive)."""
+        return self._by_pacer_id.get(str(pacer_court_id).lower())
+
+    def get_by_fjc_id(self, fjc_court_id: Union[str, int]) -> Optional[Court]:
+        """Court with a Federal Judicial Center code."""
+        return self._by_fjc_id.get(str(fjc_court_id))
+
+    def by_jurisdiction(self, *jurisdictions: str) -> List[Court]:
+        """
+        Courts in any of the given jurisdiction codes.
+
+        Args:
+            *jurisdictions: Codes such as ``'F'``, ``'FD'``, ``'FB'``, ``'S'``
+
+        Returns:
+            List of Court objects
+        """
+        return [court for code in jurisdictions for court in self._by_jurisdiction.get(code, [])]
+
+    def get_federal_courts(self) -> List[Court]:
+        """Federal appellate courts (jurisdiction ``'F'``), as ``CourtsAPI.get_federal_courts``."""
+        return self.by_jurisdiction('F')
+
+    def get_state_courts(self) -> List[Court]:
+        """State supreme courts (jurisdiction ``'S'``), as ``CourtsAPI.get_state_courts``."""
+        return self.by_jurisdiction('S')
+
+    def get_territorial_courts(self) -> List[Court]:
+        """Territorial courts (jurisdiction ``'T'``), as ``CourtsAPI.get_territorial_courts``."""
+        return self.by_jurisdiction('T')
+
+    def get_active_courts(self) -> List[Court]:
+        """Courts marked ``in_use``."""
+        return [court for court in self._courts.values() if court.in_use]
+
+    def get_defunct_courts(self) -> List[Court]:
+        """Courts that are no longer in use or have an end date."""
+        return [court for court in self._courts.values() if court.is_defunct or not court.in_use]
+
+    def parent(self, court_id: str) -> Optional[Court]:
+        """The court's ``parent_court``, if it has one in the catalog."""
+        parent_id = _court_id(self.get(court_id).parent_court)
+        return self._courts.get(parent_id) if parent_id else None
+
+    def children(self, court_id: str) -> List[Court]:
+        """Courts whose ``parent_court`` is this court."""
+        return list(self._children.get(court_id, []))
+
+    def ancestors(self, court_id: str) -> List[Court]:
+        """Parent, grandparent, ... of a court, nearest first."""
+        result: List[Court] = []
+        seen = {court_id}
+        court = self.parent(court_id)
+        while court is not None and court.id not in seen:
+            result.append(court)
+            seen.add(court.id)
+            court = self.parent(court.id)
+        return result
+
+    def appeals_to(self, court_id: str) -> List[Court]:
+        """Courts this court's decisions are appealed to."""
+        ids = _court_ids(self.get(court_id).appeals_to)
+        return [self._courts[target] for target in ids if target in self._courts]
+
+    def appeals_from(self, court_id: str) -> List[Court]:
+        """Courts whose decisions are appealed to this court."""
+        return list(self._appeals_from.get(court_id, []))
+
+    def appellate_chain(self, court_id: str) -> List[Court]:
+        """
+        Courts reachable by following ``appeals_to``, breadth first.
+
+        Args:
+            court_id: Court to start from
+
+        Returns:
+            List of Court objects, excluding the starting court
+        """
+        result: List[Court] = []
+        seen = {court_id}
+        frontier = [court_id]
+        while frontier:
+            next_frontier = []
+            for current in frontier:
+                for court in self.appeals_to(current):
+                    if court.id not in seen:
+                        seen.add(court.id)
+                        result.append(court)
+                        next_frontier.append(court.id)
+            frontier = next_frontier
+        return result
+
+    def __len__(self) -> int:
+        return len(self._courts)
+
+    def __iter__(self) -> Iterator[Court]:
+        return iter(self._courts.values())
+
+    def __contains__(self, court: Any) -> bool:
+        return _court_id(court) in self._courts
+
+    def __repr__(self) -> str:
+        """String representation of the catalog."""
+        return f"CourtCatalog(courts={len(self._courts)})"
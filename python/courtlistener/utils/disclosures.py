@@ -0,0 +1,514 @@
+"""
+Financial disclosure history for the CourtListener SDK.
+
+A judge's disclosures are split over nine endpoints: the reports themselves
+and eight sub-resources (investments, gifts, debts, ...). ``DisclosureHistory``
+fetches the reports for one or more judges, fans out concurrently to every
+fully paginated sub-resource of every report, and stores the result as typed
+columnar tables (one NumPy array per column) so roll-ups such as value ranges
+by year are a few array operations.
+
+Amounts that the API reports as letter value codes (``gross_value_code``,
+``income_during_reporting_period_code``, ``value_code``, ...) are converted
+batch-wise into numeric low/high bounds with ``parse_value_codes``.
+"""
+
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from typing import Dict, Any, Iterable, List, Mapping, Optional, Sequence, Tuple, Union
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - exercised only without numpy
+    np = None  # type: ignore[assignment]
+
+from ..exceptions import CourtListenerError, ValidationError
+from .urls import parse_resource_id
+
+# Sub-resource table -> endpoint it is loaded from
+SUB_RESOURCES = {
+    'investments': 'investments/',
+    'gifts': 'gifts/',
+    'debts': 'debts/',
+    'agreements': 'agreements/',
+    'reimbursements': 'reimbursements/',
+    'non_investment_incomes': 'non-investment-incomes/',
+    'spouse_incomes': 'spouse-incomes/',
+    'positions': 'disclosure-positions/',
+}
+
+# Disclosure value codes -> (low, high) bounds in dollars. A-H2 are income
+# codes, J-P4 value codes; the open-ended top codes have an infinite bound.
+VALUE_CODES = {
+    'A': (1.0, 1000.0),
+    'B': (1001.0, 2500.0),
+    'C': (2501.0, 5000.0),
+    'D': (5001.0, 15000.0),
+    'E': (15001.0, 50000.0),
+    'F': (50001.0, 100000.0),
+    'G': (100001.0, 1000000.0),
+    'H1': (1000001.0, 5000000.0),
+    'H2': (5000001.0, float('inf')),
+    'J': (1.0, 15000.0),
+    'K': (15001.0, 50000.0),
+    'L': (50001.0, 100000.0),
+    'M': (100001.0, 250000.0),
+    'N': (250001.0, 500000.0),
+    'O': (500001.0, 1000000.0),
+    'P1': (1000001.0, 5000000.0),
+    'P2': (5000001.0, 25000000.0),
+    'P3': (25000001.0, 50000000.0),
+    'P4': (50000001.0, float('inf')),
+}
+
+# Table -> typed data columns
+SCHEMAS = {
+    'disclosures': (('id', 'int64'), ('judge', 'int64'), ('year', 'int64')),
+    'investments': (
+        ('description', 'object'),
+        ('value_min', 'float64'),
+        ('value_max', 'float64'),
+        ('gross_value_code', 'str'),
+        ('income_during_reporting_period_code', 'str'),
+        ('income_during_reporting_period_type', 'str'),
+        ('transaction_value_code', 'str'),
+    ),
+    'gifts': (('description', 'object'), ('source', 'object'), ('value', 'float64')),
+    'debts': (('description', 'object'), ('creditor', 'object'), ('amount', 'float64'), ('value_code', 'str')),
+    'agreements': (('description', 'object'),),
+    'reimbursements': (('description', 'object'), ('amount', 'float64')),
+    'non_investment_incomes': (('description', 'object'), ('amount', 'float64')),
+    'spouse_incomes': (('description', 'object'), ('source', 'object'), ('amount', 'float64')),
+    'positions': (('position', 'object'), ('organization', 'object')),
+}
+
+# Table -> (low, high) columns summed by value roll-ups
+VALUE_COLUMNS = {
+    'investments': ('value_min', 'value_max'),
+    'gifts': ('value', 'value'),
+    'debts': ('value_min', 'value_max'),
+    'reimbursements': ('amount', 'amount'),
+    'non_investment_incomes': ('amount', 'amount'),
+    'spouse_incomes': ('amount', 'amount'),
+}
+
+# Numeric bounds derived from value codes: table -> {(low, high): (code column, fallback columns)}
+CODE_BOUNDS: Dict[str, Dict[Tuple[str, str], Tuple[str, Optional[Tuple[str, str]]]]] = {
+    'investments': {
+        ('value_min', 'value_max'): ('gross_value_code', ('value_min', 'value_max')),
+        ('income_min', 'income_max'): ('income_during_reporting_period_code', None),
+        ('transaction_min', 'transaction_max'): ('transaction_value_code', None),
+    },
+    'debts': {
+        ('value_min', 'value_max'): ('value_code', ('amount', 'amount')),
+    },
+}
+
+# Stored in integer columns for missing values
+MISSING_INT = -1
+
+
+def _require_numpy():
+    """Raise an informative error when NumPy is not installed."""
+    if np is None:
+        raise CourtListenerError(
+            "Disclosure tables require NumPy. "
+            "Install it with: pip install courtlistener-sdk-python[numpy]"
+        )
+
+
+def _to_int(value: Any) -> int:
+    parsed = parse_resource_id(value)
+    return MISSING_INT if parsed is None else parsed
+
+
+def _to_float(value: Any) -> float:
+    if value is None or value == '':
+        return float('nan')
+    try:
+        return float(str(value).replace(',', '').lstrip('$'))
+    except ValueError:
+        return float('nan')
+
+
+def _column(values: Iterable[Any], dtype: str) -> 'np.ndarray':
+    """Build one typed column from raw field values."""
+    if dtype == 'int64':
+        return np.fromiter((_to_int(value) for value in values), dtype=np.int64)
+    if dtype == 'float64':
+        return np.fromiter((_to_float(value) for value in values), dtype=np.float64)
+    if dtype == 'str':
+        # Fixed-width strings keep short codes out of per-row Python objects
+        return np.array(['' if value is None else str(value) for value in values], dtype=str)
+    values = list(values)
+    column = np.empty(len(values), dtype=object)
+    column[:] = values
+    return column
+
+
+def _as_str_array(values: Any) -> 'np.ndarray':
+    """Fixed-width string array with missing values as ``''``."""
+    array = np.asarray(values)
+    if array.dtype == object:
+        array = np.array(['' if value is None else value for value in array], dtype=object)
+    return array.astype(str)
+
+
+def parse_value_codes(codes: Any) -> Tuple['np.ndarray', 'np.ndarray']:
+    """
+    Convert disclosure value codes to numeric bounds.
+
+    Each distinct code is looked up once; rows are mapped with a single
+    array index, so the cost is independent of Python object overhead.
+
+    Args:
+        codes: Sequence or array of codes such as ``'J'``, ``'p1'``, ``None``
+
+    Returns:
+        ``(low, high)`` float64 arrays; unknown or missing codes give NaN and
+        open-ended codes an infinite ``high``
+    """
+    _require_numpy()
+    normalized = np.char.upper(np.char.strip(_as_str_array(codes)))
+    if not normalized.size:
+        return np.zeros(0), np.zeros(0)
+    unique, inverse = np.unique(normalized, return_inverse=True)
+    bounds = np.array([VALUE_CODES.get(code, (np.nan, np.nan)) for code in unique.tolist()], dtype=np.float64)
+    inverse = inverse.reshape(normalized.shape)
+    return bounds[inverse, 0], bounds[inverse, 1]
+
+
+def _factorize(column: 'np.ndarray') -> Tuple['np.ndarray', 'np.ndarray']:
+    """Distinct values of a key column and each row's index into them."""
+    if column.dtype == object:
+        column = _as_str_array(column)
+    unique, inverse = np.unique(column, return_inverse=True)
+    return unique, inverse.reshape(-1)
+
+
+class ColumnTable:
+    """Table stored as equally long, typed NumPy columns."""
+
+    def __init__(self, columns: Dict[str, 'np.ndarray']):
+        """
+        Initialize the table.
+
+        Args:
+            columns: Column name -> array, all of the same length
+        """
+        _require_numpy()
+        lengths = {len(column) for column in columns.values()}
+        if len(lengths) > 1:
+            raise ValidationError("All columns must have the same length")
+        self._columns = {name: np.asarray(column) for name, column in columns.items()}
+
+    @classmethod
+    def from_records(cls, records: Sequence[Any], schema: Sequence[Tuple[str, str]]) -> 'ColumnTable':
+        """
+        Build a table from result dicts or models.
+
+        Args:
+            records: Records to convert
+            schema: ``(column, dtype)`` pairs; dtype is ``'int64'`` (ids and
+                API URLs, missing values become ``MISSING_INT``), ``'float64'``
+                (missing values become NaN) or ``'object'``
+
+        Returns:
+            ColumnTable instance
+        """
+        _require_numpy()
+        return cls({name: _column((record.get(name) for record in records), dtype) for name, dtype in schema})
+
+    @property
+    def columns(self) -> List[str]:
+        """Column names."""
+        return list(self._columns)
+
+    def where(self, mask: 'np.ndarray') -> 'ColumnTable':
+        """
+        Select rows.
+
+        Args:
+            mask: Boolean array (or index array) over the rows
+
+        Returns:
+            New table with the selected rows
+        """
+        return ColumnTable({name: column[mask] for name, column in self._columns.items()})
+
+    def group_sum(self, by: Sequence[str], columns: Sequence[str]) -> 'ColumnTable':
+        """
+        Sum columns per group; NaN values count as 0.
+
+        Args:
+            by: Key columns to group on (integer or string columns, such as
+                ``judge``, ``year`` or ``income_during_reporting_period_type``;
+                missing strings group as ``''``)
+            columns: Numeric columns to sum
+
+        Returns:
+            Table with the key columns, one sum column per summed column and
+            a ``count`` column, ordered by key
+        """
+        if not len(self):
+            result = {name: self._columns[name][:0] for name in by}
+            result.update({name: np.zeros(0) for name in columns})
+            result['count'] = np.zeros(0, dtype=np.int64)
+            return ColumnTable(result)
+        # Combine the per-column codes into one group code per row
+        uniques, codes = zip(*(_factorize(self._columns[name]) for name in by))
+        shape = tuple(len(unique) for unique in uniques)
+        groups, inverse = np.unique(np.ravel_multi_index(codes, shape), return_inverse=True)
+        inverse = inverse.reshape(-1)
+        positions = np.unravel_index(groups, shape)
+        result = {name: uniques[i][positions[i]] for i, name in enumerate(by)}
+        for name in columns:
+            values = np.nan_to_num(self._columns[name].astype(np.float64), nan=0.0, posinf=np.inf)
+            result[name] = np.bincount(inverse, weights=values, minlength=len(groups))
+        result['count'] = np.bincount(inverse, minlength=len(groups))
+        return ColumnTable(result)
+
+    def to_records(self) -> List[Dict[str, Any]]:
+        """Rows as dicts of plain Python values."""
+        names = self.columns
+        columns = [self._columns[name].tolist() for name in names]
+        return [dict(zip(names, row)) for row in zip(*columns)]
+
+    def to_dataframe(self):
+        """
+        Convert the table to a pandas DataFrame.
+
+        Returns:
+            ``pandas.DataFrame`` sharing the column arrays
+        """
+        try:
+            import pandas as pd
+        except ImportError:
+            raise CourtListenerError(
+                "DataFrame export requires pandas. "
+                "Install it with: pip install courtlistener-sdk-python[pandas]"
+            )
+        return pd.DataFrame(self._columns, copy=False)
+
+    def __getitem__(self, name: str) -> 'np.ndarray':
+        return self._columns[name]
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._columns
+
+    def __len__(self) -> int:
+        return len(next(iter(self._columns.values()))) if self._columns else 0
+
+    def __repr__(self) -> str:
+        """String representation of the table."""
+        return f"ColumnTable(rows={len(self)}, columns={self.columns})"
+
+
+class DisclosureHistory:
+    """Columnar tables of disclosures and all their sub-resources."""
+
+    def __init__(self, disclosures: Iterable[Any], records: Optional[Mapping[str, Iterable[Any]]] = None):
+        """
+        Initialize the history.
+
+        Args:
+            disclosures: ``financial-disclosures/`` results or models
+            records: Sub-resource table name (see ``SUB_RESOURCES``) ->
+                result dicts or models
+        """
+        _require_numpy()
+        records = records or {}
+        unknown = set(records) - set(SUB_RESOURCES)
+        if unknown:
+            raise ValidationError(f"Unknown disclosure tables: {sorted(unknown)}")
+        self.tables: Dict[str, ColumnTable] = {
+            'disclosures': ColumnTable.from_records(list(disclosures), SCHEMAS['disclosures'])
+        }
+        for name in SUB_RESOURCES:
+            self.tables[name] = self._sub_table(name, list(records.get(name, ())))
+        # Table name ('disclosures' for report listings) -> failed fetches
+        self.errors: Dict[str, List[CourtListenerError]] = {}
+
+    @classmethod
+    def from_api(
+        cls,
+        client,
+        judges: Union[Any, Iterable[Any]],
+        year: Optional[int] = None,
+        tables: Optional[Sequence[str]] = None,
+        max_workers: int = 8,
+        batch_size: int = 100,
+    ) -> 'DisclosureHistory':
+        """
+        Fetch the disclosure history of one or more judges.
+
+        Sub-resource requests for a judge's reports start as soon as the
+        reports are listed, one ``financial_disclosure__in`` request per table
+        for each batch of reports, and every listing is fully paginated. A listing
+        that fails with an API error leaves its rows out of the history and
+        is recorded in ``errors`` instead of discarding everything fetched.
+
+        Args:
+            client: CourtListener client instance
+            judges: Judge ID or URL, or an iterable of them
+            year: Only fetch reports for this year
+            tables: Sub-resource tables to fetch (default: all)
+            max_workers: Concurrent requests
+            batch_size: Reports per ``financial_disclosure__in`` request
+
+        Returns:
+            DisclosureHistory instance
+        """
+        if isinstance(judges, (str, int, dict)) or not hasattr(judges, '__iter__'):
+            judges = [judges]
+        judge_ids = []
+        for judge in judges:
+            judge_id = parse_resource_id(judge)
+            if judge_id is None:
+                raise ValidationError(f"Invalid judge: {judge!r}")
+            judge_ids.append(judge_id)
+        tables = list(SUB_RESOURCES) if tables is None else list(tables)
+        unknown = set(tables) - set(SUB_RESOURCES)
+        if unknown:
+            raise ValidationError(f"Unknown disclosure tables: {sorted(unknown)}")
+        if batch_size < 1:
+            raise ValidationError("batch_size must be at least 1")
+
+        def fetch(endpoint, params):
+            return list(client.paginate(endpoint, params=params))
+
+        disclosures: Dict[int, Any] = {}
+        records: Dict[str, List[Any]] = {name: [] for name in tables}
+        errors: Dict[str, List[CourtListenerError]] = {}
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            pending: Dict[Future, Optional[str]] = {}
+            for judge_id in dict.fromkeys(judge_ids):
+                params = {'judge': judge_id}
+                if year is not None:
+                    params['year'] = year
+                pending[executor.submit(fetch, 'financial-disclosures/', params)] = None
+            while pending:
+                future = next(as_completed(pending))
+                table = pending.pop(future)
+                try:
+                    results = future.result()
+                except CourtListenerError as e:
+                    errors.setdefault(table or 'disclosures', []).append(e)
+                    continue
+                except BaseException:
+                    # Do not wait for the rest of the fan-out before raising
+                    for other in pending:
+                        other.cancel()
+                    raise
+                if table is not None:
+                    records[table].extend(results)
+                    continue
+                new_ids = []
+                for disclosure in results:
+                    disclosure_id = parse_resource_id(disclosure.get('id'))
+                    if disclosure_id is None or disclosure_id in disclosures:
+                        continue
+                    disclosures[disclosure_id] = disclosure
+                    new_ids.append(disclosure_id)
+                for start in range(0, len(new_ids), batch_size):
+                    batch = ','.join(str(disclosure_id) for disclosure_id in new_ids[start:start + batch_size])
+                    for name in tables:
+                        batch_params = {'financial_disclosure__in': batch}
+                        pending[executor.submit(fetch, SUB_RESOURCES[name], batch_params)] = name
+        history = cls(disclosures.values(), records)
+        history.errors = errors
+        return history
+
+    def rollup(
+        self,
+        table: str,
+        by: Sequence[str] = ('judge', 'year'),
+        bounds: Optional[Tuple[str, str]] = None,
+    ) -> ColumnTable:
+        """
+        Total value range of one sub-resource table per group.
+
+        Args:
+            table: Sub-resource table
+            by: Key columns, e.g. ``('judge', 'year')`` or
+                ``('judge', 'income_during_reporting_period_type')``
+            bounds: ``(low, high)`` columns to sum, e.g.
+                ``('income_min', 'income_max')`` (default: the table's
+                ``VALUE_COLUMNS``)
+
+        Returns:
+            Table with the key columns, ``low``, ``high`` and ``count``
+        """
+        if bounds is None:
+            if table not in VALUE_COLUMNS:
+                raise ValidationError(f"Table {table!r} has no value columns")
+            bounds = VALUE_COLUMNS[table]
+        low, high = bounds
+        data = self.tables[table]
+        columns = {name: data[name] for name in by}
+        columns['low'] = data[low]
+        columns['high'] = data[high]
+        return ColumnTable(columns).group_sum(by, ['low', 'high'])
+
+    def value_ranges_by_year(self, tables: Optional[Sequence[str]] = None, judge: Any = None) -> ColumnTable:
+        """
+        Total value range per year across sub-resource tables.
+
+        Args:
+            tables: Tables to include (default: every table in ``VALUE_COLUMNS``)
+            judge: Only include this judge (ID or URL)
+
+        Returns:
+            Table with ``year``, ``low``, ``high`` and ``count`` columns
+        """
+        tables = list(VALUE_COLUMNS) if tables is None else list(tables)
+        if not tables:
+            raise ValidationError("At least one table is required")
+        parts = []
+        for name in tables:
+            if name not in VALUE_COLUMNS:
+                raise ValidationError(f"Table {name!r} has no value columns")
+            low, high = VALUE_COLUMNS[name]
+            data = self.tables[name]
+            parts.append((data['judge'], data['year'], data[low], data[high]))
+        judge_col, year_col, low_col, high_col = (np.concatenate(columns) for columns in zip(*parts))
+        combined = ColumnTable({'year': year_col, 'low': low_col, 'high': high_col})
+        if judge is not None:
+            combined = combined.where(judge_col == _to_int(judge))
+        return combined.group_sum(['year'], ['low', 'high'])
+
+    def _sub_table(self, name: str, records: List[Any]) -> ColumnTable:
+        """Build a sub-resource table and join judge/year from its disclosure."""
+        table = ColumnTable.from_records(records, SCHEMAS[name])
+        ids = _column((record.get('id') for record in records), 'int64')
+        disclosure = _column((record.get('financial_disclosure') for record in records), 'int64')
+        reports = self.tables['disclosures']
+        order = np.argsort(reports['id'], kind='stable')
+        sorted_ids = reports['id'][order]
+        pos = np.clip(np.searchsorted(sorted_ids, disclosure), 0, max(len(sorted_ids) - 1, 0))
+        matched = (sorted_ids[pos] == disclosure) if len(sorted_ids) else np.zeros(len(records), dtype=bool)
+        columns = {'id': ids, 'disclosure': disclosure}
+        for key in ('judge', 'year'):
+            values = np.full(len(records), MISSING_INT, dtype=np.int64)
+            if len(sorted_ids):
+                values[matched] = reports[key][order][pos[matched]]
+            columns[key] = values
+        # Records of reports that were not loaded keep their own judge reference
+        own_judge = _column((record.get('judge') for record in records), 'int64')
+        columns['judge'] = np.where(matched, columns['judge'], own_judge)
+        columns.update({column: table[column] for column in table.columns})
+        for (low, high), (code_column, fallback) in CODE_BOUNDS.get(name, {}).items():
+            code_low, code_high = parse_value_codes(columns[code_column])
+            if fallback is not None:
+                # Reported amounts take precedence over code ranges
+                code_low = np.where(np.isnan(columns[fallback[0]]), code_low, columns[fallback[0]])
+                code_high = np.where(np.isnan(columns[fallback[1]]), code_high, columns[fallback[1]])
+            columns[low], columns[high] = code_low, code_high
+        return ColumnTable(columns)
+
+    def __getitem__(self, name: str) -> ColumnTable:
+        return self.tables[name]
+
+    def __repr__(self) -> str:
+        """String representation of the history."""
+        counts = ', '.join(f"{name}={len(table)}" for name, table in self.tables.items())
+        return f"DisclosureHistory({counts})"
@@ -0,0 +1,358 @@
+"""
+Incremental docket watching for the CourtListener SDK.
+
+``DocketWatcher`` tracks a set of dockets and, once per interval, finds their
+new or changed entries with a few ``docket-entries/`` queries filtered by
+``docket__in`` and ``date_modified__gt`` instead of one request per docket.
+A high-water mark (latest ``date_modified`` seen) is kept per docket, can be
+persisted to disk, and each tick emits ``DocketChange`` events to a callback
+and/or queue.
+"""
+
+import json
+import logging
+import os
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timezone
+from typing import Dict, Any, Callable, Iterable, List, Optional, Tuple, Union
+
+from ..exceptions import ValidationError
+from ..models.docket_entry import DocketEntry
+from .urls import parse_resource_id
+
+DateLike = Union[date, datetime, str]
+
+
+def _to_datetime(value: Any) -> Optional[datetime]:
+    """Timezone-aware datetime from a ``datetime``, ``date`` or ISO string."""
+    if value is None or value == '':
+        return None
+    if isinstance(value, datetime):
+        parsed = value
+    elif isinstance(value, date):
+        parsed = datetime(value.year, value.month, value.day)
+    else:
+        try:
+            parsed = datetime.fromisoformat(str(value).replace('Z', '+00:00'))
+        except ValueError:
+            return None
+    # Naive timestamps are taken as UTC so every mark is comparable
+    return parsed if parsed.tzinfo is not None else parsed.replace(tzinfo=timezone.utc)
+
+
+class DocketChange:
+    """New or modified entries of one docket found in a poll."""
+
+    def __init__(self, docket_id: int, entries: List[DocketEntry], since: Optional[datetime], until: datetime):
+        """
+        Initialize the change.
+
+        Args:
+            docket_id: Docket ID
+            entries: Entries modified after ``since``, oldest first
+            since: High-water mark before the poll
+            until: High-water mark after the poll
+        """
+        self.docket_id = docket_id
+        self.entries = entries
+        self.since = since
+        self.until = until
+
+    def __repr__(self) -> str:
+        """String representation of the change."""
+        return f"DocketChange(docket_id={self.docket_id}, entries={len(self.entries)}, until={self.until.isoformat()})"
+
+
+class DocketWatcher:
+    """Batched, incremental poller for docket entries."""
+
+    def __init__(
+        self,
+        client,
+        dockets: Iterable[Any] = (),
+        since: Optional[DateLike] = None,
+        interval: float = 300.0,
+        batch_size: Optional[int] = 200,
+        max_workers: int = 4,
+        callback: Optional[Callable[[DocketChange], None]] = None,
+        queue=None,
+        state_path: Optional[str] = None,
+    ):
+        """
+        Initialize the watcher.
+
+        Args:
+            client: CourtListener client instance
+            dockets: Docket IDs or URLs to watch
+            since: Report entries modified after this time for ``dockets``
+                (default: only changes from now on)
+            interval: Seconds between polls when running in the background
+            batch_size: Dockets per ``docket__in`` query; None queries all
+                entries modified since the oldest mark once and filters
+                locally, which suits very large watch lists
+            max_workers: Concurrent batch queries
+            callback: Called with each ``DocketChange``
+            queue: Object with ``put()`` (e.g. ``queue.Queue``) receiving each
+                ``DocketChange``
+            state_path: JSON file the high-water marks are loaded from and
+                saved to after every poll
+        """
+        if batch_size is not None and batch_size < 1:
+            raise ValidationError("batch_size must be at least 1")
+        self.client = client
+        self.interval = interval
+        self.batch_size = batch_size
+        self.max_workers = max_workers
+        self.callback = callback
+        self.queue = queue
+        self.state_path = state_path
+        self.logger = logging.getLogger(__name__)
+        self._marks: Dict[int, datetime] = {}
+        self._lock = threading.RLock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        if state_path is not None:
+            self._load_state(state_path)
+        self.add(dockets, since=since)
+
+    @classmethod
+    def from_alerts(cls, client, **kwargs) -> 'DocketWatcher':
+        """
+        Create a watcher for every docket the account has a docket alert on.
+
+        Args:
+            client: CourtListener client instance
+            **kwargs: Passed to ``DocketWatcher``
+
+        Returns:
+            DocketWatcher instance
+        """
+        watcher = cls(client, **kwargs)
+        watcher.sync_alerts()
+        return watcher
+
+    def add(self, dockets: Iterable[Any], since: Optional[DateLike] = None) -> None:
+        """
+        Start watching dockets. Dockets already watched keep their mark.
+
+        Args:
+            dockets: Docket IDs or URLs
+            since: Report entries modified after this time (default: now)
+        """
+        mark = datetime.now(timezone.utc) if since is None else _to_datetime(since)
+        if mark is None:
+            raise ValidationError(f"Invalid since: {since!r}")
+        with self._lock:
+            for docket in dockets:
+                docket_id = self._docket_id(docket)
+                self._marks.setdefault(docket_id, mark)
+
+    def remove(self, dockets: Iterable[Any]) -> None:
+        """
+        Stop watching dockets.
+
+        Args:
+            dockets: Docket IDs or URLs
+        """
+        with self._lock:
+            for docket in dockets:
+                self._marks.pop(self._docket_id(docket), None)
+
+    def sync_alerts(self, since: Optional[DateLike] = None) -> int:
+        """
+        Watch every docket with a docket alert subscription and stop watching
+        dockets whose subscription was removed.
+
+        Args:
+            since: Mark for newly subscribed dockets (default: now)
+
+        Returns:
+            Number of dockets watched
+        """
+        subscribed = set()
+        for alert in self.client.paginate('docket-alerts/'):
+            docket_id = parse_resource_id(alert.get('docket'))
+            if docket_id is not None:
+                subscribed.add(docket_id)
+        with self._lock:
+            self.remove([docket_id for docket_id in self._marks if docket_id not in subscribed])
+            self.add(subscribed, since=since)
+            return len(self._marks)
+
+    def high_water_mark(self, docket: Any) -> Optional[datetime]:
+        """Latest ``date_modified`` seen for a docket, or None if not watched."""
+        with self._lock:
+            return self._marks.get(self._docket_id(docket))
+
+    @property
+    def dockets(self) -> List[int]:
+        """IDs of the watched dockets."""
+        with self._lock:
+            return list(self._marks)
+
+    def poll(self) -> List[DocketChange]:
+        """
+        Run one incremental check of every watched docket.
+
+        A failed batch is logged and its dockets keep their marks, so their
+        changes are picked up by the next poll.
+
+        Returns:
+            One ``DocketChange`` per docket with new or modified entries
+        """
+        with self._lock:
+            marks = dict(self._marks)
+        if not marks:
+            return []
+        batches = self._batches(marks)
+        found: Dict[int, Dict[Any, Tuple[datetime, Dict[str, Any]]]] = {}
+        with ThreadPoolExecutor(max_workers=max(1, min(self.max_workers, len(batches)))) as executor:
+            futures = [executor.submit(self._query, batch, marks) for batch in batches]
+            for future in futures:
+                try:
+                    for docket_id, modified, entry in future.result():
+                        found.setdefault(docket_id, {})[entry.get('id')] = (modified, entry)
+                except Exception as e:
+                    self.logger.warning("Docket watcher batch failed: %s", e)
+
+        changes = []
+        with self._lock:
+            for docket_id, entries in found.items():
+                # Skip dockets removed while the poll was running
+                if docket_id not in self._marks:
+                    continue
+                ordered = sorted(entries.values(), key=lambda item: item[0])
+                until = ordered[-1][0]
+                changes.append(DocketChange(
+                    docket_id, [DocketEntry(entry) for _, entry in ordered], marks[docket_id], until,
+                ))
+                if until > self._marks[docket_id]:
+                    self._marks[docket_id] = until
+        if self.state_path is not None:
+            self.save(self.state_path)
+        for change in changes:
+            self._emit(change)
+        return changes
+
+    def start(self) -> None:
+        """Poll every ``interval`` seconds on a background thread."""
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name='DocketWatcher', daemon=True)
+            self._thread.start()
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """
+        Stop the background thread.
+
+        Args:
+            timeout: Seconds to wait for a poll in progress to finish
+        """
+        self._stop.set()
+        thread = self._thread
+        if thread is not None:
+            thread.join(timeout)
+        self._thread = None
+
+    def save(self, path: str) -> None:
+        """
+        Write the high-water marks to a JSON file (atomically).
+
+        Args:
+            path: JSON file path
+        """
+        path = os.path.expanduser(path)
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        with self._lock:
+            payload = {'marks': {str(docket_id): mark.isoformat() for docket_id, mark in self._marks.items()}}
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(payload, f)
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._marks)
+
+    def __contains__(self, docket: Any) -> bool:
+        docket_id = parse_resource_id(docket)
+        with self._lock:
+            return docket_id in self._marks
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+    def __repr__(self) -> str:
+        """String representation of the watcher."""
+        return f"DocketWatcher(dockets={len(self)}, interval={self.interval}, batch_size={self.batch_size})"
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            try:
+                self.poll()
+            except Exception:
+                self.logger.exception("Docket watcher poll failed")
+            self._stop.wait(self.interval)
+
+    def _batches(self, marks: Dict[int, datetime]) -> List[List[int]]:
+        """Group dockets with similar marks so each query's lower bound fits them all."""
+        ordered = sorted(marks, key=lambda docket_id: marks[docket_id])
+        if self.batch_size is None:
+            return [ordered]
+        return [ordered[i:i + self.batch_size] for i in range(0, len(ordered), self.batch_size)]
+
+    def _query(self, batch: List[int], marks: Dict[int, datetime]) -> List[Tuple[int, datetime, Dict[str, Any]]]:
+        """Entries of a batch modified after each docket's own mark."""
+        params = {'date_modified__gt': min(marks[docket_id] for docket_id in batch).isoformat()}
+        if self.batch_size is not None:
+            params['docket__in'] = ','.join(str(docket_id) for docket_id in batch)
+        results = []
+        for entry in self.client.paginate('docket-entries/', params=params):
+            docket_id = parse_resource_id(entry.get('docket'))
+            modified = _to_datetime(entry.get('date_modified'))
+            if docket_id not in marks or modified is None or modified <= marks[docket_id]:
+                continue
+            results.append((docket_id, modified, entry))
+        return results
+
+    def _emit(self, change: DocketChange) -> None:
+        if self.callback is not None:
+            try:
+                self.callback(change)
+            except Exception:
+                self.logger.exception("Docket watcher callback failed")
+        if self.queue is not None:
+            self.queue.put(change)
+
+    def _load_state(self, path: str) -> None:
+        try:
+            with open(os.path.expanduser(path), 'r', encoding='utf-8') as f:
+                payload = json.load(f)
+            marks = payload['marks']
+        except (OSError, ValueError, KeyError, TypeError):
+            return
+        for docket_id, mark in marks.items():
+            parsed = _to_datetime(mark)
+            if parsed is not None:
+                self._marks[int(docket_id)] = parsed
+
+    @staticmethod
+    def _docket_id(docket: Any) -> int:
+        docket_id = parse_resource_id(docket)
+        if docket_id is None:
+            raise ValidationError(f"Invalid docket: {docket!r}")
+        return docket_id
@@ -0,0 +1,304 @@
+"""
+Streaming, resumable file downloads for the CourtListener SDK.
+
+Downloads opinion documents, RECAP PDFs and oral-argument audio straight to
+disk in chunks. Interrupted downloads resume from the partial file with HTTP
+Range requests, finished files are verified against their SHA-1, and several
+downloads can run concurrently under a shared bandwidth cap.
+"""
+
+import hashlib
+import os
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Optional, Iterable, List, Union
+from urllib.parse import urljoin, urlparse
+
+import requests
+
+from ..exceptions import CourtListenerError, NotFoundError, APIError, ValidationError
+from ..models.base import BaseModel
+
+# Public storage bucket that serves ``local_path``/``filepath_local`` files
+STORAGE_BASE_URL = "https://storage.courtlistener.com/"
+
+_CONTENT_RANGE_RE = re.compile(r'bytes\s+(\d+)-')
+
+# File fields checked on each model, in order of preference
+_URL_FIELDS = ('filepath_local', 'local_path', 'file_path', 'filepath_ia', 'file_url', 'download_url')
+
+
+def _raw(item: Union[BaseModel, Dict[str, Any]]) -> Dict[str, Any]:
+    """Return the raw API data behind a model or dict."""
+    return item._data if isinstance(item, BaseModel) else item
+
+
+def resolve_download_url(item: Union[BaseModel, Dict[str, Any], str]) -> Optional[str]:
+    """
+    Work out where a file can be downloaded from.
+
+    Storage paths (``local_path``/``filepath_local``) are resolved against
+    CourtListener's public storage; ``filepath_ia``, ``file_url`` and
+    ``download_url`` are used as-is.
+
+    Args:
+        item: ``Opinion``, ``Audio``, ``Document``/``RecapDocument`` (model or
+            dict), or a URL
+
+    Returns:
+        Absolute URL, or None if the item has no file
+    """
+    if isinstance(item, str):
+        return item
+    data = _raw(item)
+    for field in _URL_FIELDS:
+        value = str(data.get(field) or '')
+        if not value:
+            continue
+        if urlparse(value).scheme in ('http', 'https'):
+            return value
+        return urljoin(STORAGE_BASE_URL, value.lstrip('/'))
+    return None
+
+
+def _expected_sha1(item: Union[BaseModel, Dict[str, Any], str]) -> Optional[str]:
+    """SHA-1 a downloaded file should match, if the item carries one."""
+    if isinstance(item, str):
+        return None
+    data = _raw(item)
+    # Audio sha1 identifies the original recording, not the re-encoded MP3 on storage
+    if 'duration' in data:
+        return None
+    return data.get('sha1') or None
+
+
+class _BandwidthLimiter:
+    """Token bucket shared by all download threads."""
+
+    def __init__(self, bytes_per_second: float):
+        self.rate = float(bytes_per_second)
+        self._lock = threading.Lock()
+        self._allowance = self.rate
+        self._last = time.monotonic()
+
+    def consume(self, amount: int) -> None:
+        """Block until ``amount`` bytes may be transferred."""
+        with self._lock:
+            now = time.monotonic()
+            self._allowance = min(self.rate, self._allowance + (now - self._last) * self.rate)
+            self._last = now
+            self._allowance -= amount
+            wait = -self._allowance / self.rate if self._allowance < 0 else 0
+        if wait > 0:
+            time.sleep(wait)
+
+
+class DownloadManager:
+    """Streams files to disk with resume, checksum verification and a bandwidth cap."""
+
+    DEFAULT_CHUNK_SIZE = 1024 * 1024
+
+    def __init__(
+        self,
+        client=None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        max_workers: int = 4,
+        max_bytes_per_second: Optional[float] = None,
+        max_retries: Optional[int] = None,
+        retry_delay: Optional[float] = None,
+        timeout: Optional[float] = None,
+    ):
+        """
+        Initialize the download manager.
+
+        Args:
+            client: Optional CourtListener client; its timeout, retry and
+                User-Agent settings are used as defaults
+            chunk_size: Bytes read per chunk (default: 1 MiB)
+            max_workers: Concurrent downloads for ``download_many`` (default: 4)
+            max_bytes_per_second: Total bandwidth cap across all downloads
+                (default: unlimited)
+            max_retries: Retries per file after a network error
+            retry_delay: Delay between retries in seconds
+            timeout: Socket timeout in seconds
+        """
+        if chunk_size <= 0:
+            raise ValidationError("chunk_size must be greater than 0")
+        if max_workers < 1:
+            raise ValidationError("max_workers must be at least 1")
+        if max_bytes_per_second is not None and max_bytes_per_second <= 0:
+            raise ValidationError("max_bytes_per_second must be greater than 0")
+
+        config = getattr(client, 'config', None)
+        self.chunk_size = chunk_size
+        self.max_workers = max_workers
+        self.max_retries = max_retries if max_retries is not None else getattr(config, 'max_retries', 3)
+        self.retry_delay = retry_delay if retry_delay is not None else getattr(config, 'retry_delay', 1)
+        self.timeout = timeout if timeout is not None else getattr(config, 'timeout', 30)
+        self._limiter = _BandwidthLimiter(max_bytes_per_second) if max_bytes_per_second else None
+
+        # Files live on public storage and third-party court sites, so the API
+        # token is deliberately not sent with these requests.
+        self.session = requests.Session()
+        user_agent = config.get_headers().get('User-Agent') if config is not None else None
+        if user_agent:
+            self.session.headers['User-Agent'] = user_agent
+
+    def download(
+        self,
+        item: Union[BaseModel, Dict[str, Any], str],
+        dest: str,
+        sha1: Optional[str] = None,
+    ) -> str:
+        """
+        Download one file, resuming a previous partial download if present.
+
+        Args:
+            item: Model, dict or URL to download
+            dest: Destination file path, or an existing directory to save
+                into using the URL's file name
+            sha1: Expected SHA-1 hex digest; the file is rejected if it
+                does not match
+
+        Returns:
+            Path of the completed file
+
+        Raises:
+            ValidationError: If the item has no downloadable file
+            CourtListenerError: If the download fails or the checksum does
+                not match
+        """
+        url = resolve_download_url(item)
+        if not url:
+            raise ValidationError("Item has no downloadable file")
+        if os.path.isdir(dest):
+            dest = os.path.join(dest, os.path.basename(urlparse(url).path) or 'download')
+        part_path = dest + '.part'
+
+        for attempt in range(self.max_retries + 1):
+            try:
+                self._fetch(url, part_path)
+                break
+            except (requests.exceptions.RequestException, APIError) as e:
+                if attempt == self.max_retries:
+                    raise CourtListenerError(f"Download failed for {url}: {str(e)}")
+                time.sleep(self.retry_delay)
+
+        if sha1:
+            actual = self._sha1_of(part_path)
+            if actual.lower() != sha1.lower():
+                os.remove(part_path)
+                raise CourtListenerError(f"Checksum mismatch for {url}: expected {sha1}, got {actual}")
+        os.replace(part_path, dest)
+        return dest
+
+    def download_many(
+        self,
+        items: Iterable[Union[BaseModel, Dict[str, Any], str]],
+        dest_dir: str,
+        verify: bool = True,
+    ) -> List[Dict[str, Any]]:
+        """
+        Download many files concurrently into a directory.
+
+        Failures are reported per item instead of aborting the batch. Files
+        are named after their URL; when different URLs share a file name,
+        each of them gets a short hash of its URL appended to the name, and
+        repeated URLs are downloaded once.
+
+        Args:
+            items: Models, dicts or URLs to download
+            dest_dir: Directory to save files into (created if missing)
+            verify: Verify each file against the item's ``sha1`` field
+                when present (default: True; audio is never verified
+                because its ``sha1`` describes the original recording)
+
+        Returns:
+            One dict per item with ``url``, ``path`` and ``error`` keys
+        """
+        os.makedirs(dest_dir, exist_ok=True)
+        items = list(items)
+        urls = [resolve_download_url(item) for item in items]
+        names: Dict[str, set] = {}
+        for url in urls:
+            if url:
+                names.setdefault(os.path.basename(urlparse(url).path) or 'download', set()).add(url)
+
+        def destination(url: Optional[str]) -> str:
+            if not url:
+                return dest_dir
+            name = os.path.basename(urlparse(url).path) or 'download'
+            if len(names[name]) > 1:
+                stem, ext = os.path.splitext(name)
+                name = f"{stem}-{hashlib.sha1(url.encode('utf-8')).hexdigest()[:8]}{ext}"
+            return os.path.join(dest_dir, name)
+
+        def run(index: int) -> Dict[str, Any]:
+            item, url = items[index], urls[index]
+            result: Dict[str, Any] = {'url': url, 'path': None, 'error': None}
+            try:
+                expected = _expected_sha1(item) if verify else None
+                result['path'] = self.download(item, destination(url), sha1=expected)
+            except CourtListenerError as e:
+                result['error'] = e
+            return result
+
+        # Only the first occurrence of a URL is downloaded; repeats share its result
+        owner = []
+        first: Dict[str, int] = {}
+        for index, url in enumerate(urls):
+            owner.append(first.setdefault(url, index) if url else index)
+        unique = sorted(set(owner))
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            done = dict(zip(unique, executor.map(run, unique)))
+        return [dict(done[index]) for index in owner]
+
+    def close(self) -> None:
+        """Close the underlying HTTP session."""
+        self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def _fetch(self, url: str, part_path: str) -> None:
+        """Stream ``url`` into ``part_path``, continuing from its current size."""
+        offset = os.path.getsize(part_path) if os.path.exists(part_path) else 0
+        headers = {'Range': f'bytes={offset}-'} if offset else {}
+
+        with self.session.get(url, headers=headers, stream=True, timeout=self.timeout) as response:
+            if response.status_code == 416 and offset:
+                # Nothing left to fetch: the partial file is already complete
+                return
+            if response.status_code == 404:
+                raise NotFoundError(f"File not found: {url}")
+            if response.status_code not in (200, 206):
+                raise APIError(f"HTTP {response.status_code} downloading {url}", response.status_code)
+
+            if response.status_code == 206:
+                match = _CONTENT_RANGE_RE.match(response.headers.get('Content-Range', ''))
+                if not match or int(match.group(1)) != offset:
+                    # Not the bytes we asked for: discard the partial file and retry
+                    os.remove(part_path)
+                    raise APIError(f"Unexpected Content-Range resuming {url}", response.status_code)
+            # A 200 means the server ignored the Range header: start over
+            mode = 'ab' if response.status_code == 206 else 'wb'
+            with open(part_path, mode) as f:
+                for chunk in response.iter_content(chunk_size=self.chunk_size):
+                    if not chunk:
+                        continue
+                    if self._limiter is not None:
+                        self._limiter.consume(len(chunk))
+                    f.write(chunk)
+
+    def _sha1_of(self, path: str) -> str:
+        """Hash a file in chunks without loading it into memory."""
+        digest = hashlib.sha1()
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(self.chunk_size), b''):
+                digest.update(chunk)
+        return digest.hexdigest()
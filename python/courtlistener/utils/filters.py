@@ -1,9 +1,18 @@
 """
 Filter utilities for building Django-style query parameters.
+
+The ``build_*`` helpers return plain dicts. ``Query`` turns such dicts into
+an immutable, canonical form (sorted keys, string values, normalized dates
+and ``__in`` lists) with a stable hash, so semantically identical parameter
+sets can be used as cache, coalescing or checkpoint keys.
 """
 
-from typing import Dict, Any, Optional, Union, List
-from datetime import date, datetime
+import hashlib
+import re
+from collections.abc import Mapping
+from typing import Dict, Any, Iterator, Optional, Tuple, Union, List
+from datetime import date, datetime, timezone
+from urllib.parse import parse_qsl, urlencode, urlsplit
 
 
 def build_filters(**kwargs) -> Dict[str, Any]:
@@ -188,4 +197,230 @@ def combine_filters(*filter_dicts: Dict[str, Any]) -> Dict[str, Any]:
     for filter_dict in filter_dicts:
         if filter_dict:
             combined.update(filter_dict)
-    return combined 
\ No newline at end of file
+    return combined 
+
+
+_DATETIME_RE = re.compile(r'^\d{4}-\d{2}-\d{2}[T ]\d{2}:\d{2}')
+
+# Parameters whose lists the API takes as one comma-separated value
+_COMMA_LIST_KEYS = ('order_by',)
+
+QueryValue = Union[str, Tuple[str, ...]]
+
+
+def _canonical_scalar(value: Any) -> str:
+    """Canonical string form of a single parameter value."""
+    if isinstance(value, bool):
+        return 'true' if value else 'false'
+    if isinstance(value, int):
+        return str(value)
+    if isinstance(value, float):
+        return str(int(value)) if value.is_integer() else repr(value)
+    if isinstance(value, datetime):
+        moment = value.astimezone(timezone.utc) if value.tzinfo is not None else value
+        return moment.isoformat()
+    if isinstance(value, date):
+        return value.isoformat()
+    if isinstance(value, str):
+        text = value.strip()
+        if _DATETIME_RE.match(text):
+            try:
+                parsed = datetime.fromisoformat(text[:-1] + '+00:00' if text.endswith('Z') else text)
+            except ValueError:
+                return text
+            return _canonical_scalar(parsed)
+        return text
+    raise ValueError(f"Invalid query value type: {type(value)}")
+
+
+def _canonical_value(key: str, value: Any) -> Optional[QueryValue]:
+    """
+    Canonical form of a parameter value (None drops the parameter).
+
+    Lists on ``__in``, ``__range`` and ``order_by`` parameters become one
+    comma-separated string; lists on any other parameter become a tuple that
+    is sent as a repeated parameter.
+    """
+    if value is None:
+        return None
+    unordered = key.endswith('__in')
+    if isinstance(value, str) and key.endswith('__range'):
+        # Range bounds are comma-separated; '/' (build_date_range_filter) is accepted too
+        bounds = value.split(',') if ',' in value else value.split('/')
+        return ','.join(_canonical_scalar(bound) if bound.strip() else '' for bound in bounds)
+    if isinstance(value, str) and unordered:
+        value = value.split(',')
+    if isinstance(value, (set, frozenset)):
+        unordered = True
+    if isinstance(value, (list, tuple, set, frozenset)):
+        items = [_canonical_scalar(item) for item in value if item is not None]
+        items = [item for item in items if item]
+        if unordered:
+            items = sorted(set(items))
+        if not items:
+            return None
+        if key.endswith(('__in', '__range')) or key in _COMMA_LIST_KEYS:
+            return ','.join(items)
+        return items[0] if len(items) == 1 else tuple(items)
+    return _canonical_scalar(value)
+
+
+class Query(Mapping):
+    """
+    Immutable, canonical set of query parameters.
+
+    Parameters are merged left to right like ``combine_filters``, ``None``
+    values are dropped, and every value is reduced to the string the API
+    would receive: booleans become ``true``/``false``, dates and aware
+    datetimes ISO 8601 (datetimes in UTC), and ``__in`` lists are sorted
+    and de-duplicated. ``order_by`` lists keep their order, ``__range``
+    bounds are comma-separated ('/' is accepted on input), and lists on
+    any other parameter stay a tuple that is sent as a repeated parameter
+    (``?type=o&type=r``).
+
+    Equal queries hash equally regardless of the order or types the
+    parameters were given in, so a ``Query`` can key a dict or set directly.
+    ``key()`` gives a digest that is also stable across processes.
+
+    Examples:
+        >>> Query({'page': 1, 'court': 'scotus'}) == Query(court='scotus', page='1')
+        True
+        >>> Query(build_in_filter('court', ['ca2', 'ca1'])).encode()
+        'court__in=ca1%2Cca2'
+    """
+
+    __slots__ = ('_params', '_hash')
+
+    _params: Dict[str, QueryValue]
+    _hash: int
+
+    def __init__(self, *params: Optional[Mapping], **kwargs):
+        """
+        Initialize the query.
+
+        Args:
+            *params: Parameter mappings (e.g. ``build_*`` results or another
+                Query), later ones overriding earlier ones
+            **kwargs: Further parameters, overriding ``params``
+
+        Raises:
+            ValueError: If a value has an unsupported type
+        """
+        merged: Dict[str, Any] = {}
+        for mapping in params + (kwargs,):
+            if mapping:
+                merged.update(mapping)
+        canonical: Dict[str, QueryValue] = {}
+        for key, value in merged.items():
+            value = _canonical_value(str(key), value)
+            if value is not None:
+                canonical[str(key)] = value
+        items = tuple(sorted(canonical.items()))
+        object.__setattr__(self, '_params', dict(items))
+        object.__setattr__(self, '_hash', hash(items))
+
+    @classmethod
+    def from_url(cls, url: str) -> 'Query':
+        """
+        Build a query from a URL or query string (e.g. a ``next`` link).
+
+        Args:
+            url: URL or query string
+
+        Returns:
+            Query instance; repeated parameters stay repeated (tuple values)
+        """
+        query = urlsplit(url).query if '?' in url or '://' in url else url
+        params: Dict[str, Any] = {}
+        for key, value in parse_qsl(query, keep_blank_values=False):
+            if key in params:
+                existing = params[key]
+                params[key] = (existing if isinstance(existing, list) else [existing]) + [value]
+            else:
+                params[key] = value
+        return cls(params)
+
+    def replace(self, **kwargs) -> 'Query':
+        """
+        Copy with some parameters changed (``None`` removes a parameter).
+
+        Args:
+            **kwargs: Parameters to set
+
+        Returns:
+            New Query instance
+        """
+        return Query(self, **kwargs)
+
+    def without(self, *keys: str) -> 'Query':
+        """
+        Copy without the given parameters (e.g. ``'page'`` or ``'cursor'``).
+
+        Args:
+            *keys: Parameter names to drop
+
+        Returns:
+            New Query instance
+        """
+        return Query({key: value for key, value in self._params.items() if key not in keys})
+
+    def encode(self) -> str:
+        """Canonical URL-encoded query string."""
+        return urlencode(sorted(self._params.items()), doseq=True)
+
+    def key(self, endpoint: str = '') -> str:
+        """
+        Stable digest of the query, optionally scoped to an endpoint.
+
+        Args:
+            endpoint: Endpoint the query is sent to (e.g. ``'opinions/'``)
+
+        Returns:
+            Hex SHA-256 digest
+        """
+        text = f"{endpoint.strip('/')}?{self.encode()}"
+        return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+    def to_dict(self) -> Dict[str, QueryValue]:
+        """Canonical parameters as a plain dict."""
+        return dict(self._params)
+
+    def __getitem__(self, key: str) -> QueryValue:
+        return self._params[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._params)
+
+    def __len__(self) -> int:
+        return len(self._params)
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, Query):
+            return self._hash == other._hash and self._params == other._params
+        if isinstance(other, Mapping):
+            try:
+                return self._params == Query(other)._params
+            except ValueError:
+                return False
+        return NotImplemented
+
+    def __or__(self, other: Mapping) -> 'Query':
+        if not isinstance(other, Mapping):
+            return NotImplemented
+        return Query(self, other)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError("Query is immutable")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError("Query is immutable")
+
+    def __reduce__(self):
+        return (Query, (self._params,))
+
+    def __repr__(self) -> str:
+        """String representation of the query."""
+        return f"Query({self._params!r})"
@@ -0,0 +1,111 @@
+"""
+Hedged requests for the CourtListener SDK.
+
+A ``HedgingPolicy`` attached to a client makes ``Transport`` send a second,
+identical GET when the first has not answered within the endpoint's running
+latency percentile (p95 by default); whichever response arrives first is
+used. Hedges are only sent when the token pool, concurrency limiter and
+request budget all have room, so they never push a job past its limits.
+"""
+
+import threading
+from collections import deque
+from typing import Dict, Iterable, Optional
+
+from ..exceptions import ValidationError
+
+
+class HedgingPolicy:
+    """Per-endpoint latency tracking that decides when to hedge a GET."""
+
+    def __init__(
+        self,
+        percentile: float = 0.95,
+        initial_delay: float = 1.0,
+        min_delay: float = 0.05,
+        max_delay: Optional[float] = None,
+        min_samples: int = 20,
+        sample_size: int = 500,
+        endpoints: Optional[Iterable[str]] = None,
+        max_workers: int = 16,
+    ):
+        """
+        Initialize the policy.
+
+        Args:
+            percentile: Latency percentile after which a hedge is sent
+                (default: 0.95)
+            initial_delay: Hedge delay in seconds until enough samples exist
+            min_delay: Lower bound for the hedge delay in seconds
+            max_delay: Upper bound for the hedge delay in seconds
+            min_samples: Latencies needed before the percentile is used
+            sample_size: Most recent latencies kept per endpoint
+            endpoints: Only hedge endpoints starting with one of these
+                paths (e.g. ``'dockets/'``); all GETs when omitted
+            max_workers: Threads available for in-flight hedge requests;
+                primaries are never queued behind this pool
+        """
+        if not 0 < percentile < 1:
+            raise ValidationError("percentile must be between 0 and 1")
+        if min_samples < 1 or sample_size < min_samples:
+            raise ValidationError("sample_size must be at least min_samples, which must be at least 1")
+        if max_workers < 2:
+            raise ValidationError("max_workers must be at least 2")
+        self.percentile = percentile
+        self.initial_delay = initial_delay
+        self.min_delay = min_delay
+        self.max_delay = max_delay
+        self.min_samples = min_samples
+        self.sample_size = sample_size
+        self.endpoints = tuple(endpoint.lstrip('/') for endpoint in endpoints) if endpoints else None
+        self.max_workers = max_workers
+        self._lock = threading.Lock()
+        self._samples: Dict[str, deque] = {}
+        self.hedges_sent = 0
+        self.hedges_won = 0
+
+    def applies_to(self, method: str, endpoint: str) -> bool:
+        """Check whether requests to this endpoint may be hedged."""
+        if method.upper() != 'GET':
+            return False
+        return self.endpoints is None or endpoint.startswith(self.endpoints)
+
+    def delay(self, endpoint: str) -> float:
+        """
+        Seconds to wait for the first response before hedging.
+
+        Args:
+            endpoint: Normalized endpoint path
+
+        Returns:
+            The endpoint's running latency percentile, clamped to
+            ``[min_delay, max_delay]``
+        """
+        with self._lock:
+            samples = self._samples.get(endpoint)
+            if samples is None or len(samples) < self.min_samples:
+                value = self.initial_delay
+            else:
+                ordered = sorted(samples)
+                value = ordered[min(int(self.percentile * len(ordered)), len(ordered) - 1)]
+        value = max(value, self.min_delay)
+        return min(value, self.max_delay) if self.max_delay is not None else value
+
+    def observe(self, endpoint: str, seconds: float) -> None:
+        """Record the latency of a primary (non-hedge) request."""
+        with self._lock:
+            samples = self._samples.get(endpoint)
+            if samples is None:
+                samples = self._samples[endpoint] = deque(maxlen=self.sample_size)
+            samples.append(seconds)
+
+    def record_hedge(self, won: bool) -> None:
+        """Count a hedge that was sent, and whether it beat the original."""
+        with self._lock:
+            self.hedges_sent += 1
+            if won:
+                self.hedges_won += 1
+
+    def __repr__(self) -> str:
+        """String representation of the policy."""
+        return f"HedgingPolicy(percentile={self.percentile}, hedges_sent={self.hedges_sent}, hedges_won={self.hedges_won})"
@@ -0,0 +1,446 @@
+"""
+Local judge directory for the CourtListener SDK.
+
+``JudgeDirectory`` loads ``people/``, ``positions/``, ``educations/``,
+``political-affiliations/`` and ``aba-ratings/`` once and answers career
+questions from memory. Positions are indexed per court in an interval tree
+keyed on ``date_start``/``date_termination``, so "who sat on court X on date
+D" costs a tree lookup instead of a filtered ``positions/`` request.
+"""
+
+import json
+import os
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime
+from typing import Dict, Any, Generic, Iterable, List, Optional, Tuple, TypeVar, Union
+
+from ..exceptions import NotFoundError, ValidationError
+from ..models.aba_rating import ABARating
+from ..models.education import Education
+from ..models.judge import Judge
+from ..models.political_affiliation import PoliticalAffiliation
+from ..models.position import Position
+from .urls import parse_court_id, parse_resource_id
+
+# Refresh the local copy after 7 days by default
+DEFAULT_TTL = 7 * 24 * 3600
+
+# Record type -> endpoint it is loaded from
+SOURCES = {
+    'people': 'people/',
+    'positions': 'positions/',
+    'educations': 'educations/',
+    'political_affiliations': 'political-affiliations/',
+    'aba_ratings': 'aba-ratings/',
+}
+
+T = TypeVar('T')
+DateLike = Union[date, datetime, str]
+
+
+def _to_date(value: Any) -> Optional[date]:
+    """Date from a ``date``, ``datetime`` or ISO string."""
+    if value is None or value == '':
+        return None
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    try:
+        return date.fromisoformat(str(value)[:10])
+    except ValueError:
+        return None
+
+
+def _require_date(value: DateLike) -> date:
+    parsed = _to_date(value)
+    if parsed is None:
+        raise ValidationError(f"Invalid date: {value!r}. Use YYYY-MM-DD")
+    return parsed
+
+
+class _Node:
+    __slots__ = ('center', 'by_start', 'by_end', 'left', 'right')
+
+    def __init__(self, center, by_start, by_end, left, right):
+        self.center = center
+        self.by_start = by_start
+        self.by_end = by_end
+        self.left = left
+        self.right = right
+
+
+class IntervalTree(Generic[T]):
+    """Static centered interval tree over closed ``[start, end]`` intervals."""
+
+    def __init__(self, intervals: Iterable[Tuple[Any, Any, T]]):
+        """
+        Build the tree.
+
+        Args:
+            intervals: ``(start, end, value)`` tuples with ``start <= end``
+        """
+        items = [item for item in intervals if item[0] <= item[1]]
+        self._size = len(items)
+        self._root = self._build(items)
+
+    def at(self, point) -> List[T]:
+        """Values whose interval contains ``point``."""
+        result: List[T] = []
+        node = self._root
+        while node is not None:
+            if point < node.center:
+                for start, _, value in node.by_start:
+                    if start > point:
+                        break
+                    result.append(value)
+                node = node.left
+            elif point > node.center:
+                for _, end, value in node.by_end:
+                    if end < point:
+                        break
+                    result.append(value)
+                node = node.right
+            else:
+                result.extend(value for _, _, value in node.by_start)
+                break
+        return result
+
+    def overlapping(self, start, end) -> List[T]:
+        """Values whose interval overlaps ``[start, end]``."""
+        result: List[T] = []
+        stack = [self._root]
+        while stack:
+            node = stack.pop()
+            if node is None:
+                continue
+            if end < node.center:
+                for item_start, _, value in node.by_start:
+                    if item_start > end:
+                        break
+                    result.append(value)
+                stack.append(node.left)
+            elif start > node.center:
+                for _, item_end, value in node.by_end:
+                    if item_end < start:
+                        break
+                    result.append(value)
+                stack.append(node.right)
+            else:
+                result.extend(value for _, _, value in node.by_start)
+                stack.append(node.left)
+                stack.append(node.right)
+        return result
+
+    def __len__(self) -> int:
+        return self._size
+
+    @classmethod
+    def _build(cls, items: List[Tuple[Any, Any, T]]) -> Optional[_Node]:
+        if not items:
+            return None
+        points = sorted(point for start, end, _ in items for point in (start, end))
+        center = points[len(points) // 2]
+        here, left, right = [], [], []
+        for item in items:
+            if item[1] < center:
+                left.append(item)
+            elif item[0] > center:
+                right.append(item)
+            else:
+                here.append(item)
+        return _Node(
+            center,
+            sorted(here, key=lambda item: item[0]),
+            sorted(here, key=lambda item: item[1], reverse=True),
+            cls._build(left),
+            cls._build(right),
+        )
+
+
+class JudgeDirectory:
+    """In-memory index of judges and their careers."""
+
+    def __init__(
+        self,
+        people: Iterable[Union[Judge, Dict[str, Any]]],
+        positions: Iterable[Union[Position, Dict[str, Any]]],
+        educations: Iterable[Union[Education, Dict[str, Any]]] = (),
+        political_affiliations: Iterable[Union[PoliticalAffiliation, Dict[str, Any]]] = (),
+        aba_ratings: Iterable[Union[ABARating, Dict[str, Any]]] = (),
+        fetched_at: Optional[float] = None,
+    ):
+        """
+        Build the directory indexes.
+
+        Args:
+            people: Judge objects or raw ``people/`` records
+            positions: Position objects or raw ``positions/`` records
+            educations: Raw or parsed ``educations/`` records
+            political_affiliations: Raw or parsed ``political-affiliations/`` records
+            aba_ratings: Raw or parsed ``aba-ratings/`` records
+            fetched_at: When the records were fetched (epoch seconds;
+                default: now)
+        """
+        self.fetched_at = fetched_at if fetched_at is not None else time.time()
+        self._people: Dict[int, Judge] = {}
+        for person in people:
+            person = person if isinstance(person, Judge) else Judge(person)
+            if person.id is not None:
+                self._people[person.id] = person
+        self._positions = self._parse(positions, Position)
+        self._educations = self._parse(educations, Education)
+        self._affiliations = self._parse(political_affiliations, PoliticalAffiliation)
+        self._ratings = self._parse(aba_ratings, ABARating)
+        self._by_person: Dict[str, Dict[int, list]] = {
+            'positions': self._group(self._positions),
+            'educations': self._group(self._educations),
+            'political_affiliations': self._group(self._affiliations),
+            'aba_ratings': self._group(self._ratings),
+        }
+        for positions in self._by_person['positions'].values():
+            positions.sort(key=lambda p: _to_date(p.get('date_start')) or date.min)
+
+        # Positions without a start date cannot be placed on the timeline
+        by_court: Dict[Optional[str], List[Tuple[date, date, Position]]] = {}
+        for position in self._positions:
+            start = _to_date(position.get('date_start'))
+            if start is None:
+                continue
+            end = _to_date(position.get('date_termination')) or date.max
+            by_court.setdefault(parse_court_id(position.get('court')), []).append((start, end, position))
+        self._trees = {court: IntervalTree(items) for court, items in by_court.items()}
+        self._all = IntervalTree(item for items in by_court.values() for item in items)
+
+    @classmethod
+    def from_api(cls, client, max_workers: int = 5) -> 'JudgeDirectory':
+        """
+        Build a directory by paginating through all five endpoints.
+
+        Args:
+            client: CourtListener client instance
+            max_workers: Endpoints fetched concurrently
+
+        Returns:
+            JudgeDirectory instance
+        """
+        def fetch(endpoint):
+            return list(client.paginate(endpoint))
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            records = dict(zip(SOURCES, executor.map(fetch, SOURCES.values())))
+        return cls(**records)
+
+    @classmethod
+    def load(
+        cls,
+        client,
+        path: Optional[str] = None,
+        ttl: float = DEFAULT_TTL,
+        refresh: bool = False,
+    ) -> 'JudgeDirectory':
+        """
+        Load the directory from a local file, fetching it when stale or missing.
+
+        Args:
+            client: CourtListener client instance, used when a fetch is needed
+            path: JSON file holding the records (default: fetch every time
+                and keep nothing on disk)
+            ttl: Seconds a stored copy stays fresh (default: 7 days)
+            refresh: Fetch from the API even if the stored copy is fresh
+
+        Returns:
+            JudgeDirectory instance
+        """
+        if path:
+            path = os.path.expanduser(path)
+        if path and not refresh:
+            directory = cls.read(path)
+            if directory is not None and time.time() - directory.fetched_at < ttl:
+                return directory
+        directory = cls.from_api(client)
+        if path:
+            directory.save(path)
+        return directory
+
+    @classmethod
+    def read(cls, path: str) -> Optional['JudgeDirectory']:
+        """
+        Read a directory saved with ``save``.
+
+        Args:
+            path: JSON file path
+
+        Returns:
+            JudgeDirectory, or None if the file is missing or unreadable
+        """
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                payload = json.load(f)
+            return cls(**{name: payload[name] for name in SOURCES}, fetched_at=float(payload['fetched_at']))
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    def save(self, path: str) -> None:
+        """
+        Write the raw records to a JSON file (atomically).
+
+        Args:
+            path: JSON file path
+        """
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        records = {
+            'people': self._people.values(),
+            'positions': self._positions,
+            'educations': self._educations,
+            'political_affiliations': self._affiliations,
+            'aba_ratings': self._ratings,
+        }
+        payload: Dict[str, Any] = {name: [item._data for item in items] for name, items in records.items()}
+        payload['fetched_at'] = self.fetched_at
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(payload, f, default=str)
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    def get_judge(self, person_id: int) -> Judge:
+        """
+        Get a person by id.
+
+        Raises:
+            NotFoundError: If the directory has no such person
+        """
+        person = self._people.get(int(person_id))
+        if person is None:
+            raise NotFoundError(f"Person not found: {person_id}")
+        return person
+
+    def positions_for(self, person_id: int) -> List[Position]:
+        """A person's positions, oldest first."""
+        return list(self._by_person['positions'].get(int(person_id), []))
+
+    def educations_for(self, person_id: int) -> List[Education]:
+        """A person's educations."""
+        return list(self._by_person['educations'].get(int(person_id), []))
+
+    def political_affiliations_for(self, person_id: int) -> List[PoliticalAffiliation]:
+        """A person's political affiliations."""
+        return list(self._by_person['political_affiliations'].get(int(person_id), []))
+
+    def aba_ratings_for(self, person_id: int) -> List[ABARating]:
+        """A person's ABA ratings."""
+        return list(self._by_person['aba_ratings'].get(int(person_id), []))
+
+    def positions_on(
+        self,
+        on_date: DateLike,
+        court: Optional[str] = None,
+        position_types: Optional[Iterable[str]] = None,
+    ) -> List[Position]:
+        """
+        Positions held on a date.
+
+        Args:
+            on_date: Date to check
+            court: Court id or URL (default: every court)
+            position_types: Only these ``position_type`` codes (e.g. ``'jud'``)
+
+        Returns:
+            List of Position objects
+        """
+        tree = self._tree(court)
+        return self._filter(tree.at(_require_date(on_date)) if tree else [], position_types)
+
+    def positions_between(
+        self,
+        start: DateLike,
+        end: DateLike,
+        court: Optional[str] = None,
+        position_types: Optional[Iterable[str]] = None,
+    ) -> List[Position]:
+        """Positions held at any time between two dates (inclusive)."""
+        tree = self._tree(court)
+        return self._filter(
+            tree.overlapping(_require_date(start), _require_date(end)) if tree else [], position_types
+        )
+
+    def judges_on(
+        self,
+        court: str,
+        on_date: DateLike,
+        position_types: Optional[Iterable[str]] = ('jud',),
+    ) -> List[Judge]:
+        """
+        Who sat on a court on a date.
+
+        Args:
+            court: Court id or URL
+            on_date: Date to check
+            position_types: Position types that count as sitting (default:
+                judgeships, ``'jud'``; None for any position)
+
+        Returns:
+            List of Judge objects (people missing from the directory are
+            skipped)
+        """
+        judges = []
+        seen = set()
+        for position in self.positions_on(on_date, court, position_types):
+            person_id = self._person_id(position)
+            if person_id in self._people and person_id not in seen:
+                seen.add(person_id)
+                judges.append(self._people[person_id])
+        return judges
+
+    def get_current_position_for_judge(self, judge_id: int) -> Optional[Position]:
+        """
+        The judge's open position (no ``date_termination``), latest start first.
+
+        Mirrors ``PositionsAPI.get_current_position_for_judge`` without a request.
+        """
+        current = [p for p in self.positions_for(judge_id) if not p.get('date_termination')]
+        return current[-1] if current else None
+
+    def __len__(self) -> int:
+        return len(self._people)
+
+    def __contains__(self, person_id: Any) -> bool:
+        return parse_resource_id(person_id) in self._people
+
+    def __repr__(self) -> str:
+        """String representation of the directory."""
+        return f"JudgeDirectory(people={len(self._people)}, positions={len(self._positions)})"
+
+    @staticmethod
+    def _parse(records: Iterable[Any], model_class: type) -> list:
+        return [record if isinstance(record, model_class) else model_class(record) for record in records]
+
+    @staticmethod
+    def _person_id(record) -> Optional[int]:
+        return parse_resource_id(record.get('person') or record.get('judge'))
+
+    def _group(self, records: list) -> Dict[int, list]:
+        grouped: Dict[int, list] = {}
+        for record in records:
+            person_id = self._person_id(record)
+            if person_id is not None:
+                grouped.setdefault(person_id, []).append(record)
+        return grouped
+
+    def _tree(self, court: Optional[str]) -> Optional[IntervalTree]:
+        return self._all if court is None else self._trees.get(parse_court_id(court))
+
+    @staticmethod
+    def _filter(positions: List[Position], position_types: Optional[Iterable[str]]) -> List[Position]:
+        if position_types is None:
+            return positions
+        allowed = set(position_types)
+        return [position for position in positions if position.get('position_type') in allowed]
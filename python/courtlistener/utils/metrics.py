@@ -0,0 +1,263 @@
+"""
+Request metrics for the CourtListener SDK.
+
+``MetricsCollector`` attaches to a client's request hooks and keeps
+per-endpoint latency histograms, request/status counts, retries, 429s and
+errors, plus cache hit rates reported by SDK caches. Byte counts come from
+the transport's ``TransferStats``. Everything can be exported as a plain
+dict or in the Prometheus text exposition format.
+"""
+
+import bisect
+import threading
+from typing import Dict, Any, Sequence
+
+from ..exceptions import ValidationError
+
+# Latency histogram buckets in seconds
+DEFAULT_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+
+def _escape(value: Any) -> str:
+    """Escape a Prometheus label value."""
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _labels(**labels) -> str:
+    return '{' + ','.join(f'{name}="{_escape(value)}"' for name, value in labels.items()) + '}'
+
+
+def _format_number(value: float) -> str:
+    if value == float('inf'):
+        return '+Inf'
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class _EndpointMetrics:
+    """Counters for one endpoint."""
+
+    def __init__(self, buckets: Sequence[float]):
+        self.bucket_counts = [0] * (len(buckets) + 1)
+        self.latency_sum = 0.0
+        self.latency_count = 0
+        self.requests: Dict[tuple, int] = {}
+        self.retries = 0
+        self.rate_limited = 0
+        self.errors: Dict[str, int] = {}
+
+
+class MetricsCollector:
+    """Collects request metrics through the transport's lifecycle hooks."""
+
+    def __init__(self, client=None, buckets: Sequence[float] = DEFAULT_BUCKETS, prefix: str = 'courtlistener'):
+        """
+        Initialize the collector.
+
+        Args:
+            client: Optional client (or transport) to attach to immediately
+            buckets: Upper bounds of the latency histogram buckets in seconds
+            prefix: Metric name prefix for the Prometheus export
+        """
+        if not buckets or list(buckets) != sorted(buckets):
+            raise ValidationError("buckets must be a non-empty, ascending sequence")
+        self.buckets = tuple(float(bound) for bound in buckets)
+        self.prefix = prefix
+        self._lock = threading.Lock()
+        self._endpoints: Dict[str, _EndpointMetrics] = {}
+        self._caches: Dict[str, Dict[str, int]] = {}
+        self._transport = None
+        if client is not None:
+            self.attach(client)
+
+    def attach(self, client) -> 'MetricsCollector':
+        """
+        Start collecting from a client or transport.
+
+        Args:
+            client: ``CourtListenerClient`` or ``Transport``
+
+        Returns:
+            The collector, for chaining
+        """
+        self.detach()
+        transport = getattr(client, 'transport', client)
+        transport.hooks.register('after_response', self._on_response)
+        transport.hooks.register('on_retry', self._on_retry)
+        transport.hooks.register('on_error', self._on_error)
+        self._transport = transport
+        return self
+
+    def detach(self) -> None:
+        """Stop collecting; recorded metrics are kept."""
+        if self._transport is None:
+            return
+        self._transport.hooks.unregister('after_response', self._on_response)
+        self._transport.hooks.unregister('on_retry', self._on_retry)
+        self._transport.hooks.unregister('on_error', self._on_error)
+        self._transport = None
+
+    def record_cache(self, cache: str, hit: bool) -> None:
+        """
+        Record a cache lookup.
+
+        Args:
+            cache: Cache name (e.g. ``'resolver'``)
+            hit: Whether the lookup was served from the cache
+        """
+        with self._lock:
+            counts = self._caches.setdefault(cache, {'hits': 0, 'misses': 0})
+            counts['hits' if hit else 'misses'] += 1
+
+    def observe(self, endpoint: str, seconds: float, method: str = 'GET', status: Any = 200) -> None:
+        """
+        Record one response directly (used by the hooks; also handy in tests).
+
+        Args:
+            endpoint: Normalized endpoint path
+            seconds: Latency of the attempt
+            method: HTTP method
+            status: HTTP status code
+        """
+        with self._lock:
+            metrics = self._metrics(endpoint)
+            metrics.bucket_counts[bisect.bisect_left(self.buckets, seconds)] += 1
+            metrics.latency_sum += seconds
+            metrics.latency_count += 1
+            key = (method, str(status))
+            metrics.requests[key] = metrics.requests.get(key, 0) + 1
+            if status == 429:
+                metrics.rate_limited += 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Get all metrics as a plain dict.
+
+        Returns:
+            ``{'endpoints': {endpoint: {...}}, 'caches': {name: {...}}}``;
+            latency buckets are cumulative and keyed by upper bound
+        """
+        transfer = self._transfer_snapshot()
+        with self._lock:
+            endpoints = {}
+            for endpoint, metrics in self._endpoints.items():
+                cumulative, buckets = 0, {}
+                for bound, count in zip(self.buckets + (float('inf'),), metrics.bucket_counts):
+                    cumulative += count
+                    buckets[bound] = cumulative
+                status: Dict[str, int] = {}
+                for (_, code), count in metrics.requests.items():
+                    status[code] = status.get(code, 0) + count
+                endpoints[endpoint] = {
+                    'requests': metrics.latency_count,
+                    'status': status,
+                    'latency': {
+                        'count': metrics.latency_count,
+                        'sum': metrics.latency_sum,
+                        'mean': metrics.latency_sum / metrics.latency_count if metrics.latency_count else 0.0,
+                        'buckets': buckets,
+                    },
+                    'retries': metrics.retries,
+                    'rate_limited': metrics.rate_limited,
+                    'errors': dict(metrics.errors),
+                }
+            caches = {
+                name: dict(counts, hit_rate=counts['hits'] / (counts['hits'] + counts['misses']))
+                for name, counts in self._caches.items()
+            }
+        for endpoint, stats in transfer.items():
+            entry = endpoints.setdefault(endpoint, {'requests': stats['requests']})
+            entry['wire_bytes'] = stats['wire_bytes']
+            entry['decoded_bytes'] = stats['decoded_bytes']
+        return {'endpoints': endpoints, 'caches': caches}
+
+    def to_prometheus(self) -> str:
+        """
+        Render all metrics in the Prometheus text exposition format.
+
+        Returns:
+            Metrics text, ending with a newline
+        """
+        p = self.prefix
+        transfer = self._transfer_snapshot()
+        lines = []
+
+        def family(name: str, kind: str, help_text: str) -> None:
+            lines.append(f'# HELP {p}_{name} {help_text}')
+            lines.append(f'# TYPE {p}_{name} {kind}')
+
+        with self._lock:
+            endpoints = sorted(self._endpoints.items())
+            caches = sorted(self._caches.items())
+
+            family('request_duration_seconds', 'histogram', 'HTTP request latency by endpoint.')
+            for endpoint, metrics in endpoints:
+                cumulative = 0
+                for bound, count in zip(self.buckets + (float('inf'),), metrics.bucket_counts):
+                    cumulative += count
+                    lines.append(
+                        f'{p}_request_duration_seconds_bucket'
+                        f'{_labels(endpoint=endpoint, le=_format_number(bound))} {cumulative}'
+                    )
+                lines.append(f'{p}_request_duration_seconds_sum{_labels(endpoint=endpoint)} {metrics.latency_sum!r}')
+                lines.append(f'{p}_request_duration_seconds_count{_labels(endpoint=endpoint)} {metrics.latency_count}')
+
+            family('requests_total', 'counter', 'HTTP responses by endpoint, method and status.')
+            for endpoint, metrics in endpoints:
+                for (method, status), count in sorted(metrics.requests.items()):
+                    lines.append(f'{p}_requests_total{_labels(endpoint=endpoint, method=method, status=status)} {count}')
+
+            family('retries_total', 'counter', 'Retried attempts by endpoint.')
+            for endpoint, metrics in endpoints:
+                lines.append(f'{p}_retries_total{_labels(endpoint=endpoint)} {metrics.retries}')
+
+            family('rate_limited_total', 'counter', 'HTTP 429 responses by endpoint.')
+            for endpoint, metrics in endpoints:
+                lines.append(f'{p}_rate_limited_total{_labels(endpoint=endpoint)} {metrics.rate_limited}')
+
+            family('errors_total', 'counter', 'Failed requests by endpoint and error type.')
+            for endpoint, metrics in endpoints:
+                for error, count in sorted(metrics.errors.items()):
+                    lines.append(f'{p}_errors_total{_labels(endpoint=endpoint, error=error)} {count}')
+
+            family('cache_requests_total', 'counter', 'Cache lookups by cache and result.')
+            for name, counts in caches:
+                lines.append(f'{p}_cache_requests_total{_labels(cache=name, result="hit")} {counts["hits"]}')
+                lines.append(f'{p}_cache_requests_total{_labels(cache=name, result="miss")} {counts["misses"]}')
+
+        family('wire_bytes_total', 'counter', 'Response bytes received on the wire (compressed) by endpoint.')
+        for endpoint, stats in sorted(transfer.items()):
+            lines.append(f'{p}_wire_bytes_total{_labels(endpoint=endpoint)} {stats["wire_bytes"]}')
+        family('decoded_bytes_total', 'counter', 'Response bytes after content decoding by endpoint.')
+        for endpoint, stats in sorted(transfer.items()):
+            lines.append(f'{p}_decoded_bytes_total{_labels(endpoint=endpoint)} {stats["decoded_bytes"]}')
+
+        return '\n'.join(lines) + '\n'
+
+    def reset(self) -> None:
+        """Clear all recorded metrics (transfer byte counts are left to the transport)."""
+        with self._lock:
+            self._endpoints.clear()
+            self._caches.clear()
+
+    def _metrics(self, endpoint: str) -> _EndpointMetrics:
+        metrics = self._endpoints.get(endpoint)
+        if metrics is None:
+            metrics = self._endpoints[endpoint] = _EndpointMetrics(self.buckets)
+        return metrics
+
+    def _transfer_snapshot(self) -> Dict[str, Dict[str, Any]]:
+        stats = getattr(self._transport, 'transfer_stats', None)
+        return stats.snapshot() if stats is not None else {}
+
+    def _on_response(self, context, response) -> None:
+        self.observe(context.endpoint, context.elapsed or 0.0, context.method, context.status_code)
+
+    def _on_retry(self, context, error, delay) -> None:
+        with self._lock:
+            self._metrics(context.endpoint).retries += 1
+
+    def _on_error(self, context, error) -> None:
+        with self._lock:
+            errors = self._metrics(context.endpoint).errors
+            name = type(error).__name__
+            errors[name] = errors.get(name, 0) + 1
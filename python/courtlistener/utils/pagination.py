@@ -3,7 +3,9 @@ Pagination utilities for the CourtListener SDK.
 """
 
 from typing import Iterator, Optional, Dict, Any, Callable
+from .. import tracing
 from ..exceptions import CourtListenerError
+from .streaming import StreamedPage
 
 
 class Paginator:
@@ -23,6 +25,8 @@ class Paginator:
         self.params = params or {}
         self.cursor = None
         self.has_more = True
+        # Parent page spans to the API call that created the paginator
+        self._trace_context = tracing.current_context()
     
     def __iter__(self) -> Iterator[Dict[str, Any]]:
         """Iterate through all pages of results."""
@@ -47,7 +51,7 @@ class Paginator:
     
     def _fetch_page(self) -> Optional[Dict[str, Any]]:
         """Fetch a single page of results."""
-        params = self.params.copy()
+        params = dict(self.params)
         
         if self.cursor:
             # Extract cursor from next URL
@@ -56,16 +60,22 @@ class Paginator:
                 params['cursor'] = cursor_value
         
         try:
-            response = self.client._make_request('GET', self.endpoint, params=params)
+            with tracing.span('Paginator.fetch_page', {'courtlistener.endpoint': self.endpoint}, self._trace_context):
+                response = self.client._make_request('GET', self.endpoint, params=params)
             return response
         except Exception as e:
             raise CourtListenerError(f"Failed to fetch page: {str(e)}")
 
 
 class PageIterator:
-    """Iterator for paginated results with lazy loading."""
+    """
+    Iterator for paginated results with lazy loading.
+
+    Use it as a context manager (or call ``close()``) when a streamed
+    iteration may be abandoned partway, so the page's connection is released.
+    """
     
-    def __init__(self, client, endpoint: str, params: Optional[Dict[str, Any]] = None):
+    def __init__(self, client, endpoint: str, params: Optional[Dict[str, Any]] = None, stream: bool = False):
         """
         Initialize page iterator.
         
@@ -73,14 +83,21 @@ class PageIterator:
             client: CourtListener client instance
             endpoint: API endpoint to iterate
             params: Query parameters for the request
+            stream: Decode each page incrementally, yielding items as bytes
+                arrive instead of after the whole page has been parsed
         """
         self.client = client
         self.endpoint = endpoint
         self.params = params or {}
-        self.current_page = None
+        self.stream = stream
+        self.current_page: Any = None
         self.current_index = 0
-        self.cursor = None
+        self.cursor: Optional[str] = None
         self.has_more = True
+        self._stream_items: Optional[Iterator[Dict[str, Any]]] = None
+        self._closed = False
+        # Parent page spans to the API call that created the iterator
+        self._trace_context = tracing.current_context()
     
     def __iter__(self):
         """Return self as iterator."""
@@ -88,6 +105,11 @@ class PageIterator:
     
     def __next__(self) -> Dict[str, Any]:
         """Get next item from paginated results."""
+        if self._closed:
+            raise StopIteration
+        if self.stream:
+            return self._next_streamed()
+        
         # Load first page if not loaded
         if self.current_page is None:
             self._load_next_page()
@@ -103,9 +125,23 @@ class PageIterator:
         self.current_index += 1
         return item
     
+    def close(self) -> None:
+        """Stop iterating and release the connection of a partly read streamed page."""
+        self._closed = True
+        self.has_more = False
+        self._stream_items = None
+        if isinstance(self.current_page, StreamedPage):
+            self.current_page.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+    
     def _load_next_page(self):
         """Load the next page of results."""
-        params = self.params.copy()
+        params = dict(self.params)
         
         if self.cursor:
             if 'cursor=' in self.cursor:
@@ -113,19 +149,48 @@ class PageIterator:
                 params['cursor'] = cursor_value
         
         try:
-            response = self.client._make_request('GET', self.endpoint, params=params)
+            with tracing.span('PageIterator.load_page', {'courtlistener.endpoint': self.endpoint}, self._trace_context):
+                if self.stream:
+                    response = self.client._make_request('GET', self.endpoint, params=params, stream=True)
+                    self.current_page = response
+                    self._stream_items = response.results
+                    return
+                response = self.client._make_request('GET', self.endpoint, params=params)
             self.current_page = response
             self.current_index = 0
-            next_cursor = response.get('next')
-            # Only update cursor if it's different to prevent infinite loops
-            if next_cursor != self.cursor:
-                self.cursor = next_cursor
-                self.has_more = bool(self.cursor)
-            else:
-                # If cursor hasn't changed, we're stuck in a loop
-                self.has_more = False
+            self._advance_cursor(response.get('next'))
         except Exception as e:
             raise CourtListenerError(f"Failed to load page: {str(e)}")
+    
+    def _next_streamed(self) -> Dict[str, Any]:
+        """Get next item when pages are decoded incrementally."""
+        while True:
+            items = self._stream_items
+            if items is None:
+                if not self.has_more:
+                    raise StopIteration
+                self._load_next_page()
+                continue
+            try:
+                return next(items)
+            except StopIteration:
+                # The page is fully parsed, so its 'next' link is known now
+                self._stream_items = None
+                self._advance_cursor(self.current_page.get('next'))
+            except CourtListenerError:
+                raise
+            except Exception as e:
+                raise CourtListenerError(f"Failed to load page: {str(e)}")
+    
+    def _advance_cursor(self, next_cursor: Optional[str]):
+        """Move to the next cursor, stopping if it did not change."""
+        # Only update cursor if it's different to prevent infinite loops
+        if next_cursor != self.cursor:
+            self.cursor = next_cursor
+            self.has_more = bool(self.cursor)
+        else:
+            # If cursor hasn't changed, we're stuck in a loop
+            self.has_more = False
 
 
 def paginate_results(client, endpoint: str, params: Optional[Dict[str, Any]] = None) -> Iterator[Dict[str, Any]]:
@@ -0,0 +1,437 @@
+"""
+RECAP fetch job orchestration for the CourtListener SDK.
+
+A ``recap-fetch/`` request queues a PACER purchase that completes minutes
+later. ``RecapJobManager`` submits many such requests and tracks them all
+from a single polling loop: jobs that are due are checked together with
+batched ``id__in`` queries, each job's poll interval grows exponentially
+while it is pending, ``Retry-After`` hints push polling back, and finished
+jobs are streamed to the caller (``as_completed``, ``as_completed_async``
+or a callback) without a thread waiting on each job.
+"""
+
+import asyncio
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, AsyncIterator, Callable, Iterable, Iterator, List, Optional
+
+from ..exceptions import AcceptedError, CourtListenerError, NotFoundError, RateLimitError, ValidationError
+from .urls import parse_resource_id
+
+# recap-fetch/ processing statuses
+ENQUEUED = 1
+SUCCESSFUL = 2
+FAILED = 3
+IN_PROGRESS = 4
+QUEUED_FOR_RETRY = 5
+INVALID_CONTENT = 6
+NEEDS_INFO = 7
+
+# Statuses after which a fetch will not change any more
+TERMINAL_STATUSES = frozenset({SUCCESSFUL, FAILED, INVALID_CONTENT, NEEDS_INFO})
+
+_STATUS_NAMES = {
+    'enqueued': ENQUEUED,
+    'awaiting processing': ENQUEUED,
+    'successful': SUCCESSFUL,
+    'failed': FAILED,
+    'in progress': IN_PROGRESS,
+    'queued for retry': QUEUED_FOR_RETRY,
+    'invalid content': INVALID_CONTENT,
+    'needs info': NEEDS_INFO,
+}
+
+
+def _status_code(value: Any) -> Optional[int]:
+    """Numeric status from an int or a status name."""
+    if isinstance(value, int) and not isinstance(value, bool):
+        return value
+    if isinstance(value, str):
+        text = value.strip().lower().replace('_', ' ')
+        if text.isdigit():
+            return int(text)
+        return _STATUS_NAMES.get(text)
+    return None
+
+
+class RecapJob:
+    """One tracked ``recap-fetch/`` request."""
+
+    def __init__(self, fetch_id: Optional[int], request: Optional[Dict[str, Any]] = None, interval: float = 5.0):
+        """
+        Initialize the job.
+
+        Args:
+            fetch_id: ``recap-fetch/`` object ID (None if the submission failed)
+            request: Data the fetch was submitted with
+            interval: Seconds until the first status check
+        """
+        self.id = fetch_id
+        self.request = request or {}
+        self.data: Dict[str, Any] = {}
+        self.status: Optional[int] = None
+        self.error: Optional[Exception] = None
+        self.polls = 0
+        self.interval = interval
+        self.submitted_at = time.time()
+        self.next_poll = self.submitted_at + interval
+        self.completed_at: Optional[float] = None
+
+    @property
+    def done(self) -> bool:
+        """True once the fetch reached a terminal status or could not be tracked."""
+        return self.completed_at is not None
+
+    @property
+    def succeeded(self) -> bool:
+        """True if PACER content was fetched."""
+        return self.status == SUCCESSFUL
+
+    @property
+    def message(self) -> Optional[str]:
+        """Status message reported by CourtListener."""
+        return self.data.get('message')
+
+    def _update(self, data: Dict[str, Any]) -> bool:
+        """Record fetched data; returns True if the job just finished."""
+        self.data = data
+        self.status = _status_code(data.get('status'))
+        if self.status in TERMINAL_STATUSES and self.completed_at is None:
+            self.completed_at = time.time()
+            return True
+        return False
+
+    def __repr__(self) -> str:
+        """String representation of the job."""
+        return f"RecapJob(id={self.id}, status={self.status}, done={self.done})"
+
+
+class RecapJobManager:
+    """Submit RECAP fetches and track them with batched, adaptive polling."""
+
+    def __init__(
+        self,
+        client,
+        initial_interval: float = 5.0,
+        max_interval: float = 300.0,
+        backoff: float = 2.0,
+        batch_size: int = 100,
+        timeout: Optional[float] = None,
+        callback: Optional[Callable[[RecapJob], None]] = None,
+    ):
+        """
+        Initialize the manager.
+
+        Args:
+            client: CourtListener client instance
+            initial_interval: Seconds before a new job is first checked
+            max_interval: Longest interval between checks of one job
+            backoff: Factor the interval grows by after each pending check
+            batch_size: Jobs checked per ``id__in`` request
+            timeout: Give up on a job after this many seconds (the job
+                finishes with a ``CourtListenerError``)
+            callback: Called with each job as it finishes
+        """
+        if backoff < 1:
+            raise ValidationError("backoff must be at least 1")
+        if batch_size < 1:
+            raise ValidationError("batch_size must be at least 1")
+        self.client = client
+        self.initial_interval = initial_interval
+        self.max_interval = max_interval
+        self.backoff = backoff
+        self.batch_size = batch_size
+        self.timeout = timeout
+        self.callback = callback
+        self.logger = logging.getLogger(__name__)
+        self._jobs: Dict[int, RecapJob] = {}
+        self._finished: List[RecapJob] = []
+        self._lock = threading.RLock()
+        self._poll_lock = threading.Lock()
+        self._no_id_in = False
+
+    def submit(self, **data) -> RecapJob:
+        """
+        Queue a PACER fetch and start tracking it.
+
+        Args:
+            **data: ``recap-fetch/`` fields (``request_type``, ``docket``,
+                ``recap_document``, ``pacer_username``, ...)
+
+        Returns:
+            RecapJob instance
+        """
+        response = self.client.post('recap-fetch/', data=data)
+        fetch_id = parse_resource_id(response.get('id'))
+        if fetch_id is None:
+            raise CourtListenerError(f"recap-fetch/ response has no id: {response!r}")
+        job = self.track(fetch_id, request=data)
+        if job._update(response):
+            self._finish(job)
+        return job
+
+    def submit_many(self, requests: Iterable[Dict[str, Any]], max_workers: int = 4) -> List[RecapJob]:
+        """
+        Queue many PACER fetches concurrently.
+
+        Args:
+            requests: ``recap-fetch/`` field dicts
+            max_workers: Concurrent submissions
+
+        Returns:
+            Jobs in request order; a failed submission is a finished job
+            with ID None and the error in ``error``, delivered like any
+            other finished job
+        """
+        requests = list(requests)
+
+        def run(data):
+            try:
+                return self.submit(**data)
+            except CourtListenerError as e:
+                job = RecapJob(None, request=data)
+                job.error = e
+                job.completed_at = time.time()
+                self._finish(job)
+                return job
+
+        if not requests:
+            return []
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(requests)))) as executor:
+            return list(executor.map(run, requests))
+
+    def track(self, fetch_id: Any, request: Optional[Dict[str, Any]] = None) -> RecapJob:
+        """
+        Track an existing ``recap-fetch/`` request.
+
+        Args:
+            fetch_id: Fetch ID or URL
+            request: Data the fetch was submitted with
+
+        Returns:
+            RecapJob instance
+        """
+        fetch_id = parse_resource_id(fetch_id)
+        if fetch_id is None:
+            raise ValidationError("Invalid recap-fetch id")
+        with self._lock:
+            job = self._jobs.get(fetch_id)
+            if job is None:
+                job = RecapJob(fetch_id, request, interval=self.initial_interval)
+                self._jobs[fetch_id] = job
+            return job
+
+    def available(self, court: str, pacer_doc_ids: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Find documents that are already in RECAP, so they need no PACER fetch.
+
+        Args:
+            court: Court ID
+            pacer_doc_ids: PACER document IDs
+
+        Returns:
+            PACER document ID -> ``recap-query/`` record, for documents
+            CourtListener already has
+        """
+        ids = [str(doc_id) for doc_id in dict.fromkeys(pacer_doc_ids)]
+        found = {}
+        for start in range(0, len(ids), self.batch_size):
+            params = {
+                'docket_entry__docket__court': court,
+                'pacer_doc_id__in': ','.join(ids[start:start + self.batch_size]),
+            }
+            for record in self.client.paginate('recap-query/', params=params):
+                if record.get('pacer_doc_id') is not None:
+                    found[str(record['pacer_doc_id'])] = record
+        return found
+
+    @property
+    def pending(self) -> List[RecapJob]:
+        """Jobs that have not finished."""
+        with self._lock:
+            return [job for job in self._jobs.values() if not job.done]
+
+    def next_poll_in(self) -> Optional[float]:
+        """Seconds until the next job is due for a check (None if none are pending)."""
+        pending = self.pending
+        if not pending:
+            return None
+        return max(0.0, min(job.next_poll for job in pending) - time.time())
+
+    def poll(self) -> List[RecapJob]:
+        """
+        Check every job that is due, without waiting.
+
+        Returns:
+            Jobs that finished during this check
+        """
+        with self._poll_lock:
+            now = time.time()
+            due = sorted((job for job in self.pending if job.next_poll <= now), key=lambda job: job.next_poll)
+            finished = []
+            for start in range(0, len(due), self.batch_size):
+                finished.extend(self._check(due[start:start + self.batch_size]))
+            if self.timeout is not None:
+                for job in self.pending:
+                    if now - job.submitted_at > self.timeout:
+                        job.error = CourtListenerError(f"RECAP fetch {job.id} timed out")
+                        job.completed_at = now
+                        finished.append(job)
+            for job in finished:
+                self._finish(job)
+            return finished
+
+    def as_completed(self, timeout: Optional[float] = None) -> Iterator[RecapJob]:
+        """
+        Yield jobs as they finish, polling from the calling thread.
+
+        Args:
+            timeout: Stop after this many seconds even if jobs are pending
+
+        Yields:
+            Finished jobs (including ones that finished before the call)
+        """
+        deadline = None if timeout is None else time.time() + timeout
+        while True:
+            for job in self._take_finished():
+                yield job
+            wait = self.next_poll_in()
+            if wait is None:
+                return
+            if deadline is not None:
+                remaining = deadline - time.time()
+                if remaining <= 0:
+                    return
+                wait = min(wait, remaining)
+            if wait > 0:
+                time.sleep(wait)
+            self.poll()
+
+    async def as_completed_async(self, timeout: Optional[float] = None) -> AsyncIterator[RecapJob]:
+        """
+        Yield jobs as they finish without blocking the event loop.
+
+        Args:
+            timeout: Stop after this many seconds even if jobs are pending
+
+        Yields:
+            Finished jobs (including ones that finished before the call)
+        """
+        loop = asyncio.get_running_loop()
+        deadline = None if timeout is None else loop.time() + timeout
+        while True:
+            for job in self._take_finished():
+                yield job
+            wait = self.next_poll_in()
+            if wait is None:
+                return
+            if deadline is not None:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    return
+                wait = min(wait, remaining)
+            if wait > 0:
+                await asyncio.sleep(wait)
+            await loop.run_in_executor(None, self.poll)
+
+    def wait(self, timeout: Optional[float] = None) -> List[RecapJob]:
+        """
+        Block until every job finished.
+
+        Args:
+            timeout: Stop waiting after this many seconds
+
+        Returns:
+            Jobs that finished while waiting
+        """
+        return list(self.as_completed(timeout))
+
+    def __len__(self) -> int:
+        """Number of tracked jobs."""
+        with self._lock:
+            return len(self._jobs)
+
+    def __repr__(self) -> str:
+        """String representation of the manager."""
+        return f"RecapJobManager(jobs={len(self)}, pending={len(self.pending)})"
+
+    def _check(self, jobs: List[RecapJob]) -> List[RecapJob]:
+        """Fetch the status of a batch of due jobs."""
+        try:
+            fetched = self._fetch_batch(jobs)
+        except (AcceptedError, RateLimitError) as e:
+            self._reschedule(jobs, getattr(e, 'retry_after', None))
+            return []
+        except CourtListenerError as e:
+            self.logger.warning("RECAP job status check failed: %s", e)
+            self._reschedule(jobs)
+            return []
+        finished = []
+        throttled = False
+        for job in jobs:
+            data = fetched.get(job.id)
+            if data is None:
+                if throttled:
+                    self._reschedule([job])
+                    continue
+                # Jobs missing from the batch are fetched one by one, and a
+                # failure only affects that job
+                try:
+                    data = self.client.get(f"recap-fetch/{job.id}/")
+                except NotFoundError as e:
+                    job.error = e
+                    job.completed_at = time.time()
+                    finished.append(job)
+                    continue
+                except (AcceptedError, RateLimitError) as e:
+                    throttled = True
+                    self._reschedule([job], getattr(e, 'retry_after', None))
+                    continue
+                except CourtListenerError as e:
+                    self.logger.warning("RECAP job %s status check failed: %s", job.id, e)
+                    self._reschedule([job])
+                    continue
+            job.polls += 1
+            if job._update(data):
+                finished.append(job)
+            else:
+                self._reschedule([job])
+        return finished
+
+    def _fetch_batch(self, jobs: List[RecapJob]) -> Dict[Optional[int], Dict[str, Any]]:
+        """Current data of the jobs the ``id__in`` filter returned, where the API allows it."""
+        wanted = {job.id for job in jobs}
+        fetched: Dict[Optional[int], Dict[str, Any]] = {}
+        if not self._no_id_in and len(jobs) > 1:
+            params = {'id__in': ','.join(str(job.id) for job in jobs)}
+            for item in self.client.paginate('recap-fetch/', params=params):
+                fetch_id = parse_resource_id(item.get('id'))
+                if fetch_id not in wanted:
+                    # Filter ignored: fall back to one request per job
+                    self._no_id_in = True
+                    fetched.clear()
+                    break
+                fetched[fetch_id] = item
+        return fetched
+
+    def _reschedule(self, jobs: List[RecapJob], retry_after: Optional[float] = None) -> None:
+        now = time.time()
+        for job in jobs:
+            job.interval = min(job.interval * self.backoff, self.max_interval)
+            job.next_poll = now + max(job.interval, retry_after or 0)
+
+    def _finish(self, job: RecapJob) -> None:
+        with self._lock:
+            self._finished.append(job)
+        if self.callback is not None:
+            try:
+                self.callback(job)
+            except Exception:
+                self.logger.exception("RECAP job callback failed")
+
+    def _take_finished(self) -> List[RecapJob]:
+        with self._lock:
+            finished, self._finished = self._finished, []
+        return finished
@@ -0,0 +1,252 @@
+"""
+Overload protection for the CourtListener SDK.
+
+``CircuitBreaker`` stops sending requests while the API is failing (sustained
+5xx responses, timeouts or connection errors) and probes it again after a
+cool-off. ``AdaptiveConcurrencyLimiter`` caps how many requests are in
+flight at once and adjusts the cap with AIMD (additive increase,
+multiplicative decrease): it backs off when latency or errors rise and grows
+again as the API recovers.
+"""
+
+import threading
+import time
+from collections import deque
+from typing import Optional
+
+from ..exceptions import CircuitOpenError, ValidationError
+
+
+class CircuitBreaker:
+    """Thread-safe circuit breaker driven by the recent failure rate."""
+
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half_open'
+
+    def __init__(
+        self,
+        failure_rate: float = 0.5,
+        minimum_requests: int = 10,
+        window: float = 30.0,
+        reset_timeout: float = 30.0,
+        half_open_requests: int = 1,
+    ):
+        """
+        Initialize the breaker.
+
+        Args:
+            failure_rate: Fraction of failed requests in the window that
+                opens the circuit (default: 0.5)
+            minimum_requests: Requests the window must hold before the rate
+                is trusted (default: 10)
+            window: Length of the rolling window in seconds (default: 30)
+            reset_timeout: Seconds to stay open before probing (default: 30)
+            half_open_requests: Trial requests allowed while probing
+                (default: 1)
+        """
+        if not 0 < failure_rate <= 1:
+            raise ValidationError("failure_rate must be between 0 and 1")
+        if minimum_requests < 1 or half_open_requests < 1:
+            raise ValidationError("minimum_requests and half_open_requests must be at least 1")
+        if window <= 0 or reset_timeout <= 0:
+            raise ValidationError("window and reset_timeout must be greater than 0")
+        self.failure_rate = failure_rate
+        self.minimum_requests = minimum_requests
+        self.window = window
+        self.reset_timeout = reset_timeout
+        self.half_open_requests = half_open_requests
+        self._lock = threading.Lock()
+        self._outcomes: deque = deque()
+        self._state = self.CLOSED
+        self._opened_at = 0.0
+        self._trials = 0
+
+    @property
+    def state(self) -> str:
+        """Current state: ``'closed'``, ``'open'`` or ``'half_open'``."""
+        with self._lock:
+            self._refresh(time.monotonic())
+            return self._state
+
+    def allow(self) -> None:
+        """
+        Check that a request may be sent.
+
+        Raises:
+            CircuitOpenError: While the circuit is open, or when the trial
+                requests of a half-open circuit are already in flight
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._refresh(now)
+            if self._state == self.CLOSED:
+                return
+            if self._state == self.HALF_OPEN and self._trials < self.half_open_requests:
+                self._trials += 1
+                return
+            retry_after = max(self._opened_at + self.reset_timeout - now, 0.0)
+            raise CircuitOpenError(
+                f"Circuit open after repeated API failures; retry in {retry_after:.1f}s",
+                retry_after=retry_after,
+            )
+
+    def record(self, success: bool) -> None:
+        """
+        Record the outcome of a request.
+
+        Args:
+            success: False for 5xx responses, timeouts and connection errors
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._refresh(now)
+            if self._state == self.HALF_OPEN:
+                if success:
+                    self._close()
+                else:
+                    self._open(now)
+                return
+            if self._state == self.OPEN:
+                return
+            self._outcomes.append((now, success))
+            self._trim(now)
+            failures = sum(1 for _, ok in self._outcomes if not ok)
+            if len(self._outcomes) >= self.minimum_requests and failures / len(self._outcomes) >= self.failure_rate:
+                self._open(now)
+
+    def reset(self) -> None:
+        """Close the circuit and forget recorded outcomes."""
+        with self._lock:
+            self._close()
+
+    def __repr__(self) -> str:
+        """String representation of the breaker."""
+        return f"CircuitBreaker(state='{self.state}')"
+
+    def _refresh(self, now: float) -> None:
+        if self._state == self.OPEN and now - self._opened_at >= self.reset_timeout:
+            self._state = self.HALF_OPEN
+            self._trials = 0
+
+    def _trim(self, now: float) -> None:
+        while self._outcomes and self._outcomes[0][0] <= now - self.window:
+            self._outcomes.popleft()
+
+    def _open(self, now: float) -> None:
+        self._state = self.OPEN
+        self._opened_at = now
+        self._outcomes.clear()
+
+    def _close(self) -> None:
+        self._state = self.CLOSED
+        self._outcomes.clear()
+        self._trials = 0
+
+
+class AdaptiveConcurrencyLimiter:
+    """AIMD limit on concurrent requests, shared by every thread using a client."""
+
+    def __init__(
+        self,
+        initial_limit: int = 4,
+        min_limit: int = 1,
+        max_limit: int = 32,
+        latency_threshold: Optional[float] = None,
+        backoff: float = 0.5,
+    ):
+        """
+        Initialize the limiter.
+
+        Args:
+            initial_limit: Starting number of concurrent requests
+            min_limit: Lowest limit the limiter backs off to
+            max_limit: Highest limit the limiter grows to
+            latency_threshold: Seconds above which a successful response
+                still counts as a congestion signal (default: errors only)
+            backoff: Factor the limit is multiplied by on congestion
+                (default: 0.5)
+        """
+        if not 1 <= min_limit <= initial_limit <= max_limit:
+            raise ValidationError("Limits must satisfy 1 <= min_limit <= initial_limit <= max_limit")
+        if not 0 < backoff < 1:
+            raise ValidationError("backoff must be between 0 and 1")
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.latency_threshold = latency_threshold
+        self.backoff = backoff
+        self._limit = float(initial_limit)
+        self._in_flight = 0
+        self._last_decrease = float('-inf')
+        self._condition = threading.Condition()
+
+    @property
+    def limit(self) -> int:
+        """Current concurrency limit."""
+        with self._condition:
+            return int(self._limit)
+
+    @property
+    def in_flight(self) -> int:
+        """Requests currently holding a slot."""
+        with self._condition:
+            return self._in_flight
+
+    def acquire(self) -> float:
+        """
+        Wait for a free slot.
+
+        Returns:
+            Ticket (start time) to pass to ``release``
+        """
+        with self._condition:
+            while self._in_flight >= int(self._limit):
+                self._condition.wait()
+            self._in_flight += 1
+            return time.monotonic()
+
+    def try_acquire(self) -> Optional[float]:
+        """
+        Take a slot only if one is free right now.
+
+        Returns:
+            Ticket for ``release``, or None if the limit is reached
+        """
+        with self._condition:
+            if self._in_flight >= int(self._limit):
+                return None
+            self._in_flight += 1
+            return time.monotonic()
+
+    def release(self, ticket: float, congested: bool = False) -> None:
+        """
+        Free a slot and adjust the limit.
+
+        Args:
+            ticket: Value returned by ``acquire``
+            congested: True for errors that signal overload (5xx, 429,
+                timeouts, connection failures)
+        """
+        now = time.monotonic()
+        slow = self.latency_threshold is not None and now - ticket > self.latency_threshold
+        with self._condition:
+            self._in_flight -= 1
+            if congested or slow:
+                # Requests sent before the last decrease reflect the old limit;
+                # only back off once per congestion episode
+                if ticket > self._last_decrease:
+                    self._limit = max(float(self.min_limit), self._limit * self.backoff)
+                    self._last_decrease = now
+            else:
+                self._limit = min(float(self.max_limit), self._limit + 1.0 / self._limit)
+            self._condition.notify_all()
+
+    def cancel(self, ticket: float) -> None:
+        """Free a slot whose request was never sent, leaving the limit as is."""
+        with self._condition:
+            self._in_flight -= 1
+            self._condition.notify_all()
+
+    def __repr__(self) -> str:
+        """String representation of the limiter."""
+        return f"AdaptiveConcurrencyLimiter(limit={self.limit}, in_flight={self.in_flight})"
@@ -0,0 +1,319 @@
+"""
+Batched dereferencing of hyperlinked fields for the CourtListener SDK.
+
+Models keep related objects as API URLs (``OpinionCluster.docket``,
+``Opinion.author``, ``Position.court``, ``Judge.positions``, ...). Following
+them one at a time costs one request per reference. ``ReferenceResolver``
+collects the URLs of a whole batch of models, groups them by endpoint,
+fetches each group with ``id__in`` filters (falling back to concurrent
+single GETs where the filter is not honoured) behind a shared cache, and
+makes the objects available through ``model.resolved(field)``.
+"""
+
+import logging
+import re
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Iterable, List, Optional, Sequence, Set, Tuple
+
+from ..exceptions import NotFoundError
+from ..models.base import BaseModel
+from ..models.cluster import OpinionCluster
+from ..models.court import Court
+from ..models.docket import Docket
+from ..models.education import Education
+from ..models.judge import Judge
+from ..models.opinion import Opinion
+from ..models.position import Position
+
+# Hyperlinked fields followed by default, per model class
+DEFAULT_FIELDS: Dict[str, Tuple[str, ...]] = {
+    'OpinionCluster': ('docket', 'court'),
+    'Opinion': ('cluster', 'author'),
+    'Position': ('judge', 'court', 'appointer', 'predecessor'),
+    'Docket': ('court',),
+    'Judge': ('positions', 'educations'),
+}
+
+# Model class used for the objects of each endpoint
+ENDPOINT_MODELS: Dict[str, type] = {
+    'dockets': Docket,
+    'courts': Court,
+    'clusters': OpinionCluster,
+    'opinions': Opinion,
+    'people': Judge,
+    'positions': Position,
+    'educations': Education,
+}
+
+_REFERENCE_RE = re.compile(r'/([a-z][a-z0-9-]*)/([^/?#]+)/?(?:[?#].*)?$')
+
+
+def parse_reference(value: Any) -> Optional[Tuple[str, str]]:
+    """
+    Split an API URL into its endpoint and object id.
+
+    Args:
+        value: URL such as ``https://www.courtlistener.com/api/rest/v4/courts/ca2/``
+
+    Returns:
+        ``(endpoint, id)`` tuple (e.g. ``('courts', 'ca2')``), or None if the
+        value is not a URL of a known endpoint
+    """
+    if not isinstance(value, str) or '/' not in value:
+        return None
+    match = _REFERENCE_RE.search(value)
+    if match is None or match.group(1) not in ENDPOINT_MODELS:
+        return None
+    return match.group(1), match.group(2)
+
+
+class ReferenceResolver:
+    """Thread-safe, cached, batched resolver of hyperlinked model fields."""
+
+    def __init__(
+        self,
+        client,
+        batch_size: int = 100,
+        max_workers: int = 8,
+        cache_size: Optional[int] = 10000,
+        court_catalog=None,
+        metrics=None,
+    ):
+        """
+        Initialize the resolver.
+
+        Args:
+            client: CourtListener client instance
+            batch_size: Ids per ``id__in`` request
+            max_workers: Concurrent single GETs for endpoints without ``id__in``
+            cache_size: Objects kept in the shared cache (None for unbounded)
+            court_catalog: Optional ``CourtCatalog`` that answers court
+                references without requests
+            metrics: Optional ``MetricsCollector``; cache hits and misses are
+                recorded under ``'resolver'``
+        """
+        self.client = client
+        self.batch_size = batch_size
+        self.max_workers = max_workers
+        self.cache_size = cache_size
+        self.court_catalog = court_catalog
+        self.metrics = metrics
+        self.logger = logging.getLogger(__name__)
+        self._cache: 'OrderedDict[Tuple[str, str], BaseModel]' = OrderedDict()
+        self._missing: Set[Tuple[str, str]] = set()
+        self._no_id_in: Set[str] = set()
+        self._lock = threading.RLock()
+        self._pending: List[Tuple[BaseModel, Optional[Sequence[str]]]] = []
+        self._flush_lock = threading.Lock()
+
+    def resolve(self, models: Iterable[BaseModel], fields: Optional[Sequence[str]] = None) -> List[BaseModel]:
+        """
+        Fetch every object the models refer to and attach it to them.
+
+        Args:
+            models: Models to resolve
+            fields: Fields to follow (default: ``DEFAULT_FIELDS`` for each
+                model's class)
+
+        Returns:
+            The models, as a list; use ``model.resolved(field)`` to read the
+            attached objects
+        """
+        models = list(models)
+        references = {}
+        for model in models:
+            references[id(model)] = self._references(model, fields)
+        wanted = dict.fromkeys(ref for refs in references.values() for values in refs.values() for ref in values)
+        loaded = self._load(wanted)
+        for model in models:
+            attached = model.__dict__.setdefault('_resolved', {})
+            for field, refs in references[id(model)].items():
+                objects = [loaded.get(ref) for ref in refs]
+                if isinstance(model.get(field), (list, tuple)):
+                    attached[field] = [obj for obj in objects if obj is not None]
+                else:
+                    attached[field] = objects[0] if objects else None
+        return models
+
+    def attach(self, models: Iterable[BaseModel], fields: Optional[Sequence[str]] = None) -> List[BaseModel]:
+        """
+        Resolve the models lazily: the first ``resolved()`` call on any of
+        them resolves every model attached since the last resolution in one
+        batch.
+
+        Args:
+            models: Models to resolve later
+            fields: Fields to follow (default: ``DEFAULT_FIELDS``)
+
+        Returns:
+            The models, as a list
+        """
+        models = list(models)
+        with self._lock:
+            for model in models:
+                model.__dict__['_resolver'] = self
+                self._pending.append((model, fields))
+        return models
+
+    def prefetch(self, urls: Iterable[Any]) -> None:
+        """
+        Load objects into the cache.
+
+        Args:
+            urls: API URLs or ``(endpoint, id)`` tuples
+        """
+        refs = (value if isinstance(value, tuple) else parse_reference(value) for value in urls)
+        self._load(ref for ref in refs if ref is not None)
+
+    def get(self, url: Any) -> Optional[BaseModel]:
+        """
+        Get the object an API URL refers to, fetching it if needed.
+
+        Args:
+            url: API URL or ``(endpoint, id)`` tuple
+
+        Returns:
+            Model instance, or None if the object does not exist
+        """
+        ref = url if isinstance(url, tuple) else parse_reference(url)
+        if ref is None:
+            return None
+        return self._load([ref]).get(ref)
+
+    def clear(self) -> None:
+        """Empty the cache."""
+        with self._lock:
+            self._cache.clear()
+            self._missing.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._cache)
+
+    def __repr__(self) -> str:
+        """String representation of the resolver."""
+        return f"ReferenceResolver(cached={len(self)}, batch_size={self.batch_size})"
+
+    def _flush(self) -> None:
+        """Resolve every model attached for lazy resolution."""
+        # Serialize flushes so a concurrent reader waits for the batch it is in
+        with self._flush_lock:
+            with self._lock:
+                pending, self._pending = self._pending, []
+            self._resolve_groups(pending)
+
+    def _resolve_groups(self, pending: List[Tuple[BaseModel, Optional[Sequence[str]]]]) -> None:
+        groups: Dict[Any, List[BaseModel]] = {}
+        for model, fields in pending:
+            groups.setdefault(tuple(fields) if fields else None, []).append(model)
+        for fields, models in groups.items():
+            self.resolve(models, fields)
+
+    def _references(self, model: BaseModel, fields: Optional[Sequence[str]]) -> Dict[str, List[Tuple[str, str]]]:
+        """References held in the model's hyperlinked fields."""
+        if fields is None:
+            fields = DEFAULT_FIELDS.get(type(model).__name__, ())
+        result = {}
+        for field in fields:
+            value = model.get(field)
+            values = value if isinstance(value, (list, tuple)) else [value]
+            result[field] = [ref for ref in (parse_reference(item) for item in values) if ref is not None]
+        return result
+
+    def _load(self, refs: Iterable[Tuple[str, str]]) -> Dict[Tuple[str, str], BaseModel]:
+        """Objects for the references, from the cache or fetched in batches."""
+        loaded: Dict[Tuple[str, str], BaseModel] = {}
+        by_endpoint: Dict[str, List[str]] = {}
+        for ref in refs:
+            if ref in loaded:
+                continue
+            with self._lock:
+                obj = self._cache.get(ref)
+                hit = obj is not None or ref in self._missing
+                if obj is not None:
+                    self._cache.move_to_end(ref)
+                    loaded[ref] = obj
+            self._record_cache(hit)
+            if not hit:
+                ids = by_endpoint.setdefault(ref[0], [])
+                if ref[1] not in ids:
+                    ids.append(ref[1])
+        for endpoint, ids in by_endpoint.items():
+            for obj_id, obj in self._fetch(endpoint, ids).items():
+                loaded[(endpoint, obj_id)] = obj
+        return loaded
+
+    def _fetch(self, endpoint: str, ids: List[str]) -> Dict[str, BaseModel]:
+        """Fetch objects of one endpoint and add them to the cache."""
+        model_class = ENDPOINT_MODELS[endpoint]
+        found: Dict[str, BaseModel] = {}
+        if endpoint == 'courts' and self.court_catalog is not None:
+            for court_id in ids:
+                court = self._catalog_court(court_id)
+                if court is not None:
+                    found[court_id] = court
+        remaining = [obj_id for obj_id in ids if obj_id not in found]
+        if endpoint not in self._no_id_in:
+            for start in range(0, len(remaining), self.batch_size):
+                if not self._fetch_batch(endpoint, remaining[start:start + self.batch_size], model_class, found):
+                    break
+        remaining = [obj_id for obj_id in ids if obj_id not in found]
+        if remaining:
+            with ThreadPoolExecutor(max_workers=min(self.max_workers, len(remaining))) as executor:
+                for obj_id, data in zip(remaining, executor.map(lambda obj_id: self._fetch_one(endpoint, obj_id), remaining)):
+                    if data is None:
+                        with self._lock:
+                            self._missing.add((endpoint, obj_id))
+                    else:
+                        found[obj_id] = model_class(data)
+        for obj_id, obj in found.items():
+            self._store((endpoint, obj_id), obj)
+        return found
+
+    def _fetch_batch(self, endpoint: str, ids: List[str], model_class: type, found: Dict[str, BaseModel]) -> bool:
+        """
+        Fetch one ``id__in`` batch into ``found``.
+
+        Returns:
+            False if the endpoint ignored the filter (an unrequested object
+            came back), in which case it is fetched one by one from now on
+        """
+        requested = set(ids)
+        params = {'id__in': ','.join(ids)}
+        for item in self.client.paginate(f"{endpoint}/", params=params):
+            obj_id = str(item.get('id')) if isinstance(item, dict) else None
+            if obj_id not in requested:
+                self.logger.debug("%s/ ignores id__in; falling back to single requests", endpoint)
+                with self._lock:
+                    self._no_id_in.add(endpoint)
+                return False
+            found[obj_id] = model_class(item)
+        return True
+
+    def _fetch_one(self, endpoint: str, obj_id: str) -> Optional[Dict[str, Any]]:
+        try:
+            data: Dict[str, Any] = self.client.get(f"{endpoint}/{obj_id}/")
+        except NotFoundError:
+            return None
+        return data
+
+    def _catalog_court(self, court_id: str) -> Optional[Court]:
+        try:
+            court: Court = self.court_catalog.get(court_id)
+        except NotFoundError:
+            return None
+        return court
+
+    def _store(self, ref: Tuple[str, str], obj: BaseModel) -> None:
+        with self._lock:
+            self._cache[ref] = obj
+            self._cache.move_to_end(ref)
+            if self.cache_size is not None:
+                while len(self._cache) > self.cache_size:
+                    self._cache.popitem(last=False)
+
+    def _record_cache(self, hit: bool) -> None:
+        if self.metrics is not None:
+            self.metrics.record_cache('resolver', hit)
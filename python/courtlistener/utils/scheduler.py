@@ -0,0 +1,223 @@
+"""
+Priority-aware request scheduling for the CourtListener SDK.
+
+A ``RequestScheduler`` attached to a client admits HTTP requests under a
+shared rate and concurrency limit, always letting the most urgent waiting
+request go first. Calls carry the priority of the ``request_priority`` block
+they run in, so a user-facing ``get_docket`` inside
+``with request_priority('interactive')`` overtakes pages of a background
+``list_all_dockets`` running under ``'bulk'`` on the same client. A 429 pauses
+the whole queue, and when it resumes requests are again admitted by priority.
+"""
+
+import contextvars
+import heapq
+import itertools
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Any, Optional, Union
+
+from ..exceptions import ValidationError
+
+# Lower rank is admitted first
+PRIORITIES = {'interactive': 0, 'normal': 1, 'bulk': 2}
+
+_current_priority: 'contextvars.ContextVar[Optional[Union[str, int]]]' = contextvars.ContextVar('courtlistener_priority', default=None)
+
+
+def _rank(priority: Union[str, int]) -> int:
+    """Map a priority name (or integer rank) to its rank."""
+    if isinstance(priority, int):
+        return priority
+    try:
+        return PRIORITIES[priority]
+    except KeyError:
+        raise ValidationError(f"Unknown priority: {priority!r}. Use one of {', '.join(PRIORITIES)}")
+
+
+@contextmanager
+def request_priority(priority: Union[str, int]):
+    """
+    Run the requests made inside the block at the given priority.
+
+    The priority follows the current thread (and asyncio task); threads
+    started inside the block do not inherit it.
+
+    Args:
+        priority: ``'interactive'``, ``'normal'``, ``'bulk'`` or an integer
+            rank (lower is more urgent)
+    """
+    _rank(priority)
+    reset_token = _current_priority.set(priority)
+    try:
+        yield
+    finally:
+        _current_priority.reset(reset_token)
+
+
+def current_priority() -> Optional[Union[str, int]]:
+    """Priority set by the innermost ``request_priority`` block, if any."""
+    return _current_priority.get()
+
+
+class RequestScheduler:
+    """Thread-safe admission queue ordered by request priority."""
+
+    def __init__(
+        self,
+        requests_per_second: Optional[float] = None,
+        max_concurrent: Optional[int] = None,
+        default_priority: Union[str, int] = 'normal',
+    ):
+        """
+        Initialize the scheduler.
+
+        Args:
+            requests_per_second: Rate at which requests are admitted
+                (default: unlimited; e.g. ``5000 / 3600`` for 5,000 per hour)
+            max_concurrent: Requests allowed in flight at once (default:
+                unlimited)
+            default_priority: Priority of requests made outside a
+                ``request_priority`` block
+        """
+        if requests_per_second is not None and requests_per_second <= 0:
+            raise ValidationError("requests_per_second must be greater than 0")
+        if max_concurrent is not None and max_concurrent < 1:
+            raise ValidationError("max_concurrent must be at least 1")
+        _rank(default_priority)
+        self.requests_per_second = requests_per_second
+        self.max_concurrent = max_concurrent
+        self.default_priority = default_priority
+        self._interval = 1.0 / requests_per_second if requests_per_second else 0.0
+        self._condition = threading.Condition()
+        self._waiting: list = []
+        self._sequence = itertools.count()
+        self._in_flight = 0
+        self._next_start = 0.0
+        self._paused_until = 0.0
+        self._stats: Dict[Union[str, int], Dict[str, float]] = {}
+
+    @property
+    def in_flight(self) -> int:
+        """Admitted requests that have not been released yet."""
+        with self._condition:
+            return self._in_flight
+
+    def acquire(self, priority: Optional[Union[str, int]] = None) -> None:
+        """
+        Wait until this request is the most urgent one and capacity is free.
+
+        Requests of equal priority are admitted in arrival order.
+
+        Args:
+            priority: Priority of the request (default: the current
+                ``request_priority`` block, else ``default_priority``)
+        """
+        if priority is None:
+            priority = current_priority()
+        if priority is None:
+            priority = self.default_priority
+        entry = (_rank(priority), next(self._sequence))
+        queued_at = time.monotonic()
+        with self._condition:
+            heapq.heappush(self._waiting, entry)
+            try:
+                while True:
+                    wait = self._wait_time(time.monotonic())
+                    if self._waiting[0] == entry and wait == 0.0:
+                        break
+                    self._condition.wait(wait if self._waiting[0] == entry and wait else None)
+            except BaseException:
+                self._waiting.remove(entry)
+                heapq.heapify(self._waiting)
+                self._condition.notify_all()
+                raise
+            heapq.heappop(self._waiting)
+            self._admit(priority, time.monotonic() - queued_at)
+
+    def try_acquire(self, priority: Optional[Union[str, int]] = None) -> bool:
+        """
+        Take capacity only if nothing is queued and it is free right now.
+
+        Args:
+            priority: Priority the request is counted under
+
+        Returns:
+            True if the request was admitted
+        """
+        with self._condition:
+            if self._waiting or self._wait_time(time.monotonic()) != 0.0:
+                return False
+            self._admit(priority if priority is not None else self.default_priority, 0.0)
+            return True
+
+    def release(self) -> None:
+        """Mark an admitted request as finished."""
+        with self._condition:
+            self._in_flight -= 1
+            self._condition.notify_all()
+
+    @contextmanager
+    def slot(self, priority: Optional[Union[str, int]] = None):
+        """Hold scheduler capacity for the duration of the block."""
+        self.acquire(priority)
+        try:
+            yield
+        finally:
+            self.release()
+
+    def pause(self, seconds: float) -> None:
+        """
+        Admit no requests for a while (e.g. after a 429).
+
+        Args:
+            seconds: Length of the pause
+        """
+        with self._condition:
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+            self._condition.notify_all()
+
+    def waiting(self) -> Dict[int, int]:
+        """Queued requests per priority rank."""
+        with self._condition:
+            counts: Dict[int, int] = {}
+            for rank, _ in self._waiting:
+                counts[rank] = counts.get(rank, 0) + 1
+            return counts
+
+    def stats(self) -> Dict[Union[str, int], Dict[str, Any]]:
+        """
+        Admissions per priority.
+
+        Returns:
+            Dict mapping priority to ``requests``, ``total_wait`` and
+            ``max_wait`` (seconds spent queued)
+        """
+        with self._condition:
+            return {priority: dict(values) for priority, values in self._stats.items()}
+
+    def __repr__(self) -> str:
+        """String representation of the scheduler."""
+        return (
+            f"RequestScheduler(requests_per_second={self.requests_per_second}, "
+            f"max_concurrent={self.max_concurrent})"
+        )
+
+    def _wait_time(self, now: float) -> Optional[float]:
+        """Seconds until capacity frees up by time, None if waiting on a release, 0.0 if free."""
+        if self.max_concurrent is not None and self._in_flight >= self.max_concurrent:
+            return None
+        return max(self._next_start - now, self._paused_until - now, 0.0)
+
+    def _admit(self, priority: Union[str, int], waited: float) -> None:
+        now = time.monotonic()
+        self._in_flight += 1
+        if self._interval:
+            self._next_start = max(self._next_start, now) + self._interval
+        entry = self._stats.setdefault(priority, {'requests': 0, 'total_wait': 0.0, 'max_wait': 0.0})
+        entry['requests'] += 1
+        entry['total_wait'] += waited
+        entry['max_wait'] = max(entry['max_wait'], waited)
+        # Let the next queued request re-check capacity
+        self._condition.notify_all()
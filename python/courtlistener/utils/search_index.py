@@ -0,0 +1,391 @@
+"""
+Local full-text search index for the CourtListener SDK.
+
+Stores opinion text and cluster metadata in a SQLite FTS5 index so that a
+corpus that has already been downloaded can be searched locally, with
+results shaped like ``SearchAPI.search`` responses.
+"""
+
+import re
+import sqlite3
+import threading
+from typing import Dict, Any, List, Optional, Iterable, Union
+
+from ..exceptions import CourtListenerError, ValidationError
+from ..models.base import BaseModel
+from .urls import parse_court_id, parse_resource_id
+
+_TAG_RE = re.compile(r'<[^>]+>')
+_SPACE_RE = re.compile(r'\s+')
+_TERM_RE = re.compile(r'\w+')
+
+_ORDERING = {
+    'score desc': 'rank',
+    'dateFiled desc': 'o.date_filed DESC',
+    'dateFiled asc': 'o.date_filed ASC',
+}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS opinions (
+    id INTEGER PRIMARY KEY,
+    cluster_id INTEGER,
+    sha1 TEXT,
+    date_modified TEXT,
+    case_name TEXT,
+    court TEXT,
+    date_filed TEXT,
+    author_str TEXT,
+    type TEXT,
+    absolute_url TEXT
+);
+CREATE INDEX IF NOT EXISTS opinions_cluster ON opinions (cluster_id);
+CREATE TABLE IF NOT EXISTS clusters (
+    id INTEGER PRIMARY KEY,
+    case_name TEXT,
+    court TEXT,
+    date_filed TEXT,
+    docket TEXT,
+    citation_count INTEGER,
+    date_modified TEXT
+);
+CREATE VIRTUAL TABLE IF NOT EXISTS opinion_text USING fts5(
+    case_name, text, tokenize = 'porter unicode61'
+);
+"""
+
+
+def _raw(item: Union[BaseModel, Dict[str, Any]]) -> Dict[str, Any]:
+    """Return the raw API data behind a model or dict."""
+    return item._data if isinstance(item, BaseModel) else item
+
+
+def _body(item: Union[BaseModel, Dict[str, Any]], field: str) -> str:
+    """Read a text body, falling back to an attached text store for detached models."""
+    value = _raw(item).get(field)
+    if value is None and hasattr(item, '_text'):
+        value = item._text(field)
+    return value or ''
+
+
+def _html_to_text(html: str) -> str:
+    """Strip tags from HTML for indexing."""
+    return _SPACE_RE.sub(' ', _TAG_RE.sub(' ', html)).strip()
+
+
+class LocalSearchIndex:
+    """
+    SQLite FTS5 index over harvested opinions.
+
+    Opinions are keyed by ID and re-indexed only when their ``sha1`` or
+    ``date_modified`` changes, so the same pages can be fed in repeatedly
+    during incremental crawls.
+    """
+
+    def __init__(self, path: str = ':memory:'):
+        """
+        Initialize the index.
+
+        Args:
+            path: SQLite database path (default: in-memory)
+        """
+        self.path = path
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        try:
+            self._conn.executescript(_SCHEMA)
+        except sqlite3.OperationalError as e:
+            raise CourtListenerError(f"SQLite FTS5 is not available: {str(e)}")
+
+    def add_opinion(
+        self,
+        opinion: Union[BaseModel, Dict[str, Any]],
+        cluster: Optional[Union[BaseModel, Dict[str, Any]]] = None,
+    ) -> bool:
+        """
+        Index a single opinion.
+
+        Args:
+            opinion: ``Opinion`` model or opinion dict
+            cluster: Optional cluster model or dict providing case metadata
+
+        Returns:
+            True if the opinion was added or re-indexed, False if the stored
+            copy is already current
+        """
+        with self._lock, self._conn:
+            if cluster is not None:
+                self._upsert_cluster(_raw(cluster))
+            return self._upsert_opinion(opinion)
+
+    def add_cluster(self, cluster: Union[BaseModel, Dict[str, Any]]) -> None:
+        """
+        Store cluster metadata and apply it to the cluster's opinions.
+
+        Args:
+            cluster: ``OpinionCluster`` model or cluster dict
+        """
+        with self._lock, self._conn:
+            self._upsert_cluster(_raw(cluster))
+
+    def ingest(self, items: Iterable[Union[BaseModel, Dict[str, Any]]]) -> int:
+        """
+        Index a batch of opinions and/or clusters in one transaction.
+
+        Clusters are recognized by their ``sub_opinions`` field; everything
+        else is treated as an opinion.
+
+        Args:
+            items: Opinion and cluster models or dicts
+
+        Returns:
+            Number of opinions added or re-indexed
+        """
+        changed = 0
+        with self._lock, self._conn:
+            for item in items:
+                data = _raw(item)
+                if 'sub_opinions' in data:
+                    self._upsert_cluster(data)
+                elif self._upsert_opinion(item):
+                    changed += 1
+        return changed
+
+    def needs_update(self, opinion: Union[BaseModel, Dict[str, Any]]) -> bool:
+        """
+        Check whether an opinion is missing or stale in the index.
+
+        Args:
+            opinion: ``Opinion`` model or opinion dict (text fields are not
+                required, so list responses requested without them can be
+                used to decide what to fetch)
+
+        Returns:
+            True if the opinion should be (re-)indexed
+        """
+        data = _raw(opinion)
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT sha1, date_modified FROM opinions WHERE id = ?", (data.get('id'),)
+            ).fetchone()
+        return self._is_stale(row, data)
+
+    def remove(self, opinion_id: int) -> None:
+        """Remove an opinion from the index."""
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM opinions WHERE id = ?", (opinion_id,))
+            self._conn.execute("DELETE FROM opinion_text WHERE rowid = ?", (opinion_id,))
+
+    def search(
+        self,
+        q: str,
+        page: int = 1,
+        result_type: Optional[str] = None,
+        filters: Optional[Dict[str, Any]] = None,
+        page_size: int = 20,
+        **kwargs,
+    ) -> Dict[str, Any]:
+        """
+        Search the local index.
+
+        Mirrors ``SearchAPI.search``. FTS5 query syntax (``AND``, ``OR``,
+        ``NOT``, phrases, ``prefix*``) is supported; queries that are not
+        valid FTS5 are searched as plain terms.
+
+        Args:
+            q: Search query
+            page: Page number (default: 1)
+            result_type: Only ``'o'``/``'opinions'`` (or None) is supported
+            filters: Filters such as ``court`` (space-separated IDs),
+                ``filed_after``, ``filed_before``, ``cluster_id`` and
+                ``order_by`` (``'score desc'``, ``'dateFiled desc'`` or
+                ``'dateFiled asc'``)
+            page_size: Results per page (default: 20)
+            **kwargs: Additional filters
+
+        Returns:
+            Dict with ``count``, ``next``, ``previous`` and ``results``
+            (``next``/``previous`` are page numbers or None)
+        """
+        if result_type not in (None, 'o', 'opinions'):
+            raise ValidationError(f"Local index only supports opinion search, not '{result_type}'")
+        if page < 1 or page_size < 1:
+            raise ValidationError("page and page_size must be positive")
+
+        params = dict(filters or {})
+        params.update(kwargs)
+        order_by = _ORDERING.get(params.pop('order_by', 'score desc'))
+        if order_by is None:
+            raise ValidationError(f"Unsupported order_by; use one of {sorted(_ORDERING)}")
+
+        where = ["opinion_text MATCH ?"]
+        args: List[Any] = []
+        if params.get('court'):
+            courts = str(params['court']).split()
+            where.append(f"o.court IN ({','.join('?' * len(courts))})")
+            args.extend(courts)
+        if params.get('filed_after'):
+            where.append("o.date_filed >= ?")
+            args.append(str(params['filed_after']))
+        if params.get('filed_before'):
+            where.append("o.date_filed <= ?")
+            args.append(str(params['filed_before']))
+        if params.get('cluster_id'):
+            where.append("o.cluster_id = ?")
+            args.append(int(params['cluster_id']))
+
+        base = (
+            "FROM opinion_text JOIN opinions o ON o.id = opinion_text.rowid "
+            f"WHERE {' AND '.join(where)}"
+        )
+        offset = (page - 1) * page_size
+        try:
+            return self._run_search(base, [q] + args, order_by, page, page_size, offset)
+        except sqlite3.OperationalError:
+            # Not valid FTS5 syntax: search the individual terms instead
+            terms = ' '.join(f'"{term}"' for term in _TERM_RE.findall(q))
+            if not terms:
+                return {'count': 0, 'next': None, 'previous': None, 'results': []}
+            return self._run_search(base, [terms] + args, order_by, page, page_size, offset)
+
+    def count(self) -> int:
+        """Number of indexed opinions."""
+        with self._lock:
+            count: int = self._conn.execute("SELECT COUNT(*) FROM opinions").fetchone()[0]
+        return count
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        with self._lock:
+            self._conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def __repr__(self) -> str:
+        """String representation of the index."""
+        return f"LocalSearchIndex(path='{self.path}')"
+
+    def _run_search(self, base, args, order_by, page, page_size, offset) -> Dict[str, Any]:
+        """Execute a search query and shape the response like the API."""
+        with self._lock:
+            count = self._conn.execute(f"SELECT COUNT(*) {base}", args).fetchone()[0]
+            rows = self._conn.execute(
+                "SELECT o.id, o.cluster_id, o.case_name, o.court, o.date_filed, o.author_str, "
+                "o.type, o.sha1, o.absolute_url, bm25(opinion_text), "
+                "snippet(opinion_text, 1, '<mark>', '</mark>', '…', 32) "
+                f"{base} ORDER BY {order_by} LIMIT ? OFFSET ?",
+                args + [page_size, offset],
+            ).fetchall()
+        results = [
+            {
+                'id': row[0],
+                'cluster_id': row[1],
+                'caseName': row[2],
+                'court_id': row[3],
+                'dateFiled': row[4],
+                'author': row[5],
+                'type': row[6],
+                'sha1': row[7],
+                'absolute_url': row[8],
+                'score': -row[9],
+                'snippet': row[10],
+            }
+            for row in rows
+        ]
+        return {
+            'count': count,
+            'next': page + 1 if offset + len(rows) < count else None,
+            'previous': page - 1 if page > 1 else None,
+            'results': results,
+        }
+
+    @staticmethod
+    def _is_stale(row, data: Dict[str, Any]) -> bool:
+        """Compare a stored (sha1, date_modified) row with fresh data."""
+        if row is None:
+            return True
+        stored_sha1, stored_modified = row
+        if data.get('sha1') and data.get('sha1') != stored_sha1:
+            return True
+        modified = data.get('date_modified')
+        return bool(modified) and (not stored_modified or str(modified) > stored_modified)
+
+    def _upsert_opinion(self, opinion: Union[BaseModel, Dict[str, Any]]) -> bool:
+        """Insert or refresh an opinion; caller holds the lock and transaction."""
+        data = _raw(opinion)
+        opinion_id = data.get('id')
+        if opinion_id is None:
+            raise ValidationError("Opinion data must include an 'id'")
+        row = self._conn.execute(
+            "SELECT sha1, date_modified FROM opinions WHERE id = ?", (opinion_id,)
+        ).fetchone()
+        if not self._is_stale(row, data):
+            return False
+
+        text = _body(opinion, 'plain_text')
+        if not text.strip():
+            html = _body(opinion, 'html_with_citations') or _body(opinion, 'html')
+            text = _html_to_text(html)
+        if not text.strip() and row is not None:
+            # Metadata-only refresh (e.g. text detached to a text store):
+            # keep the text that is already indexed
+            stored = self._conn.execute(
+                "SELECT text FROM opinion_text WHERE rowid = ?", (opinion_id,)
+            ).fetchone()
+            if stored:
+                text = stored[0]
+
+        cluster_id = data.get('cluster_id') or parse_resource_id(data.get('cluster'))
+        cluster = self._conn.execute(
+            "SELECT case_name, court, date_filed FROM clusters WHERE id = ?", (cluster_id,)
+        ).fetchone() if cluster_id else None
+        case_name = data.get('case_name') or (cluster[0] if cluster else None)
+        court = parse_court_id(data.get('court')) or (cluster[1] if cluster else None)
+        date_filed = data.get('date_filed') or (cluster[2] if cluster else None)
+
+        self._conn.execute(
+            "INSERT OR REPLACE INTO opinions (id, cluster_id, sha1, date_modified, case_name, "
+            "court, date_filed, author_str, type, absolute_url) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                opinion_id, cluster_id, data.get('sha1'),
+                str(data['date_modified']) if data.get('date_modified') else None,
+                case_name, court, date_filed, data.get('author_str'), data.get('type'),
+                data.get('absolute_url'),
+            ),
+        )
+        self._conn.execute("DELETE FROM opinion_text WHERE rowid = ?", (opinion_id,))
+        self._conn.execute(
+            "INSERT INTO opinion_text (rowid, case_name, text) VALUES (?, ?, ?)",
+            (opinion_id, case_name or '', text),
+        )
+        return True
+
+    def _upsert_cluster(self, data: Dict[str, Any]) -> None:
+        """Store cluster metadata and propagate it; caller holds the lock and transaction."""
+        cluster_id = data.get('id')
+        if cluster_id is None:
+            raise ValidationError("Cluster data must include an 'id'")
+        case_name = data.get('case_name') or data.get('case_name_full')
+        court = parse_court_id(data.get('court') or data.get('court_id'))
+        self._conn.execute(
+            "INSERT OR REPLACE INTO clusters (id, case_name, court, date_filed, docket, "
+            "citation_count, date_modified) VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (
+                cluster_id, case_name, court, data.get('date_filed'), data.get('docket'),
+                data.get('citation_count'), data.get('date_modified'),
+            ),
+        )
+        self._conn.execute(
+            "UPDATE opinions SET case_name = COALESCE(?, case_name), court = COALESCE(?, court), "
+            "date_filed = COALESCE(?, date_filed) WHERE cluster_id = ?",
+            (case_name, court, data.get('date_filed'), cluster_id),
+        )
+        if case_name:
+            self._conn.execute(
+                "UPDATE opinion_text SET case_name = ? "
+                "WHERE rowid IN (SELECT id FROM opinions WHERE cluster_id = ?)",
+                (case_name, cluster_id),
+            )
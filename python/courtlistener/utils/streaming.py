@@ -0,0 +1,231 @@
+"""
+Streaming JSON decoding for paginated API responses.
+
+Parses the ``results`` array of a page incrementally while the body is
+still arriving, so items can be processed one at a time instead of
+materializing the whole page. The C-accelerated ``ijson`` backend is used
+when installed; otherwise a pure-Python incremental parser is used.
+"""
+
+import codecs
+import json
+from typing import Dict, Any, Callable, Iterator, Optional, Union
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+from ..exceptions import CourtListenerError, ValidationError
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+_WHITESPACE = ' \t\r\n'
+_SCALAR_EVENTS = ('null', 'boolean', 'integer', 'double', 'number', 'string')
+
+
+class _PythonStreamParser:
+    """Incremental parser for ``{"count": ..., "results": [...], ...}`` bodies."""
+
+    def __init__(self, fileobj, chunk_size: int = DEFAULT_CHUNK_SIZE):
+        self._read = fileobj.read
+        self._chunk_size = chunk_size
+        self._utf8 = codecs.getincrementaldecoder('utf-8')()
+        self._json = json.JSONDecoder()
+        self._buf = ''
+        self._pos = 0
+        self._eof = False
+
+    def parse(self, metadata: Dict[str, Any]) -> Iterator[Any]:
+        """Yield each item of ``results``; other top-level keys go into ``metadata``."""
+        self._expect('{')
+        if self._peek() == '}':
+            self._pos += 1
+            return
+        while True:
+            key = self._value()
+            if not isinstance(key, str):
+                raise CourtListenerError("Malformed JSON response: expected object key")
+            self._expect(':')
+            if key == 'results' and self._peek() == '[':
+                self._pos += 1
+                if self._peek() == ']':
+                    self._pos += 1
+                else:
+                    while True:
+                        yield self._value()
+                        if self._separator(']'):
+                            break
+            else:
+                metadata[key] = self._value()
+            if self._separator('}'):
+                break
+
+    def _fill(self) -> None:
+        """Read one more chunk into the buffer, dropping consumed text."""
+        chunk = self._read(self._chunk_size)
+        if not chunk:
+            self._eof = True
+        text = self._utf8.decode(chunk or b'', final=self._eof)
+        self._buf = self._buf[self._pos:] + text
+        self._pos = 0
+
+    def _peek(self) -> str:
+        """Return the next non-whitespace character without consuming it."""
+        while True:
+            while self._pos < len(self._buf) and self._buf[self._pos] in _WHITESPACE:
+                self._pos += 1
+            if self._pos < len(self._buf) or self._eof:
+                break
+            self._fill()
+        return self._buf[self._pos] if self._pos < len(self._buf) else ''
+
+    def _expect(self, char: str) -> None:
+        if self._peek() != char:
+            raise CourtListenerError(f"Malformed JSON response: expected '{char}'")
+        self._pos += 1
+
+    def _separator(self, closing: str) -> bool:
+        """Consume ',' (returns False) or the closing bracket (returns True)."""
+        char = self._peek()
+        self._pos += 1
+        if char == closing:
+            return True
+        if char != ',':
+            raise CourtListenerError(f"Malformed JSON response: expected ',' or '{closing}'")
+        return False
+
+    def _value(self) -> Any:
+        """Decode the next complete JSON value, reading more data as needed."""
+        while True:
+            self._peek()
+            try:
+                value, end = self._json.raw_decode(self._buf, self._pos)
+                # A number at the very end of the buffer may continue in the next chunk
+                if end < len(self._buf) or self._eof or isinstance(value, (dict, list, str)):
+                    self._pos = end
+                    return value
+            except json.JSONDecodeError:
+                if self._eof:
+                    raise CourtListenerError("Malformed JSON response: truncated body")
+            # Grow the buffer geometrically so large items decode in linear time
+            target = max(len(self._buf) - self._pos, self._chunk_size) * 2
+            while not self._eof and len(self._buf) - self._pos < target:
+                self._fill()
+
+
+def _parse_with_ijson(fileobj, metadata: Dict[str, Any]) -> Iterator[Any]:
+    """Yield ``results`` items using ijson's event stream."""
+    builder = None
+    for prefix, event, value in ijson.parse(fileobj, use_float=True):
+        if builder is not None:
+            builder.event(event, value)
+            if prefix == 'results.item' and event in ('end_map', 'end_array'):
+                yield builder.value
+                builder = None
+        elif prefix == 'results.item':
+            if event in ('start_map', 'start_array'):
+                builder = ijson.ObjectBuilder()
+                builder.event(event, value)
+            else:
+                yield value
+        elif prefix and '.' not in prefix and event in _SCALAR_EVENTS:
+            metadata[prefix] = value
+
+
+def available_backend() -> str:
+    """Name of the fastest installed decoder backend."""
+    return 'ijson' if ijson is not None else 'python'
+
+
+def iter_results(
+    fileobj,
+    metadata: Dict[str, Any],
+    backend: Union[str, Callable[..., Iterator[Any]]] = 'auto',
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Iterator[Any]:
+    """
+    Incrementally decode the ``results`` array of a page.
+
+    Args:
+        fileobj: Binary file-like object with a ``read(n)`` method
+        metadata: Dict that receives the other top-level keys (``count``,
+            ``next``, ``previous``) as they are parsed
+        backend: ``'auto'``, ``'ijson'``, ``'python'``, or a callable
+            ``backend(fileobj, metadata)`` returning an item iterator
+        chunk_size: Bytes read per chunk by the Python backend
+
+    Returns:
+        Iterator over result items
+    """
+    if callable(backend):
+        return backend(fileobj, metadata)
+    if backend == 'auto':
+        backend = available_backend()
+    if backend == 'ijson':
+        if ijson is None:
+            raise CourtListenerError(
+                "The ijson backend requires the ijson package. "
+                "Install it with: pip install courtlistener-sdk-python[streaming]"
+            )
+        return _parse_with_ijson(fileobj, metadata)
+    if backend == 'python':
+        return _PythonStreamParser(fileobj, chunk_size).parse(metadata)
+    raise ValidationError(f"Unknown JSON backend: {backend}")
+
+
+class StreamedPage:
+    """
+    A page of results decoded while it downloads.
+
+    ``results`` can be iterated once. Top-level fields are available from
+    ``metadata`` (and ``get``) as soon as they have been parsed; all of them
+    are present once ``results`` is exhausted.
+    """
+
+    def __init__(
+        self,
+        fileobj,
+        backend: Union[str, Callable] = 'auto',
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        on_close: Optional[Callable[[], None]] = None,
+    ):
+        """
+        Initialize the streamed page.
+
+        Args:
+            fileobj: Binary file-like object holding the response body
+            backend: Decoder backend (see ``iter_results``)
+            chunk_size: Bytes read per chunk by the Python backend
+            on_close: Callback that releases the underlying connection
+        """
+        self.metadata: Dict[str, Any] = {}
+        self._on_close = on_close
+        self._items = iter_results(fileobj, self.metadata, backend, chunk_size)
+
+    @property
+    def results(self) -> Iterator[Any]:
+        """Iterator over the page's result items."""
+        return self._iter_and_close()
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Get a top-level field parsed so far."""
+        return self.metadata.get(key, default)
+
+    def close(self) -> None:
+        """Release the underlying connection."""
+        if self._on_close is not None:
+            self._on_close()
+            self._on_close = None
+
+    def _iter_and_close(self) -> Iterator[Any]:
+        try:
+            yield from self._items
+        finally:
+            self.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
@@ -0,0 +1,224 @@
+"""
+Content-addressed, compressed storage for opinion text.
+
+Opinion bodies (``plain_text``, ``html``, ``html_with_citations``,
+``xml_harvard``, ...) are compressed with zstd (when the ``zstandard``
+package is installed) or gzip and written once per distinct text, so bodies
+repeated across clusters and re-crawls take no extra space. A small manifest
+per ``Opinion.sha1`` maps each field to its blob, and reads go through a
+memory map so the compressed file is never copied into Python memory.
+"""
+
+import gzip
+import hashlib
+import json
+import mmap
+import os
+import tempfile
+from typing import Dict, Any, Optional, Union
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+from ..exceptions import CourtListenerError, ValidationError
+from ..models.base import BaseModel
+from ..models.opinion import Opinion
+
+
+# Opinion fields that hold full text bodies
+TEXT_FIELDS = (
+    'plain_text',
+    'html',
+    'html_lawbox',
+    'html_columbia',
+    'html_anon_2020',
+    'html_with_citations',
+    'xml_harvard',
+)
+
+_EXTENSIONS = {'zstd': '.zst', 'gzip': '.gz'}
+
+
+class OpinionTextStore:
+    """Local blob store for opinion bodies keyed by ``Opinion.sha1``."""
+
+    def __init__(self, root: str, compression: Optional[str] = None, level: Optional[int] = None):
+        """
+        Initialize the store.
+
+        Args:
+            root: Directory that holds the store (created if missing)
+            compression: ``'zstd'`` or ``'gzip'`` (default: zstd when
+                ``zstandard`` is installed, otherwise gzip)
+            level: Compression level (default: codec default)
+        """
+        if compression is None:
+            compression = 'zstd' if zstandard is not None else 'gzip'
+        if compression not in _EXTENSIONS:
+            raise ValidationError(f"Unsupported compression: {compression}. Use 'zstd' or 'gzip'")
+        if compression == 'zstd' and zstandard is None:
+            raise CourtListenerError(
+                "zstd compression requires the zstandard package. "
+                "Install it with: pip install courtlistener-sdk-python[zstd]"
+            )
+        self.root = root
+        self.compression = compression
+        self.level = level
+        os.makedirs(os.path.join(root, 'blobs'), exist_ok=True)
+        os.makedirs(os.path.join(root, 'opinions'), exist_ok=True)
+
+    def put(self, text: str) -> str:
+        """
+        Store a text body.
+
+        Args:
+            text: Text to store
+
+        Returns:
+            Content digest (SHA-1 of the UTF-8 text) used to read it back
+        """
+        raw = text.encode('utf-8')
+        digest = hashlib.sha1(raw).hexdigest()
+        if self._find_blob(digest) is None:
+            self._write_atomic(self._blob_path(digest, self.compression), self._compress(raw))
+        return digest
+
+    def get(self, digest: str) -> Optional[str]:
+        """
+        Read a text body by content digest.
+
+        Args:
+            digest: Digest returned by ``put``
+
+        Returns:
+            The text, or None if the blob does not exist
+        """
+        found = self._find_blob(digest)
+        if found is None:
+            return None
+        path, compression = found
+        with open(path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return ''
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                return self._decompress(mapped, compression).decode('utf-8')
+
+    def put_opinion(self, opinion: Union[BaseModel, Dict[str, Any]]) -> Dict[str, str]:
+        """
+        Store every text body of an opinion.
+
+        Args:
+            opinion: ``Opinion`` model or opinion dict with a ``sha1``
+
+        Returns:
+            Manifest mapping each stored field to its content digest
+        """
+        data = opinion._data if isinstance(opinion, BaseModel) else opinion
+        sha1 = data.get('sha1')
+        if not sha1:
+            raise ValidationError("Opinion must have a sha1 to be stored")
+
+        manifest = self.get_manifest(sha1) or {}
+        for field in TEXT_FIELDS:
+            if data.get(field):
+                manifest[field] = self.put(data[field])
+        self._write_atomic(self._manifest_path(sha1), json.dumps(manifest, sort_keys=True).encode('utf-8'))
+        return manifest
+
+    def get_manifest(self, sha1: str) -> Optional[Dict[str, str]]:
+        """Get the field-to-digest manifest for an opinion, if stored."""
+        try:
+            with open(self._manifest_path(sha1), 'rb') as f:
+                manifest: Dict[str, str] = json.loads(f.read().decode('utf-8'))
+        except FileNotFoundError:
+            return None
+        return manifest
+
+    def get_body(self, sha1: str, field: str) -> Optional[str]:
+        """
+        Read one text field of an opinion.
+
+        Args:
+            sha1: ``Opinion.sha1``
+            field: Text field name (e.g. ``'plain_text'``)
+
+        Returns:
+            The text, or None if it was not stored
+        """
+        digest = (self.get_manifest(sha1) or {}).get(field)
+        return self.get(digest) if digest else None
+
+    def has_opinion(self, sha1: str) -> bool:
+        """Check whether an opinion's bodies are stored."""
+        return os.path.exists(self._manifest_path(sha1))
+
+    def detach(self, opinion: Opinion) -> Opinion:
+        """
+        Move an opinion's bodies into the store.
+
+        The text fields are removed from the model's ``_data`` and loaded
+        lazily from the store whenever the corresponding property is read.
+
+        Args:
+            opinion: ``Opinion`` model with a ``sha1``
+
+        Returns:
+            The same opinion, now backed by the store
+        """
+        self.put_opinion(opinion)
+        for field in TEXT_FIELDS:
+            opinion._data.pop(field, None)
+        opinion.attach_text_store(self)
+        return opinion
+
+    def __repr__(self) -> str:
+        """String representation of the store."""
+        return f"OpinionTextStore(root='{self.root}', compression='{self.compression}')"
+
+    def _blob_path(self, digest: str, compression: str) -> str:
+        return os.path.join(self.root, 'blobs', digest[:2], digest + _EXTENSIONS[compression])
+
+    def _manifest_path(self, sha1: str) -> str:
+        return os.path.join(self.root, 'opinions', sha1[:2], sha1 + '.json')
+
+    def _find_blob(self, digest: str):
+        """Locate a blob written with any codec; returns (path, compression) or None."""
+        for compression in (self.compression,) + tuple(c for c in _EXTENSIONS if c != self.compression):
+            path = self._blob_path(digest, compression)
+            if os.path.exists(path):
+                return path, compression
+        return None
+
+    def _compress(self, raw: bytes) -> bytes:
+        if self.compression == 'zstd':
+            level = self.level if self.level is not None else 3
+            compressed: bytes = zstandard.ZstdCompressor(level=level).compress(raw)
+            return compressed
+        level = self.level if self.level is not None else 6
+        return gzip.compress(raw, compresslevel=level)
+
+    @staticmethod
+    def _decompress(buffer, compression: str) -> bytes:
+        if compression == 'zstd':
+            if zstandard is None:
+                raise CourtListenerError("Reading zstd blobs requires the zstandard package")
+            raw: bytes = zstandard.ZstdDecompressor().decompress(buffer)
+            return raw
+        return gzip.decompress(buffer)
+
+    @staticmethod
+    def _write_atomic(path: str, payload: bytes) -> None:
+        """Write via a temporary file so readers never see partial blobs."""
+        directory = os.path.dirname(path)
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(payload)
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
@@ -0,0 +1,179 @@
+"""
+API token pool for the CourtListener SDK.
+
+Spreads requests across several API tokens (e.g. one per service account).
+Each token has its own request-rate limit and health state: a token that
+gets a 401 is taken out of rotation, and one that gets a 429 rests for its
+``Retry-After`` period while the other tokens carry the load.
+"""
+
+import hashlib
+import threading
+import time
+from typing import Dict, Any, Iterable, List, Optional, Tuple
+
+from ..exceptions import AuthenticationError, ValidationError
+
+
+class _TokenState:
+    """Rate-limit and health bookkeeping for one token."""
+
+    def __init__(self, token: str):
+        self.token = token
+        self.fingerprint = hashlib.sha256(token.encode('utf-8')).hexdigest()[:16]
+        self.next_allowed = 0.0
+        self.cooldown_until = 0.0
+        self.invalid = False
+        self.requests = 0
+        self.rate_limited = 0
+
+
+class TokenPool:
+    """Thread-safe scheduler of requests across several API tokens."""
+
+    def __init__(
+        self,
+        tokens: Iterable[str],
+        requests_per_second: Optional[float] = None,
+        cooldown: float = 60.0,
+    ):
+        """
+        Initialize the pool.
+
+        Args:
+            tokens: API tokens to rotate through
+            requests_per_second: Request rate allowed per token (default:
+                unlimited; e.g. ``5000 / 3600`` for 5,000 per hour)
+            cooldown: Seconds a token rests after a 429 without ``Retry-After``
+        """
+        tokens = list(dict.fromkeys(token for token in tokens if token))
+        if not tokens:
+            raise ValidationError("At least one API token is required")
+        if requests_per_second is not None and requests_per_second <= 0:
+            raise ValidationError("requests_per_second must be greater than 0")
+        self._states = [_TokenState(token) for token in tokens]
+        self._interval = 1.0 / requests_per_second if requests_per_second else 0.0
+        self.cooldown = cooldown
+        self._lock = threading.Lock()
+
+    @property
+    def tokens(self) -> List[str]:
+        """Tokens in the pool."""
+        return [state.token for state in self._states]
+
+    def acquire(self) -> str:
+        """
+        Reserve a request slot on the best available token.
+
+        Picks the token that is free soonest (least used on ties), waiting for
+        a rate-limit slot or a cooldown to end when every token is busy.
+
+        Returns:
+            The token to send the request with
+
+        Raises:
+            AuthenticationError: If every token has been rejected with 401
+        """
+        while True:
+            token, wait = self._reserve()
+            if token is not None:
+                return token
+            time.sleep(wait)
+
+    def try_acquire(self) -> Optional[str]:
+        """
+        Reserve a request slot only if a token is free right now.
+
+        Returns:
+            A token, or None if every token is rate limited, resting or
+            rejected
+        """
+        try:
+            return self._reserve()[0]
+        except AuthenticationError:
+            return None
+
+    def report(self, token: str, status_code: int, retry_after: Optional[float] = None) -> None:
+        """
+        Update a token's health from a response.
+
+        Args:
+            token: Token the request was sent with
+            status_code: HTTP status of the response
+            retry_after: ``Retry-After`` seconds from a 429 response
+        """
+        with self._lock:
+            state = self._state(token)
+            if state is None:
+                return
+            if status_code == 401:
+                state.invalid = True
+            elif status_code == 429:
+                state.rate_limited += 1
+                delay = retry_after if retry_after is not None else self.cooldown
+                state.cooldown_until = max(state.cooldown_until, time.monotonic() + delay)
+
+    def has_available(self) -> bool:
+        """Check whether any token is still accepted by the API."""
+        with self._lock:
+            return any(not state.invalid for state in self._states)
+
+    def reset(self, token: Optional[str] = None) -> None:
+        """
+        Return tokens to rotation (e.g. after a rejected token was renewed).
+
+        Args:
+            token: Token to reset (default: all tokens)
+        """
+        with self._lock:
+            for state in self._states:
+                if token is None or state.token == token:
+                    state.invalid = False
+                    state.cooldown_until = 0.0
+
+    def status(self) -> List[Dict[str, Any]]:
+        """
+        Health of every token, identified by fingerprint rather than value.
+
+        Returns:
+            One dict per token with ``token`` (fingerprint), ``healthy``,
+            ``cooldown_remaining``, ``requests`` and ``rate_limited``
+        """
+        now = time.monotonic()
+        with self._lock:
+            return [
+                {
+                    'token': state.fingerprint,
+                    'healthy': not state.invalid,
+                    'cooldown_remaining': max(state.cooldown_until - now, 0.0),
+                    'requests': state.requests,
+                    'rate_limited': state.rate_limited,
+                }
+                for state in self._states
+            ]
+
+    def __len__(self) -> int:
+        return len(self._states)
+
+    def __repr__(self) -> str:
+        """String representation of the pool."""
+        return f"TokenPool(tokens={len(self._states)})"
+
+    def _reserve(self) -> Tuple[Optional[str], float]:
+        """Take a slot on the token free soonest; returns (token, 0) or (None, wait)."""
+        with self._lock:
+            now = time.monotonic()
+            candidates = [state for state in self._states if not state.invalid]
+            if not candidates:
+                raise AuthenticationError("All API tokens in the pool were rejected")
+            state = min(candidates, key=lambda s: (max(s.cooldown_until, s.next_allowed, now), s.requests))
+            ready_at = max(state.cooldown_until, state.next_allowed)
+            if ready_at > now:
+                return None, ready_at - now
+            state.requests += 1
+            if self._interval:
+                state.next_allowed = max(state.next_allowed, now) + self._interval
+            return state.token, 0.0
+
+    def _state(self, token: str) -> Optional[_TokenState]:
+        return next((state for state in self._states if state.token == token), None)
@@ -0,0 +1,51 @@
+"""
+URL helpers for CourtListener hyperlinked resources.
+"""
+
+from typing import Any, Optional
+
+
+def parse_resource_id(value: Any) -> Optional[int]:
+    """
+    Extract a numeric resource ID from an API URL or ID-like value.
+
+    Args:
+        value: An int, a numeric string, a resource dict, or a URL such as
+            ``https://www.courtlistener.com/api/rest/v4/opinions/123/``
+
+    Returns:
+        The resource ID, or None if one cannot be determined
+
+    Examples:
+        >>> parse_resource_id('https://www.courtlistener.com/api/rest/v4/opinions/123/')
+        123
+    """
+    if value is None or isinstance(value, bool):
+        return None
+    if isinstance(value, dict):
+        return parse_resource_id(value.get('id') or value.get('resource_uri'))
+    if isinstance(value, int):
+        return value
+    tail = str(value).split('?')[0].rstrip('/').split('/')[-1]
+    try:
+        return int(tail)
+    except ValueError:
+        return None
+
+
+def parse_court_id(value: Any) -> Optional[str]:
+    """
+    Extract a court ID (e.g. ``'ca2'``) from a court URL, ID or court dict.
+
+    Args:
+        value: A court ID, a court dict, or a URL such as
+            ``https://www.courtlistener.com/api/rest/v4/courts/ca2/``
+
+    Returns:
+        The court ID, or None if one cannot be determined
+    """
+    if value is None or value == '':
+        return None
+    if isinstance(value, dict):
+        return parse_court_id(value.get('id') or value.get('resource_uri'))
+    return str(value).split('?')[0].rstrip('/').split('/')[-1] or None
@@ -8,6 +8,21 @@ from datetime import date, datetime
 from ..exceptions import ValidationError
 
 
+_WHITESPACE_RE = re.compile(r'\s+')
+
+# Basic citation patterns, compiled once at import time
+_CITATION_PATTERNS = [
+    # SCOTUS: 576 U.S. 644
+    re.compile(r'^\d+\s+U\.?S\.?\s+\d+$'),
+    # Federal Reporter: 123 F.3d 456
+    re.compile(r'^\d+\s+F\.?\d*d\s+\d+$'),
+    # Federal Supplement: 123 F.Supp. 456
+    re.compile(r'^\d+\s+F\.?Supp\.?\s+\d+$'),
+    # State citations: 123 Cal. 3d 456
+    re.compile(r'^\d+\s+[A-Za-z]+\.?\s+\d+d\s+\d+$'),
+]
+
+
 def validate_date(date_str: str) -> bool:
     """
     Validate date string format (YYYY-MM-DD).
@@ -53,22 +68,10 @@ def validate_citation(citation: str) -> bool:
     if not citation:
         raise ValidationError("Citation cannot be empty")
     
-    # Basic citation patterns
-    patterns = [
-        # SCOTUS: 576 U.S. 644
-        r'^\d+\s+U\.?S\.?\s+\d+$',
-        # Federal Reporter: 123 F.3d 456
-        r'^\d+\s+F\.?\d*d\s+\d+$',
-        # Federal Supplement: 123 F.Supp. 456
-        r'^\d+\s+F\.?Supp\.?\s+\d+$',
-        # State citations: 123 Cal. 3d 456
-        r'^\d+\s+[A-Za-z]+\.?\s+\d+d\s+\d+$',
-    ]
-    
-    citation_clean = re.sub(r'\s+', ' ', citation.strip())
+    citation_clean = _WHITESPACE_RE.sub(' ', citation.strip())
     
-    for pattern in patterns:
-        if re.match(pattern, citation_clean):
+    for pattern in _CITATION_PATTERNS:
+        if pattern.match(citation_clean):
             return True
     
     # If no pattern matches, still allow it but warn
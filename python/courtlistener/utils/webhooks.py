@@ -0,0 +1,680 @@
+"""
+Embeddable webhook receiver for the CourtListener SDK.
+
+CourtListener can push docket alerts, search alerts and RECAP fetch results
+to a webhook URL instead of being polled. ``WebhookReceiver`` (threaded) and
+``AsyncWebhookReceiver`` (asyncio) accept those POSTs, validate them, drop
+duplicates by ``Idempotency-Key``, and persist each event to a SQLite-backed
+``WebhookQueue`` before answering 200. Handlers run from the queue, and an
+event is only removed once every handler succeeded, so processing is
+at-least-once across crashes and restarts.
+"""
+
+import asyncio
+import hashlib
+import inspect
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Any, Callable, Iterable, List, Optional, Tuple, Union
+
+from ..exceptions import ValidationError
+
+# CourtListener webhook event types
+DOCKET_ALERT = 1
+SEARCH_ALERT = 2
+RECAP_FETCH = 3
+OLD_DOCKET_ALERTS_REPORT = 4
+
+EVENT_NAMES = {
+    DOCKET_ALERT: 'docket_alert',
+    SEARCH_ALERT: 'search_alert',
+    RECAP_FETCH: 'recap_fetch',
+    OLD_DOCKET_ALERTS_REPORT: 'old_docket_alerts_report',
+}
+
+# Largest request body accepted, in bytes
+DEFAULT_MAX_BODY = 10 * 1024 * 1024
+
+_REASONS = {200: 'OK', 400: 'Bad Request', 403: 'Forbidden', 404: 'Not Found', 405: 'Method Not Allowed',
+            411: 'Length Required', 413: 'Payload Too Large'}
+
+
+class WebhookEvent:
+    """One webhook delivery."""
+
+    def __init__(self, key: str, body: Dict[str, Any], received_at: float, attempts: int = 0):
+        """
+        Initialize the event.
+
+        Args:
+            key: Idempotency key the event is deduplicated by
+            body: Parsed JSON body (``{"webhook": {...}, "payload": {...}}``)
+            received_at: Receive time (Unix timestamp)
+            attempts: Processing attempts so far, including the current one
+        """
+        webhook = body.get('webhook') or {}
+        self.key = key
+        self.body = body
+        self.received_at = received_at
+        self.attempts = attempts
+        self.event_type = int(webhook.get('event_type') or 0)
+        self.name = EVENT_NAMES.get(self.event_type, f"event_{self.event_type}")
+        self.version = webhook.get('version')
+        self.date_created = webhook.get('date_created')
+        self.payload: Any = body.get('payload')
+
+    def __repr__(self) -> str:
+        """String representation of the event."""
+        return f"WebhookEvent(key={self.key!r}, name={self.name!r}, attempts={self.attempts})"
+
+
+def parse_event(body: Union[bytes, str], headers: Optional[Dict[str, str]] = None) -> WebhookEvent:
+    """
+    Validate a webhook request body.
+
+    Args:
+        body: Raw request body
+        headers: Request headers; ``Idempotency-Key`` is used as the event key
+            (default: SHA-256 of the body)
+
+    Returns:
+        WebhookEvent instance
+
+    Raises:
+        ValidationError: If the body is not a CourtListener webhook event
+    """
+    raw = body.encode('utf-8') if isinstance(body, str) else bytes(body)
+    try:
+        data = json.loads(raw.decode('utf-8'))
+    except (UnicodeDecodeError, ValueError) as e:
+        raise ValidationError(f"Webhook body is not valid JSON: {e}")
+    if not isinstance(data, dict) or not isinstance(data.get('webhook'), dict):
+        raise ValidationError("Webhook body must be an object with a 'webhook' object")
+    event_type = data['webhook'].get('event_type')
+    if not isinstance(event_type, int) or isinstance(event_type, bool):
+        raise ValidationError("Webhook event_type must be an integer")
+    if not isinstance(data.get('payload'), (dict, list)):
+        raise ValidationError("Webhook body must contain a 'payload'")
+    headers = {name.lower(): value for name, value in (headers or {}).items()}
+    key = (headers.get('idempotency-key') or '').strip() or hashlib.sha256(raw).hexdigest()
+    return WebhookEvent(key, data, time.time())
+
+
+class WebhookQueue:
+    """Durable, deduplicating event queue in a SQLite file."""
+
+    def __init__(self, path: str = ':memory:', max_attempts: int = 5, retry_delay: float = 30.0, lease: float = 300.0):
+        """
+        Initialize the queue.
+
+        Args:
+            path: SQLite file (default: in memory, which is not durable)
+            max_attempts: Processing attempts before an event is marked failed
+            retry_delay: Seconds before a failed event is retried; doubles
+                with every attempt
+            lease: Seconds a claimed event stays hidden; an event whose
+                processing never finished (e.g. the process died) is
+                redelivered after that
+        """
+        if path != ':memory:':
+            path = os.path.expanduser(path)
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self.path = path
+        self.max_attempts = max_attempts
+        self.retry_delay = retry_delay
+        self.lease = lease
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(path, timeout=30, isolation_level=None, check_same_thread=False)
+        if path != ':memory:':
+            self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS webhook_events ("
+            "key TEXT PRIMARY KEY, body TEXT NOT NULL, received_at REAL NOT NULL, "
+            "status TEXT NOT NULL DEFAULT 'pending', attempts INTEGER NOT NULL DEFAULT 0, "
+            "available_at REAL NOT NULL, error TEXT)"
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS webhook_events_pending ON webhook_events (status, available_at)"
+        )
+
+    @contextmanager
+    def _transaction(self):
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._conn.execute("COMMIT")
+
+    def put(self, event: WebhookEvent) -> bool:
+        """
+        Store an event unless one with the same key was already received.
+
+        Args:
+            event: Event to store
+
+        Returns:
+            True if stored, False if it is a duplicate
+        """
+        with self._lock:
+            cursor = self._conn.execute(
+                "INSERT OR IGNORE INTO webhook_events (key, body, received_at, available_at) VALUES (?, ?, ?, ?)",
+                (event.key, json.dumps(event.body), event.received_at, event.received_at),
+            )
+            return cursor.rowcount == 1
+
+    def claim(self, limit: int = 100) -> List[WebhookEvent]:
+        """
+        Take due events for processing, oldest first.
+
+        Args:
+            limit: Maximum number of events
+
+        Returns:
+            Claimed events; each must be passed to ``ack`` or ``nack``
+        """
+        now = time.time()
+        with self._transaction():
+            rows = self._conn.execute(
+                "SELECT key, body, received_at, attempts FROM webhook_events "
+                "WHERE status = 'pending' AND available_at <= ? ORDER BY received_at LIMIT ?",
+                (now, limit),
+            ).fetchall()
+            self._conn.executemany(
+                "UPDATE webhook_events SET attempts = attempts + 1, available_at = ? WHERE key = ?",
+                [(now + self.lease, row[0]) for row in rows],
+            )
+        return [WebhookEvent(key, json.loads(body), received_at, attempts + 1)
+                for key, body, received_at, attempts in rows]
+
+    def ack(self, event: WebhookEvent) -> None:
+        """Mark an event as processed."""
+        with self._lock:
+            self._conn.execute(
+                "UPDATE webhook_events SET status = 'done', error = NULL WHERE key = ?", (event.key,)
+            )
+
+    def nack(self, event: WebhookEvent, error: Optional[str] = None) -> None:
+        """
+        Schedule a retry of an event, or mark it failed after ``max_attempts``.
+
+        Args:
+            event: Claimed event
+            error: Error message to record
+        """
+        status = 'failed' if event.attempts >= self.max_attempts else 'pending'
+        delay = self.retry_delay * (2 ** max(event.attempts - 1, 0))
+        with self._lock:
+            self._conn.execute(
+                "UPDATE webhook_events SET status = ?, available_at = ?, error = ? WHERE key = ?",
+                (status, time.time() + delay, error, event.key),
+            )
+
+    def retry_failed(self) -> int:
+        """
+        Requeue every failed event.
+
+        Returns:
+            Number of events requeued
+        """
+        with self._lock:
+            cursor = self._conn.execute(
+                "UPDATE webhook_events SET status = 'pending', attempts = 0, available_at = ? WHERE status = 'failed'",
+                (time.time(),),
+            )
+            return cursor.rowcount
+
+    def purge(self, older_than: float) -> int:
+        """
+        Delete processed events. Their keys stop being deduplicated.
+
+        Args:
+            older_than: Age in seconds
+
+        Returns:
+            Number of events deleted
+        """
+        with self._lock:
+            cursor = self._conn.execute(
+                "DELETE FROM webhook_events WHERE status = 'done' AND received_at < ?",
+                (time.time() - older_than,),
+            )
+            return cursor.rowcount
+
+    def counts(self) -> Dict[str, int]:
+        """Number of events per status (``pending``, ``done``, ``failed``)."""
+        with self._lock:
+            rows = self._conn.execute("SELECT status, COUNT(*) FROM webhook_events GROUP BY status").fetchall()
+        result = {'pending': 0, 'done': 0, 'failed': 0}
+        result.update(dict(rows))
+        return result
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+    def __len__(self) -> int:
+        return self.counts()['pending']
+
+
+class _BaseReceiver:
+    """Configuration, handler registry and delivery validation shared by both receivers."""
+
+    def __init__(
+        self,
+        queue: Optional[WebhookQueue] = None,
+        host: str = '127.0.0.1',
+        port: int = 8080,
+        path: str = '/',
+        allowed_ips: Optional[Iterable[str]] = None,
+        max_body: int = DEFAULT_MAX_BODY,
+        poll_interval: float = 1.0,
+    ):
+        """
+        Initialize the receiver.
+
+        Args:
+            queue: Event queue (default: in-memory ``WebhookQueue``; pass one
+                with a file path for durability)
+            host: Interface to listen on
+            port: Port to listen on (0 picks a free port)
+            path: URL path that accepts events; other paths get 404, so a
+                hard-to-guess path acts as a shared secret
+            allowed_ips: Only accept requests from these addresses
+            max_body: Largest body accepted, in bytes
+            poll_interval: Seconds between checks for events due for retry
+        """
+        self.queue = queue if queue is not None else WebhookQueue()
+        self.host = host
+        self.port = port
+        self.path = '/' + path.strip('/') if path.strip('/') else '/'
+        self.allowed_ips = set(allowed_ips) if allowed_ips is not None else None
+        self.max_body = max_body
+        self.poll_interval = poll_interval
+        self.logger = logging.getLogger(__name__)
+        self._handlers: List[Tuple[Optional[str], Callable]] = []
+
+    def on(self, event: Union[str, int, None] = None, handler: Optional[Callable] = None):
+        """
+        Register a handler, directly or as a decorator.
+
+        Args:
+            event: Event name (``'docket_alert'``, ``'search_alert'``,
+                ``'recap_fetch'``, ``'old_docket_alerts_report'``), event type
+                number, or None for every event
+            handler: Callable taking a ``WebhookEvent``
+
+        Returns:
+            The handler (or a decorator when ``handler`` is omitted)
+        """
+        name = EVENT_NAMES.get(event, f"event_{event}") if isinstance(event, int) else event
+
+        def register(func: Callable) -> Callable:
+            self._check_handler(func)
+            self._handlers.append((name, func))
+            return func
+
+        return register(handler) if handler is not None else register
+
+    def accept(
+        self,
+        body: Union[bytes, str],
+        headers: Optional[Dict[str, str]] = None,
+        remote_addr: Optional[str] = None,
+        path: Optional[str] = None,
+    ) -> Tuple[int, str]:
+        """
+        Validate and queue one delivery; used by the HTTP servers and usable
+        from any other web framework.
+
+        Args:
+            body: Raw request body
+            headers: Request headers
+            remote_addr: Client address, checked against ``allowed_ips``
+            path: Request path, checked against ``path``
+
+        Returns:
+            ``(status_code, message)`` to answer with
+        """
+        event = self._parse_delivery(body, headers, remote_addr, path)
+        if isinstance(event, tuple):
+            return event
+        return self._queued(self.queue.put(event))
+
+    def _parse_delivery(
+        self,
+        body: Union[bytes, str],
+        headers: Optional[Dict[str, str]],
+        remote_addr: Optional[str],
+        path: Optional[str],
+    ) -> Union[WebhookEvent, Tuple[int, str]]:
+        """The delivery's event, or the ``(status_code, message)`` rejecting it."""
+        if path is not None and path.split('?')[0].rstrip('/') != self.path.rstrip('/'):
+            return 404, 'not found'
+        if self.allowed_ips is not None and remote_addr not in self.allowed_ips:
+            return 403, 'forbidden'
+        try:
+            return parse_event(body, headers)
+        except ValidationError as e:
+            return 400, str(e)
+
+    def _queued(self, inserted: bool) -> Tuple[int, str]:
+        """Reply for a parsed delivery, waking the worker if it was new."""
+        if inserted:
+            self._notify()
+            return 200, 'queued'
+        return 200, 'duplicate'
+
+    def _handlers_for(self, event: WebhookEvent) -> List[Callable]:
+        return [handler for name, handler in self._handlers if name is None or name == event.name]
+
+    def _check_handler(self, handler: Callable) -> None:
+        """Reject handlers this receiver cannot run."""
+
+    def _notify(self) -> None:
+        """Wake the handler worker after an event was queued."""
+
+    def _check_length(self, length: Optional[str]) -> Optional[Tuple[int, str]]:
+        """Error reply for a missing, malformed or oversized Content-Length."""
+        if length is None:
+            return 411, 'content length required'
+        if not length.strip().isdigit():
+            return 400, 'invalid content length'
+        if int(length) > self.max_body:
+            return 413, 'payload too large'
+        return None
+
+
+class WebhookReceiver(_BaseReceiver):
+    """Threaded HTTP receiver that queues webhook events and dispatches them to handlers."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._server: Optional[ThreadingHTTPServer] = None
+        self._threads: List[threading.Thread] = []
+        self._wakeup = threading.Event()
+        self._stopping = threading.Event()
+
+    def process_pending(self, limit: int = 100) -> int:
+        """
+        Run handlers for queued events that are due.
+
+        Args:
+            limit: Maximum number of events
+
+        Returns:
+            Number of events claimed
+        """
+        events = self.queue.claim(limit)
+        for event in events:
+            try:
+                for handler in self._handlers_for(event):
+                    result = handler(event)
+                    if inspect.isawaitable(result):
+                        if inspect.iscoroutine(result):
+                            result.close()
+                        raise ValidationError("Awaitable handler results need AsyncWebhookReceiver")
+            except Exception as e:
+                self.logger.warning("Webhook handler failed for %r: %s", event, e)
+                self.queue.nack(event, repr(e))
+            else:
+                self.queue.ack(event)
+        return len(events)
+
+    @property
+    def address(self) -> Tuple[str, int]:
+        """``(host, port)`` the server listens on."""
+        if self._server is not None:
+            host, port = self._server.server_address[:2]
+            return str(host), int(port)
+        return self.host, self.port
+
+    def start(self) -> None:
+        """Start the HTTP server and the handler worker on background threads."""
+        if self._server is not None:
+            return
+        self._stopping.clear()
+        self._server = ThreadingHTTPServer((self.host, self.port), self._request_handler())
+        self._server.daemon_threads = True
+        self._threads = [
+            threading.Thread(target=self._server.serve_forever, name='WebhookServer', daemon=True),
+            threading.Thread(target=self._work, name='WebhookWorker', daemon=True),
+        ]
+        for thread in self._threads:
+            thread.start()
+
+    def stop(self, timeout: Optional[float] = 5.0) -> None:
+        """Stop the server and worker; queued events stay in the queue."""
+        self._stopping.set()
+        self._wakeup.set()
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+        for thread in self._threads:
+            thread.join(timeout)
+        self._threads = []
+
+    def serve_forever(self) -> None:
+        """Run until interrupted."""
+        self.start()
+        try:
+            while not self._stopping.wait(1.0):
+                pass
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self.stop()
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+    def _check_handler(self, handler: Callable) -> None:
+        if inspect.iscoroutinefunction(handler):
+            raise ValidationError("Coroutine handlers need AsyncWebhookReceiver")
+
+    def _notify(self) -> None:
+        self._wakeup.set()
+
+    def _work(self) -> None:
+        while not self._stopping.is_set():
+            self._wakeup.wait(self.poll_interval)
+            self._wakeup.clear()
+            try:
+                while not self._stopping.is_set() and self.process_pending():
+                    pass
+            except Exception:
+                self.logger.exception("Webhook worker failed")
+
+    def _request_handler(self) -> type:
+        receiver = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                length = self.headers.get('Content-Length')
+                error = receiver._check_length(length)
+                if error is not None:
+                    return self._reply(*error)
+                body = self.rfile.read(int(length or 0))
+                status, message = receiver.accept(body, dict(self.headers), self.client_address[0], self.path)
+                self._reply(status, message)
+
+            def do_GET(self):
+                self._reply(405, 'method not allowed')
+
+            def _reply(self, status, message):
+                payload = json.dumps({'status': message}).encode('utf-8')
+                self.send_response(status)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def log_message(self, format, *args):
+                receiver.logger.debug("webhook %s - %s", self.address_string(), format % args)
+
+        return Handler
+
+
+class AsyncWebhookReceiver(_BaseReceiver):
+    """asyncio HTTP receiver; handlers may be plain functions or coroutines."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._aserver: Optional[asyncio.Server] = None
+        self._worker: Optional[asyncio.Future] = None
+        self._aevent: Optional[asyncio.Event] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._stopping = False
+
+    async def start(self) -> None:
+        """Start the HTTP server and the handler worker on the running loop."""
+        if self._aserver is not None:
+            return
+        self._loop = asyncio.get_running_loop()
+        self._stopping = False
+        self._aevent = asyncio.Event()
+        self._aserver = await asyncio.start_server(self._handle_connection, self.host, self.port)
+        self._worker = asyncio.ensure_future(self._awork(self._aevent))
+
+    async def stop(self) -> None:
+        """Stop the server and worker; queued events stay in the queue."""
+        self._stopping = True
+        if self._aserver is not None:
+            self._aserver.close()
+            await self._aserver.wait_closed()
+            self._aserver = None
+        if self._worker is not None:
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+            self._worker = None
+
+    async def serve_forever(self) -> None:
+        """Run until cancelled."""
+        await self.start()
+        try:
+            if self._aserver is not None:
+                await self._aserver.serve_forever()
+        finally:
+            await self.stop()
+
+    async def process_pending(self, limit: int = 100) -> int:
+        """
+        Run handlers for queued events that are due.
+
+        Args:
+            limit: Maximum number of events
+
+        Returns:
+            Number of events claimed
+        """
+        loop = asyncio.get_running_loop()
+        events = await loop.run_in_executor(None, self.queue.claim, limit)
+        for event in events:
+            try:
+                for handler in self._handlers_for(event):
+                    if inspect.iscoroutinefunction(handler):
+                        await handler(event)
+                    else:
+                        result = await loop.run_in_executor(None, handler, event)
+                        if inspect.isawaitable(result):
+                            await result
+            except Exception as e:
+                self.logger.warning("Webhook handler failed for %r: %s", event, e)
+                await loop.run_in_executor(None, self.queue.nack, event, repr(e))
+            else:
+                await loop.run_in_executor(None, self.queue.ack, event)
+        return len(events)
+
+    @property
+    def address(self) -> Tuple[str, int]:
+        """``(host, port)`` the server listens on."""
+        if self._aserver is not None and self._aserver.sockets:
+            host, port = self._aserver.sockets[0].getsockname()[:2]
+            return str(host), int(port)
+        return self.host, self.port
+
+    async def __aenter__(self):
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.stop()
+
+    def _notify(self) -> None:
+        if self._aevent is not None and self._loop is not None:
+            self._loop.call_soon_threadsafe(self._aevent.set)
+
+    async def _awork(self, wakeup: asyncio.Event) -> None:
+        # The flag also ends the loop when wait_for swallows the cancellation
+        # (possible before Python 3.12 if the wakeup fires at the same time)
+        while not self._stopping:
+            try:
+                await asyncio.wait_for(wakeup.wait(), self.poll_interval)
+            except asyncio.TimeoutError:
+                pass
+            wakeup.clear()
+            try:
+                while await self.process_pending():
+                    pass
+            except Exception:
+                self.logger.exception("Webhook worker failed")
+
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            status, message = await self._read_request(reader, writer)
+        except (asyncio.IncompleteReadError, ValueError, UnicodeDecodeError):
+            status, message = 400, 'malformed request'
+        payload = json.dumps({'status': message}).encode('utf-8')
+        writer.write(
+            f"HTTP/1.1 {status} {_REASONS.get(status, '')}\r\n"
+            f"Content-Type: application/json\r\nContent-Length: {len(payload)}\r\n"
+            f"Connection: close\r\n\r\n".encode('latin-1') + payload
+        )
+        try:
+            await writer.drain()
+        finally:
+            writer.close()
+
+    async def _read_request(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> Tuple[int, str]:
+        request_line = (await reader.readline()).decode('latin-1').split()
+        if len(request_line) < 2:
+            raise ValueError("bad request line")
+        method, target = request_line[0], request_line[1]
+        headers: Dict[str, str] = {}
+        while True:
+            line = (await reader.readline()).decode('latin-1')
+            if line in ('\r\n', '\n', ''):
+                break
+            name, _, value = line.partition(':')
+            headers[name.strip()] = value.strip()
+        if method != 'POST':
+            return 405, 'method not allowed'
+        length = next((value for name, value in headers.items() if name.lower() == 'content-length'), None)
+        error = self._check_length(length)
+        if error is not None:
+            return error
+        body = await reader.readexactly(int(length or 0))
+        peer = writer.get_extra_info('peername')
+        event = self._parse_delivery(body, headers, peer[0] if peer else None, target)
+        if isinstance(event, tuple):
+            return event
+        # The SQLite insert commits to disk and may wait for a claim in progress
+        loop = asyncio.get_running_loop()
+        return self._queued(await loop.run_in_executor(None, self.queue.put, event))
@@ -170,7 +170,7 @@ class TestCompleteWorkflows:
             "rate": "dly",
             "alert_type": "search"
         }
-        self.client.post.return_value = mock_updated_alert
+        self.client._make_request.return_value = mock_updated_alert
         
         updated_alert = self.client.alerts.update(1, rate="dly")
         assert updated_alert["rate"] == "dly"
@@ -61,7 +61,7 @@ class TestAlertsIntegration:
             "rate": "dly",
             "alert_type": "search"
         }
-        self.client.post.return_value = mock_updated_alert
+        self.client._make_request.return_value = mock_updated_alert
         
         # Test updating an alert
         updated_alert = self.client.alerts.update(1, rate="dly")
@@ -114,7 +114,7 @@ class TestAlertsIntegration:
             "docket": "https://api.courtlistener.com/api/rest/v4/dockets/123/",
             "alert_type": "document"
         }
-        self.client.post.return_value = mock_updated_docket_alert
+        self.client._make_request.return_value = mock_updated_docket_alert
         
         # Test updating a docket alert
         updated_docket_alert = self.client.docket_alerts.update(1, alert_type="document")
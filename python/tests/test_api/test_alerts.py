@@ -96,12 +96,12 @@ class TestAlertsAPI:
             "query": "constitutional",
             "rate": "dly"
         }
-        self.mock_client.post.return_value = mock_response
+        self.mock_client._make_request.return_value = mock_response
         
         result = self.api.update(1, rate="dly")
         
         assert result == mock_response
-        self.mock_client.post.assert_called_once_with("alerts/1/", data={"rate": "dly"})
+        self.mock_client._make_request.assert_called_once_with("PATCH", "alerts/1/", json_data={"rate": "dly"})
     
     def test_delete_alert(self):
         """Test deleting an alert."""
@@ -4,8 +4,8 @@ Comprehensive tests for Citations API to achieve 100% coverage.
 
 import pytest
 from unittest.mock import Mock, patch
-from courtlistener.api.citations import CitationsAPI, Citation
-from courtlistener.exceptions import ValidationError, CourtListenerError
+from courtlistener.api.citations import CitationsAPI, Citation, _split_text
+from courtlistener.exceptions import ValidationError, CourtListenerError, RateLimitError
 
 
 class TestCitationsAPIComprehensive:
@@ -210,3 +210,148 @@ class TestCitationsAPIComprehensive:
         
         with pytest.raises(Exception):
             self.api.lookup_citations("test text")
+
+
+class TestCitationsBulkLookup:
+    """Tests for chunked, concurrent bulk citation lookup."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.mock_client = Mock()
+        self.api = CitationsAPI(self.mock_client)
+
+    @staticmethod
+    def _find(text, needle="1 U.S. 1"):
+        """Fake citation-lookup/ response for every occurrence of needle."""
+        results = []
+        start = text.find(needle)
+        while start != -1:
+            results.append({
+                "citation": needle,
+                "start_index": start,
+                "end_index": start + len(needle),
+                "status": 200,
+            })
+            start = text.find(needle, start + 1)
+        return results
+
+    def test_split_text_prefers_paragraphs(self):
+        """Chunks break on paragraph boundaries and cover the whole text."""
+        text = ("a" * 30 + "\n\n") * 5
+        chunks = _split_text(text, 70)
+        assert all(len(chunk) <= 70 for _, chunk in chunks)
+        assert "".join(chunk for _, chunk in chunks) == text
+        assert all(chunk.endswith("\n\n") for _, chunk in chunks[:-1])
+        for offset, chunk in chunks:
+            assert text[offset:offset + len(chunk)] == chunk
+
+    def test_split_text_short_and_unbroken(self):
+        """Short texts are one chunk; unbroken runs are hard-split."""
+        assert _split_text("short", 100) == [(0, "short")]
+        assert _split_text("x" * 10, 4) == [(0, "xxxx"), (4, "xxxx"), (8, "xx")]
+
+    def test_split_text_keeps_abbreviations_together(self):
+        """Sentence boundaries skip "v." and reporter abbreviations."""
+        text = "Intro text here. See Roe v. Wade, 410 F. Supp. 113. Then more."
+        chunks = _split_text(text, 56)
+        assert chunks[0][1] == "Intro text here. See Roe v. Wade, 410 F. Supp. 113. "
+
+    def test_split_text_overlap(self):
+        """Overlapping chunks repeat the tail of the previous chunk."""
+        chunks = _split_text("x" * 20, 8, overlap=2)
+        assert [offset for offset, _ in chunks] == [0, 6, 12]
+        assert all(len(chunk) <= 8 for _, chunk in chunks)
+
+    def test_bulk_recovers_citation_cut_by_chunking(self):
+        """A citation across a hard split is reported once, in full."""
+        text = "x" * 110 + " 410 U.S. 113 " + "y" * 100
+        self.mock_client.post.side_effect = lambda endpoint, json_data: self._find(json_data["text"], "410 U.S. 113")
+
+        result = self.api.lookup_citations_bulk(text, max_chars=120)
+
+        sent = [call[1]["json_data"]["text"] for call in self.mock_client.post.call_args_list]
+        assert any(chunk.endswith("410 U.S. ") for chunk in sent)  # first chunk cuts it
+        assert [text[item["start_index"]:item["end_index"]] for item in result] == ["410 U.S. 113"]
+
+    def test_bulk_single_text_remaps_offsets(self):
+        """Offsets from each chunk are remapped onto the original text."""
+        text = "See 1 U.S. 1 here.\n\n" * 6
+        self.mock_client.post.side_effect = lambda endpoint, json_data: self._find(json_data["text"])
+
+        result = self.api.lookup_citations_bulk(text, max_chars=45, max_workers=2)
+
+        assert len(result) == 6
+        assert self.mock_client.post.call_count > 1
+        for item in result:
+            assert text[item["start_index"]:item["end_index"]] == "1 U.S. 1"
+        assert [item["start_index"] for item in result] == sorted(
+            item["start_index"] for item in result
+        )
+
+    def test_bulk_many_documents(self):
+        """A list of texts returns one result list per text."""
+        self.mock_client.post.side_effect = lambda endpoint, json_data: self._find(json_data["text"])
+
+        result = self.api.lookup_citations_bulk(["1 U.S. 1 and 1 U.S. 1", "", "none"])
+
+        assert [len(items) for items in result] == [2, 0, 0]
+
+    def test_bulk_resubmits_capped_citations(self):
+        """Citations beyond the per-request cap are looked up again."""
+        text = "1 U.S. 1; 1 U.S. 1; 1 U.S. 1"
+
+        def capped(endpoint, json_data):
+            found = self._find(json_data["text"])
+            for item in found[1:]:
+                item["status"] = 429
+            return found
+
+        self.mock_client.post.side_effect = capped
+
+        result = self.api.lookup_citations_bulk(text)
+
+        assert self.mock_client.post.call_count == 3
+        assert [item["start_index"] for item in result] == [0, 10, 20]
+        assert all(item["status"] == 200 for item in result)
+
+    def test_bulk_retries_cap_at_first_citation(self):
+        """A cap at index 0 is retried after a back-off, not treated as no cap."""
+        text = "1 U.S. 1; 1 U.S. 1"
+        capped = [dict(item, status=429) for item in self._find(text)]
+        self.mock_client.config.rate_limit_delay = 0
+        self.mock_client.post.side_effect = [capped, self._find(text)]
+
+        result = self.api.lookup_citations_bulk(text)
+
+        assert self.mock_client.post.call_count == 2
+        assert [item["start_index"] for item in result] == [0, 10]
+
+        self.mock_client.post.side_effect = lambda endpoint, json_data: capped
+        with pytest.raises(RateLimitError):
+            self.api.lookup_citations_bulk(text, max_throttle_retries=1)
+        assert self.mock_client.post.call_count == 4
+
+    def test_bulk_retries_after_throttling(self):
+        """A throttled chunk backs off and is retried."""
+        responses = [RateLimitError(retry_after=0), [{"start_index": 0, "end_index": 1}]]
+        self.mock_client.post.side_effect = responses
+
+        result = self.api.lookup_citations_bulk("x")
+
+        assert result == [{"start_index": 0, "end_index": 1}]
+        assert self.mock_client.post.call_count == 2
+
+    def test_bulk_gives_up_when_throttled(self):
+        """Throttling beyond max_throttle_retries is raised."""
+        self.mock_client.post.side_effect = RateLimitError(retry_after=0)
+
+        with pytest.raises(RateLimitError):
+            self.api.lookup_citations_bulk("x", max_throttle_retries=1)
+        assert self.mock_client.post.call_count == 2
+
+    def test_bulk_invalid_arguments(self):
+        """Invalid chunk sizes and worker counts are rejected."""
+        with pytest.raises(ValidationError):
+            self.api.lookup_citations_bulk("x", max_chars=0)
+        with pytest.raises(ValidationError):
+            self.api.lookup_citations_bulk("x", max_workers=0)
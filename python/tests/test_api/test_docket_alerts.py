@@ -94,12 +94,12 @@ class TestDocketAlertsAPI:
             "docket": "https://api.courtlistener.com/api/rest/v4/dockets/123/",
             "alert_type": "document"
         }
-        self.mock_client.post.return_value = mock_response
+        self.mock_client._make_request.return_value = mock_response
         
         result = self.api.update(1, alert_type="document")
         
         assert result == mock_response
-        self.mock_client.post.assert_called_once_with("docket-alerts/1/", data={"alert_type": "document"})
+        self.mock_client._make_request.assert_called_once_with("PATCH", "docket-alerts/1/", json_data={"alert_type": "document"})
     
     def test_delete_docket_alert(self):
         """Test deleting a docket alert."""
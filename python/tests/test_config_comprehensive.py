@@ -5,7 +5,7 @@ Comprehensive tests for Config class to achieve 100% coverage.
 import pytest
 from unittest.mock import Mock, patch
 import os
-from courtlistener.config import Config
+from courtlistener.config import Config, supported_encodings
 from courtlistener.exceptions import ValidationError
 
 
@@ -179,6 +179,16 @@ class TestConfigComprehensive:
             
             assert headers["User-Agent"] == "CourtListener-SDK/0.1.0"
     
+    def test_get_headers_accept_encoding(self):
+        """Test that compression is negotiated from the installed decoders."""
+        with patch('courtlistener.config._CONTENT_DECODERS', ('gzip', 'x-gzip', 'deflate', 'br', 'zstd')):
+            assert supported_encodings() == "zstd, br, gzip, deflate"
+            config = Config(api_token="test-token")
+        assert config.get_headers()["Accept-Encoding"] == "zstd, br, gzip, deflate"
+        
+        config = Config(api_token="test-token", accept_encoding="identity")
+        assert config.get_headers()["Accept-Encoding"] == "identity"
+    
     def test_get_version_success(self):
         """Test _get_version method with successful import."""
         with patch('courtlistener.__version__', '2.0.0'):
@@ -0,0 +1,111 @@
+"""
+Tests for optional OpenTelemetry tracing.
+"""
+
+import pytest
+from unittest.mock import Mock, patch
+from courtlistener import tracing
+from courtlistener.api.dockets import DocketsAPI
+from courtlistener.exceptions import CourtListenerError, NotFoundError
+
+sdk_trace = pytest.importorskip("opentelemetry.sdk.trace")
+from opentelemetry.sdk.trace.export import SimpleSpanProcessor  # noqa: E402
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter  # noqa: E402
+from opentelemetry.trace import StatusCode  # noqa: E402
+
+
+def ok(payload):
+    response = Mock(status_code=200)
+    response.json.return_value = payload
+    return response
+
+
+class TestTracing:
+    """Spans recorded across API calls, pagination, retries and models."""
+
+    def setup_method(self):
+        self.exporter = InMemorySpanExporter()
+        provider = sdk_trace.TracerProvider()
+        provider.add_span_processor(SimpleSpanProcessor(self.exporter))
+        tracing.enable_tracing(provider.get_tracer("test"))
+
+    def teardown_method(self):
+        tracing.disable_tracing()
+
+    def spans(self):
+        return {span.name: span for span in self.exporter.get_finished_spans()}
+
+    def test_generator_call_parents_pages_requests_and_models(self, client):
+        pages = [
+            ok({"next": "https://x/?cursor=2", "results": [{"id": 1}]}),
+            ok({"next": None, "results": [{"id": 2}]}),
+        ]
+        with patch.object(client.transport.session, "request", side_effect=pages):
+            dockets = list(client.dockets.list_all_dockets({"court": "scotus"}))
+        assert [d.id for d in dockets] == [1, 2]
+
+        finished = self.exporter.get_finished_spans()
+        names = [span.name for span in finished]
+        assert names.count("PageIterator.load_page") == 2
+        assert names.count("HTTP GET") == 2
+        assert names.count("Docket.parse") == 2
+
+        root = self.spans()["DocketsAPI.list_all_dockets"]
+        by_id = {span.context.span_id: span for span in finished}
+        for span in finished:
+            if span is root:
+                continue
+            parent = span
+            while parent.parent is not None and parent.parent.span_id in by_id:
+                parent = by_id[parent.parent.span_id]
+            assert parent is root, span.name
+            assert span.context.trace_id == root.context.trace_id
+
+        http = self.spans()["HTTP GET"]
+        assert http.parent.span_id == self.spans()["PageIterator.load_page"].context.span_id
+        assert http.attributes["courtlistener.endpoint"] == "dockets"
+        assert http.attributes["http.response.status_code"] == 200
+
+    @patch("time.sleep")
+    def test_retry_attempts_and_errors(self, mock_sleep, client):
+        responses = [Mock(status_code=500), Mock(status_code=404)]
+        with patch.object(client.transport.session, "request", side_effect=responses):
+            with pytest.raises(NotFoundError):
+                client.courts.get_court("nope")
+
+        finished = self.exporter.get_finished_spans()
+        attempts = [span for span in finished if span.name == "HTTP GET"]
+        assert [span.attributes["courtlistener.attempt"] for span in attempts] == [0, 1]
+        assert all(span.status.status_code == StatusCode.ERROR for span in attempts)
+        call = self.spans()["CourtsAPI.get_court"]
+        assert call.status.status_code == StatusCode.ERROR
+        assert all(span.parent.span_id == call.context.span_id for span in attempts)
+
+    def test_abandoned_generator_ends_span(self):
+        client = Mock()
+        client._make_request.return_value = {"next": "https://x/?cursor=2", "results": [{"id": 1}, {"id": 2}]}
+        dockets = DocketsAPI(client).list_all_dockets()
+        next(dockets)
+        dockets.close()
+        assert "DocketsAPI.list_all_dockets" in self.spans()
+
+
+class TestTracingDisabled:
+    """Tracing is off unless enabled."""
+
+    def test_no_spans_when_disabled(self):
+        assert not tracing.is_enabled()
+        assert tracing.current_context() is None
+        with tracing.span("anything") as span:
+            assert span is None
+
+    def test_wrapped_methods_keep_identity(self):
+        assert DocketsAPI.list_all_dockets.__name__ == "list_all_dockets"
+        assert DocketsAPI.list_all_dockets._traced
+        assert tracing.traced(DocketsAPI.list_all_dockets) is DocketsAPI.list_all_dockets
+
+    def test_enable_requires_opentelemetry(self, monkeypatch):
+        monkeypatch.setattr(tracing, "otel_trace", None)
+        with pytest.raises(CourtListenerError):
+            tracing.enable_tracing()
+        assert not tracing.is_enabled()
@@ -0,0 +1,213 @@
+"""
+Tests for Transport compression negotiation, transfer-size accounting and hooks.
+"""
+
+import gzip
+import io
+import json
+import pytest
+import requests
+from unittest.mock import Mock, patch
+from urllib3.response import HTTPResponse
+from courtlistener.config import Config
+from courtlistener.exceptions import AcceptedError, NotFoundError, RateLimitError, ValidationError
+from courtlistener.hooks import HookRegistry
+from courtlistener.transport import Transport, TransferStats
+
+
+def gzip_response(payload, status=200):
+    """Build a real requests.Response carrying a gzip-encoded body."""
+    body = gzip.compress(json.dumps(payload).encode("utf-8"))
+    raw = HTTPResponse(
+        body=io.BytesIO(body),
+        headers={"Content-Encoding": "gzip", "Content-Length": str(len(body))},
+        status=status,
+        preload_content=False,
+    )
+    response = requests.Response()
+    response.status_code = status
+    response.raw = raw
+    response.headers = requests.structures.CaseInsensitiveDict(raw.headers)
+    return response, len(body)
+
+
+class TestTransferStats:
+    """Test cases for TransferStats."""
+
+    def test_record_and_snapshot(self):
+        stats = TransferStats()
+        stats.record("search/", 100, 1000, "gzip")
+        stats.record("search/", 50, 500, "gzip")
+        stats.record("courts/", 400, 400)
+        snapshot = stats.snapshot()
+        assert list(snapshot) == ["courts/", "search/"]
+        assert snapshot["search/"]["requests"] == 2
+        assert snapshot["search/"]["wire_bytes"] == 150
+        assert snapshot["search/"]["decoded_bytes"] == 1500
+        assert snapshot["search/"]["ratio"] == pytest.approx(0.1)
+        assert snapshot["courts/"]["encodings"] == {"identity": 1}
+        assert stats.totals() == {"requests": 3, "wire_bytes": 550, "decoded_bytes": 1900}
+        stats.reset()
+        assert stats.snapshot() == {}
+
+
+class TestTransportCompression:
+    """Transport records compressed and decoded sizes per endpoint."""
+
+    def setup_method(self):
+        self.transport = Transport(Config(api_token="test-token"))
+
+    def test_accept_encoding_sent(self):
+        assert "gzip" in self.transport.session.headers["Accept-Encoding"]
+
+    def test_endpoint_key(self):
+        base = self.transport.config.base_url
+        assert self.transport._endpoint_key(base + "opinions/123/") == "opinions/{id}/"
+        assert self.transport._endpoint_key(base + "search/") == "search/"
+        assert self.transport._endpoint_key("https://other.example/x/7") == "x/{id}"
+
+    def test_records_gzip_response(self):
+        payload = {"results": [{"plain_text": "x" * 5000}]}
+        response, wire = gzip_response(payload)
+        with patch.object(self.transport.session, "request", return_value=response):
+            assert self.transport.get("opinions/5/") == payload
+        stats = self.transport.transfer_stats.snapshot()["opinions/{id}/"]
+        assert stats["wire_bytes"] == wire
+        assert stats["decoded_bytes"] == len(json.dumps(payload))
+        assert stats["wire_bytes"] < stats["decoded_bytes"]
+        assert stats["encodings"] == {"gzip": 1}
+
+    def test_records_streamed_response(self):
+        payload = {"next": None, "results": [{"id": i} for i in range(200)]}
+        response, wire = gzip_response(payload)
+        with patch.object(self.transport.session, "request", return_value=response):
+            page = self.transport.stream_get("opinions/")
+            assert len(list(page.results)) == 200
+        stats = self.transport.transfer_stats.snapshot()["opinions/"]
+        assert stats["wire_bytes"] == wire
+        assert stats["decoded_bytes"] == len(json.dumps(payload))
+
+    def test_records_error_responses(self):
+        response, _ = gzip_response({"detail": "Not found."}, status=404)
+        with patch.object(self.transport.session, "request", return_value=response):
+            with pytest.raises(NotFoundError):
+                self.transport.get("dockets/1/")
+        assert self.transport.transfer_stats.totals()["requests"] == 1
+
+    def test_mock_responses_are_ignored(self):
+        response = Mock(status_code=200)
+        response.json.return_value = {"ok": True}
+        with patch.object(self.transport.session, "request", return_value=response):
+            assert self.transport.get("courts/") == {"ok": True}
+        assert self.transport.transfer_stats.snapshot() == {}
+
+
+class TestTransportHooks:
+    """Lifecycle hooks around Transport._make_request."""
+
+    def setup_method(self):
+        self.transport = Transport(Config(api_token="test-token", max_retries=2))
+        self.events = []
+        for event in ("before_request", "after_response", "on_retry", "on_error"):
+            self.transport.hooks.register(event, lambda *args, event=event: self.events.append((event, args)))
+
+    def test_success_events(self):
+        response = Mock(status_code=200)
+        response.json.return_value = {"ok": True}
+        with patch.object(self.transport.session, "request", return_value=response):
+            self.transport.get("courts/", params={"id": "scotus"})
+        assert [event for event, _ in self.events] == ["before_request", "after_response"]
+        context = self.events[1][1][0]
+        assert context.endpoint == "courts/"
+        assert context.params == {"id": "scotus"}
+        assert context.status_code == 200
+        assert context.elapsed >= 0
+
+    @patch("time.sleep")
+    def test_retry_and_error_events(self, mock_sleep):
+        attempts = []
+        self.transport.hooks.register("on_retry", lambda context, error, delay: attempts.append(context.attempt))
+        response = Mock(status_code=429, headers={"Retry-After": "2"})
+        with patch.object(self.transport.session, "request", return_value=response):
+            with pytest.raises(RateLimitError):
+                self.transport.get("search/")
+        names = [event for event, _ in self.events]
+        assert names.count("before_request") == 3
+        assert names.count("on_retry") == 2
+        assert names[-1] == "on_error"
+        retries = [args for event, args in self.events if event == "on_retry"]
+        assert attempts == [0, 1]
+        assert all(delay == 2 for _, _, delay in retries)
+
+    def test_non_retryable_error_event(self):
+        with patch.object(self.transport.session, "request", return_value=Mock(status_code=404)):
+            with pytest.raises(NotFoundError):
+                self.transport.get("dockets/1/")
+        assert isinstance(self.events[-1][1][1], NotFoundError)
+
+    def test_before_request_can_modify_request(self):
+        self.transport.hooks.register(
+            "before_request", lambda context: context.request_kwargs.setdefault("headers", {}).update({"X-Trace": "1"})
+        )
+        response = Mock(status_code=200)
+        response.json.return_value = {}
+        with patch.object(self.transport.session, "request", return_value=response) as request:
+            self.transport.get("courts/")
+        assert request.call_args.kwargs["headers"] == {"X-Trace": "1"}
+
+    def test_failing_hook_does_not_break_request(self):
+        self.transport.hooks.register("after_response", Mock(side_effect=RuntimeError("boom")))
+        response = Mock(status_code=200)
+        response.json.return_value = {"ok": True}
+        with patch.object(self.transport.session, "request", return_value=response):
+            assert self.transport.get("courts/") == {"ok": True}
+
+    def test_registry(self):
+        hooks = HookRegistry()
+
+        @hooks.register("on_error")
+        def handler(context, error):
+            pass
+
+        assert hooks.has_hooks("on_error")
+        hooks.unregister("on_error", handler)
+        assert not hooks.has_hooks("on_error")
+        with pytest.raises(ValidationError):
+            hooks.register("on_something", handler)
+
+
+class TestTransportStatusHandling:
+    """Test cases for non-200 success and accepted responses."""
+
+    def setup_method(self):
+        self.transport = Transport(Config(api_token="test-token"))
+
+    def make_response(self, status, payload=None, headers=None):
+        response = Mock()
+        response.status_code = status
+        response.headers = headers or {}
+        response.json.return_value = payload
+        return response
+
+    def test_created_and_no_content(self):
+        assert self.transport._handle_response(self.make_response(201, {"id": 1})) == {"id": 1}
+        assert self.transport._handle_response(self.make_response(204)) == {}
+
+    def test_accepted_carries_retry_after(self):
+        with pytest.raises(AcceptedError) as exc:
+            self.transport._handle_response(self.make_response(202, headers={"Retry-After": "7"}))
+        assert exc.value.retry_after == 7
+
+    @patch("time.sleep")
+    def test_accepted_is_not_retried(self, mock_sleep):
+        response = self.make_response(202, headers={"Retry-After": "30"})
+        with patch.object(self.transport.session, "request", return_value=response) as request:
+            with pytest.raises(AcceptedError):
+                self.transport.post("recap-fetch/", data={"docket": 1})
+        assert request.call_count == 1
+        mock_sleep.assert_not_called()
+
+    def test_rate_limit_retry_after(self):
+        with pytest.raises(RateLimitError) as exc:
+            self.transport._handle_response(self.make_response(429, headers={"Retry-After": "soon"}))
+        assert exc.value.retry_after is None
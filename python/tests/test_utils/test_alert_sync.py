@@ -0,0 +1,169 @@
+"""
+Tests for bulk alert synchronization.
+"""
+
+import threading
+import pytest
+from unittest.mock import Mock
+from courtlistener.api.alerts import AlertsAPI
+from courtlistener.api.docket_alerts import DocketAlertsAPI
+from courtlistener.exceptions import APIError, ValidationError
+
+BASE = "https://www.courtlistener.com/api/rest/v4/"
+
+
+class FakeServer:
+    """Mock client keeping alerts in memory."""
+
+    def __init__(self, endpoint, alerts):
+        self.endpoint = endpoint
+        self.alerts = {alert["id"]: dict(alert) for alert in alerts}
+        self.next_id = 1000
+        self.fail_on = set()
+        self.lock = threading.Lock()
+        self.client = Mock()
+        self.client.paginate.side_effect = self.paginate
+        self.client.post.side_effect = self.post
+        self.client._make_request.side_effect = self.request
+
+    def paginate(self, endpoint, params=None):
+        assert endpoint == self.endpoint
+        params = params or {}
+        return iter([dict(a) for a in self.alerts.values()
+                     if all(a.get(field) == value for field, value in params.items())])
+
+    def post(self, endpoint, data=None):
+        with self.lock:
+            key = data.get("name") or data.get("docket")
+            if key in self.fail_on:
+                raise APIError("Server error", status_code=500)
+            # Detail URLs only allow GET, PATCH, PUT and DELETE
+            assert endpoint == self.endpoint
+            self.next_id += 1
+            alert = dict(data, id=self.next_id)
+            self.alerts[alert["id"]] = alert
+            return alert
+
+    def request(self, method, endpoint, json_data=None):
+        alert_id = int(endpoint.rstrip("/").split("/")[-1])
+        with self.lock:
+            if method == "PATCH":
+                if self.alerts[alert_id].get("name") in self.fail_on:
+                    raise APIError("Server error", status_code=500)
+                self.alerts[alert_id].update(json_data)
+                return self.alerts[alert_id]
+            assert method == "DELETE"
+            del self.alerts[alert_id]
+
+
+class TestAlertsSync:
+    """Test cases for AlertsAPI.sync."""
+
+    def setup_method(self):
+        self.server = FakeServer("alerts/", [
+            {"id": 1, "name": "matter-1", "query": "q=foo", "rate": "dly", "alert_type": "search"},
+            {"id": 2, "name": "matter-2", "query": "q=bar", "rate": "dly", "alert_type": "search"},
+            {"id": 3, "name": "matter-2", "query": "q=bar", "rate": "dly", "alert_type": "search"},
+            {"id": 4, "name": "old", "query": "q=old", "rate": "wly", "alert_type": "search"},
+            {"id": 5, "name": "mine", "query": "q=x", "rate": "wly", "alert_type": "oa"},
+        ])
+        self.api = AlertsAPI(self.server.client)
+        self.desired = [
+            {"name": "matter-1", "query": "q=foo", "rate": "dly"},
+            {"name": "matter-2", "query": "q=bar", "rate": "wly"},
+            {"name": "matter-3", "query": "q=baz", "rate": "dly"},
+        ]
+
+    def test_sync_applies_diff(self):
+        result = self.api.sync(self.desired, alert_type="search")
+        assert result.ok
+        assert result.unchanged == 1
+        assert [a["name"] for a in result.created] == ["matter-3"]
+        assert [a["id"] for a in result.updated] == [2]
+        assert sorted(result.deleted) == [3, 4]
+        assert self.server.client.paginate.call_count == 1
+        self.server.client._make_request.assert_any_call("PATCH", "alerts/2/", json_data={"rate": "wly"})
+        assert self.server.alerts[2]["rate"] == "wly"
+        assert self.server.alerts[2]["rate"] == "wly"
+        assert 5 in self.server.alerts  # outside the filter: untouched
+
+        # Idempotent: a second run changes nothing
+        again = self.api.sync(self.desired, alert_type="search")
+        assert again.changes == 0 and again.unchanged == 3
+
+    def test_dry_run(self):
+        result = self.api.sync(self.desired, alert_type="search", dry_run=True)
+        assert (len(result.created), len(result.updated), sorted(result.deleted)) == (1, 1, [3, 4])
+        self.server.client.post.assert_not_called()
+        self.server.client._make_request.assert_not_called()
+
+    def test_keep_missing_and_custom_key(self):
+        result = self.api.sync(
+            [{"name": "renamed", "query": "q=old", "rate": "wly"}],
+            key="query", delete_missing=False, alert_type="search",
+        )
+        assert [a["id"] for a in result.updated] == [4]
+        assert result.deleted == [] and result.created == []
+
+    def test_partial_failure_is_resumable(self):
+        self.server.fail_on = {"matter-3"}
+        result = self.api.sync(self.desired, alert_type="search")
+        assert not result.ok
+        assert result.errors[0][:2] == ("create", "matter-3")
+        assert sorted(result.deleted) == [3, 4]
+        self.server.fail_on = set()
+        resumed = self.api.sync(self.desired, alert_type="search")
+        assert [a["name"] for a in resumed.created] == ["matter-3"]
+        assert resumed.changes == 1
+
+    def test_invalid_desired(self):
+        with pytest.raises(ValidationError):
+            self.api.sync([{"name": "a", "query": "q", "rate": "dly"}] * 2)
+        with pytest.raises(ValidationError):
+            self.api.sync([{"name": "a", "query": "q"}])
+
+
+class TestDocketAlertsSync:
+    """Test cases for DocketAlertsAPI.sync."""
+
+    def setup_method(self):
+        self.server = FakeServer("docket-alerts/", [
+            {"id": 1, "docket": f"{BASE}dockets/10/"},
+            {"id": 2, "docket": f"{BASE}dockets/11/"},
+            {"id": 3, "docket": f"{BASE}dockets/11/"},
+            {"id": 4, "docket": f"{BASE}dockets/12/"},
+        ])
+        self.api = DocketAlertsAPI(self.server.client)
+
+    def test_sync_applies_diff(self):
+        result = self.api.sync([10, f"{BASE}dockets/11/", 13, 13], webhook_url="https://example.com/hook")
+        assert result.ok
+        assert result.unchanged == 2
+        assert [a["docket"] for a in result.created] == [13]
+        assert result.created[0]["webhook_url"] == "https://example.com/hook"
+        assert sorted(result.deleted) == [3, 4]
+        assert self.api.sync([10, 11, 13]).changes == 0
+
+    def test_unsubscription_is_not_coverage(self):
+        self.server.alerts[5] = {"id": 5, "docket": f"{BASE}dockets/20/", "alert_type": 0}
+        self.server.alerts[6] = {"id": 6, "docket": f"{BASE}dockets/21/", "alert_type": 0}
+        assert self.api.sync([10, 11, 20], dry_run=True).updated == [20]
+        result = self.api.sync([10, 11, 20])
+        assert result.ok
+        assert result.unchanged == 2
+        assert result.created == []
+        assert [a["id"] for a in result.updated] == [5]
+        assert self.server.alerts[5]["alert_type"] == 1
+        assert sorted(result.deleted) == [3, 4]
+        assert 6 in self.server.alerts
+        assert self.api.sync([10, 11, 20]).changes == 0
+
+    def test_dry_run_and_keep_missing(self):
+        result = self.api.sync([11, 14], delete_missing=False, dry_run=True)
+        assert result.created == [14]
+        assert result.deleted == [3]
+        self.server.client.post.assert_not_called()
+
+    def test_invalid_docket(self):
+        with pytest.raises(ValidationError):
+            self.api.sync(["nope"])
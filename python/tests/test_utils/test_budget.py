@@ -0,0 +1,147 @@
+"""
+Tests for request budgets.
+"""
+
+import threading
+import pytest
+from unittest.mock import Mock, patch
+from courtlistener.client import CourtListenerClient
+from courtlistener.exceptions import BudgetExceededError, ValidationError
+from courtlistener.utils.budget import RequestBudget, BudgetRule
+
+
+class TestRequestBudget:
+    """Test cases for RequestBudget."""
+
+    def test_hard_cap(self):
+        budget = RequestBudget([BudgetRule(2, 60, name="job")])
+        budget.acquire("search/")
+        budget.acquire("opinions/")
+        assert budget.remaining() == {"job": 0}
+        with pytest.raises(BudgetExceededError) as exc_info:
+            budget.acquire("search/")
+        assert 0 < exc_info.value.retry_after <= 60
+        assert 0 < budget.reset_in("job") <= 60
+
+    def test_try_acquire_never_waits(self):
+        budget = RequestBudget([BudgetRule(1, 60, name="job")], block=True)
+        assert budget.try_acquire("search/")
+        assert not budget.try_acquire("search/")
+        assert budget.remaining() == {"job": 0}
+
+    def test_rolling_window(self):
+        budget = RequestBudget([BudgetRule(1, 10, name="job")])
+        with patch("courtlistener.utils.budget.time.time", return_value=1000.0):
+            budget.acquire("search/")
+        with patch("courtlistener.utils.budget.time.time", return_value=1005.0):
+            with pytest.raises(BudgetExceededError) as exc_info:
+                budget.acquire("search/")
+            assert exc_info.value.retry_after == pytest.approx(5.0)
+        with patch("courtlistener.utils.budget.time.time", return_value=1010.5):
+            budget.acquire("search/")
+            assert budget.remaining() == {"job": 0}
+
+    def test_endpoint_and_token_scoping(self):
+        budget = RequestBudget([
+            BudgetRule(1, 60, endpoint="search/", name="search"),
+            BudgetRule(1, 60, token="token-a", name="token-a"),
+            BudgetRule(10, 60, name="total"),
+        ])
+        budget.acquire("search/", "token-b")
+        with pytest.raises(BudgetExceededError):
+            budget.acquire("search/", "token-c")
+        budget.acquire("opinions/", "token-a")
+        with pytest.raises(BudgetExceededError):
+            budget.acquire("dockets/", "token-a")
+        budget.acquire("dockets/", "token-b")
+        assert budget.remaining(endpoint="dockets/") == {"token-a": 0, "total": 7}
+        assert budget.remaining(endpoint="search/", token="token-b") == {"search": 0, "total": 7}
+        usage = budget.usage()
+        assert sum(usage["dockets/"].values()) == 1
+        assert "token-b" not in str(usage)
+
+    def test_soft_cap_warns_once(self):
+        on_soft_limit = Mock()
+        budget = RequestBudget([BudgetRule(1, 60, hard=False, name="soft")], on_soft_limit=on_soft_limit)
+        for _ in range(3):
+            budget.acquire("search/")
+        on_soft_limit.assert_called_once()
+        assert on_soft_limit.call_args[0][1] == 2
+        assert budget.remaining() == {"soft": 0}
+
+    @patch("courtlistener.utils.budget.time.sleep")
+    def test_blocking(self, mock_sleep):
+        clock = [1000.0]
+        mock_sleep.side_effect = lambda seconds: clock.__setitem__(0, clock[0] + seconds)
+        budget = RequestBudget([BudgetRule(1, 30)], block=True)
+        with patch("courtlistener.utils.budget.time.time", side_effect=lambda: clock[0]):
+            budget.acquire("search/")
+            budget.acquire("search/")
+        mock_sleep.assert_called_once_with(30.0)
+
+        limited = RequestBudget([BudgetRule(1, 30)], block=True, max_wait=5)
+        limited.acquire("search/")
+        with pytest.raises(BudgetExceededError):
+            limited.acquire("search/")
+
+    def test_threads_never_overspend(self):
+        budget = RequestBudget([BudgetRule(50, 60)])
+        granted = []
+
+        def worker():
+            for _ in range(20):
+                try:
+                    budget.acquire("search/")
+                    granted.append(1)
+                except BudgetExceededError:
+                    pass
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert len(granted) == 50
+
+    def test_shared_sqlite_file(self, tmp_path):
+        path = str(tmp_path / "budget.db")
+        with RequestBudget([BudgetRule(3, 60, name="job")], path=path) as first:
+            with RequestBudget([BudgetRule(3, 60, name="job")], path=path) as second:
+                first.acquire("search/")
+                second.acquire("search/")
+                first.acquire("opinions/")
+                with pytest.raises(BudgetExceededError):
+                    second.acquire("search/")
+                assert second.remaining() == {"job": 0}
+                assert set(second.usage()) == {"search/", "opinions/"}
+
+    def test_validation(self):
+        with pytest.raises(ValidationError):
+            BudgetRule(0, 60)
+        with pytest.raises(ValidationError):
+            BudgetRule(1, 0)
+        with pytest.raises(ValidationError):
+            RequestBudget([])
+        with pytest.raises(ValidationError):
+            RequestBudget([BudgetRule(1, 60)]).reset_in("missing")
+
+
+class TestClientBudget:
+    """Budgets are enforced before requests are sent."""
+
+    def test_client_budget(self):
+        budget = RequestBudget([BudgetRule(1, 60, endpoint="search/")])
+        client = CourtListenerClient(api_token="test-token", budget=budget)
+        assert client.budget is budget
+        response = Mock(status_code=200)
+        response.json.return_value = {}
+        with patch.object(client.transport.session, "request", return_value=response) as request:
+            client.get("search/")
+            with pytest.raises(BudgetExceededError):
+                client.get("search/")
+            client.get("courts/")
+        assert request.call_count == 2
+        assert budget.remaining("search/", "test-token") == {"search/:1/60s": 0}
+
+        client.budget = None
+        assert client.transport.budget is None
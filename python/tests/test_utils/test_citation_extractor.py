@@ -0,0 +1,86 @@
+"""
+Tests for the local citation extractor.
+"""
+
+from courtlistener.utils.citation_extractor import (
+    CitationExtractor,
+    extract_citations,
+    normalize_citation,
+    _reporter_pattern,
+)
+
+
+class TestReporterPattern:
+    """Test cases for reporter pattern generation."""
+
+    def test_spacing_variants(self):
+        import re
+        pattern = re.compile(_reporter_pattern("F. Supp. 2d"))
+        assert pattern.fullmatch("F. Supp. 2d")
+        assert pattern.fullmatch("F.Supp.2d")
+        assert not pattern.fullmatch("F Supp 2d")
+
+
+class TestCitationExtractor:
+    """Test cases for CitationExtractor."""
+
+    def setup_method(self):
+        self.extractor = CitationExtractor()
+
+    def test_extract_with_offsets(self):
+        text = "See Obergefell v. Hodges, 576 U.S. 644, 651 (2015); 123 F.3d 456."
+        results = self.extractor.extract(text)
+        assert [r['normalized_citations'] for r in results] == [
+            ["576 U.S. 644"],
+            ["123 F.3d 456"],
+        ]
+        first = results[0]
+        assert text[first['start_index']:first['end_index']] == "576 U.S. 644, 651"
+        assert first['volume'] == 576
+        assert first['reporter'] == "U.S."
+        assert first['page'] == 644
+        assert first['pin_cite'] == 651
+        assert results[1]['pin_cite'] is None
+
+    def test_normalizes_spacing_and_variants(self):
+        results = self.extractor.extract("1 F.Supp.2d 2 and 3 Fed. Appx. 4 and 5 L.Ed. 6")
+        assert [r['normalized_citations'][0] for r in results] == [
+            "1 F. Supp. 2d 2",
+            "3 F. App'x 4",
+            "5 L. Ed. 6",
+        ]
+
+    def test_longest_reporter_wins(self):
+        results = self.extractor.extract("10 Cal. App. 4th 20")
+        assert results[0]['reporter'] == "Cal. App. 4th"
+
+    def test_no_false_positives(self):
+        assert self.extractor.extract("In 2020 there were 15 F. cases.") == []
+        assert self.extractor.extract("Version 1.576 U.S. 644x") == []
+        assert self.extractor.extract("") == []
+
+    def test_contains_citation(self):
+        assert self.extractor.contains_citation("cf. 410 U.S. 113")
+        assert not self.extractor.contains_citation("no citations here")
+        assert not self.extractor.contains_citation("")
+
+    def test_normalize(self):
+        assert self.extractor.normalize(" 410  U.S.  113 ") == "410 U.S. 113"
+        assert self.extractor.normalize("not a citation") is None
+        assert self.extractor.normalize("") is None
+
+    def test_custom_reporters(self):
+        extractor = CitationExtractor({"Foo Rptr.": ["FooR."]})
+        assert extractor.normalize("7 FooR. 8") == "7 Foo Rptr. 8"
+        assert extractor.normalize("7 U.S. 8") == "7 U.S. 8"
+
+
+class TestModuleFunctions:
+    """Test cases for the module-level helpers."""
+
+    def test_extract_citations(self):
+        results = extract_citations("Roe v. Wade, 410 U.S. 113 (1973)")
+        assert results[0]['citation'] == "410 U.S. 113"
+
+    def test_normalize_citation(self):
+        assert normalize_citation("123 F.Supp.2d 456") == "123 F. Supp. 2d 456"
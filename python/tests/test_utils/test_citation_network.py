@@ -0,0 +1,114 @@
+"""
+Tests for the citation network analytics module.
+"""
+
+import pytest
+from unittest.mock import Mock
+
+np = pytest.importorskip("numpy")
+
+from courtlistener.exceptions import ValidationError
+from courtlistener.models.opinion import Opinion
+from courtlistener.utils.citation_network import CitationNetwork, _opinion_id
+
+
+BASE = "https://www.courtlistener.com/api/rest/v4/opinions"
+
+
+class TestOpinionId:
+    """Test cases for opinion ID extraction."""
+
+    def test_int_and_string(self):
+        assert _opinion_id(5) == 5
+        assert _opinion_id("5") == 5
+
+    def test_url(self):
+        assert _opinion_id(f"{BASE}/123/") == 123
+
+    def test_dict_and_invalid(self):
+        assert _opinion_id({"id": 7}) == 7
+        assert _opinion_id("not-a-url") is None
+        assert _opinion_id(None) is None
+
+
+class TestCitationNetwork:
+    """Test cases for CitationNetwork."""
+
+    def setup_method(self):
+        # 1 -> 2, 1 -> 3, 4 -> 2, 4 -> 3, 5 -> 2, 3 -> 2
+        self.network = CitationNetwork.from_edges(
+            [(1, 2), (1, 3), (4, 2), (4, 3), (5, 2), (3, 2), (1, 2)]
+        )
+
+    def test_counts_deduplicate_edges(self):
+        assert self.network.num_nodes == 5
+        assert self.network.num_edges == 6
+        assert repr(self.network) == "CitationNetwork(nodes=5, edges=6)"
+
+    def test_degrees(self):
+        degrees = self.network.to_dict(self.network.in_degree())
+        assert degrees == {1: 0, 2: 4, 3: 2, 4: 0, 5: 0}
+        out = self.network.to_dict(self.network.out_degree())
+        assert out == {1: 2, 2: 0, 3: 1, 4: 2, 5: 1}
+
+    def test_pagerank(self):
+        scores = self.network.pagerank()
+        assert scores.sum() == pytest.approx(1.0)
+        top = self.network.top(scores, 2)
+        assert [opinion_id for opinion_id, _ in top] == [2, 3]
+
+    def test_pagerank_invalid_damping(self):
+        with pytest.raises(ValidationError):
+            self.network.pagerank(damping=1.5)
+
+    def test_co_citation(self):
+        # 2 and 3 are cited together by opinions 1 and 4
+        assert self.network.co_citation(3) == [(2, 2)]
+        assert self.network.co_citation(2, top_n=1) == [(3, 2)]
+
+    def test_bibliographic_coupling(self):
+        # 1 and 4 both cite 2 and 3; 5 and 3 share only 2 with 1
+        result = self.network.bibliographic_coupling(1)
+        assert result[0] == (4, 2)
+        assert sorted(result[1:]) == [(3, 1), (5, 1)]
+
+    def test_unknown_opinion(self):
+        with pytest.raises(ValidationError):
+            self.network.co_citation(999)
+
+    def test_empty_network(self):
+        network = CitationNetwork([], [])
+        assert network.num_nodes == 0
+        assert len(network.pagerank()) == 0
+        assert network.top(network.in_degree()) == []
+
+    def test_length_mismatch(self):
+        with pytest.raises(ValidationError):
+            CitationNetwork([1, 2], [3])
+
+    def test_from_opinions_cited(self):
+        records = [
+            {"citing_opinion": f"{BASE}/10/", "cited_opinion": f"{BASE}/20/"},
+            {"citing_opinion": f"{BASE}/11/", "cited_opinion": f"{BASE}/20/"},
+            {"citing_opinion": None, "cited_opinion": f"{BASE}/20/"},
+        ]
+        network = CitationNetwork.from_opinions_cited(records)
+        assert network.num_edges == 2
+        assert network.to_dict(network.in_degree())[20] == 2
+
+    def test_from_opinions(self):
+        opinions = [
+            Opinion({"id": 1, "opinions_cited": [f"{BASE}/2/", f"{BASE}/3/"]}),
+            {"id": 2, "opinions_cited": [f"{BASE}/3/"]},
+        ]
+        network = CitationNetwork.from_opinions(opinions)
+        assert network.num_edges == 3
+
+    def test_from_api(self):
+        client = Mock()
+        client.paginate.return_value = iter([{"citing_opinion": 1, "cited_opinion": 2}])
+        network = CitationNetwork.from_api(client, citing_opinion__in="1")
+        client.paginate.assert_called_once_with(
+            "opinions-cited/", params={"citing_opinion__in": "1"}
+        )
+        assert network.num_edges == 1
@@ -0,0 +1,130 @@
+"""
+Tests for the preloaded court catalog.
+"""
+
+import json
+import os
+import time
+import pytest
+from unittest.mock import Mock, patch
+from courtlistener.client import CourtListenerClient
+from courtlistener.exceptions import NotFoundError
+from courtlistener.models.court import Court
+from courtlistener.utils.court_catalog import CourtCatalog
+
+BASE = "https://www.courtlistener.com/api/rest/v4/courts/"
+
+COURTS = [
+    {"id": "scotus", "jurisdiction": "F", "in_use": True, "appeals_to": []},
+    {"id": "ca2", "jurisdiction": "F", "in_use": True, "appeals_to": [f"{BASE}scotus/"], "fjc_court_id": "02"},
+    {
+        "id": "nysd",
+        "jurisdiction": "FD",
+        "in_use": True,
+        "pacer_court_id": "NYSD",
+        "fjc_court_id": "28",
+        "appeals_to": [f"{BASE}ca2/"],
+    },
+    {"id": "nysb", "jurisdiction": "FB", "in_use": True, "parent_court": f"{BASE}nysd/", "appeals_to": [f"{BASE}nysd/"]},
+    {"id": "cal", "jurisdiction": "S", "in_use": True},
+    {"id": "calctapp", "jurisdiction": "SA", "in_use": True, "appeals_to": [f"{BASE}cal/"]},
+    {"id": "ccpa", "jurisdiction": "F", "in_use": False, "end_date": "1982-10-01"},
+]
+
+
+class TestCourtCatalog:
+    """Test cases for CourtCatalog."""
+
+    def setup_method(self):
+        self.catalog = CourtCatalog(COURTS)
+
+    def test_lookup(self):
+        assert len(self.catalog) == 7
+        assert isinstance(self.catalog.get("ca2"), Court)
+        assert self.catalog.get_court_by_url(f"{BASE}nysd/").id == "nysd"
+        assert self.catalog.get_court_by_url({"id": "cal"}).id == "cal"
+        assert f"{BASE}scotus/" in self.catalog
+        with pytest.raises(NotFoundError):
+            self.catalog.get_court_by_url(f"{BASE}nowhere/")
+
+    def test_code_indexes(self):
+        assert self.catalog.get_by_pacer_id("nysd").id == "nysd"
+        assert self.catalog.get_by_fjc_id(2) is None
+        assert self.catalog.get_by_fjc_id("02").id == "ca2"
+
+    def test_jurisdiction_and_status(self):
+        assert {c.id for c in self.catalog.get_federal_courts()} == {"scotus", "ca2", "ccpa"}
+        assert [c.id for c in self.catalog.get_state_courts()] == ["cal"]
+        assert {c.id for c in self.catalog.by_jurisdiction("FD", "FB")} == {"nysd", "nysb"}
+        assert [c.id for c in self.catalog.get_defunct_courts()] == ["ccpa"]
+        assert "ccpa" not in {c.id for c in self.catalog.get_active_courts()}
+
+    def test_hierarchy(self):
+        assert self.catalog.parent("nysb").id == "nysd"
+        assert [c.id for c in self.catalog.children("nysd")] == ["nysb"]
+        assert [c.id for c in self.catalog.ancestors("nysb")] == ["nysd"]
+        assert [c.id for c in self.catalog.appeals_to("nysd")] == ["ca2"]
+        assert [c.id for c in self.catalog.appeals_from("scotus")] == ["ca2"]
+        assert [c.id for c in self.catalog.appellate_chain("nysb")] == ["nysd", "ca2", "scotus"]
+
+    def test_save_and_read(self, tmp_path):
+        path = str(tmp_path / "courts.json")
+        self.catalog.save(path)
+        loaded = CourtCatalog.read(path)
+        assert len(loaded) == 7
+        assert loaded.fetched_at == self.catalog.fetched_at
+        assert loaded.get("nysb").parent_court == f"{BASE}nysd/"
+        assert CourtCatalog.read(str(tmp_path / "missing.json")) is None
+
+
+class TestCourtCatalogLoading:
+    """Loading the catalog through the client."""
+
+    def test_load_uses_fresh_file(self, tmp_path):
+        path = str(tmp_path / "courts.json")
+        client = Mock()
+        client.paginate.return_value = iter(COURTS)
+        CourtCatalog.load(client, path=path)
+        client.paginate.assert_called_once_with("courts/", params=None)
+
+        catalog = CourtCatalog.load(client, path=path)
+        assert len(catalog) == 7
+        assert client.paginate.call_count == 1
+
+    def test_load_refreshes_stale_file(self, tmp_path):
+        path = str(tmp_path / "courts.json")
+        with open(path, "w") as f:
+            json.dump({"fetched_at": time.time() - 100, "courts": COURTS[:1]}, f)
+        client = Mock()
+        client.paginate.return_value = iter(COURTS)
+        assert len(CourtCatalog.load(client, path=path, ttl=50)) == 7
+        assert len(CourtCatalog.read(path)) == 7
+        assert os.listdir(tmp_path) == ["courts.json"]
+
+    def test_courts_api_catalog_is_cached(self):
+        client = CourtListenerClient(api_token="test-token")
+        with patch.object(client, "paginate", return_value=iter(COURTS)) as paginate:
+            first = client.courts.catalog()
+            assert client.courts.catalog() is first
+            assert paginate.call_count == 1
+            paginate.return_value = iter(COURTS[:2])
+            assert len(client.courts.catalog(refresh=True)) == 2
+
+    def test_courts_api_uses_loaded_catalog(self):
+        client = CourtListenerClient(api_token="test-token")
+        with patch.object(client, "get", return_value={"id": "newct", "results": []}) as get:
+            client.courts.get_federal_courts()
+            assert get.call_count == 1
+            with patch.object(client, "paginate", return_value=iter(COURTS)):
+                client.courts.catalog()
+            get.reset_mock()
+            assert [court.id for court in client.courts.get_federal_courts()] == ["scotus", "ca2", "ccpa"]
+            assert client.courts.get_federal_courts(page=2) == []
+            assert [court.id for court in client.courts.get_state_courts()] == ["cal"]
+            assert "ccpa" in [court.id for court in client.courts.get_defunct_courts()]
+            assert len(client.courts.get_active_courts()) == 6
+            assert client.courts.get_court_by_url(f"{BASE}ca2/").id == "ca2"
+            get.assert_not_called()
+            # Courts added after the catalog was fetched still resolve
+            assert client.courts.get_court_by_url(f"{BASE}newct/").id == "newct"
+            get.assert_called_once_with("courts/newct/")
@@ -0,0 +1,263 @@
+"""
+Tests for the financial disclosure history tables.
+"""
+
+import threading
+import numpy as np
+import pytest
+from unittest.mock import Mock
+from courtlistener.exceptions import APIError, ValidationError
+from courtlistener.models.investment import Investment
+from courtlistener.utils.disclosures import (
+    MISSING_INT,
+    SUB_RESOURCES,
+    ColumnTable,
+    DisclosureHistory,
+    parse_value_codes,
+)
+
+BASE = "https://www.courtlistener.com/api/rest/v4/"
+
+DISCLOSURES = [
+    {"id": 1, "judge": f"{BASE}people/7/", "year": 2019},
+    {"id": 2, "judge": f"{BASE}people/7/", "year": 2020},
+    {"id": 3, "judge": f"{BASE}people/8/", "year": 2020},
+]
+
+RECORDS = {
+    "investments/": [
+        {"id": 10, "financial_disclosure": f"{BASE}financial-disclosures/1/", "description": "Fund A",
+         "value_min": 1001, "value_max": 15000},
+        {"id": 11, "financial_disclosure": f"{BASE}financial-disclosures/2/", "description": "Fund A",
+         "value_min": "15,001", "value_max": "50,000"},
+        {"id": 12, "financial_disclosure": f"{BASE}financial-disclosures/2/", "description": "Fund B",
+         "value_min": None, "value_max": 1000},
+        {"id": 13, "financial_disclosure": f"{BASE}financial-disclosures/3/", "description": "Bond",
+         "value_min": 50001, "value_max": 100000},
+    ],
+    "gifts/": [
+        {"id": 20, "financial_disclosure": f"{BASE}financial-disclosures/2/", "description": "Books", "value": 400},
+    ],
+    "debts/": [
+        {"id": 30, "financial_disclosure": f"{BASE}financial-disclosures/1/", "creditor": "Bank", "amount": 250000},
+    ],
+}
+
+
+def fake_client():
+    """Mock client whose paginate filters the fixtures by judge or disclosure."""
+    client = Mock()
+    calls = []
+    lock = threading.Lock()
+
+    def paginate(endpoint, params=None):
+        with lock:
+            calls.append((endpoint, dict(params)))
+        if endpoint == "financial-disclosures/":
+            return iter([d for d in DISCLOSURES if d["judge"].endswith(f"/{params['judge']}/")
+                         and params.get("year", d["year"]) == d["year"]])
+        wanted = {f"/{disclosure_id}/" for disclosure_id in params["financial_disclosure__in"].split(",")}
+        return iter([r for r in RECORDS.get(endpoint, [])
+                     if any(r["financial_disclosure"].endswith(suffix) for suffix in wanted)])
+
+    client.paginate.side_effect = paginate
+    client.calls = calls
+    return client
+
+
+class TestParseValueCodes:
+    """Test cases for parse_value_codes."""
+
+    def test_codes(self):
+        low, high = parse_value_codes(["J", " k ", "p4", "H1", None, "", "-1", "Q"])
+        assert low[:4].tolist() == [1.0, 15001.0, 50000001.0, 1000001.0]
+        assert high[:2].tolist() == [15000.0, 50000.0]
+        assert np.isinf(high[2])
+        assert np.isnan(low[4:]).all() and np.isnan(high[4:]).all()
+
+    def test_arrays(self):
+        codes = np.array(["M", "N", "M"])
+        low, high = parse_value_codes(codes)
+        assert low.dtype == np.float64
+        assert high.tolist() == [250000.0, 500000.0, 250000.0]
+        assert parse_value_codes([])[0].shape == (0,)
+
+
+class TestColumnTable:
+    """Test cases for ColumnTable."""
+
+    def test_typed_columns(self):
+        table = ColumnTable.from_records(
+            [{"id": 1, "value": "1,000"}, {"id": f"{BASE}gifts/2/", "value": None}, Investment({"id": None})],
+            [("id", "int64"), ("value", "float64"), ("description", "object")],
+        )
+        assert table["id"].dtype == np.int64
+        assert table["id"].tolist() == [1, 2, MISSING_INT]
+        assert table["value"][0] == 1000.0
+        assert np.isnan(table["value"][1])
+        assert table["description"].dtype == object
+        assert len(table.where(table["id"] > 0)) == 2
+
+    def test_group_sum(self):
+        table = ColumnTable({
+            "year": np.array([2020, 2019, 2020]),
+            "value": np.array([1.0, 2.0, np.nan]),
+        })
+        grouped = table.group_sum(["year"], ["value"])
+        assert grouped.to_records() == [
+            {"year": 2019, "value": 2.0, "count": 1},
+            {"year": 2020, "value": 1.0, "count": 2},
+        ]
+        assert len(table.where(np.zeros(3, dtype=bool)).group_sum(["year"], ["value"])) == 0
+
+    def test_group_by_string_column(self):
+        table = ColumnTable.from_records(
+            [{"judge": 1, "kind": "Dividend", "v": 1}, {"judge": 1, "kind": None, "v": 2},
+             {"judge": 1, "kind": "Dividend", "v": 3}, {"judge": 2, "kind": "Rent", "v": 4}],
+            [("judge", "int64"), ("kind", "str"), ("v", "float64")],
+        )
+        grouped = table.group_sum(["judge", "kind"], ["v"])
+        assert grouped.to_records() == [
+            {"judge": 1, "kind": "", "v": 2.0, "count": 1},
+            {"judge": 1, "kind": "Dividend", "v": 4.0, "count": 2},
+            {"judge": 2, "kind": "Rent", "v": 4.0, "count": 1},
+        ]
+
+    def test_mismatched_lengths(self):
+        with pytest.raises(ValidationError):
+            ColumnTable({"a": np.zeros(2), "b": np.zeros(3)})
+
+
+class TestDisclosureHistory:
+    """Test cases for DisclosureHistory."""
+
+    def setup_method(self):
+        self.history = DisclosureHistory(
+            DISCLOSURES,
+            {"investments": RECORDS["investments/"], "gifts": RECORDS["gifts/"], "debts": RECORDS["debts/"]},
+        )
+
+    def test_join_judge_and_year(self):
+        investments = self.history["investments"]
+        assert investments["disclosure"].tolist() == [1, 2, 2, 3]
+        assert investments["judge"].tolist() == [7, 7, 7, 8]
+        assert investments["year"].tolist() == [2019, 2020, 2020, 2020]
+        assert len(self.history["agreements"]) == 0
+
+    def test_unmatched_records_keep_own_judge(self):
+        history = DisclosureHistory([], {"gifts": [{"id": 1, "financial_disclosure": 99, "judge": 5, "value": 1}]})
+        assert history["gifts"]["judge"].tolist() == [5]
+        assert history["gifts"]["year"].tolist() == [MISSING_INT]
+
+    def test_rollup(self):
+        rollup = self.history.rollup("investments")
+        assert rollup.to_records() == [
+            {"judge": 7, "year": 2019, "low": 1001.0, "high": 15000.0, "count": 1},
+            {"judge": 7, "year": 2020, "low": 15001.0, "high": 51000.0, "count": 2},
+            {"judge": 8, "year": 2020, "low": 50001.0, "high": 100000.0, "count": 1},
+        ]
+        with pytest.raises(ValidationError):
+            self.history.rollup("agreements")
+
+    def test_value_ranges_by_year(self):
+        ranges = self.history.value_ranges_by_year(judge=f"{BASE}people/7/")
+        assert ranges["year"].tolist() == [2019, 2020]
+        assert ranges["low"].tolist() == [251001.0, 15401.0]
+        assert ranges["high"].tolist() == [265000.0, 51400.0]
+
+    def test_value_codes_fill_bounds(self):
+        history = DisclosureHistory(DISCLOSURES, {
+            "investments": [
+                {"id": 1, "financial_disclosure": 1, "gross_value_code": "K",
+                 "income_during_reporting_period_code": "A", "income_during_reporting_period_type": "Dividend"},
+                {"id": 2, "financial_disclosure": 1, "gross_value_code": "L", "value_min": 60000, "value_max": 60000,
+                 "income_during_reporting_period_code": "B", "income_during_reporting_period_type": "Dividend"},
+                {"id": 3, "financial_disclosure": 2, "gross_value_code": "P4",
+                 "income_during_reporting_period_code": "C", "income_during_reporting_period_type": "Rent"},
+            ],
+            "debts": [{"id": 4, "financial_disclosure": 3, "value_code": "M"}],
+        })
+        investments = history["investments"]
+        assert investments["gross_value_code"].dtype.kind == "U"
+        assert investments["value_min"].tolist() == [15001.0, 60000.0, 50000001.0]
+        assert investments["income_max"].tolist() == [1000.0, 2500.0, 5000.0]
+        assert np.isnan(investments["transaction_min"]).all()
+        assert history["debts"]["value_max"].tolist() == [250000.0]
+
+        income = history.rollup("investments", by=("judge", "income_during_reporting_period_type"),
+                                bounds=("income_min", "income_max"))
+        assert income.to_records() == [
+            {"judge": 7, "income_during_reporting_period_type": "Dividend", "low": 1002.0, "high": 3500.0, "count": 2},
+            {"judge": 7, "income_during_reporting_period_type": "Rent", "low": 2501.0, "high": 5000.0, "count": 1},
+        ]
+        ranges = history.value_ranges_by_year(tables=["investments"])
+        assert ranges["low"].tolist() == [75001.0, 50000001.0]
+        assert np.isinf(ranges["high"][1])
+
+    def test_unknown_table(self):
+        with pytest.raises(ValidationError):
+            DisclosureHistory(DISCLOSURES, {"stocks": []})
+        with pytest.raises(ValidationError):
+            DisclosureHistory(DISCLOSURES).value_ranges_by_year(tables=[])
+
+
+class TestDisclosureHistoryLoading:
+    """Fetching histories through the client."""
+
+    def test_fans_out_to_every_sub_resource(self):
+        client = fake_client()
+        history = DisclosureHistory.from_api(client, [7, f"{BASE}people/8/"], max_workers=4)
+        listed = [call for call in client.calls if call[0] == "financial-disclosures/"]
+        assert sorted(params["judge"] for _, params in listed) == [7, 8]
+        # One request per table for each judge's batch of reports
+        assert len(client.calls) == 2 + 2 * len(SUB_RESOURCES)
+        assert len(history["disclosures"]) == 3
+        assert sorted(history["investments"]["id"].tolist()) == [10, 11, 12, 13]
+
+    def test_batch_size(self):
+        client = fake_client()
+        history = DisclosureHistory.from_api(client, 7, tables=["investments"], batch_size=1)
+        batches = [params["financial_disclosure__in"] for endpoint, params in client.calls if endpoint == "investments/"]
+        assert sorted(batches) == ["1", "2"]
+        assert sorted(history["investments"]["id"].tolist()) == [10, 11, 12]
+        with pytest.raises(ValidationError):
+            DisclosureHistory.from_api(client, 7, batch_size=0)
+
+    def test_year_and_tables(self):
+        client = fake_client()
+        history = DisclosureHistory.from_api(client, 7, year=2020, tables=["gifts"])
+        assert history["disclosures"]["id"].tolist() == [2]
+        assert history["gifts"]["value"].tolist() == [400.0]
+        assert {endpoint for endpoint, _ in client.calls} == {"financial-disclosures/", "gifts/"}
+
+    def test_failed_listing_is_recorded(self):
+        client = fake_client()
+        paginate = client.paginate.side_effect
+
+        def flaky(endpoint, params=None):
+            if endpoint == "gifts/" or params.get("judge") == 8:
+                raise APIError("Server error", status_code=500)
+            return paginate(endpoint, params)
+
+        client.paginate.side_effect = flaky
+        history = DisclosureHistory.from_api(client, [7, 8], tables=["gifts", "investments"])
+        assert history["disclosures"]["id"].tolist() == [1, 2]
+        assert len(history["investments"]) == 3 and len(history["gifts"]) == 0
+        assert len(history.errors["gifts"]) == 1 and len(history.errors["disclosures"]) == 1
+        assert DisclosureHistory(DISCLOSURES).errors == {}
+
+        client.paginate.side_effect = KeyError("bug")
+        with pytest.raises(KeyError):
+            DisclosureHistory.from_api(client, 7)
+
+    def test_invalid_input(self):
+        with pytest.raises(ValidationError):
+            DisclosureHistory.from_api(fake_client(), "not-a-judge")
+        with pytest.raises(ValidationError):
+            DisclosureHistory.from_api(fake_client(), 7, tables=["stocks"])
+
+    def test_api_history(self):
+        from courtlistener.api.financial_disclosures import FinancialDisclosuresAPI
+        client = fake_client()
+        history = FinancialDisclosuresAPI(client).history(8, tables=["investments"])
+        assert history["investments"]["id"].tolist() == [13]
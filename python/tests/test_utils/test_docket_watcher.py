@@ -0,0 +1,154 @@
+"""
+Tests for the incremental docket watcher.
+"""
+
+import queue
+import threading
+from datetime import datetime, timezone
+import pytest
+from unittest.mock import Mock
+from courtlistener.exceptions import APIError, ValidationError
+from courtlistener.models.docket_entry import DocketEntry
+from courtlistener.utils.docket_watcher import DocketWatcher
+
+BASE = "https://www.courtlistener.com/api/rest/v4/"
+SINCE = "2024-01-01T00:00:00+00:00"
+
+
+def entry(entry_id, docket_id, modified):
+    return {"id": entry_id, "docket": f"{BASE}dockets/{docket_id}/", "date_modified": modified}
+
+
+class FakeFeed:
+    """Serves docket-entries/ honouring docket__in and date_modified__gt."""
+
+    def __init__(self, entries):
+        self.entries = list(entries)
+        self.calls = []
+        self.fail_for = set()
+        self.lock = threading.Lock()
+
+    def paginate(self, endpoint, params=None):
+        with self.lock:
+            self.calls.append((endpoint, dict(params or {})))
+        if endpoint == "docket-alerts/":
+            return iter(self.alerts)
+        wanted = None
+        if "docket__in" in params:
+            wanted = {int(x) for x in params["docket__in"].split(",")}
+            if wanted & self.fail_for:
+                raise APIError("Server error", status_code=500)
+        after = datetime.fromisoformat(params["date_modified__gt"])
+        return iter([
+            e for e in self.entries
+            if (wanted is None or int(e["docket"].rstrip("/").split("/")[-1]) in wanted)
+            and datetime.fromisoformat(e["date_modified"]) > after
+        ])
+
+
+def make_client(feed):
+    client = Mock()
+    client.paginate.side_effect = feed.paginate
+    return client
+
+
+class TestDocketWatcher:
+    """Test cases for DocketWatcher."""
+
+    def test_batched_queries_and_marks(self):
+        feed = FakeFeed([
+            entry(1, 10, "2024-02-01T00:00:00+00:00"),
+            entry(2, 10, "2024-01-15T00:00:00Z"),
+            entry(3, 11, "2024-03-01T00:00:00+00:00"),
+            entry(4, 99, "2024-03-01T00:00:00+00:00"),
+        ])
+        watcher = DocketWatcher(make_client(feed), [10, 11, f"{BASE}dockets/12/"], since=SINCE, batch_size=2)
+        changes = watcher.poll()
+        assert len(feed.calls) == 2
+        assert all(params["date_modified__gt"] == SINCE for _, params in feed.calls)
+        by_docket = {change.docket_id: change for change in changes}
+        assert set(by_docket) == {10, 11}
+        assert [e.id for e in by_docket[10].entries] == [2, 1]
+        assert isinstance(by_docket[10].entries[0], DocketEntry)
+        assert watcher.high_water_mark(10) == datetime(2024, 2, 1, tzinfo=timezone.utc)
+
+        # Nothing new: second poll reports no changes
+        assert watcher.poll() == []
+        feed.entries.append(entry(5, 10, "2024-04-01T00:00:00+00:00"))
+        changes = watcher.poll()
+        assert [(c.docket_id, [e.id for e in c.entries]) for c in changes] == [(10, [5])]
+
+    def test_per_docket_marks_filter_batch(self):
+        feed = FakeFeed([entry(1, 10, "2024-02-01T00:00:00+00:00"), entry(2, 11, "2024-02-01T00:00:00+00:00")])
+        watcher = DocketWatcher(make_client(feed), [10], since=SINCE)
+        watcher.add([11], since="2024-06-01")
+        watcher.add([10], since="2030-01-01")  # already watched: mark kept
+        changes = watcher.poll()
+        assert [c.docket_id for c in changes] == [10]
+        assert feed.calls[0][1]["docket__in"] == "10,11"
+
+    def test_unbatched_mode(self):
+        feed = FakeFeed([entry(1, 10, "2024-02-01T00:00:00+00:00"), entry(2, 99, "2024-02-01T00:00:00+00:00")])
+        watcher = DocketWatcher(make_client(feed), [10, 11], since=SINCE, batch_size=None)
+        changes = watcher.poll()
+        assert "docket__in" not in feed.calls[0][1]
+        assert [c.docket_id for c in changes] == [10]
+
+    def test_failed_batch_is_retried(self):
+        feed = FakeFeed([entry(1, 10, "2024-02-01T00:00:00+00:00"), entry(2, 11, "2024-02-01T00:00:00+00:00")])
+        feed.fail_for = {11}
+        watcher = DocketWatcher(make_client(feed), [10, 11], since=SINCE, batch_size=1)
+        assert [c.docket_id for c in watcher.poll()] == [10]
+        assert watcher.high_water_mark(11) == datetime(2024, 1, 1, tzinfo=timezone.utc)
+        feed.fail_for = set()
+        assert [c.docket_id for c in watcher.poll()] == [11]
+
+    def test_callback_and_queue(self):
+        feed = FakeFeed([entry(1, 10, "2024-02-01T00:00:00+00:00")])
+        events = queue.Queue()
+        callback = Mock(side_effect=RuntimeError("boom"))
+        watcher = DocketWatcher(make_client(feed), [10], since=SINCE, callback=callback, queue=events)
+        watcher.poll()
+        callback.assert_called_once()
+        assert events.get_nowait().docket_id == 10
+
+    def test_state_is_persisted(self, tmp_path):
+        path = str(tmp_path / "marks.json")
+        feed = FakeFeed([entry(1, 10, "2024-02-01T00:00:00+00:00")])
+        watcher = DocketWatcher(make_client(feed), [10], since=SINCE, state_path=path)
+        watcher.poll()
+        restored = DocketWatcher(make_client(feed), [10], state_path=path)
+        assert restored.high_water_mark(10) == datetime(2024, 2, 1, tzinfo=timezone.utc)
+        assert restored.poll() == []
+
+    def test_sync_alerts(self):
+        feed = FakeFeed([entry(1, 10, "2024-02-01T00:00:00+00:00")])
+        feed.alerts = [{"id": 1, "docket": 10}, {"id": 2, "docket": f"{BASE}dockets/11/"}]
+        watcher = DocketWatcher.from_alerts(make_client(feed), since=SINCE)
+        assert sorted(watcher.dockets) == [10, 11]
+        feed.alerts = feed.alerts[1:]
+        assert watcher.sync_alerts() == 1
+        assert 10 not in watcher and f"{BASE}dockets/11/" in watcher
+
+    def test_background_thread(self):
+        feed = FakeFeed([entry(1, 10, "2024-02-01T00:00:00+00:00")])
+        events = queue.Queue()
+        with DocketWatcher(make_client(feed), [10], since=SINCE, interval=0.01, queue=events):
+            assert events.get(timeout=2).docket_id == 10
+
+    def test_invalid_input(self):
+        with pytest.raises(ValidationError):
+            DocketWatcher(Mock(), ["not-a-docket"])
+        with pytest.raises(ValidationError):
+            DocketWatcher(Mock(), [1], since="whenever")
+        with pytest.raises(ValidationError):
+            DocketWatcher(Mock(), batch_size=0)
+
+    def test_api_entry_points(self):
+        from courtlistener.api.docket_alerts import DocketAlertsAPI
+        from courtlistener.api.docket_entries import DocketEntriesAPI
+        feed = FakeFeed([])
+        feed.alerts = [{"id": 1, "docket": 5}]
+        client = make_client(feed)
+        assert DocketEntriesAPI(client).watch([1, 2]).dockets == [1, 2]
+        assert DocketAlertsAPI(client).watch().dockets == [5]
@@ -0,0 +1,250 @@
+"""
+Tests for the streaming download manager.
+"""
+
+import hashlib
+import os
+import pytest
+import requests
+from unittest.mock import Mock
+from courtlistener.exceptions import CourtListenerError, ValidationError
+from courtlistener.models.opinion import Opinion
+from courtlistener.utils.downloads import (
+    DownloadManager,
+    resolve_download_url,
+    _BandwidthLimiter,
+    _expected_sha1,
+)
+
+
+CONTENT = b"0123456789" * 100
+
+
+class FakeResponse:
+    """Minimal streaming response honouring Range headers."""
+
+    def __init__(self, content, status_code=200, headers=None, honour_range=True):
+        self.status_code = status_code
+        self._content = content
+        self.headers = {}
+        range_header = (headers or {}).get('Range')
+        if range_header and honour_range and status_code == 200:
+            start = int(range_header.split('=')[1].rstrip('-'))
+            if start >= len(content):
+                self.status_code = 416
+                self._content = b''
+            else:
+                self.status_code = 206
+                self._content = content[start:]
+                self.headers['Content-Range'] = f"bytes {start}-{len(content) - 1}/{len(content)}"
+
+    def iter_content(self, chunk_size):
+        for i in range(0, len(self._content), chunk_size):
+            yield self._content[i:i + chunk_size]
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        return False
+
+
+def make_manager(**kwargs):
+    manager = DownloadManager(chunk_size=64, retry_delay=0, **kwargs)
+    manager.session = Mock()
+    return manager
+
+
+class TestResolveDownloadUrl:
+    """Test cases for resolve_download_url."""
+
+    def test_storage_path(self):
+        opinion = Opinion({'local_path': 'pdf/2020/01/01/case.pdf'})
+        assert resolve_download_url(opinion) == "https://storage.courtlistener.com/pdf/2020/01/01/case.pdf"
+
+    def test_absolute_urls_and_preference(self):
+        assert resolve_download_url({'filepath_ia': 'https://archive.org/x.pdf'}) == 'https://archive.org/x.pdf'
+        data = {'download_url': 'https://court.gov/a.pdf', 'local_path': 'pdf/a.pdf'}
+        assert resolve_download_url(data).startswith("https://storage.courtlistener.com/")
+        assert resolve_download_url('https://example.com/f.mp3') == 'https://example.com/f.mp3'
+        assert resolve_download_url({'id': 1}) is None
+
+    def test_expected_sha1(self):
+        assert _expected_sha1({'sha1': 'abc'}) == 'abc'
+        assert _expected_sha1({'sha1': 'abc', 'duration': 60}) is None
+        assert _expected_sha1('https://example.com') is None
+
+
+class TestDownloadManager:
+    """Test cases for DownloadManager."""
+
+    def test_download_streams_to_file(self, tmp_path):
+        manager = make_manager()
+        manager.session.get.side_effect = lambda url, headers, stream, timeout: FakeResponse(CONTENT, headers=headers)
+        dest = str(tmp_path / "file.pdf")
+
+        path = manager.download('https://example.com/file.pdf', dest, sha1=hashlib.sha1(CONTENT).hexdigest())
+
+        assert path == dest
+        assert open(dest, 'rb').read() == CONTENT
+        assert not os.path.exists(dest + '.part')
+        assert manager.session.get.call_args.kwargs['stream'] is True
+
+    def test_download_into_directory(self, tmp_path):
+        manager = make_manager()
+        manager.session.get.return_value = FakeResponse(CONTENT)
+        path = manager.download({'local_path': 'mp3/2020/arg.mp3'}, str(tmp_path))
+        assert path == str(tmp_path / "arg.mp3")
+
+    def test_resume_with_range(self, tmp_path):
+        dest = str(tmp_path / "file.pdf")
+        with open(dest + '.part', 'wb') as f:
+            f.write(CONTENT[:300])
+        manager = make_manager()
+        manager.session.get.side_effect = lambda url, headers, stream, timeout: FakeResponse(CONTENT, headers=headers)
+
+        manager.download('https://example.com/file.pdf', dest)
+
+        assert manager.session.get.call_args.kwargs['headers'] == {'Range': 'bytes=300-'}
+        assert open(dest, 'rb').read() == CONTENT
+
+    def test_resume_when_range_ignored(self, tmp_path):
+        dest = str(tmp_path / "file.pdf")
+        with open(dest + '.part', 'wb') as f:
+            f.write(b"garbage")
+        manager = make_manager()
+        manager.session.get.return_value = FakeResponse(CONTENT, honour_range=False)
+        manager.download('https://example.com/file.pdf', dest)
+        assert open(dest, 'rb').read() == CONTENT
+
+    def test_resume_with_wrong_content_range_restarts(self, tmp_path):
+        dest = str(tmp_path / "file.pdf")
+        with open(dest + '.part', 'wb') as f:
+            f.write(CONTENT[:300])
+        manager = make_manager(max_retries=1)
+        wrong = FakeResponse(CONTENT, headers={'Range': 'bytes=200-'})
+        responses = iter([wrong])
+        manager.session.get.side_effect = lambda url, headers, stream, timeout: next(
+            responses, FakeResponse(CONTENT, headers=headers)
+        )
+
+        manager.download('https://example.com/file.pdf', dest)
+
+        assert manager.session.get.call_args.kwargs['headers'] == {}
+        assert open(dest, 'rb').read() == CONTENT
+
+    def test_already_complete_part(self, tmp_path):
+        dest = str(tmp_path / "file.pdf")
+        with open(dest + '.part', 'wb') as f:
+            f.write(CONTENT)
+        manager = make_manager()
+        manager.session.get.side_effect = lambda url, headers, stream, timeout: FakeResponse(CONTENT, headers=headers)
+        manager.download('https://example.com/file.pdf', dest)
+        assert open(dest, 'rb').read() == CONTENT
+
+    def test_retry_after_network_error_resumes(self, tmp_path):
+        dest = str(tmp_path / "file.pdf")
+        manager = make_manager(max_retries=1)
+
+        class Broken(FakeResponse):
+            def iter_content(self, chunk_size):
+                yield self._content[:100]
+                raise requests.exceptions.ConnectionError("reset")
+
+        responses = iter([Broken(CONTENT)])
+        manager.session.get.side_effect = lambda url, headers, stream, timeout: next(
+            responses, FakeResponse(CONTENT, headers=headers)
+        )
+
+        manager.download('https://example.com/file.pdf', dest)
+
+        assert manager.session.get.call_args.kwargs['headers'] == {'Range': 'bytes=100-'}
+        assert open(dest, 'rb').read() == CONTENT
+
+    def test_checksum_mismatch(self, tmp_path):
+        manager = make_manager()
+        manager.session.get.return_value = FakeResponse(CONTENT)
+        dest = str(tmp_path / "file.pdf")
+        with pytest.raises(CourtListenerError, match="Checksum mismatch"):
+            manager.download('https://example.com/file.pdf', dest, sha1='0' * 40)
+        assert not os.path.exists(dest) and not os.path.exists(dest + '.part')
+
+    def test_http_errors(self, tmp_path):
+        manager = make_manager(max_retries=0)
+        manager.session.get.return_value = FakeResponse(b'', status_code=404)
+        with pytest.raises(CourtListenerError):
+            manager.download('https://example.com/missing.pdf', str(tmp_path / "f"))
+        manager.session.get.return_value = FakeResponse(b'', status_code=503)
+        with pytest.raises(CourtListenerError, match="HTTP 503"):
+            manager.download('https://example.com/down.pdf', str(tmp_path / "f"))
+
+    def test_no_file(self, tmp_path):
+        with pytest.raises(ValidationError):
+            make_manager().download({'id': 1}, str(tmp_path))
+
+    def test_download_many_reports_errors(self, tmp_path):
+        manager = make_manager(max_retries=0)
+
+        def get(url, headers, stream, timeout):
+            if 'bad' in url:
+                return FakeResponse(b'', status_code=404)
+            return FakeResponse(CONTENT, headers=headers)
+
+        manager.session.get.side_effect = get
+        results = manager.download_many(
+            [
+                {'local_path': 'pdf/good.pdf', 'sha1': hashlib.sha1(CONTENT).hexdigest()},
+                'https://example.com/bad.pdf',
+                {'local_path': 'pdf/wrong.pdf', 'sha1': '0' * 40},
+            ],
+            str(tmp_path / "out"),
+        )
+
+        assert results[0]['path'] == str(tmp_path / "out" / "good.pdf")
+        assert results[0]['error'] is None
+        assert isinstance(results[1]['error'], CourtListenerError)
+        assert isinstance(results[2]['error'], CourtListenerError)
+
+    def test_download_many_separates_shared_file_names(self, tmp_path):
+        manager = make_manager(max_retries=0)
+        manager.session.get.side_effect = lambda url, headers, stream, timeout: FakeResponse(
+            url.encode(), headers=headers
+        )
+        urls = ['https://a.example.com/opinion.pdf', 'https://b.example.com/opinion.pdf',
+                'https://a.example.com/opinion.pdf', 'https://a.example.com/other.pdf']
+
+        results = manager.download_many(urls, str(tmp_path))
+
+        paths = [result['path'] for result in results]
+        assert paths[0] != paths[1] and paths[0] == paths[2]
+        assert paths[3] == str(tmp_path / "other.pdf")
+        assert all(open(path, 'rb').read() == url.encode() for path, url in zip(paths, urls))
+        assert manager.session.get.call_count == 3
+
+    def test_invalid_arguments(self):
+        with pytest.raises(ValidationError):
+            DownloadManager(chunk_size=0)
+        with pytest.raises(ValidationError):
+            DownloadManager(max_workers=0)
+        with pytest.raises(ValidationError):
+            DownloadManager(max_bytes_per_second=0)
+
+    def test_uses_client_settings_without_token(self, client):
+        manager = DownloadManager(client)
+        assert manager.timeout == client.config.timeout
+        assert 'Authorization' not in manager.session.headers
+        assert manager.session.headers['User-Agent'].startswith('CourtListener-SDK/')
+        manager.close()
+
+
+class TestBandwidthLimiter:
+    """Test cases for the shared bandwidth limiter."""
+
+    def test_throttles(self, monkeypatch):
+        sleeps = []
+        monkeypatch.setattr('courtlistener.utils.downloads.time.sleep', sleeps.append)
+        limiter = _BandwidthLimiter(1000)
+        limiter.consume(1000)
+        assert sleeps == []
+        limiter.consume(500)
+        assert sleeps and sleeps[0] == pytest.approx(0.5, abs=0.05)
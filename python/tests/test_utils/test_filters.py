@@ -2,8 +2,9 @@
 Comprehensive tests for the filters utility module.
 """
 
+import pickle
 import pytest
-from datetime import date, datetime
+from datetime import date, datetime, timedelta, timezone
 from courtlistener.utils.filters import (
     build_filters,
     build_date_range_filter,
@@ -12,7 +13,8 @@ from courtlistener.utils.filters import (
     build_exact_filter,
     build_ordering,
     _format_date,
-    combine_filters
+    combine_filters,
+    Query
 )
 
 
@@ -287,4 +289,98 @@ class TestCombineFilters:
     def test_combine_filters_no_args(self):
         """Test combining filters with no arguments."""
         result = combine_filters()
-        assert result == {}
\ No newline at end of file
+        assert result == {}
+
+
+class TestQuery:
+    """Test cases for the canonical Query type."""
+
+    def test_order_and_types_do_not_matter(self):
+        """Test that equivalent parameter dicts give equal queries and hashes."""
+        a = Query({'court': 'scotus', 'page': 1})
+        b = Query({'page': '1', 'court': 'scotus'})
+        assert a == b and hash(a) == hash(b) and a.key() == b.key()
+        assert len({a: 'cached'}.keys() | {b}) == 1
+        assert a == {'court': 'scotus', 'page': 1}
+        assert Query(court='scotus', page=2) != a
+
+    def test_normalizes_values(self):
+        """Test canonical forms for dates, booleans, None and lists."""
+        eastern = timezone(timedelta(hours=-5))
+        query = Query(
+            build_in_filter('court', ['ca2', 'ca1', 'ca2']),
+            build_ordering(['-date_filed', 'id']),
+            date_modified__gt=datetime(2024, 1, 1, 7, tzinfo=eastern),
+            date_filed__gte=date(2024, 1, 1),
+            precedential=True,
+            judge=None,
+        )
+        assert query.to_dict() == {
+            'court__in': 'ca1,ca2',
+            'order_by': '-date_filed,id',
+            'date_modified__gt': '2024-01-01T12:00:00+00:00',
+            'date_filed__gte': '2024-01-01',
+            'precedential': 'true',
+        }
+        assert Query(court__in='ca2, ca1') == Query(court__in={'ca1', 'ca2'})
+        assert Query(date_modified__gt='2024-01-01T12:00:00Z') == Query(
+            date_modified__gt='2024-01-01T12:00:00+00:00')
+        assert Query(build_date_range_filter('date_filed', date(2020, 1, 1), '2020-12-31')) == Query(
+            date_filed__range='2020-01-01,2020-12-31')
+        assert Query(date_filed__range=(date(2020, 1, 1), '2020-12-31'))['date_filed__range'] == '2020-01-01,2020-12-31'
+        assert Query(date_filed__range=' 2020-01-01 /2020-12-31T00:00:00Z').encode() == (
+            'date_filed__range=2020-01-01%2C2020-12-31T00%3A00%3A00%2B00%3A00')
+
+    def test_immutable_and_derived_copies(self):
+        """Test that queries cannot change and copies are canonical."""
+        query = Query(court='scotus', page=3)
+        with pytest.raises(AttributeError):
+            query.page = 4
+        with pytest.raises(TypeError):
+            query['page'] = 4
+        assert query.without('page') == Query(court='scotus')
+        assert query.replace(page=None, q='fourth amendment') == Query(court='scotus', q='fourth amendment')
+        assert (query | {'page': 1}) == Query(court='scotus', page=1)
+        assert query == Query(court='scotus', page=3)
+        assert pickle.loads(pickle.dumps(query)) == query
+
+    def test_encode_and_from_url(self):
+        """Test the canonical query string and URL parsing."""
+        query = Query(q='a b', court__in=['ca2', 'ca1'])
+        assert query.encode() == 'court__in=ca1%2Cca2&q=a+b'
+        url = 'https://www.courtlistener.com/api/rest/v4/search/?q=a+b&court__in=ca2,ca1'
+        assert Query.from_url(url) == query
+        assert Query.from_url(url).key('search/') == query.key('/search/') != query.key()
+
+    def test_repeated_params(self):
+        """Test that repeated parameters are kept apart instead of comma-joined."""
+        import requests
+        query = Query.from_url('https://www.courtlistener.com/api/rest/v4/search/?type=o&type=r&q=x')
+        assert query['type'] == ('o', 'r')
+        assert query.encode() == 'q=x&type=o&type=r'
+        assert query == Query(q='x', type=['o', 'r']) and hash(query) == hash(Query(q='x', type=('o', 'r')))
+        assert query != Query(q='x', type='o,r')
+        assert Query(type=['o']) == Query(type='o')
+        assert Query.from_url('?order_by=-date_filed&order_by=id')['order_by'] == '-date_filed,id'
+        prepared = requests.Request('GET', 'https://x/', params=query.to_dict()).prepare()
+        assert prepared.url == 'https://x/?q=x&type=o&type=r'
+
+    def test_usable_as_request_params(self):
+        """Test that paginators accept a Query and leave it untouched."""
+        from unittest.mock import Mock
+        from courtlistener.utils.pagination import PageIterator
+        client = Mock()
+        client._make_request.side_effect = [
+            {'results': [1], 'next': 'https://x/?cursor=abc'},
+            {'results': [2], 'next': None},
+        ]
+        query = Query(court='scotus')
+        assert list(PageIterator(client, 'opinions/', query)) == [1, 2]
+        assert client._make_request.call_args[1]['params'] == {'court': 'scotus', 'cursor': 'abc'}
+        assert query == Query(court='scotus')
+
+    def test_invalid_value(self):
+        """Test that unsupported value types are rejected."""
+        with pytest.raises(ValueError):
+            Query(court={'nested': 'dict'})
+        assert (Query(court='scotus') == {'court': object()}) is False
@@ -0,0 +1,166 @@
+"""
+Tests for hedged GET requests.
+"""
+
+import threading
+import pytest
+from unittest.mock import Mock, patch
+from courtlistener.client import CourtListenerClient
+from courtlistener.exceptions import ValidationError
+from courtlistener.utils.budget import RequestBudget, BudgetRule
+from courtlistener.utils.hedging import HedgingPolicy
+from courtlistener.utils.resilience import AdaptiveConcurrencyLimiter
+
+
+def ok_response(payload):
+    response = Mock(status_code=200, headers={})
+    response.json.return_value = payload
+    return response
+
+
+class SlowThenFast:
+    """Session.request stand-in whose first call hangs until released."""
+
+    def __init__(self):
+        self.release = threading.Event()
+        self.calls = []
+        self.lock = threading.Lock()
+
+    def __call__(self, method, url, **kwargs):
+        with self.lock:
+            self.calls.append(kwargs.get("headers"))
+            call = len(self.calls)
+        if call == 1:
+            self.release.wait(2)
+            return ok_response({"source": "primary"})
+        return ok_response({"source": "hedge"})
+
+
+class TestHedgingPolicy:
+    """Test cases for HedgingPolicy."""
+
+    def test_initial_delay_until_enough_samples(self):
+        policy = HedgingPolicy(initial_delay=0.7, min_samples=3)
+        policy.observe("search/", 0.1)
+        assert policy.delay("search/") == 0.7
+
+    def test_percentile_delay(self):
+        policy = HedgingPolicy(percentile=0.9, min_samples=10)
+        for i in range(1, 101):
+            policy.observe("search/", i / 100)
+        assert policy.delay("search/") == pytest.approx(0.91)
+        assert policy.delay("dockets/{id}/") == policy.initial_delay
+
+    def test_delay_is_clamped(self):
+        policy = HedgingPolicy(min_samples=1, min_delay=0.2, max_delay=0.5)
+        policy.observe("search/", 0.01)
+        assert policy.delay("search/") == 0.2
+        policy.observe("courts/", 3.0)
+        assert policy.delay("courts/") == 0.5
+
+    def test_sample_window(self):
+        policy = HedgingPolicy(min_samples=2, sample_size=2)
+        for seconds in (5.0, 0.1, 0.1):
+            policy.observe("search/", seconds)
+        assert policy.delay("search/") == pytest.approx(0.1)
+
+    def test_applies_to(self):
+        policy = HedgingPolicy(endpoints=["/dockets/"])
+        assert policy.applies_to("get", "dockets/{id}/")
+        assert not policy.applies_to("GET", "search/")
+        assert not policy.applies_to("POST", "dockets/")
+
+    def test_validation(self):
+        with pytest.raises(ValidationError):
+            HedgingPolicy(percentile=1)
+        with pytest.raises(ValidationError):
+            HedgingPolicy(min_samples=10, sample_size=5)
+        with pytest.raises(ValidationError):
+            HedgingPolicy(max_workers=1)
+
+
+class TestTransportHedging:
+    """HedgingPolicy wired into Transport."""
+
+    def setup_method(self):
+        self.policy = HedgingPolicy(initial_delay=0.05)
+        self.session_request = SlowThenFast()
+
+    def teardown_method(self):
+        self.session_request.release.set()
+
+    def test_hedge_wins(self):
+        client = CourtListenerClient(api_token="test-token", hedging=self.policy)
+        assert client.hedging is self.policy
+        with patch.object(client.transport.session, "request", side_effect=self.session_request):
+            assert client.get("search/") == {"source": "hedge"}
+        assert len(self.session_request.calls) == 2
+        assert self.policy.hedges_sent == 1
+        assert self.policy.hedges_won == 1
+
+    def test_fast_primary_is_not_hedged(self):
+        client = CourtListenerClient(api_token="test-token", hedging=self.policy)
+        self.session_request.release.set()
+        self.policy.initial_delay = 5
+        with patch.object(client.transport.session, "request", side_effect=self.session_request):
+            assert client.get("search/") == {"source": "primary"}
+        assert len(self.session_request.calls) == 1
+        assert self.policy.hedges_sent == 0
+        assert self.policy.delay("search/") == 5
+
+    def test_hedge_respects_budget(self):
+        budget = RequestBudget([BudgetRule(limit=1, window=60)])
+        client = CourtListenerClient(api_token="test-token", hedging=self.policy, budget=budget)
+        threading.Timer(0.2, self.session_request.release.set).start()
+        with patch.object(client.transport.session, "request", side_effect=self.session_request):
+            assert client.get("search/") == {"source": "primary"}
+        assert len(self.session_request.calls) == 1
+        assert self.policy.hedges_sent == 0
+
+    def test_hedge_respects_concurrency_limit(self):
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=1, max_limit=1)
+        client = CourtListenerClient(
+            api_token="test-token", hedging=self.policy, concurrency_limiter=limiter
+        )
+        threading.Timer(0.2, self.session_request.release.set).start()
+        with patch.object(client.transport.session, "request", side_effect=self.session_request):
+            assert client.get("search/") == {"source": "primary"}
+        assert len(self.session_request.calls) == 1
+        assert limiter.in_flight == 0
+
+    def test_hedge_uses_another_pool_token(self):
+        client = CourtListenerClient(api_tokens=["token-a", "token-b"], hedging=self.policy)
+        with patch.object(client.transport.session, "request", side_effect=self.session_request):
+            client.get("search/")
+        tokens = {headers["Authorization"] for headers in self.session_request.calls}
+        assert tokens == {"Token token-a", "Token token-b"}
+
+    def test_primaries_are_not_capped_by_hedge_pool(self):
+        policy = HedgingPolicy(initial_delay=5, max_workers=2)
+        client = CourtListenerClient(api_token="test-token", hedging=policy)
+        in_flight = threading.Semaphore(0)
+        release = threading.Event()
+
+        def hang(method, url, **kwargs):
+            in_flight.release()
+            release.wait(2)
+            return ok_response({})
+
+        with patch.object(client.transport.session, "request", side_effect=hang):
+            threads = [threading.Thread(target=client.get, args=("search/",)) for _ in range(4)]
+            for thread in threads:
+                thread.start()
+            try:
+                assert all(in_flight.acquire(timeout=1) for _ in range(4))
+            finally:
+                release.set()
+                for thread in threads:
+                    thread.join()
+        assert policy.hedges_sent == 0
+
+    def test_post_is_not_hedged(self):
+        client = CourtListenerClient(api_token="test-token", hedging=self.policy)
+        threading.Timer(0.2, self.session_request.release.set).start()
+        with patch.object(client.transport.session, "request", side_effect=self.session_request):
+            assert client.post("search/", json_data={}) == {"source": "primary"}
+        assert len(self.session_request.calls) == 1
@@ -0,0 +1,138 @@
+"""
+Tests for the local judge directory.
+"""
+
+import random
+from datetime import date
+import pytest
+from unittest.mock import Mock, patch
+from courtlistener.client import CourtListenerClient
+from courtlistener.exceptions import NotFoundError, ValidationError
+from courtlistener.utils.judge_directory import IntervalTree, JudgeDirectory
+
+BASE = "https://www.courtlistener.com/api/rest/v4/"
+
+PEOPLE = [
+    {"id": 1, "name_first": "Ruth", "name_last": "Ginsburg"},
+    {"id": 2, "name_first": "Sonia", "name_last": "Sotomayor"},
+    {"id": 3, "name_first": "Thurgood", "name_last": "Marshall"},
+]
+
+POSITIONS = [
+    {"id": 10, "person": f"{BASE}people/1/", "court": f"{BASE}courts/cadc/", "position_type": "jud",
+     "date_start": "1980-06-30", "date_termination": "1993-08-09"},
+    {"id": 11, "person": f"{BASE}people/1/", "court": f"{BASE}courts/scotus/", "position_type": "jud",
+     "date_start": "1993-08-10", "date_termination": "2020-09-18"},
+    {"id": 12, "person": f"{BASE}people/2/", "court": f"{BASE}courts/ca2/", "position_type": "jud",
+     "date_start": "1998-10-07", "date_termination": "2009-08-07"},
+    {"id": 13, "person": f"{BASE}people/2/", "court": f"{BASE}courts/scotus/", "position_type": "jud",
+     "date_start": "2009-08-08", "date_termination": None},
+    {"id": 14, "person": f"{BASE}people/3/", "court": f"{BASE}courts/scotus/", "position_type": "jud",
+     "date_start": "1967-10-02", "date_termination": "1991-10-01"},
+    {"id": 15, "person": f"{BASE}people/3/", "court": f"{BASE}courts/scotus/", "position_type": "clerk",
+     "date_start": None},
+]
+
+EDUCATIONS = [{"id": 20, "person": f"{BASE}people/1/", "degree_level": "jd"}]
+AFFILIATIONS = [{"id": 30, "person": f"{BASE}people/2/", "political_party": "d"}]
+RATINGS = [{"id": 40, "person": f"{BASE}people/2/", "rating": "wq"}]
+
+
+class TestIntervalTree:
+    """Test cases for IntervalTree."""
+
+    def test_matches_brute_force(self):
+        rng = random.Random(7)
+        intervals = []
+        for value in range(300):
+            start = rng.randint(0, 1000)
+            intervals.append((start, start + rng.randint(0, 120), value))
+        tree = IntervalTree(intervals)
+        assert len(tree) == 300
+        for point in range(-5, 1130, 7):
+            expected = {v for s, e, v in intervals if s <= point <= e}
+            assert set(tree.at(point)) == expected
+        for start in range(0, 1100, 37):
+            end = start + 25
+            expected = {v for s, e, v in intervals if s <= end and e >= start}
+            assert set(tree.overlapping(start, end)) == expected
+
+    def test_empty(self):
+        tree = IntervalTree([])
+        assert tree.at(5) == []
+        assert tree.overlapping(1, 2) == []
+
+
+class TestJudgeDirectory:
+    """Test cases for JudgeDirectory."""
+
+    def setup_method(self):
+        self.directory = JudgeDirectory(PEOPLE, POSITIONS, EDUCATIONS, AFFILIATIONS, RATINGS)
+
+    def test_who_sat_on_court(self):
+        judges = self.directory.judges_on("scotus", "1990-01-01")
+        assert [judge.id for judge in judges] == [3]
+        judges = self.directory.judges_on(f"{BASE}courts/scotus/", date(2015, 1, 1))
+        assert {judge.id for judge in judges} == {1, 2}
+        assert self.directory.judges_on("scotus", "1993-08-10")[0].id == 1
+        assert self.directory.judges_on("nowhere", "2000-01-01") == []
+
+    def test_positions_queries(self):
+        assert {p.id for p in self.directory.positions_on("2009-08-07")} == {11, 12}
+        assert {p.id for p in self.directory.positions_between("1991-01-01", "1993-12-31", court="scotus")} == {11, 14}
+        assert self.directory.positions_on("1970-01-01", position_types=["clerk"]) == []
+
+    def test_person_records(self):
+        assert self.directory.get_judge(2).name_last == "Sotomayor"
+        assert [p.id for p in self.directory.positions_for(2)] == [12, 13]
+        assert [p.id for p in self.directory.positions_for(3)] == [15, 14]
+        assert self.directory.educations_for(1)[0].id == 20
+        assert self.directory.political_affiliations_for(2)[0].id == 30
+        assert self.directory.aba_ratings_for(2)[0].id == 40
+        assert f"{BASE}people/3/" in self.directory
+        with pytest.raises(NotFoundError):
+            self.directory.get_judge(99)
+
+    def test_current_position(self):
+        assert self.directory.get_current_position_for_judge(2).id == 13
+        assert self.directory.get_current_position_for_judge(1) is None
+
+    def test_invalid_date(self):
+        with pytest.raises(ValidationError):
+            self.directory.positions_on("yesterday")
+
+    def test_save_and_read(self, tmp_path):
+        path = str(tmp_path / "judges.json")
+        self.directory.save(path)
+        loaded = JudgeDirectory.read(path)
+        assert len(loaded) == 3
+        assert loaded.fetched_at == self.directory.fetched_at
+        assert [j.id for j in loaded.judges_on("scotus", "1990-01-01")] == [3]
+
+
+class TestJudgeDirectoryLoading:
+    """Loading the directory through the client."""
+
+    def test_from_api_fetches_every_endpoint(self):
+        records = {
+            "people/": PEOPLE,
+            "positions/": POSITIONS,
+            "educations/": EDUCATIONS,
+            "political-affiliations/": AFFILIATIONS,
+            "aba-ratings/": RATINGS,
+        }
+        client = Mock()
+        client.paginate.side_effect = lambda endpoint: iter(records[endpoint])
+        directory = JudgeDirectory.from_api(client)
+        assert client.paginate.call_count == 5
+        assert len(directory) == 3
+        assert directory.aba_ratings_for(2)[0].id == 40
+
+    def test_judges_api_directory_is_cached(self, tmp_path):
+        client = CourtListenerClient(api_token="test-token")
+        path = str(tmp_path / "judges.json")
+        with patch.object(client, "paginate", side_effect=lambda endpoint: iter(PEOPLE if endpoint == "people/" else [])) as paginate:
+            directory = client.judges.directory(path=path)
+            assert client.judges.directory() is directory
+            assert paginate.call_count == 5
+        assert len(JudgeDirectory.read(path)) == 3
@@ -0,0 +1,78 @@
+"""
+Tests for the request metrics collector.
+"""
+
+import pytest
+from unittest.mock import Mock, patch
+from courtlistener.client import CourtListenerClient
+from courtlistener.exceptions import ValidationError, RateLimitError
+from courtlistener.utils.metrics import MetricsCollector
+
+
+class TestMetricsCollector:
+    """Test cases for MetricsCollector."""
+
+    def test_observe_and_snapshot(self):
+        metrics = MetricsCollector(buckets=(0.1, 1.0))
+        metrics.observe("search/", 0.05)
+        metrics.observe("search/", 0.5)
+        metrics.observe("search/", 3.0, status=429)
+        endpoint = metrics.snapshot()["endpoints"]["search/"]
+        assert endpoint["requests"] == 3
+        assert endpoint["status"] == {"200": 2, "429": 1}
+        assert endpoint["rate_limited"] == 1
+        assert endpoint["latency"]["buckets"] == {0.1: 1, 1.0: 2, float("inf"): 3}
+        assert endpoint["latency"]["sum"] == pytest.approx(3.55)
+
+    def test_cache_hit_rate(self):
+        metrics = MetricsCollector()
+        metrics.record_cache("resolver", True)
+        metrics.record_cache("resolver", True)
+        metrics.record_cache("resolver", False)
+        assert metrics.snapshot()["caches"]["resolver"] == {"hits": 2, "misses": 1, "hit_rate": pytest.approx(2 / 3)}
+
+    def test_prometheus_format(self):
+        metrics = MetricsCollector(buckets=(0.5,), prefix="cl")
+        metrics.observe('opinions/{id}/', 0.2)
+        metrics.record_cache("resolver", False)
+        text = metrics.to_prometheus()
+        assert "# TYPE cl_request_duration_seconds histogram" in text
+        assert 'cl_request_duration_seconds_bucket{endpoint="opinions/{id}/",le="0.5"} 1' in text
+        assert 'cl_request_duration_seconds_bucket{endpoint="opinions/{id}/",le="+Inf"} 1' in text
+        assert 'cl_requests_total{endpoint="opinions/{id}/",method="GET",status="200"} 1' in text
+        assert 'cl_cache_requests_total{cache="resolver",result="miss"} 1' in text
+        assert text.endswith("\n")
+
+    def test_label_escaping(self):
+        metrics = MetricsCollector()
+        metrics.observe('a"b\\c', 0.1)
+        assert 'endpoint="a\\"b\\\\c"' in metrics.to_prometheus()
+
+    def test_invalid_buckets(self):
+        with pytest.raises(ValidationError):
+            MetricsCollector(buckets=(1.0, 0.5))
+        with pytest.raises(ValidationError):
+            MetricsCollector(buckets=())
+
+    @patch("time.sleep")
+    def test_collects_from_client(self, mock_sleep):
+        client = CourtListenerClient(api_token="test-token", max_retries=1)
+        metrics = MetricsCollector(client)
+        limited = Mock(status_code=429, headers={})
+        with patch.object(client.transport.session, "request", return_value=limited):
+            with pytest.raises(RateLimitError):
+                client.get("search/")
+        client.transfer_stats.record("search/", 10, 100)
+
+        endpoint = metrics.snapshot()["endpoints"]["search/"]
+        assert endpoint["requests"] == 2
+        assert endpoint["rate_limited"] == 2
+        assert endpoint["retries"] == 1
+        assert endpoint["errors"] == {"RateLimitError": 1}
+        assert endpoint["wire_bytes"] == 10 and endpoint["decoded_bytes"] == 100
+        assert 'courtlistener_wire_bytes_total{endpoint="search/"} 10' in metrics.to_prometheus()
+
+        metrics.detach()
+        assert not client.hooks.has_hooks("after_response")
+        metrics.reset()
+        assert metrics.snapshot()["endpoints"] == {}
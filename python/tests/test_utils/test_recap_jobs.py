@@ -0,0 +1,163 @@
+"""
+Tests for RECAP fetch job orchestration.
+"""
+
+import asyncio
+import threading
+import time
+import pytest
+from unittest.mock import Mock
+from courtlistener.api.recap_fetch import RecapFetchAPI
+from courtlistener.exceptions import APIError, NotFoundError, RateLimitError, ValidationError
+from courtlistener.utils.recap_jobs import RecapJobManager, SUCCESSFUL, FAILED
+
+
+class FakeRecap:
+    """Mock client running recap-fetch/ jobs that finish after N status checks."""
+
+    def __init__(self, checks=2, id_in=True):
+        self.checks = checks
+        self.id_in = id_in
+        self.jobs = {}
+        self.calls = []
+        self.fail_post = set()
+        self.lock = threading.Lock()
+        self.client = Mock()
+        self.client.post.side_effect = self.post
+        self.client.get.side_effect = self.get
+        self.client.paginate.side_effect = self.paginate
+
+    def post(self, endpoint, data=None):
+        assert endpoint == "recap-fetch/"
+        with self.lock:
+            if data.get("docket") in self.fail_post:
+                raise APIError("Bad request", status_code=400)
+            fetch_id = len(self.jobs) + 1
+            self.jobs[fetch_id] = {"id": fetch_id, "status": 1, "left": self.checks, "docket": data.get("docket")}
+            return self.view(fetch_id, advance=False)
+
+    def view(self, fetch_id, advance=True):
+        job = self.jobs[fetch_id]
+        if advance and job["left"] > 0:
+            job["left"] -= 1
+            if job["left"] == 0:
+                job["status"] = FAILED if job["docket"] == 13 else SUCCESSFUL
+        return {"id": fetch_id, "status": job["status"], "message": "done" if job["left"] == 0 else ""}
+
+    def get(self, endpoint, params=None):
+        self.calls.append(("get", endpoint))
+        fetch_id = int(endpoint.rstrip("/").split("/")[-1])
+        if fetch_id not in self.jobs:
+            raise NotFoundError("Resource not found")
+        return self.view(fetch_id)
+
+    def paginate(self, endpoint, params=None):
+        self.calls.append(("paginate", endpoint, dict(params or {})))
+        if endpoint == "recap-query/":
+            ids = params["pacer_doc_id__in"].split(",")
+            return iter([{"pacer_doc_id": doc_id, "filepath_local": "x.pdf"} for doc_id in ids if doc_id.startswith("0")])
+        if not self.id_in:
+            return iter([{"id": 500, "status": SUCCESSFUL}] + [self.view(i, advance=False) for i in self.jobs])
+        wanted = [int(x) for x in params["id__in"].split(",")]
+        return iter([self.view(fetch_id) for fetch_id in wanted if fetch_id in self.jobs])
+
+
+class TestRecapJobManager:
+    """Test cases for RecapJobManager."""
+
+    def setup_method(self):
+        self.recap = FakeRecap()
+        self.manager = RecapJobManager(self.recap.client, initial_interval=0, batch_size=2)
+
+    def test_batched_polling(self):
+        jobs = self.manager.submit_many([{"request_type": 1, "docket": d} for d in (10, 11, 12)], max_workers=1)
+        assert [job.id for job in jobs] == [1, 2, 3]
+        assert self.manager.poll() == []
+        finished = self.manager.poll()
+        assert sorted(job.id for job in finished) == [1, 2, 3]
+        # Each poll: one id__in batch of two, then a detail request for the rest
+        assert [c[0] for c in self.recap.calls] == ["paginate", "get"] * 2
+        assert all(job.succeeded and job.message == "done" for job in jobs)
+        assert self.manager.pending == []
+
+    def test_missing_job_does_not_hold_back_batch(self):
+        recap = FakeRecap(checks=1)
+        manager = RecapJobManager(recap.client, initial_interval=0)
+        jobs = manager.submit_many([{"request_type": 1, "docket": d} for d in (10, 11)], max_workers=1)
+        missing = manager.track(99)
+        finished = manager.poll()
+        assert sorted(finished, key=lambda job: job.id) == jobs + [missing]
+        assert all(job.succeeded for job in jobs)
+        assert isinstance(missing.error, NotFoundError) and missing.done
+        assert manager.pending == []
+
+    def test_single_job_uses_detail_endpoint(self):
+        self.manager.submit(request_type=1, docket=10)
+        self.manager.poll()
+        assert self.recap.calls == [("get", "recap-fetch/1/")]
+
+    def test_backoff_and_retry_after(self):
+        manager = RecapJobManager(self.recap.client, initial_interval=1, max_interval=3, backoff=2)
+        job = manager.submit(request_type=1, docket=10)
+        assert manager.poll() == []  # not due yet
+        job.next_poll = 0
+        manager.poll()
+        assert job.interval == 2 and 1.5 < manager.next_poll_in() <= 2
+        job.next_poll = 0
+        self.recap.client.get.side_effect = RateLimitError("slow down", retry_after=60)
+        manager.poll()
+        assert job.interval == 3  # capped
+        assert manager.next_poll_in() > 50
+
+    def test_as_completed_and_callback(self):
+        seen = []
+        manager = RecapJobManager(self.recap.client, initial_interval=0.01, callback=seen.append)
+        manager.submit_many([{"request_type": 1, "docket": d} for d in (10, 13)], max_workers=1)
+        finished = list(manager.as_completed(timeout=5))
+        assert sorted(job.id for job in finished) == [1, 2]
+        assert {job.id: job.succeeded for job in finished} == {1: True, 2: False}
+        assert seen == finished
+
+    def test_as_completed_async(self):
+        manager = RecapJobManager(self.recap.client, initial_interval=0.01)
+        manager.submit_many([{"request_type": 1, "docket": d} for d in (10, 11, 12)])
+
+        async def collect():
+            return [job.id async for job in manager.as_completed_async(timeout=5)]
+
+        assert sorted(asyncio.run(collect())) == [1, 2, 3]
+
+    def test_ignored_id_filter_falls_back(self):
+        recap = FakeRecap(checks=1, id_in=False)
+        manager = RecapJobManager(recap.client, initial_interval=0)
+        manager.submit_many([{"request_type": 1, "docket": d} for d in (10, 11)], max_workers=1)
+        assert len(manager.poll()) == 2
+        assert [c[1] for c in recap.calls if c[0] == "get"] == ["recap-fetch/1/", "recap-fetch/2/"]
+
+    def test_failed_submission_and_timeout(self):
+        self.recap.fail_post = {11}
+        seen = []
+        manager = RecapJobManager(self.recap.client, initial_interval=60, timeout=0, callback=seen.append)
+        jobs = manager.submit_many([{"request_type": 1, "docket": d} for d in (10, 11)])
+        assert jobs[1].done and jobs[1].id is None and jobs[1].error is not None
+        assert seen == [jobs[1]]
+        time.sleep(0.01)
+        assert [job.id for job in manager.poll()] == [1]
+        assert jobs[0].error is not None and not jobs[0].succeeded
+        assert list(manager.as_completed()) == [jobs[1], jobs[0]]
+
+    def test_track_and_available(self):
+        job = self.manager.track("https://www.courtlistener.com/api/rest/v4/recap-fetch/7/")
+        assert job.id == 7 and self.manager.track(7) is job
+        found = self.manager.available("nysd", ["011", "22", "033", "011"])
+        assert sorted(found) == ["011", "033"]
+        assert self.recap.calls[0][2]["docket_entry__docket__court"] == "nysd"
+        with pytest.raises(ValidationError):
+            self.manager.track("nope")
+        with pytest.raises(ValidationError):
+            RecapJobManager(Mock(), backoff=0.5)
+
+    def test_api_entry_points(self):
+        api = RecapFetchAPI(self.recap.client)
+        assert api.create(request_type=1, docket=10)["id"] == 1
+        assert isinstance(api.jobs(batch_size=10), RecapJobManager)
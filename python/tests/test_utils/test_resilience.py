@@ -0,0 +1,212 @@
+"""
+Tests for the circuit breaker and adaptive concurrency limiter.
+"""
+
+import threading
+import pytest
+import requests
+from unittest.mock import Mock, patch
+from courtlistener.client import CourtListenerClient
+from courtlistener.exceptions import BudgetExceededError, CircuitOpenError, APIError, ValidationError
+from courtlistener.utils.budget import BudgetRule, RequestBudget
+from courtlistener.utils.resilience import CircuitBreaker, AdaptiveConcurrencyLimiter
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestCircuitBreaker:
+    """Test cases for CircuitBreaker."""
+
+    def setup_method(self):
+        self.clock = FakeClock()
+        self.patcher = patch("courtlistener.utils.resilience.time.monotonic", self.clock)
+        self.patcher.start()
+        self.breaker = CircuitBreaker(failure_rate=0.5, minimum_requests=4, window=10, reset_timeout=5)
+
+    def teardown_method(self):
+        self.patcher.stop()
+
+    def test_opens_on_failure_rate(self):
+        for success in (True, False, True):
+            self.breaker.record(success)
+        assert self.breaker.state == "closed"
+        self.breaker.record(False)
+        assert self.breaker.state == "open"
+        with pytest.raises(CircuitOpenError) as exc_info:
+            self.breaker.allow()
+        assert exc_info.value.retry_after == pytest.approx(5)
+
+    def test_old_outcomes_expire(self):
+        for _ in range(3):
+            self.breaker.record(False)
+        self.clock.now += 11
+        self.breaker.record(False)
+        assert self.breaker.state == "closed"
+
+    def test_half_open_probe(self):
+        for _ in range(4):
+            self.breaker.record(False)
+        self.clock.now += 5
+        assert self.breaker.state == "half_open"
+        self.breaker.allow()
+        with pytest.raises(CircuitOpenError):
+            self.breaker.allow()
+        self.breaker.record(False)
+        assert self.breaker.state == "open"
+
+        self.clock.now += 5
+        self.breaker.allow()
+        self.breaker.record(True)
+        assert self.breaker.state == "closed"
+        self.breaker.allow()
+
+    def test_reset_and_validation(self):
+        for _ in range(4):
+            self.breaker.record(False)
+        self.breaker.reset()
+        assert self.breaker.state == "closed"
+        with pytest.raises(ValidationError):
+            CircuitBreaker(failure_rate=0)
+        with pytest.raises(ValidationError):
+            CircuitBreaker(minimum_requests=0)
+
+
+class TestAdaptiveConcurrencyLimiter:
+    """Test cases for AdaptiveConcurrencyLimiter."""
+
+    def test_additive_increase(self):
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=2, max_limit=3)
+        for _ in range(4):
+            limiter.release(limiter.acquire())
+        assert limiter.limit == 3
+        for _ in range(10):
+            limiter.release(limiter.acquire())
+        assert limiter.limit == 3
+
+    def test_multiplicative_decrease_once_per_episode(self):
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=8, max_limit=16)
+        tickets = [limiter.acquire() for _ in range(4)]
+        for ticket in tickets:
+            limiter.release(ticket, congested=True)
+        assert limiter.limit == 4
+        limiter.release(limiter.acquire(), congested=True)
+        assert limiter.limit == 2
+        for _ in range(5):
+            limiter.release(limiter.acquire(), congested=True)
+        assert limiter.limit == 1
+
+    def test_latency_threshold(self):
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=4, latency_threshold=0.5)
+        limiter.release(limiter.acquire() - 1.0)
+        assert limiter.limit == 2
+
+    def test_blocks_at_limit(self):
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=1, max_limit=1)
+        first = limiter.acquire()
+        acquired = threading.Event()
+        thread = threading.Thread(target=lambda: (limiter.acquire(), acquired.set()))
+        thread.start()
+        assert not acquired.wait(0.05)
+        assert limiter.in_flight == 1
+        limiter.release(first)
+        assert acquired.wait(1)
+        thread.join()
+
+    def test_try_acquire_and_cancel(self):
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=1, max_limit=4)
+        ticket = limiter.try_acquire()
+        assert ticket is not None
+        assert limiter.try_acquire() is None
+        limiter.cancel(ticket)
+        assert limiter.in_flight == 0
+        assert limiter.limit == 1
+
+    def test_validation(self):
+        with pytest.raises(ValidationError):
+            AdaptiveConcurrencyLimiter(initial_limit=0)
+        with pytest.raises(ValidationError):
+            AdaptiveConcurrencyLimiter(initial_limit=8, max_limit=4)
+        with pytest.raises(ValidationError):
+            AdaptiveConcurrencyLimiter(backoff=1)
+
+
+class TestTransportResilience:
+    """Breaker and limiter wired into Transport."""
+
+    @patch("time.sleep")
+    def test_breaker_fails_fast_during_outage(self, mock_sleep):
+        breaker = CircuitBreaker(minimum_requests=2, reset_timeout=60)
+        client = CourtListenerClient(api_token="test-token", max_retries=5, circuit_breaker=breaker)
+        with patch.object(client.transport.session, "request", return_value=Mock(status_code=503)) as request:
+            with pytest.raises(CircuitOpenError):
+                client.get("search/")
+            assert request.call_count == 2
+            with pytest.raises(CircuitOpenError):
+                client.get("courts/")
+            assert request.call_count == 2
+
+    @patch("time.sleep")
+    def test_timeouts_and_connection_errors_count(self, mock_sleep):
+        breaker = CircuitBreaker(minimum_requests=2)
+        client = CourtListenerClient(api_token="test-token", max_retries=3, circuit_breaker=breaker)
+        errors = [requests.exceptions.Timeout(), requests.exceptions.ConnectionError()]
+        with patch.object(client.transport.session, "request", side_effect=errors):
+            with pytest.raises(CircuitOpenError):
+                client.get("search/")
+
+    def test_unsent_request_keeps_half_open_trial(self):
+        clock = FakeClock()
+        breaker = CircuitBreaker(minimum_requests=1, reset_timeout=5)
+        budget = RequestBudget([BudgetRule(1, 3600, endpoint="courts/")])
+        limiter = AdaptiveConcurrencyLimiter()
+        client = CourtListenerClient(
+            api_token="test-token", circuit_breaker=breaker, budget=budget, concurrency_limiter=limiter
+        )
+        response = Mock(status_code=200)
+        response.json.return_value = {}
+        with patch("courtlistener.utils.resilience.time.monotonic", clock), \
+                patch.object(client.transport.session, "request", return_value=response) as request:
+            client.get("courts/")
+            breaker.record(False)
+            clock.now += 5
+            assert breaker.state == "half_open"
+            with pytest.raises(BudgetExceededError):
+                client.get("courts/")
+            # An interrupted wait for a concurrency slot
+            with patch.object(limiter, "acquire", side_effect=KeyboardInterrupt):
+                with pytest.raises(KeyboardInterrupt):
+                    client.get("search/")
+            client.get("search/")
+        assert request.call_count == 2
+        assert breaker.state == "closed"
+
+    def test_client_errors_do_not_trip(self):
+        breaker = CircuitBreaker(minimum_requests=1)
+        client = CourtListenerClient(api_token="test-token", circuit_breaker=breaker)
+        with patch.object(client.transport.session, "request", return_value=Mock(status_code=404)):
+            for _ in range(3):
+                with pytest.raises(Exception):
+                    client.get("dockets/1/")
+        assert breaker.state == "closed"
+
+    @patch("time.sleep")
+    def test_limiter_shrinks_on_errors_and_releases_slots(self, mock_sleep):
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=8)
+        client = CourtListenerClient(api_token="test-token", max_retries=1, concurrency_limiter=limiter)
+        assert client.concurrency_limiter is limiter
+        with patch.object(client.transport.session, "request", return_value=Mock(status_code=500)):
+            with pytest.raises(APIError):
+                client.get("search/")
+        assert limiter.limit < 8
+        assert limiter.in_flight == 0
+
+        with patch.object(client.transport.session, "request", side_effect=requests.exceptions.InvalidURL()):
+            with pytest.raises(Exception):
+                client.get("search/")
+        assert limiter.in_flight == 0
@@ -0,0 +1,161 @@
+"""
+Tests for the batched reference resolver.
+"""
+
+from unittest.mock import Mock
+from courtlistener.exceptions import NotFoundError
+from courtlistener.models.cluster import OpinionCluster
+from courtlistener.models.court import Court
+from courtlistener.models.docket import Docket
+from courtlistener.models.judge import Judge
+from courtlistener.models.opinion import Opinion
+from courtlistener.utils.court_catalog import CourtCatalog
+from courtlistener.utils.metrics import MetricsCollector
+from courtlistener.utils.resolver import ReferenceResolver, parse_reference
+
+BASE = "https://www.courtlistener.com/api/rest/v4/"
+
+
+def fake_client(records, honour_id_in=True):
+    """Mock client serving records keyed by (endpoint, id)."""
+    client = Mock()
+
+    def paginate(endpoint, params=None):
+        name = endpoint.rstrip("/")
+        items = [data for (ep, _), data in records.items() if ep == name]
+        if honour_id_in:
+            wanted = params["id__in"].split(",")
+            items = [data for data in items if str(data["id"]) in wanted]
+        return iter(items)
+
+    def get(endpoint):
+        name, obj_id = endpoint.strip("/").split("/")
+        if (name, obj_id) not in records:
+            raise NotFoundError("Resource not found")
+        return records[(name, obj_id)]
+
+    client.paginate.side_effect = paginate
+    client.get.side_effect = get
+    return client
+
+
+RECORDS = {
+    ("dockets", "1"): {"id": 1, "case_name": "Roe v. Wade"},
+    ("dockets", "2"): {"id": 2, "case_name": "Doe v. Bolton"},
+    ("courts", "scotus"): {"id": "scotus", "jurisdiction": "F"},
+    ("people", "7"): {"id": 7, "name_last": "Blackmun"},
+    ("people", "9"): {"id": 9, "name_last": "Burger"},
+    ("clusters", "10"): {"id": 10, "case_name": "Roe"},
+}
+
+
+def clusters():
+    return [
+        OpinionCluster({"id": 10, "docket": f"{BASE}dockets/1/", "court": f"{BASE}courts/scotus/"}),
+        OpinionCluster({"id": 11, "docket": f"{BASE}dockets/2/", "court": f"{BASE}courts/scotus/"}),
+    ]
+
+
+class TestParseReference:
+    """Test cases for parse_reference."""
+
+    def test_parse(self):
+        assert parse_reference(f"{BASE}courts/ca2/") == ("courts", "ca2")
+        assert parse_reference(f"{BASE}dockets/123/?fields=id") == ("dockets", "123")
+        assert parse_reference("/api/rest/v4/people/7/") == ("people", "7")
+        assert parse_reference(f"{BASE}unknown/1/") is None
+        assert parse_reference(123) is None
+        assert parse_reference(None) is None
+
+
+class TestReferenceResolver:
+    """Test cases for ReferenceResolver."""
+
+    def test_batches_by_endpoint(self):
+        client = fake_client(RECORDS)
+        resolver = ReferenceResolver(client)
+        items = resolver.resolve(clusters())
+        assert isinstance(items[0].resolved("docket"), Docket)
+        assert items[1].resolved("docket").case_name == "Doe v. Bolton"
+        assert isinstance(items[0].resolved("court"), Court)
+        assert items[0].resolved("court") is items[1].resolved("court")
+        assert client.paginate.call_count == 2
+        client.paginate.assert_any_call("dockets/", params={"id__in": "1,2"})
+        client.get.assert_not_called()
+
+    def test_cache_is_shared(self):
+        client = fake_client(RECORDS)
+        metrics = MetricsCollector()
+        resolver = ReferenceResolver(client, metrics=metrics)
+        resolver.resolve(clusters())
+        resolver.resolve(clusters())
+        assert client.paginate.call_count == 2
+        caches = metrics.snapshot()["caches"]["resolver"]
+        assert (caches["hits"], caches["misses"]) == (3, 3)
+        assert len(resolver) == 3
+
+    def test_batch_size(self):
+        client = fake_client(RECORDS)
+        resolver = ReferenceResolver(client, batch_size=1)
+        resolver.resolve(clusters(), fields=["docket"])
+        assert client.paginate.call_count == 2
+
+    def test_falls_back_when_id_in_is_ignored(self):
+        client = fake_client(RECORDS, honour_id_in=False)
+        resolver = ReferenceResolver(client)
+        opinions = [
+            Opinion({"id": 1, "author": f"{BASE}people/7/", "cluster": f"{BASE}clusters/10/"}),
+            Opinion({"id": 2, "author": f"{BASE}people/8/"}),
+        ]
+        resolver.resolve(opinions)
+        assert isinstance(opinions[0].resolved("author"), Judge)
+        assert opinions[0].resolved("cluster").case_name == "Roe"
+        assert opinions[1].resolved("author") is None
+        client.get.assert_called_once_with("people/8/")
+
+        # Missing objects are remembered; the endpoint is no longer batched
+        assert resolver.get(f"{BASE}people/8/") is None
+        paginated = client.paginate.call_count
+        assert resolver.get(f"{BASE}people/9/").name_last == "Burger"
+        assert client.paginate.call_count == paginated
+        assert client.get.call_count == 2
+
+    def test_list_fields(self):
+        records = {
+            ("positions", "1"): {"id": 1, "job_title": "Judge"},
+            ("positions", "2"): {"id": 2, "job_title": "Chief Judge"},
+        }
+        client = fake_client(records)
+        judge = Judge({"id": 7, "positions": [f"{BASE}positions/1/", f"{BASE}positions/2/"], "educations": []})
+        ReferenceResolver(client).resolve([judge])
+        assert [p.id for p in judge.resolved("positions")] == [1, 2]
+        assert judge.resolved("educations") == []
+
+    def test_court_catalog(self):
+        client = fake_client(RECORDS)
+        catalog = CourtCatalog([{"id": "scotus", "jurisdiction": "F"}])
+        resolver = ReferenceResolver(client, court_catalog=catalog)
+        items = resolver.resolve(clusters(), fields=["court"])
+        assert items[0].resolved("court") is catalog.get("scotus")
+        client.paginate.assert_not_called()
+
+    def test_lazy_attach(self):
+        client = fake_client(RECORDS)
+        resolver = ReferenceResolver(client)
+        items = resolver.attach(clusters())
+        client.paginate.assert_not_called()
+        assert items[1].resolved("docket").id == 2
+        assert items[0].resolved("court").id == "scotus"
+        assert client.paginate.call_count == 2
+
+    def test_cache_size(self):
+        client = fake_client(RECORDS)
+        resolver = ReferenceResolver(client, cache_size=1)
+        items = resolver.resolve(clusters(), fields=["docket"])
+        assert items[0].resolved("docket").id == 1
+        assert len(resolver) == 1
+
+    def test_unresolved_field_default(self):
+        docket = Docket({"id": 1})
+        assert docket.resolved("court") is None
+        assert docket.resolved("court", "n/a") == "n/a"
@@ -0,0 +1,178 @@
+"""
+Tests for the priority-aware request scheduler.
+"""
+
+import threading
+import time
+import pytest
+from unittest.mock import Mock, patch
+from courtlistener.client import CourtListenerClient
+from courtlistener.exceptions import NotFoundError, ValidationError
+from courtlistener.utils.scheduler import RequestScheduler, request_priority, current_priority
+
+
+def ok_response():
+    response = Mock(status_code=200, headers={})
+    response.json.return_value = {"ok": True}
+    return response
+
+
+def wait_for_queue(scheduler, size):
+    deadline = time.monotonic() + 2
+    while sum(scheduler.waiting().values()) < size:
+        assert time.monotonic() < deadline
+        time.sleep(0.005)
+
+
+class TestRequestScheduler:
+    """Test cases for RequestScheduler."""
+
+    def _queue(self, scheduler, priorities, admitted):
+        threads = []
+        for index, priority in enumerate(priorities):
+            def run(priority=priority):
+                scheduler.acquire(priority)
+                admitted.append(priority)
+                scheduler.release()
+            thread = threading.Thread(target=run)
+            thread.start()
+            threads.append(thread)
+            wait_for_queue(scheduler, index + 1)
+        return threads
+
+    def test_higher_priority_jumps_the_queue(self):
+        scheduler = RequestScheduler(max_concurrent=1)
+        scheduler.acquire("bulk")
+        admitted = []
+        threads = self._queue(scheduler, ["bulk", "bulk", "normal", "interactive"], admitted)
+        assert scheduler.waiting() == {2: 2, 1: 1, 0: 1}
+        scheduler.release()
+        for thread in threads:
+            thread.join(2)
+        assert admitted == ["interactive", "normal", "bulk", "bulk"]
+        assert scheduler.in_flight == 0
+        assert scheduler.stats()["bulk"]["requests"] == 3
+
+    def test_rate_limit(self):
+        scheduler = RequestScheduler(requests_per_second=20)
+        started = time.monotonic()
+        for _ in range(3):
+            scheduler.acquire()
+            scheduler.release()
+        assert time.monotonic() - started >= 0.09
+
+    def test_pause(self):
+        scheduler = RequestScheduler()
+        scheduler.pause(0.1)
+        assert not scheduler.try_acquire()
+        started = time.monotonic()
+        with scheduler.slot("interactive"):
+            assert scheduler.in_flight == 1
+        assert time.monotonic() - started >= 0.09
+
+    def test_try_acquire_yields_to_queue(self):
+        scheduler = RequestScheduler(max_concurrent=1)
+        assert scheduler.try_acquire()
+        assert not scheduler.try_acquire()
+        scheduler.release()
+
+    def test_request_priority_context(self):
+        assert current_priority() is None
+        with request_priority("bulk"):
+            with request_priority("interactive"):
+                assert current_priority() == "interactive"
+            assert current_priority() == "bulk"
+        assert current_priority() is None
+
+    def test_validation(self):
+        with pytest.raises(ValidationError):
+            RequestScheduler(requests_per_second=0)
+        with pytest.raises(ValidationError):
+            RequestScheduler(max_concurrent=0)
+        with pytest.raises(ValidationError):
+            with request_priority("urgent"):
+                pass
+
+
+class TestClientScheduler:
+    """RequestScheduler wired into Transport."""
+
+    def test_client_priority(self):
+        scheduler = RequestScheduler()
+        client = CourtListenerClient(api_token="test-token", scheduler=scheduler)
+        assert client.scheduler is scheduler
+        with patch.object(client.transport.session, "request", return_value=ok_response()):
+            with client.priority("interactive"):
+                client.get("dockets/1/")
+            client.get("search/")
+        assert scheduler.stats()["interactive"]["requests"] == 1
+        assert scheduler.stats()["normal"]["requests"] == 1
+        assert scheduler.in_flight == 0
+
+    def test_slot_released_on_error(self):
+        scheduler = RequestScheduler(max_concurrent=1)
+        client = CourtListenerClient(api_token="test-token", scheduler=scheduler)
+        with patch.object(client.transport.session, "request", return_value=Mock(status_code=404)):
+            with pytest.raises(NotFoundError):
+                client.get("dockets/1/")
+        assert scheduler.in_flight == 0
+
+    def test_budget_wait_happens_inside_slot(self):
+        scheduler = RequestScheduler(max_concurrent=1)
+        client = CourtListenerClient(api_token="test-token", scheduler=scheduler)
+        in_flight = []
+        client.budget = Mock(acquire=Mock(side_effect=lambda *args: in_flight.append(scheduler.in_flight)))
+        with patch.object(client.transport.session, "request", return_value=ok_response()):
+            client.get("search/")
+        assert in_flight == [1]
+        assert scheduler.in_flight == 0
+
+    def test_token_wait_follows_priority(self):
+        scheduler = RequestScheduler(max_concurrent=1)
+        client = CourtListenerClient(api_token="test-token", scheduler=scheduler)
+        first_waiting = threading.Event()
+        release_first = threading.Event()
+        served = []
+
+        def acquire():
+            if not served:
+                served.append(None)
+                first_waiting.set()
+                release_first.wait(2)
+            else:
+                served.append(current_priority())
+            return "test-token"
+
+        client.token_pool = Mock(acquire=Mock(side_effect=acquire))
+
+        def run(priority):
+            with client.priority(priority):
+                client.get("search/")
+
+        with patch.object(client.transport.session, "request", return_value=ok_response()):
+            threads = [threading.Thread(target=run, args=("normal",))]
+            threads[0].start()
+            assert first_waiting.wait(2)
+            for index, priority in enumerate(["bulk", "bulk", "interactive"]):
+                thread = threading.Thread(target=run, args=(priority,))
+                thread.start()
+                threads.append(thread)
+                wait_for_queue(scheduler, index + 1)
+            release_first.set()
+            for thread in threads:
+                thread.join(2)
+        assert served == [None, "interactive", "bulk", "bulk"]
+
+    @patch("courtlistener.transport.time.sleep")
+    def test_rate_limit_pauses_queue(self, mock_sleep):
+        scheduler = RequestScheduler()
+        client = CourtListenerClient(
+            api_token="test-token", scheduler=scheduler, max_retries=1, rate_limit_delay=0.05
+        )
+        limited = Mock(status_code=429, headers={})
+        with patch.object(client.transport.session, "request", side_effect=[limited, ok_response()]):
+            with patch.object(scheduler, "pause", wraps=scheduler.pause) as pause:
+                assert client.get("search/") == {"ok": True}
+        pause.assert_called_once_with(0.05)
+        mock_sleep.assert_called_once_with(0)
+        assert scheduler.in_flight == 0
@@ -0,0 +1,182 @@
+"""
+Tests for the local full-text search index.
+"""
+
+import pytest
+from unittest.mock import Mock
+from courtlistener.api.clusters import ClustersAPI
+from courtlistener.api.opinions import OpinionsAPI
+from courtlistener.exceptions import ValidationError
+from courtlistener.models.cluster import OpinionCluster
+from courtlistener.models.opinion import Opinion
+from courtlistener.utils.search_index import LocalSearchIndex
+
+
+BASE = "https://www.courtlistener.com/api/rest/v4"
+
+
+def make_opinion(opinion_id, text, sha1="a", modified="2024-01-01T00:00:00", cluster=1, **extra):
+    data = {
+        "id": opinion_id,
+        "cluster": f"{BASE}/clusters/{cluster}/",
+        "sha1": sha1,
+        "date_modified": modified,
+        "plain_text": text,
+    }
+    data.update(extra)
+    return data
+
+
+class TestLocalSearchIndex:
+    """Test cases for LocalSearchIndex."""
+
+    def setup_method(self):
+        self.index = LocalSearchIndex()
+        self.index.add_cluster({
+            "id": 1,
+            "case_name": "Roe v. Wade",
+            "court": f"{BASE}/courts/scotus/",
+            "date_filed": "1973-01-22",
+            "sub_opinions": [],
+        })
+        self.index.ingest([
+            Opinion(make_opinion(10, "The right of privacy is broad enough.")),
+            make_opinion(11, "", html_with_citations="<p>Due <b>process</b> clause</p>", cluster=2,
+                         court=f"{BASE}/courts/ca9/", date_filed="2001-05-01"),
+        ])
+
+    def teardown_method(self):
+        self.index.close()
+
+    def test_search_returns_api_shape(self):
+        response = self.index.search("privacy")
+        assert response["count"] == 1
+        assert response["next"] is None and response["previous"] is None
+        result = response["results"][0]
+        assert result["id"] == 10
+        assert result["caseName"] == "Roe v. Wade"
+        assert result["court_id"] == "scotus"
+        assert result["dateFiled"] == "1973-01-22"
+        assert "<mark>privacy</mark>" in result["snippet"]
+
+    def test_html_is_indexed_as_text(self):
+        assert self.index.search("process")["results"][0]["id"] == 11
+
+    def test_filters(self):
+        assert self.index.search("privacy OR process", court="ca9")["count"] == 1
+        assert self.index.search("privacy OR process", filters={"filed_after": "2000-01-01"})["count"] == 1
+        assert self.index.search("privacy OR process", filed_before="2000-01-01")["count"] == 1
+        assert self.index.search("privacy OR process", court="scotus ca9")["count"] == 2
+
+    def test_pagination_and_ordering(self):
+        first = self.index.search("privacy OR process", page_size=1, order_by="dateFiled desc")
+        assert first["count"] == 2
+        assert first["next"] == 2
+        assert first["results"][0]["id"] == 11
+        second = self.index.search("privacy OR process", page=2, page_size=1, order_by="dateFiled desc")
+        assert second["previous"] == 1
+        assert second["results"][0]["id"] == 10
+
+    def test_invalid_fts_syntax_falls_back_to_terms(self):
+        assert self.index.search('privacy "')["count"] == 1
+        assert self.index.search('"')["count"] == 0
+
+    def test_invalid_arguments(self):
+        with pytest.raises(ValidationError):
+            self.index.search("privacy", result_type="r")
+        with pytest.raises(ValidationError):
+            self.index.search("privacy", order_by="nope")
+        with pytest.raises(ValidationError):
+            self.index.search("privacy", page=0)
+        with pytest.raises(ValidationError):
+            self.index.add_opinion({"plain_text": "no id"})
+
+    def test_incremental_updates(self):
+        unchanged = make_opinion(10, "New text")
+        assert not self.index.needs_update(unchanged)
+        assert not self.index.add_opinion(unchanged)
+        assert self.index.search("privacy")["count"] == 1
+
+        newer = make_opinion(10, "Rewritten text", modified="2024-02-01T00:00:00")
+        assert self.index.needs_update(newer)
+        assert self.index.add_opinion(newer)
+        assert self.index.search("privacy")["count"] == 0
+        assert self.index.search("rewritten")["count"] == 1
+
+        rehashed = make_opinion(10, "Different hash", sha1="b", modified="2024-02-01T00:00:00")
+        assert self.index.add_opinion(rehashed)
+        assert self.index.count() == 2
+
+    def test_refresh_without_text_keeps_indexed_text(self):
+        detached = make_opinion(10, None, modified="2024-03-01T00:00:00", author_str="Blackmun")
+        assert self.index.add_opinion(detached)
+        result = self.index.search("privacy")["results"]
+        assert [r["id"] for r in result] == [10]
+        assert result[0]["author"] == "Blackmun"
+
+    def test_detached_opinion_text_is_read_from_store(self, tmp_path):
+        from courtlistener.utils.text_store import OpinionTextStore
+        store = OpinionTextStore(str(tmp_path / "texts"), compression="gzip")
+        opinion = store.detach(Opinion(make_opinion(12, "Stored penumbra text", sha1="c")))
+        assert "plain_text" not in opinion._data
+        assert self.index.add_opinion(opinion)
+        assert [r["id"] for r in self.index.search("penumbra")["results"]] == [12]
+
+    def test_cluster_metadata_applies_to_existing_opinions(self):
+        self.index.add_cluster(OpinionCluster({"id": 2, "case_name": "Smith v. Jones", "sub_opinions": []}))
+        result = self.index.search("smith")["results"][0]
+        assert result["id"] == 11
+        assert result["caseName"] == "Smith v. Jones"
+
+    def test_remove(self):
+        self.index.remove(10)
+        assert self.index.count() == 1
+        assert self.index.search("privacy")["count"] == 0
+
+    def test_persistence(self, tmp_path):
+        path = str(tmp_path / "index.db")
+        with LocalSearchIndex(path) as index:
+            index.add_opinion(make_opinion(1, "stored text"))
+        with LocalSearchIndex(path) as index:
+            assert index.search("stored")["count"] == 1
+            assert repr(index) == f"LocalSearchIndex(path='{path}')"
+
+
+class TestIndexingOnFetch:
+    """Opinions and clusters are indexed as they are fetched."""
+
+    def test_opinions_and_clusters_feed_index(self):
+        client = Mock()
+        client.local_index = LocalSearchIndex()
+        client.get.return_value = {"results": [make_opinion(5, "fetched opinion")]}
+        OpinionsAPI(client).list_opinions()
+        assert client.local_index.search("fetched")["count"] == 1
+
+        client.get.return_value = {"id": 1, "case_name": "Fetched v. Cluster", "sub_opinions": []}
+        ClustersAPI(client).get_cluster(1)
+        assert client.local_index.search("cluster")["results"][0]["id"] == 5
+
+    def test_sub_opinions_and_cluster_searches_feed_index(self):
+        client = Mock()
+        client.local_index = LocalSearchIndex()
+        client.get.return_value = {"results": [make_opinion(6, "concurring sub opinion")]}
+        OpinionsAPI(client).get_sub_opinions(5)
+        assert client.local_index.search("concurring")["count"] == 1
+
+        client.get.return_value = {"results": [{"id": 1, "case_name": "Searched v. Cluster", "sub_opinions": []}]}
+        ClustersAPI(client).search_opinion_clusters(q="searched")
+        assert client.local_index.search("searched")["results"][0]["id"] == 6
+
+    def test_no_index_attached(self):
+        client = Mock()
+        client.local_index = None
+        client.get.return_value = make_opinion(5, "text")
+        assert OpinionsAPI(client).get_opinion(5).id == 5
+
+    def test_indexing_failure_does_not_fail_fetch(self):
+        client = Mock()
+        client.local_index = Mock()
+        client.local_index.ingest.side_effect = ValidationError("Opinion has no id")
+        client.get.return_value = {"results": [make_opinion(5, "text")]}
+        assert OpinionsAPI(client).list_opinions()
+        client.local_index.ingest.assert_called_once()
@@ -0,0 +1,171 @@
+"""
+Tests for streaming JSON decoding of paginated responses.
+"""
+
+import io
+import json
+import pytest
+from unittest.mock import Mock, patch
+from courtlistener.exceptions import CourtListenerError, NotFoundError, ValidationError
+from courtlistener.utils import streaming
+from courtlistener.utils.pagination import PageIterator
+from courtlistener.utils.streaming import StreamedPage, iter_results, available_backend
+
+
+PAGE = {
+    "count": 3,
+    "next": "https://www.courtlistener.com/api/rest/v4/opinions/?cursor=abc",
+    "previous": None,
+    "results": [
+        {"id": 1, "plain_text": "café § 1983", "score": 1.5, "tags": [1, 2]},
+        {"id": 2, "nested": {"a": [None, True, False]}},
+        {"id": 12345678901},
+    ],
+}
+
+
+def backends():
+    params = ["python"]
+    try:
+        import ijson  # noqa: F401
+        params.append("ijson")
+    except ImportError:
+        pass
+    return params
+
+
+class TestIterResults:
+    """Test cases for iter_results."""
+
+    @pytest.mark.parametrize("backend", backends())
+    @pytest.mark.parametrize("chunk_size", [1, 7, 65536])
+    def test_decodes_items_and_metadata(self, backend, chunk_size):
+        body = json.dumps(PAGE, ensure_ascii=False).encode("utf-8")
+        metadata = {}
+        items = list(iter_results(io.BytesIO(body), metadata, backend=backend, chunk_size=chunk_size))
+        assert items == PAGE["results"]
+        assert metadata == {"count": 3, "next": PAGE["next"], "previous": None}
+
+    @pytest.mark.parametrize("backend", backends())
+    def test_metadata_after_results_and_empty_results(self, backend):
+        body = b'{"results": [], "next": null, "count": 0}'
+        metadata = {}
+        assert list(iter_results(io.BytesIO(body), metadata, backend=backend)) == []
+        assert metadata == {"next": None, "count": 0}
+
+    def test_yields_before_body_is_complete(self):
+        reads = []
+
+        class Source(io.BytesIO):
+            def read(self, n=-1):
+                data = super().read(n)
+                reads.append(len(data))
+                return data
+
+        body = json.dumps({"results": [{"id": i} for i in range(100)]}).encode()
+        items = iter_results(Source(body), {}, backend="python", chunk_size=16)
+        assert next(items) == {"id": 0}
+        assert sum(reads) < len(body)
+
+    def test_python_backend_errors(self):
+        with pytest.raises(CourtListenerError):
+            list(iter_results(io.BytesIO(b'{"results": [{"id": 1}'), {}, backend="python"))
+        with pytest.raises(CourtListenerError):
+            list(iter_results(io.BytesIO(b'[1, 2]'), {}, backend="python"))
+        with pytest.raises(CourtListenerError):
+            list(iter_results(io.BytesIO(b'{"results": [1 2]}'), {}, backend="python"))
+        assert list(iter_results(io.BytesIO(b'{}'), {}, backend="python")) == []
+
+    def test_custom_and_unknown_backends(self):
+        custom = Mock(return_value=iter([1]))
+        assert list(iter_results(io.BytesIO(b''), {}, backend=custom)) == [1]
+        with pytest.raises(ValidationError):
+            iter_results(io.BytesIO(b''), {}, backend="nope")
+
+    def test_ijson_missing(self, monkeypatch):
+        monkeypatch.setattr(streaming, "ijson", None)
+        assert available_backend() == "python"
+        with pytest.raises(CourtListenerError):
+            iter_results(io.BytesIO(b''), {}, backend="ijson")
+
+
+class TestStreamedPage:
+    """Test cases for StreamedPage."""
+
+    def test_results_close_connection(self):
+        on_close = Mock()
+        page = StreamedPage(io.BytesIO(json.dumps(PAGE).encode()), backend="python", on_close=on_close)
+        assert page.get("count") is None
+        assert [item["id"] for item in page.results] == [1, 2, 12345678901]
+        assert page.get("count") == 3
+        on_close.assert_called_once()
+        page.close()
+        on_close.assert_called_once()
+
+
+class TestTransportStreaming:
+    """Streaming through the transport and client."""
+
+    def test_stream_get(self, client):
+        response = Mock(status_code=200, raw=io.BytesIO(json.dumps(PAGE).encode()))
+        with patch.object(client.transport.session, "request", return_value=response) as request:
+            page = client.transport.stream_get("opinions/")
+            assert [item["id"] for item in page.results] == [1, 2, 12345678901]
+        assert request.call_args.kwargs["stream"] is True
+        assert response.raw.decode_content is True
+        response.close.assert_called_once()
+
+    def test_stream_error_response(self, client):
+        response = Mock(status_code=404)
+        with patch.object(client.transport.session, "request", return_value=response):
+            with pytest.raises(NotFoundError):
+                client.transport.stream_get("opinions/999/")
+        response.close.assert_called_once()
+
+    def test_paginate_stream(self, client):
+        pages = [
+            {"next": "https://x/?cursor=2", "results": [{"id": 1}, {"id": 2}]},
+            {"next": None, "results": [{"id": 3}]},
+        ]
+        responses = [Mock(status_code=200, raw=io.BytesIO(json.dumps(p).encode())) for p in pages]
+        with patch.object(client.transport.session, "request", side_effect=responses) as request:
+            items = list(client.paginate("opinions/", {"court": "scotus"}, stream=True))
+        assert [item["id"] for item in items] == [1, 2, 3]
+        assert request.call_args_list[1].kwargs["params"] == {"court": "scotus", "cursor": "2"}
+
+
+class TestPageIteratorStreaming:
+    """PageIterator in streaming mode with a mocked client."""
+
+    def test_stops_on_repeated_cursor(self):
+        client = Mock()
+        body = json.dumps({"next": None, "results": [{"id": 1}]}).encode()
+        client._make_request.return_value = StreamedPage(io.BytesIO(body), backend="python")
+        iterator = PageIterator(client, "dockets/", stream=True)
+        assert list(iterator) == [{"id": 1}]
+        client._make_request.assert_called_once_with("GET", "dockets/", params={}, stream=True)
+
+    def test_close_releases_partly_read_page(self):
+        client = Mock()
+        on_close = Mock()
+        body = json.dumps(PAGE).encode()
+        client._make_request.return_value = StreamedPage(io.BytesIO(body), on_close=on_close, backend="python")
+        with PageIterator(client, "opinions/", stream=True) as iterator:
+            assert next(iterator)["id"] == 1
+            on_close.assert_not_called()
+        on_close.assert_called_once()
+        assert list(iterator) == []
+        iterator.close()
+        on_close.assert_called_once()
+        client._make_request.assert_called_once()
+
+    def test_wraps_errors(self):
+        client = Mock()
+        client._make_request.side_effect = Exception("boom")
+        with pytest.raises(CourtListenerError, match="Failed to load page"):
+            next(PageIterator(client, "dockets/", stream=True))
+
+        client._make_request.side_effect = None
+        client._make_request.return_value = StreamedPage(io.BytesIO(b'{"results": [1'), backend="python")
+        with pytest.raises(CourtListenerError):
+            list(PageIterator(client, "dockets/", stream=True))
@@ -0,0 +1,101 @@
+"""
+Tests for the content-addressed opinion text store.
+"""
+
+import os
+import pytest
+from courtlistener.exceptions import CourtListenerError, ValidationError
+from courtlistener.models.opinion import Opinion
+from courtlistener.utils import text_store
+from courtlistener.utils.text_store import OpinionTextStore
+
+
+def blob_count(root):
+    return sum(len(files) for _, _, files in os.walk(os.path.join(root, 'blobs')))
+
+
+class TestOpinionTextStore:
+    """Test cases for OpinionTextStore."""
+
+    def setup_method(self):
+        self.opinion_data = {
+            'id': 1,
+            'sha1': 'abc123',
+            'plain_text': 'The opinion text. ' * 100,
+            'html_with_citations': '<p>The opinion text.</p>',
+            'xml_harvard': '',
+        }
+
+    def test_put_and_get_roundtrip(self, tmp_path):
+        store = OpinionTextStore(str(tmp_path), compression='gzip')
+        digest = store.put('héllo wörld')
+        assert store.get(digest) == 'héllo wörld'
+        assert store.get('0' * 40) is None
+
+    def test_empty_text(self, tmp_path):
+        store = OpinionTextStore(str(tmp_path), compression='gzip')
+        assert store.get(store.put('')) == ''
+
+    def test_content_is_deduplicated_and_compressed(self, tmp_path):
+        store = OpinionTextStore(str(tmp_path), compression='gzip')
+        store.put_opinion(self.opinion_data)
+        store.put_opinion(dict(self.opinion_data, sha1='def456'))
+        assert blob_count(str(tmp_path)) == 2
+        blob_bytes = sum(
+            os.path.getsize(os.path.join(d, f))
+            for d, _, files in os.walk(os.path.join(str(tmp_path), 'blobs')) for f in files
+        )
+        assert blob_bytes < len(self.opinion_data['plain_text'])
+
+    def test_put_opinion_manifest(self, tmp_path):
+        store = OpinionTextStore(str(tmp_path), compression='gzip')
+        manifest = store.put_opinion(Opinion(self.opinion_data))
+        assert set(manifest) == {'plain_text', 'html_with_citations'}
+        assert store.has_opinion('abc123')
+        assert not store.has_opinion('missing')
+        assert store.get_body('abc123', 'html_with_citations') == '<p>The opinion text.</p>'
+        assert store.get_body('abc123', 'xml_harvard') is None
+        assert store.get_body('missing', 'plain_text') is None
+
+    def test_put_opinion_requires_sha1(self, tmp_path):
+        store = OpinionTextStore(str(tmp_path), compression='gzip')
+        with pytest.raises(ValidationError):
+            store.put_opinion({'id': 1, 'plain_text': 'x'})
+
+    def test_detach_loads_lazily(self, tmp_path):
+        store = OpinionTextStore(str(tmp_path), compression='gzip')
+        opinion = store.detach(Opinion(dict(self.opinion_data)))
+        assert 'plain_text' not in opinion._data
+        assert opinion.plain_text == self.opinion_data['plain_text']
+        assert opinion.html_with_citations == '<p>The opinion text.</p>'
+        assert opinion.html is None
+
+    def test_attach_to_fresh_model(self, tmp_path):
+        store = OpinionTextStore(str(tmp_path), compression='gzip')
+        store.put_opinion(self.opinion_data)
+        opinion = Opinion({'id': 1, 'sha1': 'abc123'})
+        assert opinion.plain_text is None
+        opinion.attach_text_store(store)
+        assert opinion.plain_text == self.opinion_data['plain_text']
+
+    def test_invalid_compression(self, tmp_path):
+        with pytest.raises(ValidationError):
+            OpinionTextStore(str(tmp_path), compression='lz4')
+
+    def test_zstd_requires_package(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(text_store, 'zstandard', None)
+        with pytest.raises(CourtListenerError):
+            OpinionTextStore(str(tmp_path), compression='zstd')
+        assert OpinionTextStore(str(tmp_path)).compression == 'gzip'
+
+    def test_zstd_roundtrip(self, tmp_path):
+        pytest.importorskip('zstandard')
+        store = OpinionTextStore(str(tmp_path), compression='zstd')
+        digest = store.put('zstd text')
+        assert store.get(digest) == 'zstd text'
+        # Blobs written with another codec remain readable
+        assert OpinionTextStore(str(tmp_path), compression='gzip').get(digest) == 'zstd text'
+
+    def test_repr(self, tmp_path):
+        store = OpinionTextStore(str(tmp_path), compression='gzip')
+        assert repr(store) == f"OpinionTextStore(root='{tmp_path}', compression='gzip')"
@@ -0,0 +1,145 @@
+"""
+Tests for the API token pool.
+"""
+
+import threading
+import pytest
+from unittest.mock import Mock, patch
+from courtlistener.client import CourtListenerClient
+from courtlistener.config import Config
+from courtlistener.exceptions import AuthenticationError, ValidationError
+from courtlistener.utils.token_pool import TokenPool
+
+
+def ok():
+    response = Mock(status_code=200)
+    response.json.return_value = {"ok": True}
+    return response
+
+
+class TestTokenPool:
+    """Test cases for TokenPool."""
+
+    def test_spreads_requests(self):
+        pool = TokenPool(["a", "b", "c"])
+        assert sorted(pool.acquire() for _ in range(6)) == ["a", "a", "b", "b", "c", "c"]
+        assert [entry["requests"] for entry in pool.status()] == [2, 2, 2]
+
+    def test_unauthorized_token_leaves_rotation(self):
+        pool = TokenPool(["a", "b"])
+        pool.report("a", 401)
+        assert {pool.acquire() for _ in range(3)} == {"b"}
+        pool.report("b", 401)
+        assert not pool.has_available()
+        with pytest.raises(AuthenticationError):
+            pool.acquire()
+        pool.reset("a")
+        assert pool.acquire() == "a"
+
+    def test_rate_limited_token_rests(self):
+        pool = TokenPool(["a", "b"], cooldown=30)
+        pool.report("a", 429)
+        assert {pool.acquire() for _ in range(3)} == {"b"}
+        status = pool.status()[0]
+        assert status["rate_limited"] == 1 and 29 < status["cooldown_remaining"] <= 30
+        pool.report("a", 429, retry_after=0)
+        pool.report("unknown", 429)
+
+    @patch("courtlistener.utils.token_pool.time.sleep")
+    def test_waits_when_all_tokens_busy(self, mock_sleep):
+        clock = [100.0]
+        mock_sleep.side_effect = lambda seconds: clock.__setitem__(0, clock[0] + seconds)
+        pool = TokenPool(["a", "b"], requests_per_second=1)
+        with patch("courtlistener.utils.token_pool.time.monotonic", side_effect=lambda: clock[0]):
+            assert {pool.acquire(), pool.acquire()} == {"a", "b"}
+            pool.acquire()
+        mock_sleep.assert_called_once_with(pytest.approx(1.0))
+
+    def test_try_acquire(self):
+        pool = TokenPool(["a", "b"], requests_per_second=0.1)
+        assert {pool.try_acquire(), pool.try_acquire()} == {"a", "b"}
+        assert pool.try_acquire() is None
+        pool.report("a", 401)
+        pool.report("b", 401)
+        assert pool.try_acquire() is None
+
+    def test_thread_safe(self):
+        pool = TokenPool(["a", "b", "c", "d"])
+        acquired = []
+        threads = [threading.Thread(target=lambda: acquired.extend(pool.acquire() for _ in range(100))) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert sum(entry["requests"] for entry in pool.status()) == 400 == len(acquired)
+
+    def test_validation_and_fingerprints(self):
+        with pytest.raises(ValidationError):
+            TokenPool([])
+        with pytest.raises(ValidationError):
+            TokenPool(["a"], requests_per_second=0)
+        pool = TokenPool(["secret", "secret", "other"])
+        assert len(pool) == 2
+        assert "secret" not in str(pool.status())
+
+
+class TestClientTokenRotation:
+    """Transport rotates tokens on 401 and 429."""
+
+    def test_config_tokens(self, monkeypatch):
+        config = Config(api_tokens=["a", "b"])
+        assert config.api_token == "a" and config.api_tokens == ["a", "b"]
+        assert Config(api_token="x", api_tokens=["a", "x"]).api_tokens == ["x", "a"]
+        monkeypatch.delenv("COURTLISTENER_API_TOKEN", raising=False)
+        monkeypatch.setenv("COURTLISTENER_API_TOKENS", "e1, e2")
+        assert Config().api_tokens == ["e1", "e2"]
+
+    def test_single_token_has_no_pool(self):
+        client = CourtListenerClient(api_token="only")
+        assert client.token_pool is None
+
+    def test_token_rate_from_config(self, monkeypatch):
+        client = CourtListenerClient(api_tokens=["a", "b"], token_requests_per_second=2)
+        assert client.token_pool._interval == 0.5
+        # A rate alone is enough to pace a single token
+        assert CourtListenerClient(api_token="only", token_requests_per_second=4).token_pool.tokens == ["only"]
+        monkeypatch.setenv("COURTLISTENER_TOKEN_REQUESTS_PER_SECOND", "0.25")
+        assert Config(api_token="x").token_requests_per_second == 0.25
+        with pytest.raises(ValidationError):
+            Config(api_token="x", token_requests_per_second=0)
+
+    def test_requests_use_pool_tokens(self):
+        client = CourtListenerClient(api_tokens=["a", "b"])
+        with patch.object(client.transport.session, "request", side_effect=[ok(), ok()]) as request:
+            client.get("courts/")
+            client.get("courts/")
+        used = {call.kwargs["headers"]["Authorization"] for call in request.call_args_list}
+        assert used == {"Token a", "Token b"}
+
+    def test_rotates_on_401(self):
+        client = CourtListenerClient(api_tokens=["a", "b"])
+        responses = [Mock(status_code=401), ok()]
+        with patch.object(client.transport.session, "request", side_effect=responses) as request:
+            assert client.get("courts/") == {"ok": True}
+        first, second = (call.kwargs["headers"]["Authorization"] for call in request.call_args_list)
+        assert first != second
+        assert [entry["healthy"] for entry in client.token_pool.status()].count(False) == 1
+
+    def test_all_tokens_rejected(self):
+        client = CourtListenerClient(api_tokens=["a", "b"])
+        with patch.object(client.transport.session, "request", return_value=Mock(status_code=401)) as request:
+            with pytest.raises(AuthenticationError):
+                client.get("courts/")
+        assert request.call_count == 2
+
+    @patch("time.sleep")
+    def test_rotates_on_429_without_waiting(self, mock_sleep):
+        client = CourtListenerClient(api_tokens=["a", "b"])
+        limited = Mock(status_code=429, headers={"Retry-After": "120"})
+        with patch.object(client.transport.session, "request", side_effect=[limited, ok()]) as request:
+            assert client.get("search/") == {"ok": True}
+        first, second = (call.kwargs["headers"]["Authorization"] for call in request.call_args_list)
+        assert first != second
+        assert all(call.args[0] == 0 for call in mock_sleep.call_args_list)
+        resting = [entry for entry in client.token_pool.status() if entry["cooldown_remaining"] > 0]
+        assert len(resting) == 1 and resting[0]["cooldown_remaining"] > 100
@@ -0,0 +1,265 @@
+"""
+Tests for the webhook receiver and durable event queue.
+"""
+
+import asyncio
+import json
+import socket
+import threading
+import time
+import urllib.error
+import urllib.request
+import pytest
+from unittest.mock import Mock
+from courtlistener.exceptions import ValidationError
+from courtlistener.utils.webhooks import (
+    AsyncWebhookReceiver,
+    WebhookQueue,
+    WebhookReceiver,
+    parse_event,
+)
+
+DOCKET_EVENT = {
+    "webhook": {"version": 1, "event_type": 1, "date_created": "2024-01-01T00:00:00Z"},
+    "payload": {"results": [{"id": 1, "docket": 10}]},
+}
+SEARCH_EVENT = {"webhook": {"version": 1, "event_type": 2}, "payload": {"results": []}}
+
+
+def body(data):
+    return json.dumps(data).encode("utf-8")
+
+
+def post(address, data, key=None, path="/"):
+    request = urllib.request.Request(f"http://{address[0]}:{address[1]}{path}", data=body(data), method="POST")
+    request.add_header("Content-Type", "application/json")
+    if key:
+        request.add_header("Idempotency-Key", key)
+    try:
+        with urllib.request.urlopen(request, timeout=5) as response:
+            return response.status, json.loads(response.read())
+    except urllib.error.HTTPError as e:
+        return e.code, json.loads(e.read())
+
+
+def raw_post(address, content_length):
+    with socket.create_connection(address, timeout=5) as sock:
+        sock.sendall(f"POST / HTTP/1.1\r\nHost: localhost\r\nContent-Length: {content_length}\r\n\r\n{{}}".encode())
+        return sock.recv(65536).split(b" ", 2)[1]
+
+
+def wait_for(condition, timeout=5.0):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if condition():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+class TestParseEvent:
+    """Test cases for parse_event."""
+
+    def test_valid(self):
+        event = parse_event(body(DOCKET_EVENT), {"idempotency-key": "abc"})
+        assert event.key == "abc"
+        assert event.name == "docket_alert"
+        assert event.payload["results"][0]["docket"] == 10
+        assert parse_event(body(SEARCH_EVENT)).key == parse_event(body(SEARCH_EVENT)).key
+
+    @pytest.mark.parametrize("raw", [b"not json", b"[]", b'{"payload": {}}',
+                                     b'{"webhook": {"event_type": "1"}, "payload": {}}',
+                                     b'{"webhook": {"event_type": 1}}'])
+    def test_invalid(self, raw):
+        with pytest.raises(ValidationError):
+            parse_event(raw)
+
+
+class TestWebhookQueue:
+    """Test cases for WebhookQueue."""
+
+    def test_dedup_ack_and_durability(self, tmp_path):
+        path = str(tmp_path / "events.db")
+        queue = WebhookQueue(path)
+        assert queue.put(parse_event(body(DOCKET_EVENT), {"Idempotency-Key": "a"}))
+        assert not queue.put(parse_event(body(DOCKET_EVENT), {"Idempotency-Key": "a"}))
+        queue.close()
+
+        queue = WebhookQueue(path, lease=0.05)
+        [event] = queue.claim()
+        assert event.attempts == 1 and event.name == "docket_alert"
+        assert queue.claim() == []
+        # An unfinished claim is redelivered once the lease expires
+        time.sleep(0.06)
+        [event] = queue.claim()
+        assert event.attempts == 2
+        queue.ack(event)
+        assert queue.counts() == {"pending": 0, "done": 1, "failed": 0}
+        assert not queue.put(parse_event(body(DOCKET_EVENT), {"Idempotency-Key": "a"}))
+        assert queue.purge(older_than=0) == 1
+
+    def test_nack_backoff_and_failure(self):
+        queue = WebhookQueue(max_attempts=2, retry_delay=0)
+        queue.put(parse_event(body(DOCKET_EVENT)))
+        [event] = queue.claim()
+        queue.nack(event, "boom")
+        [event] = queue.claim()
+        queue.nack(event, "boom")
+        assert queue.counts()["failed"] == 1
+        assert queue.retry_failed() == 1
+        assert len(queue) == 1
+
+
+class TestWebhookReceiver:
+    """Test cases for the threaded receiver."""
+
+    def test_accept_and_dispatch(self):
+        receiver = WebhookReceiver(path="/hooks/secret")
+        docket_handler = Mock()
+        all_handler = Mock()
+        receiver.on("docket_alert", docket_handler)
+        receiver.on(handler=all_handler)
+        assert receiver.accept(body(DOCKET_EVENT), {"Idempotency-Key": "1"}, path="/hooks/secret") == (200, "queued")
+        assert receiver.accept(body(DOCKET_EVENT), {"Idempotency-Key": "1"}, path="/hooks/secret/")[1] == "duplicate"
+        assert receiver.accept(body(SEARCH_EVENT), path="/hooks/secret")[0] == 200
+        assert receiver.accept(body(SEARCH_EVENT), path="/other")[0] == 404
+        assert receiver.accept(b"{}", path="/hooks/secret")[0] == 400
+        assert receiver.process_pending() == 2
+        docket_handler.assert_called_once()
+        assert all_handler.call_count == 2
+
+    def test_failed_handler_is_retried(self):
+        receiver = WebhookReceiver(queue=WebhookQueue(retry_delay=0))
+        handler = Mock(side_effect=[RuntimeError("down"), None])
+        receiver.on(1)(handler)
+        receiver.accept(body(DOCKET_EVENT))
+        receiver.process_pending()
+        assert receiver.queue.counts()["pending"] == 1
+        receiver.process_pending()
+        assert handler.call_count == 2
+        assert receiver.queue.counts()["done"] == 1
+
+    def test_awaitable_handlers_are_rejected(self):
+        receiver = WebhookReceiver()
+
+        async def handle(event):
+            pass
+
+        with pytest.raises(ValidationError):
+            receiver.on("docket_alert", handle)
+        receiver.on("docket_alert", lambda event: handle(event))
+        receiver.accept(body(DOCKET_EVENT))
+        receiver.process_pending()
+        assert receiver.queue.counts()["done"] == 0
+
+    def test_allowed_ips(self):
+        receiver = WebhookReceiver(allowed_ips=["34.210.230.218"])
+        assert receiver.accept(body(DOCKET_EVENT), remote_addr="10.0.0.1")[0] == 403
+        assert receiver.accept(body(DOCKET_EVENT), remote_addr="34.210.230.218")[0] == 200
+
+    def test_http_server(self):
+        received = []
+        receiver = WebhookReceiver(port=0, max_body=1000)
+        receiver.on("docket_alert", received.append)
+        with receiver:
+            assert post(receiver.address, DOCKET_EVENT, key="k1") == (200, {"status": "queued"})
+            assert post(receiver.address, DOCKET_EVENT, key="k1") == (200, {"status": "duplicate"})
+            assert post(receiver.address, {"payload": "x" * 2000})[0] == 413
+            assert raw_post(receiver.address, "abc") == b"400"
+            assert raw_post(receiver.address, "-2") == b"400"
+            assert wait_for(lambda: len(received) == 1)
+        assert received[0].key == "k1"
+
+
+class TestAsyncWebhookReceiver:
+    """Test cases for the asyncio receiver."""
+
+    def test_http_server_with_coroutine_handler(self):
+        async def scenario():
+            received = []
+            receiver = AsyncWebhookReceiver(port=0, path="/hook")
+
+            @receiver.on("search_alert")
+            async def handle(event):
+                received.append(event)
+
+            sync_handler = Mock()
+            receiver.on("search_alert", sync_handler)
+
+            async with receiver:
+                host, port = receiver.address
+                reader, writer = await asyncio.open_connection(host, port)
+                payload = body(SEARCH_EVENT)
+                writer.write(
+                    b"POST /hook HTTP/1.1\r\nHost: localhost\r\nIdempotency-Key: s1\r\n"
+                    + f"Content-Length: {len(payload)}\r\n\r\n".encode() + payload
+                )
+                response = await reader.read()
+                writer.close()
+                assert response.startswith(b"HTTP/1.1 200 OK")
+                assert b'"queued"' in response
+
+                reader, writer = await asyncio.open_connection(host, port)
+                writer.write(b"GET /hook HTTP/1.1\r\n\r\n")
+                assert (await reader.read()).startswith(b"HTTP/1.1 405")
+                writer.close()
+
+                for _ in range(500):
+                    if received and sync_handler.called:
+                        break
+                    await asyncio.sleep(0.01)
+            return received, sync_handler
+
+        received, sync_handler = asyncio.run(scenario())
+        assert [event.key for event in received] == ["s1"]
+        sync_handler.assert_called_once()
+
+    def test_process_pending_awaits_handlers(self):
+        receiver = AsyncWebhookReceiver()
+        received = []
+
+        @receiver.on("docket_alert")
+        async def handle(event):
+            await asyncio.sleep(0)
+            received.append(event.key)
+
+        receiver.accept(body(DOCKET_EVENT), {"Idempotency-Key": "d1"})
+        assert asyncio.run(receiver.process_pending()) == 1
+        assert received == ["d1"] and receiver.queue.counts()["done"] == 1
+        assert not hasattr(receiver, "__enter__")
+
+    def test_queue_insert_runs_off_the_event_loop(self):
+        async def scenario():
+            receiver = AsyncWebhookReceiver(port=0)
+            put = receiver.queue.put
+            threads = []
+
+            def tracking_put(event):
+                threads.append(threading.current_thread())
+                return put(event)
+
+            receiver.queue.put = tracking_put
+            async with receiver:
+                reader, writer = await asyncio.open_connection(*receiver.address)
+                payload = body(DOCKET_EVENT)
+                writer.write(f"POST / HTTP/1.1\r\nContent-Length: {len(payload)}\r\n\r\n".encode() + payload)
+                response = await reader.read()
+                writer.close()
+            return response, threads
+
+        response, threads = asyncio.run(scenario())
+        assert b'"queued"' in response
+        assert threads and threads[0] is not threading.main_thread()
+
+    def test_invalid_content_length(self):
+        async def scenario():
+            async with AsyncWebhookReceiver(port=0) as receiver:
+                statuses = []
+                for length in ("abc", "-2"):
+                    reader, writer = await asyncio.open_connection(*receiver.address)
+                    writer.write(f"POST / HTTP/1.1\r\nContent-Length: {length}\r\n\r\n{{}}".encode())
+                    statuses.append((await reader.read()).split(b" ", 2)[1])
+                    writer.close()
+                return statuses
+
+        assert asyncio.run(scenario()) == [b"400", b"400"]